@@ -27,11 +27,20 @@ Design Principles (from ADR-006):
 Version: 1.0.0
 """
 
-from typing import Protocol, Optional, Any, runtime_checkable
+from typing import (
+    Protocol,
+    Optional,
+    Any,
+    AsyncIterable,
+    Awaitable,
+    Callable,
+    runtime_checkable,
+)
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum, auto
 import re
+import time
 
 
 class ConnectionState(Enum):
@@ -311,3 +320,81 @@ def is_bot_mentioned(
     """
     mentions = extract_mentions(content, platform)
     return bot_id in mentions
+
+
+# =============================================================================
+# Streaming Utilities
+# =============================================================================
+
+# Minimum seconds between progressive edits; keeps adapters inside the
+# per-channel edit rate limits of Slack, Discord and Telegram.
+DEFAULT_EDIT_INTERVAL = 1.0
+
+
+def truncate_for_preview(content: str, max_length: Optional[int]) -> str:
+    """
+    Truncate an in-progress message to a platform length limit.
+
+    Args:
+        content: Message text so far
+        max_length: Platform limit, or None for no limit
+
+    Returns:
+        Content, cut with an ellipsis if it exceeds max_length
+    """
+    if max_length is None or len(content) <= max_length:
+        return content
+    return content[: max_length - 1] + "\u2026"
+
+
+async def stream_message_edits(
+    updates: AsyncIterable[str],
+    send: Callable[[str], Awaitable[Any]],
+    edit: Callable[[Any, str], Awaitable[Any]],
+    min_interval: float = DEFAULT_EDIT_INTERVAL,
+) -> tuple[Any, str]:
+    """
+    Render a stream of message snapshots as one progressively edited message.
+
+    The first non-empty snapshot is sent immediately; later snapshots are
+    applied as edits no more than once per min_interval. The final snapshot
+    is always applied, so the message ends with the complete text.
+
+    Args:
+        updates: Full message text so far, one snapshot per item
+        send: Coroutine sending the initial message; returns a handle
+        edit: Coroutine applying new text to the handle
+        min_interval: Minimum seconds between edits
+
+    Returns:
+        Tuple of (handle returned by send, or None if nothing was sent;
+        final snapshot text)
+    """
+    handle = None
+    shown = ""
+    latest = ""
+    last_edit = 0.0
+
+    async for snapshot in updates:
+        latest = snapshot
+        if not snapshot or snapshot == shown:
+            continue
+
+        now = time.monotonic()
+        if handle is None:
+            handle = await send(snapshot)
+        elif now - last_edit >= min_interval:
+            await edit(handle, snapshot)
+        else:
+            continue
+        shown = snapshot
+        last_edit = now
+
+    if latest and latest != shown:
+        if handle is None:
+            handle = await send(latest)
+        else:
+            await edit(handle, latest)
+
+    return handle, latest
+
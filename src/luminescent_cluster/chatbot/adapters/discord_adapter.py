@@ -29,7 +29,7 @@ Version: 1.0.0
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, List, Callable, Awaitable, Any, Dict
+from typing import Optional, List, Callable, Awaitable, Any, AsyncIterable, Dict
 import asyncio
 import logging
 
@@ -37,6 +37,9 @@ from luminescent_cluster.chatbot.adapters.base import (
     ConnectionState,
     ChatMessage,
     MessageAuthor,
+    DEFAULT_EDIT_INTERVAL,
+    stream_message_edits,
+    truncate_for_preview,
 )
 from luminescent_cluster.chatbot.gateway import GatewayRequest
 
@@ -462,6 +465,71 @@ class DiscordAdapter:
             platform="discord",
         )
 
+    async def send_message_stream(
+        self,
+        channel_id: str,
+        updates: AsyncIterable[str],
+        reply_to: Optional[str] = None,
+        min_edit_interval: float = DEFAULT_EDIT_INTERVAL,
+    ) -> Optional[ChatMessage]:
+        """
+        Send a streamed response as one progressively edited message.
+
+        In-progress text longer than Discord's limit is shown truncated;
+        once the stream ends any overflow is sent as follow-up messages.
+
+        Args:
+            channel_id: Channel ID to send to
+            updates: Full message text so far, one snapshot per item
+                (e.g. GatewayStreamChunk.content)
+            reply_to: Optional message ID to reply to
+            min_edit_interval: Minimum seconds between message edits
+
+        Returns:
+            The first sent ChatMessage, or None if the stream produced no text
+
+        Raises:
+            Exception: If not connected or send fails
+        """
+        if self._connection_state != ConnectionState.CONNECTED:
+            raise Exception("Not connected to Discord")
+
+        channel = await self._get_channel(channel_id)
+
+        async def send(text: str) -> Any:
+            kwargs = {"content": truncate_for_preview(text, 2000)}
+            if reply_to:
+                try:
+                    kwargs["reference"] = await channel.fetch_message(int(reply_to))
+                except Exception:
+                    pass  # Skip reference if fetch fails
+            return await channel.send(**kwargs)
+
+        async def edit(sent: Any, text: str) -> None:
+            await sent.edit(content=truncate_for_preview(text, 2000))
+
+        sent_msg, content = await stream_message_edits(updates, send, edit, min_edit_interval)
+        if sent_msg is None:
+            return None
+
+        chunks = self._split_message(content)
+        if len(chunks) > 1:
+            await sent_msg.edit(content=chunks[0])
+            for chunk in chunks[1:]:
+                await channel.send(content=chunk)
+
+        return ChatMessage(
+            id=str(sent_msg.id),
+            content=content,
+            author=MessageAuthor(
+                id=self.bot_user_id or "",
+                username="bot",
+            ),
+            channel_id=channel_id,
+            timestamp=datetime.now(),
+            platform="discord",
+        )
+
     def _split_message(self, content: str, max_length: int = 2000) -> List[str]:
         """Split message into chunks for Discord's limit."""
         if len(content) <= max_length:
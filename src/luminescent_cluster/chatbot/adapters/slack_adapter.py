@@ -29,7 +29,7 @@ Version: 1.0.0
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, List, Callable, Awaitable, Any, Dict
+from typing import Optional, List, Callable, Awaitable, Any, AsyncIterable, Dict
 import asyncio
 import logging
 import re
@@ -38,8 +38,11 @@ from luminescent_cluster.chatbot.adapters.base import (
     ConnectionState,
     ChatMessage,
     MessageAuthor,
+    DEFAULT_EDIT_INTERVAL,
+    stream_message_edits,
 )
 from luminescent_cluster.chatbot.gateway import GatewayRequest
+from luminescent_cluster.chatbot.http_pool import SharedClientSession
 
 logger = logging.getLogger(__name__)
 
@@ -172,6 +175,9 @@ class SlackAdapter:
         self._web_client = None
         self._bot_user_id: Optional[str] = None
 
+        # Keep-alive session for response_url posts
+        self._http_session = SharedClientSession()
+
         # User info cache
         self._user_cache: Dict[str, Dict[str, Any]] = {}
 
@@ -267,6 +273,8 @@ class SlackAdapter:
             except Exception as e:
                 logger.warning(f"Error closing socket mode handler: {e}")
 
+        await self._http_session.close()
+
         self._connection_state = ConnectionState.DISCONNECTED
         logger.info("Disconnected from Slack")
 
@@ -416,6 +424,58 @@ class SlackAdapter:
             platform="slack",
         )
 
+    async def send_message_stream(
+        self,
+        channel_id: str,
+        updates: AsyncIterable[str],
+        reply_to: Optional[str] = None,
+        min_edit_interval: float = DEFAULT_EDIT_INTERVAL,
+    ) -> Optional[ChatMessage]:
+        """
+        Send a streamed response as one progressively edited message.
+
+        Args:
+            channel_id: Channel ID to send to
+            updates: Full message text so far, one snapshot per item
+                (e.g. GatewayStreamChunk.content)
+            reply_to: Optional thread_ts to reply to
+            min_edit_interval: Minimum seconds between chat.update calls
+
+        Returns:
+            The sent ChatMessage, or None if the stream produced no text
+
+        Raises:
+            Exception: If not connected or send fails
+        """
+        if self._connection_state != ConnectionState.CONNECTED:
+            raise Exception("Not connected to Slack")
+
+        async def send(text: str) -> str:
+            kwargs = {"channel": channel_id, "text": text}
+            if reply_to:
+                kwargs["thread_ts"] = reply_to
+            response = await self._web_client.chat_postMessage(**kwargs)
+            return response.get("ts", "")
+
+        async def edit(ts: str, text: str) -> None:
+            await self._web_client.chat_update(channel=channel_id, ts=ts, text=text)
+
+        ts, content = await stream_message_edits(updates, send, edit, min_edit_interval)
+        if ts is None:
+            return None
+
+        return ChatMessage(
+            id=ts,
+            content=content,
+            author=MessageAuthor(
+                id=self._bot_user_id or "",
+                username="bot",
+            ),
+            channel_id=channel_id,
+            timestamp=datetime.now(),
+            platform="slack",
+        )
+
     async def send_ephemeral(
         self,
         channel_id: str,
@@ -518,8 +578,6 @@ class SlackAdapter:
             response_type: "in_channel" or "ephemeral"
             blocks: Optional Block Kit blocks
         """
-        import aiohttp
-
         payload = {
             "text": text,
             "response_type": response_type,
@@ -528,10 +586,10 @@ class SlackAdapter:
         if blocks:
             payload["blocks"] = blocks
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(response_url, json=payload) as response:
-                if response.status != 200:
-                    logger.error(f"Failed to respond to command: {response.status}")
+        session = await self._http_session.get()
+        async with session.post(response_url, json=payload) as response:
+            if response.status != 200:
+                logger.error(f"Failed to respond to command: {response.status}")
 
     # =========================================================================
     # Event Handling
@@ -596,6 +654,9 @@ class _MockSlackClient:
     async def chat_postMessage(self, **kwargs) -> Dict[str, Any]:
         return {"ok": True, "ts": "1234567890.123456", "channel": kwargs.get("channel")}
 
+    async def chat_update(self, **kwargs) -> Dict[str, Any]:
+        return {"ok": True, "ts": kwargs.get("ts"), "channel": kwargs.get("channel")}
+
     async def chat_postEphemeral(self, **kwargs) -> Dict[str, Any]:
         return {"ok": True, "message_ts": "1234567890.123456"}
 
@@ -30,7 +30,7 @@ Version: 1.0.0
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, List, Callable, Awaitable, Any, Dict, Union
+from typing import Optional, List, Callable, Awaitable, Any, AsyncIterable, Dict, Union
 import asyncio
 import logging
 import re
@@ -39,11 +39,17 @@ from luminescent_cluster.chatbot.adapters.base import (
     ConnectionState,
     ChatMessage,
     MessageAuthor,
+    DEFAULT_EDIT_INTERVAL,
+    stream_message_edits,
+    truncate_for_preview,
 )
 from luminescent_cluster.chatbot.gateway import GatewayRequest
 
 logger = logging.getLogger(__name__)
 
+# Telegram Bot API limit for message text
+MAX_MESSAGE_LENGTH = 4096
+
 
 # =============================================================================
 # Telegram Configuration
@@ -664,6 +670,79 @@ class TelegramAdapter:
             platform="telegram",
         )
 
+    async def send_message_stream(
+        self,
+        channel_id: str,
+        updates: AsyncIterable[str],
+        reply_to: Optional[str] = None,
+        min_edit_interval: float = DEFAULT_EDIT_INTERVAL,
+    ) -> Optional[ChatMessage]:
+        """
+        Send a streamed response as one progressively edited message.
+
+        In-progress text longer than Telegram's limit is shown truncated;
+        once the stream ends any overflow is sent as follow-up messages.
+
+        Args:
+            channel_id: Chat ID to send to
+            updates: Full message text so far, one snapshot per item
+                (e.g. GatewayStreamChunk.content)
+            reply_to: Optional message ID to reply to
+            min_edit_interval: Minimum seconds between editMessageText calls
+
+        Returns:
+            The first sent ChatMessage, or None if the stream produced no text
+
+        Raises:
+            Exception: If not connected or send fails
+        """
+        if self._connection_state != ConnectionState.CONNECTED:
+            raise Exception("Not connected to Telegram")
+
+        chat_id = int(channel_id)
+
+        async def send(text: str) -> int:
+            kwargs: Dict[str, Any] = {
+                "chat_id": chat_id,
+                "text": truncate_for_preview(text, MAX_MESSAGE_LENGTH),
+            }
+            if reply_to:
+                kwargs["reply_to_message_id"] = int(reply_to)
+            response = await self._api_client.send_message(**kwargs)
+            return response.get("message_id")
+
+        async def edit(message_id: int, text: str) -> None:
+            await self._api_client.edit_message_text(
+                chat_id=chat_id,
+                message_id=message_id,
+                text=truncate_for_preview(text, MAX_MESSAGE_LENGTH),
+            )
+
+        message_id, content = await stream_message_edits(updates, send, edit, min_edit_interval)
+        if message_id is None:
+            return None
+
+        if len(content) > MAX_MESSAGE_LENGTH:
+            await self._api_client.edit_message_text(
+                chat_id=chat_id, message_id=message_id, text=content[:MAX_MESSAGE_LENGTH]
+            )
+            for start in range(MAX_MESSAGE_LENGTH, len(content), MAX_MESSAGE_LENGTH):
+                await self._api_client.send_message(
+                    chat_id=chat_id, text=content[start : start + MAX_MESSAGE_LENGTH]
+                )
+
+        return ChatMessage(
+            id=str(message_id),
+            content=content,
+            author=MessageAuthor(
+                id=self.bot_user_id or "",
+                username=self.bot_username or "bot",
+            ),
+            channel_id=channel_id,
+            timestamp=datetime.now(),
+            platform="telegram",
+        )
+
     async def answer_inline_query(
         self,
         inline_query_id: str,
@@ -804,6 +883,9 @@ class _TelegramAPIClient:
             "chat": {"id": message.chat.id},
         }
 
+    async def edit_message_text(self, **kwargs) -> Any:
+        return await self._bot.edit_message_text(**kwargs)
+
     async def answer_inline_query(self, **kwargs) -> bool:
         return await self._bot.answer_inline_query(**kwargs)
 
@@ -830,6 +912,13 @@ class _MockTelegramClient:
             "chat": {"id": kwargs.get("chat_id")},
         }
 
+    async def edit_message_text(self, **kwargs) -> Dict[str, Any]:
+        return {
+            "message_id": kwargs.get("message_id"),
+            "text": kwargs.get("text", ""),
+            "chat": {"id": kwargs.get("chat_id")},
+        }
+
     async def answer_inline_query(self, **kwargs) -> bool:
         return True
 
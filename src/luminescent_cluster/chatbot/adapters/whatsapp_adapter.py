@@ -43,6 +43,7 @@ from luminescent_cluster.chatbot.adapters.base import (
     MessageAuthor,
 )
 from luminescent_cluster.chatbot.gateway import GatewayRequest
+from luminescent_cluster.chatbot.http_pool import SharedClientSession
 
 logger = logging.getLogger(__name__)
 
@@ -326,6 +327,9 @@ class WhatsAppAdapter:
         self._connection_state = ConnectionState.DISCONNECTED
         self._api_client = None
 
+        # One keep-alive session shared by verification and all sends
+        self._http_session = SharedClientSession()
+
         # Track 24-hour windows per user
         self._conversation_windows: Dict[str, datetime] = {}
 
@@ -369,27 +373,27 @@ class WhatsAppAdapter:
     async def _verify_api_access(self) -> None:
         """Verify API access by fetching phone number info."""
         try:
-            import aiohttp
+            session = await self._http_session.get()
 
             url = f"https://graph.facebook.com/{self.config.api_version}/{self.config.phone_number_id}"
             headers = {"Authorization": f"Bearer {self.config.access_token}"}
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers) as response:
-                    if response.status != 200:
-                        raise Exception(f"API verification failed: {response.status}")
+            async with session.get(url, headers=headers) as response:
+                if response.status != 200:
+                    raise Exception(f"API verification failed: {response.status}")
 
-                    data = await response.json()
-                    logger.info(f"Verified phone number: {data.get('display_phone_number')}")
+                data = await response.json()
+                logger.info(f"Verified phone number: {data.get('display_phone_number')}")
 
-            self._api_client = _WhatsAppAPIClient(self.config)
+            self._api_client = _WhatsAppAPIClient(self.config, self._http_session)
 
         except ImportError:
             logger.warning("aiohttp not installed, using mock client")
             self._api_client = _MockWhatsAppClient()
 
     async def disconnect(self) -> None:
-        """Disconnect from WhatsApp."""
+        """Disconnect from WhatsApp and release pooled connections."""
+        await self._http_session.close()
         self._connection_state = ConnectionState.DISCONNECTED
         logger.info("Disconnected from WhatsApp")
 
@@ -850,8 +854,9 @@ class WhatsAppAdapter:
 class _WhatsAppAPIClient:
     """WhatsApp Cloud API client."""
 
-    def __init__(self, config: WhatsAppConfig):
+    def __init__(self, config: WhatsAppConfig, http_session: SharedClientSession):
         self.config = config
+        self._http_session = http_session
         self.base_url = f"https://graph.facebook.com/{config.api_version}"
 
     async def send_message(
@@ -861,8 +866,6 @@ class _WhatsAppAPIClient:
         preview_url: bool = False,
     ) -> Dict[str, Any]:
         """Send text message."""
-        import aiohttp
-
         url = f"{self.base_url}/{self.config.phone_number_id}/messages"
         headers = {
             "Authorization": f"Bearer {self.config.access_token}",
@@ -879,9 +882,9 @@ class _WhatsAppAPIClient:
             },
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, headers=headers, json=payload) as response:
-                return await response.json()
+        session = await self._http_session.get()
+        async with session.post(url, headers=headers, json=payload) as response:
+            return await response.json()
 
     async def send_interactive(
         self,
@@ -889,8 +892,6 @@ class _WhatsAppAPIClient:
         interactive: Dict[str, Any],
     ) -> Dict[str, Any]:
         """Send interactive message."""
-        import aiohttp
-
         url = f"{self.base_url}/{self.config.phone_number_id}/messages"
         headers = {
             "Authorization": f"Bearer {self.config.access_token}",
@@ -904,9 +905,9 @@ class _WhatsAppAPIClient:
             "interactive": interactive,
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, headers=headers, json=payload) as response:
-                return await response.json()
+        session = await self._http_session.get()
+        async with session.post(url, headers=headers, json=payload) as response:
+            return await response.json()
 
     async def send_template(
         self,
@@ -914,8 +915,6 @@ class _WhatsAppAPIClient:
         template: Dict[str, Any],
     ) -> Dict[str, Any]:
         """Send template message."""
-        import aiohttp
-
         url = f"{self.base_url}/{self.config.phone_number_id}/messages"
         headers = {
             "Authorization": f"Bearer {self.config.access_token}",
@@ -929,9 +928,9 @@ class _WhatsAppAPIClient:
             "template": template,
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, headers=headers, json=payload) as response:
-                return await response.json()
+        session = await self._http_session.get()
+        async with session.post(url, headers=headers, json=payload) as response:
+            return await response.json()
 
     async def send_media(
         self,
@@ -943,8 +942,6 @@ class _WhatsAppAPIClient:
         filename: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Send media message."""
-        import aiohttp
-
         url = f"{self.base_url}/{self.config.phone_number_id}/messages"
         headers = {
             "Authorization": f"Bearer {self.config.access_token}",
@@ -970,21 +967,19 @@ class _WhatsAppAPIClient:
             media_type: media_content,
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, headers=headers, json=payload) as response:
-                return await response.json()
+        session = await self._http_session.get()
+        async with session.post(url, headers=headers, json=payload) as response:
+            return await response.json()
 
     async def get_media_url(self, media_id: str) -> str:
         """Get media download URL."""
-        import aiohttp
-
         url = f"{self.base_url}/{media_id}"
         headers = {"Authorization": f"Bearer {self.config.access_token}"}
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers) as response:
-                data = await response.json()
-                return data.get("url", "")
+        session = await self._http_session.get()
+        async with session.get(url, headers=headers) as response:
+            data = await response.json()
+            return data.get("url", "")
 
 
 # =============================================================================
@@ -19,6 +19,8 @@ Manages conversation context for chat threads with:
 - 10 message sliding window (configurable)
 - 2000 token limit (configurable)
 - 24 hour TTL expiration (configurable)
+- Optional write-behind persistence (batched multi-row upserts)
+- Bounded LRU hot cache with heap-based expiry and negative caching
 
 Design (from ADR-006):
 - Bounded context to control LLM costs
@@ -28,15 +30,46 @@ Design (from ADR-006):
 Version: 1.0.0
 """
 
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Optional, Dict, List, Any, Protocol, runtime_checkable
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Protocol,
+    Tuple,
+    runtime_checkable,
+)
+import heapq
 import threading
 import asyncio
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
+# Counts tokens in a message body
+Tokenizer = Callable[[str], int]
+
+
+def approximate_tokens(text: str) -> int:
+    """
+    Default tokenizer, shared with the memory blocks' HistoryCompressor.
+
+    Args:
+        text: Text to count tokens for
+
+    Returns:
+        Approximate token count
+    """
+    from luminescent_cluster.memory.blocks.compressor import estimate_tokens
+
+    return estimate_tokens(text)
+
 
 @dataclass
 class ContextConfig:
@@ -48,12 +81,42 @@ class ContextConfig:
         max_tokens: Maximum tokens per context (default 2000)
         ttl_hours: Hours before context expires (default 24)
         persistence_ttl_days: Days to retain persisted contexts (default 90)
+        write_behind: Persist dirty threads from a background task instead
+            of flushing on every add_message_async (default False)
+        flush_interval_seconds: Write-behind flush interval (default 1.0)
+        flush_batch_size: Dirty threads that trigger an early flush and the
+            maximum rows per upsert (default 100)
+        max_pending_threads: Dirty threads allowed before add_message_async
+            waits for the writer to catch up (default 1000)
+        backpressure_timeout_seconds: Longest add_message_async waits for
+            the writer before going ahead anyway (default 30.0)
+        backpressure_max_failures: Consecutive failed writes after which
+            add_message_async stops waiting until a write succeeds (default 3)
+        max_cached_threads: Thread contexts kept in memory; the least
+            recently used clean context is evicted beyond this (default 10000)
+        max_cached_chars: Optional bound on the total message characters
+            held in memory (default None, unbounded)
+        negative_cache_ttl_seconds: Seconds a thread known to be absent
+            from the store is not looked up again (default 2, 0 disables).
+            Another replica sharing the store may create the thread in this
+            window, so keep it short.
+        negative_cache_max_entries: Absent threads remembered (default 10000)
     """
 
     max_messages: int = 10
     max_tokens: int = 2000
     ttl_hours: int = 24
     persistence_ttl_days: int = 90
+    write_behind: bool = False
+    flush_interval_seconds: float = 1.0
+    flush_batch_size: int = 100
+    max_pending_threads: int = 1000
+    backpressure_timeout_seconds: float = 30.0
+    backpressure_max_failures: int = 3
+    max_cached_threads: int = 10000
+    max_cached_chars: Optional[int] = None
+    negative_cache_ttl_seconds: float = 2.0
+    negative_cache_max_entries: int = 10000
 
 
 @dataclass
@@ -83,19 +146,67 @@ class ThreadContext:
     """
     Context for a conversation thread.
 
+    Messages are kept in a deque with running token and character totals,
+    so trimming the window is O(1) per message. Mutate them through
+    append() and popleft() to keep the totals and the formatted cache
+    in sync.
+
     Attributes:
         thread_id: Unique thread identifier
         channel_id: Channel where thread exists
         created_at: When context was created
         last_activity: Last activity timestamp
-        messages: List of context messages
+        messages: Context messages, oldest first
+        token_total: Sum of message token counts
+        char_total: Sum of message content lengths
+        lock: Guards this context's messages (per-thread lock)
     """
 
     thread_id: str
     channel_id: str
     created_at: datetime
     last_activity: datetime = field(default_factory=datetime.now)
-    messages: List[ContextMessage] = field(default_factory=list)
+    messages: Deque[ContextMessage] = field(default_factory=deque)
+    token_total: int = field(default=0, init=False, compare=False)
+    char_total: int = field(default=0, init=False, compare=False)
+    lock: threading.RLock = field(
+        default_factory=threading.RLock, repr=False, compare=False
+    )
+    _formatted: Optional[List[Dict[str, str]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.messages, deque):
+            self.messages = deque(self.messages)
+        self.token_total = sum(m.token_count or 0 for m in self.messages)
+        self.char_total = sum(len(m.content) for m in self.messages)
+
+    def append(self, message: ContextMessage) -> None:
+        """Add a message at the newest end."""
+        self.messages.append(message)
+        self.token_total += message.token_count or 0
+        self.char_total += len(message.content)
+        self._formatted = None
+
+    def popleft(self) -> ContextMessage:
+        """Remove and return the oldest message."""
+        message = self.messages.popleft()
+        self.token_total -= message.token_count or 0
+        self.char_total -= len(message.content)
+        self._formatted = None
+        return message
+
+    def formatted(self) -> List[Dict[str, str]]:
+        """
+        Return the messages as LLM message dicts.
+
+        The list is cached until the next append() or popleft(); callers
+        get their own copy of the list but must not mutate the dicts.
+        """
+        if self._formatted is None:
+            self._formatted = [{"role": m.role, "content": m.content} for m in self.messages]
+        return list(self._formatted)
 
 
 # =============================================================================
@@ -221,37 +332,55 @@ class PixeltableContextStore:
 
         return self._available
 
+    @staticmethod
+    def _to_row(thread_id: str, context_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert serialized context to a table row."""
+        # Convert ISO strings to datetime for Pixeltable
+        created_at = datetime.fromisoformat(
+            context_data.get("created_at", datetime.now().isoformat())
+        )
+        last_activity = datetime.fromisoformat(
+            context_data.get("last_activity", datetime.now().isoformat())
+        )
+
+        return {
+            "thread_id": thread_id,
+            "channel_id": context_data.get("channel_id", ""),
+            "created_at": created_at,
+            "last_activity": last_activity,
+            "messages": context_data.get("messages", []),
+            "metadata": context_data.get("metadata", {}),
+        }
+
     async def save(self, thread_id: str, context_data: Dict[str, Any]) -> None:
         """Save context to Pixeltable."""
         if not self._ensure_table():
             return
 
         try:
-            import pixeltable as pxt
-
-            # Convert ISO strings to datetime for Pixeltable
-            created_at = datetime.fromisoformat(
-                context_data.get("created_at", datetime.now().isoformat())
-            )
-            last_activity = datetime.fromisoformat(
-                context_data.get("last_activity", datetime.now().isoformat())
-            )
-
-            row = {
-                "thread_id": thread_id,
-                "channel_id": context_data.get("channel_id", ""),
-                "created_at": created_at,
-                "last_activity": last_activity,
-                "messages": context_data.get("messages", []),
-                "metadata": context_data.get("metadata", {}),
-            }
-
             # Use upsert for idempotent saves
-            self._table.upsert([row])
+            self._table.upsert([self._to_row(thread_id, context_data)])
             logger.debug(f"Saved context for thread {thread_id}")
         except Exception as e:
             logger.warning(f"Failed to save context for {thread_id}: {e}")
 
+    async def save_many(self, contexts: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Save several contexts in one multi-row upsert.
+
+        Args:
+            contexts: Mapping of thread_id to serialized context data
+
+        Raises:
+            Exception: If the upsert fails, so callers can retry the batch
+        """
+        if not contexts or not self._ensure_table():
+            return
+
+        rows = [self._to_row(tid, data) for tid, data in contexts.items()]
+        await asyncio.to_thread(self._table.upsert, rows)
+        logger.debug(f"Saved {len(rows)} contexts")
+
     async def load(self, thread_id: str) -> Optional[Dict[str, Any]]:
         """Load context from Pixeltable."""
         if not self._ensure_table():
@@ -310,6 +439,282 @@ class PixeltableContextStore:
             return 0
 
 
+async def save_contexts(store: ContextStore, contexts: Dict[str, Dict[str, Any]]) -> None:
+    """
+    Persist several contexts, batched when the store supports it.
+
+    Uses the store's optional ``save_many`` (one multi-row write) and falls
+    back to one ``save`` per thread.
+
+    Args:
+        store: Context store
+        contexts: Mapping of thread_id to serialized context data
+    """
+    save_many = getattr(store, "save_many", None)
+    if save_many is not None:
+        await save_many(contexts)
+        return
+
+    for thread_id, data in contexts.items():
+        await store.save(thread_id, data)
+
+
+class WriteBehindPersister:
+    """
+    Background writer that coalesces dirty threads into batched saves.
+
+    Threads are marked dirty as messages arrive; a background task writes
+    the latest snapshot of every dirty thread once per flush interval, or
+    sooner when flush_batch_size threads are waiting. Repeated changes to
+    one thread between flushes cost a single row write.
+
+    The dirty set is bounded by max_pending_threads: wait_for_capacity()
+    blocks producers until the writer drains it, for at most
+    capacity_timeout_seconds, and not at all while the store has failed
+    max_failed_batches times in a row. Failed batches are put back and
+    retried on the next cycle with the snapshots already taken, so a
+    thread evicted from memory in the meantime is still written. stop()
+    writes everything that is still pending before returning.
+    """
+
+    def __init__(
+        self,
+        store: ContextStore,
+        snapshot: Callable[[str], Dict[str, Any]],
+        flush_interval_seconds: float = 1.0,
+        flush_batch_size: int = 100,
+        max_pending_threads: int = 1000,
+        capacity_timeout_seconds: float = 30.0,
+        max_failed_batches: int = 3,
+    ):
+        """
+        Initialize the persister.
+
+        Args:
+            store: Context store to write to
+            snapshot: Returns the current serialized context for a thread
+                ({} if the thread no longer exists)
+            flush_interval_seconds: Maximum delay before a dirty thread is written
+            flush_batch_size: Dirty threads that trigger an early flush; also
+                the maximum rows per write
+            max_pending_threads: Dirty threads allowed before producers wait
+            capacity_timeout_seconds: Longest a producer waits for capacity
+            max_failed_batches: Consecutive failed batches after which
+                producers stop waiting until a batch succeeds again
+        """
+        self.store = store
+        self._snapshot = snapshot
+        self.flush_interval_seconds = flush_interval_seconds
+        self.flush_batch_size = max(1, flush_batch_size)
+        self.max_pending_threads = max(1, max_pending_threads)
+        self.capacity_timeout_seconds = capacity_timeout_seconds
+        self.max_failed_batches = max(1, max_failed_batches)
+
+        self._lock = threading.Lock()
+        self._dirty: Dict[str, None] = {}  # insertion-ordered set
+        # Snapshots of threads whose write failed, reused if the thread
+        # has left memory by the time it is retried
+        self._unsaved: Dict[str, Dict[str, Any]] = {}
+        self._consecutive_failures = 0
+        self._write_lock = asyncio.Lock()
+        self._wake = asyncio.Event()
+        self._has_capacity = asyncio.Event()
+        self._has_capacity.set()
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self.batches_written = 0
+        self.rows_written = 0
+        self.failed_batches = 0
+
+    @property
+    def running(self) -> bool:
+        """Return True while the background task is active."""
+        return self._task is not None and not self._task.done()
+
+    @property
+    def pending(self) -> int:
+        """Return the number of dirty threads awaiting a write."""
+        with self._lock:
+            return len(self._dirty)
+
+    def mark_dirty(self, thread_id: str) -> None:
+        """
+        Mark a thread as needing a write. Safe to call from any thread.
+
+        Args:
+            thread_id: Thread identifier
+        """
+        with self._lock:
+            self._dirty[thread_id] = None
+            size = len(self._dirty)
+
+        if size >= self.flush_batch_size or size >= self.max_pending_threads:
+            self._signal(self._wake.set)
+        if size >= self.max_pending_threads:
+            self._signal(self._has_capacity.clear)
+
+    def is_dirty(self, thread_id: str) -> bool:
+        """Return True if the thread has a write pending."""
+        with self._lock:
+            return thread_id in self._dirty
+
+    def discard(self, thread_id: str) -> None:
+        """Forget a pending write (e.g. the thread was deleted)."""
+        with self._lock:
+            self._dirty.pop(thread_id, None)
+            self._unsaved.pop(thread_id, None)
+
+    def _signal(self, callback: Callable[[], None]) -> None:
+        """Run an asyncio.Event operation on the persister's loop."""
+        loop = self._loop
+        if loop is None:
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            callback()
+        else:
+            loop.call_soon_threadsafe(callback)
+
+    async def wait_for_capacity(self) -> None:
+        """
+        Block while the dirty set is full (backpressure).
+
+        Returns after capacity_timeout_seconds even if the set is still
+        full, and immediately while the store keeps failing.
+        """
+        deadline = time.monotonic() + self.capacity_timeout_seconds
+        while (
+            self.running
+            and self.pending >= self.max_pending_threads
+            and self._consecutive_failures < self.max_failed_batches
+        ):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.warning("Write-behind queue still full, continuing without waiting")
+                return
+            self._has_capacity.clear()
+            self._wake.set()
+            try:
+                await asyncio.wait_for(self._has_capacity.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                pass
+
+    async def start(self) -> None:
+        """Start the background writer on the current event loop."""
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background writer and durably flush pending threads."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        await self.flush()
+        self._has_capacity.set()
+
+    async def flush(self) -> None:
+        """
+        Write every pending thread now.
+
+        Stops early if a batch fails, leaving the remaining threads pending
+        for a later retry.
+        """
+        while self.pending:
+            if not await self._write_batch():
+                break
+
+    async def _run(self) -> None:
+        """Background loop: write on interval or when the batch fills up."""
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.flush_interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+            deadline = time.monotonic() + self.flush_interval_seconds
+            while self.pending and time.monotonic() < deadline:
+                if not await self._write_batch():
+                    break
+
+    async def _write_batch(self) -> bool:
+        """
+        Write up to flush_batch_size dirty threads in one store call.
+
+        Returns:
+            True if the batch was written (or empty), False on failure
+        """
+        async with self._write_lock:
+            with self._lock:
+                thread_ids = list(self._dirty)[: self.flush_batch_size]
+                for tid in thread_ids:
+                    del self._dirty[tid]
+
+            if not thread_ids:
+                return True
+
+            contexts = {}
+            for tid in thread_ids:
+                data = self._snapshot(tid)
+                if not data:
+                    with self._lock:
+                        data = self._unsaved.get(tid)
+                if data:
+                    contexts[tid] = data
+
+            try:
+                if contexts:
+                    await save_contexts(self.store, contexts)
+            except asyncio.CancelledError:
+                self._requeue(thread_ids, contexts)
+                raise
+            except Exception as e:
+                logger.warning(f"Write-behind flush of {len(contexts)} contexts failed: {e}")
+                self.failed_batches += 1
+                self._consecutive_failures += 1
+                self._requeue(thread_ids, contexts)
+                # Waiting producers retry the write, and stop waiting once
+                # max_failed_batches is reached
+                self._has_capacity.set()
+                return False
+
+            self._consecutive_failures = 0
+            with self._lock:
+                for tid in thread_ids:
+                    self._unsaved.pop(tid, None)
+            self.batches_written += 1
+            self.rows_written += len(contexts)
+            if self.pending < self.max_pending_threads:
+                self._has_capacity.set()
+            return True
+
+    def _requeue(self, thread_ids: List[str], contexts: Dict[str, Dict[str, Any]]) -> None:
+        """Mark an unwritten batch dirty again, keeping its snapshots."""
+        with self._lock:
+            self._unsaved.update(contexts)
+            for tid in thread_ids:
+                self._dirty.setdefault(tid, None)
+
+    def stats(self) -> Dict[str, int]:
+        """Return writer counters."""
+        return {
+            "pending": self.pending,
+            "batches_written": self.batches_written,
+            "rows_written": self.rows_written,
+            "failed_batches": self.failed_batches,
+        }
+
+
 class ThreadContextManager:
     """
     Manages conversation context for chat threads.
@@ -318,7 +723,9 @@ class ThreadContextManager:
     - Sliding window message limit (default 10)
     - Token-based limit (default 2000)
     - TTL-based expiration (default 24h)
-    - Thread-safe operations
+    - Thread-safe operations with per-thread locks
+    - Bounded LRU hot cache (threads and characters) with heap-based expiry
+    - Negative caching of threads absent from the store
     - Optional persistent storage via ContextStore
 
     Example:
@@ -334,22 +741,65 @@ class ThreadContextManager:
         store = PixeltableContextStore()
         manager = ThreadContextManager(context_store=store)
         # Contexts will be persisted to Pixeltable
+
+    With write-behind persistence:
+        manager = ThreadContextManager(
+            ContextConfig(write_behind=True), context_store=store
+        )
+        await manager.start()
+        ...
+        await manager.close()  # flushes everything still pending
     """
 
     def __init__(
         self,
         config: Optional[ContextConfig] = None,
         context_store: Optional[ContextStore] = None,
+        tokenizer: Optional[Tokenizer] = None,
     ):
-        """Initialize context manager with configuration."""
+        """
+        Initialize context manager with configuration.
+
+        Args:
+            config: Context limits and cache settings
+            context_store: Optional persistent storage
+            tokenizer: Counts tokens for messages added without a
+                token_count (defaults to approximate_tokens)
+        """
         self.config = config or ContextConfig()
         self.context_store = context_store
+        self.tokenizer: Tokenizer = tokenizer or approximate_tokens
+
+        # The global lock only guards the cache structures below; message
+        # lists are guarded by each ThreadContext's own lock.
         self._lock = threading.RLock()
-        self._contexts: Dict[str, ThreadContext] = {}
+        self._contexts: "OrderedDict[str, ThreadContext]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self._cached_chars = 0
+        self.evictions = 0
+
+        # Min-heap of (expiry time, thread_id); stale entries are skipped lazily
+        self._expiry_heap: List[Tuple[datetime, str]] = []
+
+        # Threads known to be absent from the store: thread_id -> monotonic expiry
+        self._absent: "OrderedDict[str, float]" = OrderedDict()
 
         # Pending saves for batch flush
         self._pending_saves: set[str] = set()
 
+        # Background writer (only with write_behind and a store)
+        self.persister: Optional[WriteBehindPersister] = None
+        if self.context_store and self.config.write_behind:
+            self.persister = WriteBehindPersister(
+                self.context_store,
+                self.to_dict,
+                flush_interval_seconds=self.config.flush_interval_seconds,
+                flush_batch_size=self.config.flush_batch_size,
+                max_pending_threads=self.config.max_pending_threads,
+                capacity_timeout_seconds=self.config.backpressure_timeout_seconds,
+                max_failed_batches=self.config.backpressure_max_failures,
+            )
+
         # Time offset for testing
         self._time_offset_hours: float = 0.0
 
@@ -361,6 +811,124 @@ class ThreadContextManager:
         """Advance time for testing purposes."""
         self._time_offset_hours += hours
 
+    # =========================================================================
+    # Hot cache bookkeeping (callers hold self._lock)
+    # =========================================================================
+
+    def _expiry_of(self, ctx: ThreadContext) -> datetime:
+        """Return the time at which a context expires."""
+        return ctx.last_activity + timedelta(hours=self.config.ttl_hours)
+
+    @staticmethod
+    def _size_of(ctx: ThreadContext) -> int:
+        """Approximate memory footprint of a context in message characters."""
+        return ctx.char_total
+
+    def _schedule_expiry(self, thread_id: str, ctx: ThreadContext) -> None:
+        """Push the context's current expiry onto the expiry heap."""
+        heapq.heappush(self._expiry_heap, (self._expiry_of(ctx), thread_id))
+        # Superseded entries accumulate as threads stay active; compact them
+        if len(self._expiry_heap) > 2 * len(self._contexts) + 64:
+            self._expiry_heap = [
+                (self._expiry_of(c), tid) for tid, c in self._contexts.items()
+            ]
+            heapq.heapify(self._expiry_heap)
+
+    def _set_size(self, thread_id: str, size: int) -> None:
+        """Update the tracked size of a cached context."""
+        self._cached_chars += size - self._sizes.get(thread_id, 0)
+        self._sizes[thread_id] = size
+
+    def _insert(self, thread_id: str, ctx: ThreadContext) -> None:
+        """Add a context as most recently used and enforce cache bounds."""
+        self._contexts[thread_id] = ctx
+        self._contexts.move_to_end(thread_id)
+        self._set_size(thread_id, self._size_of(ctx))
+        self._schedule_expiry(thread_id, ctx)
+        self._evict_over_capacity(protect=thread_id)
+
+    def _remove(self, thread_id: str) -> None:
+        """Drop a context from the cache (its heap entries go stale)."""
+        if self._contexts.pop(thread_id, None) is not None:
+            self._cached_chars -= self._sizes.pop(thread_id, 0)
+
+    def _is_dirty(self, thread_id: str) -> bool:
+        """Return True if the context has changes not yet persisted."""
+        if thread_id in self._pending_saves:
+            return True
+        return self.persister is not None and self.persister.is_dirty(thread_id)
+
+    def _over_capacity(self) -> bool:
+        """Return True if the cache exceeds its thread or size bound."""
+        if len(self._contexts) > self.config.max_cached_threads:
+            return True
+        limit = self.config.max_cached_chars
+        return limit is not None and self._cached_chars > limit
+
+    def _evict_over_capacity(self, protect: Optional[str] = None) -> None:
+        """
+        Evict least recently used contexts until the cache is within bounds.
+
+        Contexts with unpersisted changes are skipped so eviction never
+        loses data; if every candidate is dirty the bound is exceeded
+        until the next flush.
+        """
+        while self._over_capacity():
+            victim = next(
+                (
+                    tid
+                    for tid in self._contexts
+                    if tid != protect and not self._is_dirty(tid)
+                ),
+                None,
+            )
+            if victim is None:
+                return
+            self._remove(victim)
+            self.evictions += 1
+
+    def _is_known_absent(self, thread_id: str) -> bool:
+        """Return True if a recent store lookup found no such thread."""
+        with self._lock:
+            expires_at = self._absent.get(thread_id)
+            if expires_at is None:
+                return False
+            if time.monotonic() >= expires_at:
+                del self._absent[thread_id]
+                return False
+            return True
+
+    def _remember_absent(self, thread_id: str) -> None:
+        """Record a store miss in the negative cache."""
+        ttl = self.config.negative_cache_ttl_seconds
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._absent[thread_id] = time.monotonic() + ttl
+            self._absent.move_to_end(thread_id)
+            while len(self._absent) > self.config.negative_cache_max_entries:
+                self._absent.popitem(last=False)
+
+    def cache_stats(self) -> Dict[str, int]:
+        """
+        Get hot cache statistics.
+
+        Returns:
+            Dict with cached threads, cached characters, evictions and
+            negatively cached thread count
+        """
+        with self._lock:
+            return {
+                "threads": len(self._contexts),
+                "chars": self._cached_chars,
+                "evictions": self.evictions,
+                "known_absent": len(self._absent),
+            }
+
+    # =========================================================================
+    # Context Operations
+    # =========================================================================
+
     def get_or_create(self, thread_id: str, channel_id: str) -> ThreadContext:
         """
         Get existing context or create new one.
@@ -374,21 +942,23 @@ class ThreadContextManager:
         """
         with self._lock:
             # Check if context exists and is not expired
-            if thread_id in self._contexts:
-                if self.is_expired(thread_id):
-                    # Remove expired context
-                    del self._contexts[thread_id]
-                else:
-                    return self._contexts[thread_id]
+            ctx = self._contexts.get(thread_id)
+            if ctx is not None:
+                if self._current_time() <= self._expiry_of(ctx):
+                    self._contexts.move_to_end(thread_id)
+                    return ctx
+                # Remove expired context
+                self._remove(thread_id)
 
             # Create new context
+            now = self._current_time()
             ctx = ThreadContext(
                 thread_id=thread_id,
                 channel_id=channel_id,
-                created_at=self._current_time(),
-                last_activity=self._current_time(),
+                created_at=now,
+                last_activity=now,
             )
-            self._contexts[thread_id] = ctx
+            self._insert(thread_id, ctx)
             return ctx
 
     def add_message(
@@ -408,53 +978,70 @@ class ThreadContextManager:
             role: Message role (user, assistant, system)
             content: Message content
             message_id: Optional message ID
-            token_count: Optional token count
+            token_count: Optional token count (computed with the
+                tokenizer when omitted)
             metadata: Optional metadata
         """
+        if token_count is None:
+            token_count = self.tokenizer(content)
+
+        now = self._current_time()
+        msg = ContextMessage(
+            role=role,
+            content=content,
+            timestamp=now,
+            message_id=message_id,
+            token_count=token_count,
+            metadata=metadata or {},
+        )
+
         with self._lock:
             # Get or create context (use empty channel_id, will be set on first get_or_create)
-            if thread_id not in self._contexts:
-                self._contexts[thread_id] = ThreadContext(
+            ctx = self._contexts.get(thread_id)
+            if ctx is None:
+                ctx = ThreadContext(
                     thread_id=thread_id,
                     channel_id="",
-                    created_at=self._current_time(),
-                    last_activity=self._current_time(),
+                    created_at=now,
+                    last_activity=now,
                 )
-
-            ctx = self._contexts[thread_id]
-
-            # Create message
-            msg = ContextMessage(
-                role=role,
-                content=content,
-                timestamp=self._current_time(),
-                message_id=message_id,
-                token_count=token_count,
-                metadata=metadata or {},
-            )
-
-            # Add message
-            ctx.messages.append(msg)
-            ctx.last_activity = self._current_time()
-
-            # Enforce limits
+                self._insert(thread_id, ctx)
+            else:
+                self._contexts.move_to_end(thread_id)
+            self._absent.pop(thread_id, None)
+
+        # Mutate under the per-thread lock so other threads are not blocked
+        with ctx.lock:
+            ctx.append(msg)
+            ctx.last_activity = now
             self._enforce_limits(ctx)
+            size = ctx.char_total
 
-            # Mark for pending save
-            if self.context_store:
+        with self._lock:
+            # Re-admit the context if it was evicted while we mutated it
+            if thread_id not in self._contexts:
+                self._contexts[thread_id] = ctx
+            self._set_size(thread_id, size)
+            self._schedule_expiry(thread_id, ctx)
+
+            # Mark for pending save (before eviction, so it is never dropped)
+            if self.persister:
+                self.persister.mark_dirty(thread_id)
+            elif self.context_store:
                 self._pending_saves.add(thread_id)
 
+            self._evict_over_capacity(protect=thread_id)
+
     def _enforce_limits(self, ctx: ThreadContext) -> None:
         """Enforce message and token limits on context."""
         # Enforce message limit
         while len(ctx.messages) > self.config.max_messages:
-            ctx.messages.pop(0)
+            ctx.popleft()
 
-        # Enforce token limit
-        total_tokens = sum(m.token_count or 0 for m in ctx.messages)
-        while total_tokens > self.config.max_tokens and len(ctx.messages) > 0:
-            removed = ctx.messages.pop(0)
-            total_tokens -= removed.token_count or 0
+        # Enforce token limit (running total, no re-summing); the newest
+        # message is always kept, even when it alone exceeds the limit
+        while ctx.token_total > self.config.max_tokens and len(ctx.messages) > 1:
+            ctx.popleft()
 
     def is_expired(self, thread_id: str) -> bool:
         """
@@ -467,25 +1054,37 @@ class ThreadContextManager:
             True if context has expired
         """
         with self._lock:
-            if thread_id not in self._contexts:
+            ctx = self._contexts.get(thread_id)
+            if ctx is None:
                 return True
-
-            ctx = self._contexts[thread_id]
-            expiry_time = ctx.last_activity + timedelta(hours=self.config.ttl_hours)
-            return self._current_time() > expiry_time
+            return self._current_time() > self._expiry_of(ctx)
 
     def cleanup_expired(self) -> int:
         """
         Remove all expired contexts.
 
+        Pops the expiry heap instead of scanning every thread, so the cost
+        is proportional to the number of expired entries.
+
         Returns:
             Number of contexts removed
         """
         with self._lock:
-            expired = [tid for tid in self._contexts.keys() if self.is_expired(tid)]
-            for tid in expired:
-                del self._contexts[tid]
-            return len(expired)
+            now = self._current_time()
+            removed = 0
+            while self._expiry_heap and self._expiry_heap[0][0] < now:
+                _, tid = heapq.heappop(self._expiry_heap)
+                ctx = self._contexts.get(tid)
+                if ctx is None:
+                    continue
+                expires_at = self._expiry_of(ctx)
+                if now > expires_at:
+                    self._remove(tid)
+                    removed += 1
+                else:
+                    # Activity since this entry was pushed; keep it scheduled
+                    heapq.heappush(self._expiry_heap, (expires_at, tid))
+            return removed
 
     def clear(self, thread_id: str) -> None:
         """
@@ -495,8 +1094,7 @@ class ThreadContextManager:
             thread_id: Thread identifier
         """
         with self._lock:
-            if thread_id in self._contexts:
-                del self._contexts[thread_id]
+            self._remove(thread_id)
 
     def format_for_llm(
         self,
@@ -513,18 +1111,19 @@ class ThreadContextManager:
         Returns:
             List of message dicts for LLM
         """
-        with self._lock:
-            messages = []
+        messages = []
 
-            if system_message:
-                messages.append({"role": "system", "content": system_message})
+        if system_message:
+            messages.append({"role": "system", "content": system_message})
 
-            if thread_id in self._contexts:
-                ctx = self._contexts[thread_id]
-                for msg in ctx.messages:
-                    messages.append({"role": msg.role, "content": msg.content})
+        with self._lock:
+            ctx = self._contexts.get(thread_id)
 
-            return messages
+        if ctx is not None:
+            with ctx.lock:
+                messages.extend(ctx.formatted())
+
+        return messages
 
     def to_dict(self, thread_id: str) -> Dict[str, Any]:
         """
@@ -537,10 +1136,11 @@ class ThreadContextManager:
             Dict representation of context
         """
         with self._lock:
-            if thread_id not in self._contexts:
-                return {}
+            ctx = self._contexts.get(thread_id)
+        if ctx is None:
+            return {}
 
-            ctx = self._contexts[thread_id]
+        with ctx.lock:
             return {
                 "thread_id": ctx.thread_id,
                 "channel_id": ctx.channel_id,
@@ -566,26 +1166,32 @@ class ThreadContextManager:
         Args:
             data: Dict representation of context
         """
+        thread_id = data["thread_id"]
+        ctx = ThreadContext(
+            thread_id=thread_id,
+            channel_id=data["channel_id"],
+            created_at=datetime.fromisoformat(data["created_at"]),
+            last_activity=datetime.fromisoformat(data.get("last_activity", data["created_at"])),
+            messages=[
+                ContextMessage(
+                    role=m["role"],
+                    content=m["content"],
+                    timestamp=datetime.fromisoformat(m["timestamp"]),
+                    message_id=m.get("message_id"),
+                    token_count=(
+                        m["token_count"]
+                        if m.get("token_count") is not None
+                        else self.tokenizer(m["content"])
+                    ),
+                    metadata=m.get("metadata", {}),
+                )
+                for m in data.get("messages", [])
+            ],
+        )
         with self._lock:
-            thread_id = data["thread_id"]
-            ctx = ThreadContext(
-                thread_id=thread_id,
-                channel_id=data["channel_id"],
-                created_at=datetime.fromisoformat(data["created_at"]),
-                last_activity=datetime.fromisoformat(data.get("last_activity", data["created_at"])),
-                messages=[
-                    ContextMessage(
-                        role=m["role"],
-                        content=m["content"],
-                        timestamp=datetime.fromisoformat(m["timestamp"]),
-                        message_id=m.get("message_id"),
-                        token_count=m.get("token_count"),
-                        metadata=m.get("metadata", {}),
-                    )
-                    for m in data.get("messages", [])
-                ],
-            )
-            self._contexts[thread_id] = ctx
+            self._remove(thread_id)
+            self._absent.pop(thread_id, None)
+            self._insert(thread_id, ctx)
 
     # =========================================================================
     # Async Methods for Persistence
@@ -601,14 +1207,39 @@ class ThreadContextManager:
         if not self.context_store:
             return
 
+        if self.persister:
+            await self.persister.flush()
+            return
+
         with self._lock:
             pending = list(self._pending_saves)
             self._pending_saves.clear()
 
+        contexts = {}
         for thread_id in pending:
             data = self.to_dict(thread_id)
             if data:
-                await self.context_store.save(thread_id, data)
+                contexts[thread_id] = data
+
+        if contexts:
+            try:
+                await save_contexts(self.context_store, contexts)
+            except Exception as e:
+                logger.warning(f"Failed to persist {len(contexts)} contexts: {e}")
+                with self._lock:
+                    self._pending_saves.update(contexts)
+
+    async def start(self) -> None:
+        """Start the write-behind persister, if configured."""
+        if self.persister:
+            await self.persister.start()
+
+    async def close(self) -> None:
+        """Stop the write-behind persister and flush pending contexts."""
+        if self.persister:
+            await self.persister.stop()
+        else:
+            await self.flush()
 
     async def get_or_create_async(self, thread_id: str, channel_id: str) -> ThreadContext:
         """
@@ -623,20 +1254,23 @@ class ThreadContextManager:
         """
         with self._lock:
             # Check if already in memory
-            if thread_id in self._contexts:
-                if not self.is_expired(thread_id):
-                    return self._contexts[thread_id]
-                else:
-                    del self._contexts[thread_id]
-
-        # Try to load from persistent storage
-        if self.context_store:
+            ctx = self._contexts.get(thread_id)
+            if ctx is not None:
+                if self._current_time() <= self._expiry_of(ctx):
+                    self._contexts.move_to_end(thread_id)
+                    return ctx
+                self._remove(thread_id)
+
+        # Try to load from persistent storage, unless recently found absent
+        if self.context_store and not self._is_known_absent(thread_id):
             data = await self.context_store.load(thread_id)
             if data:
                 self.from_dict(data)
                 with self._lock:
                     if thread_id in self._contexts:
                         return self._contexts[thread_id]
+            else:
+                self._remember_absent(thread_id)
 
         # Create new context
         return self.get_or_create(thread_id, channel_id)
@@ -654,8 +1288,22 @@ class ThreadContextManager:
         Async version of add_message.
 
         Adds message and immediately flushes to persistent storage
-        if a context store is configured.
+        if a context store is configured. With a running write-behind
+        persister the write is deferred to the background task instead,
+        and this call waits only when the pending queue is full.
         """
+        if self.persister and self.persister.running:
+            await self.persister.wait_for_capacity()
+            self.add_message(
+                thread_id=thread_id,
+                role=role,
+                content=content,
+                message_id=message_id,
+                token_count=token_count,
+                metadata=metadata,
+            )
+            return
+
         self.add_message(
             thread_id=thread_id,
             role=role,
@@ -674,5 +1322,8 @@ class ThreadContextManager:
             thread_id: Thread identifier
         """
         self.clear(thread_id)
+        if self.persister:
+            self.persister.discard(thread_id)
         if self.context_store:
             await self.context_store.delete(thread_id)
+            self._remember_absent(thread_id)
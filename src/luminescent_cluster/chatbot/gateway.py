@@ -32,12 +32,24 @@ Version: 1.0.0
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum, auto
-from typing import Optional, List, Any
+from typing import AsyncIterator, Awaitable, Dict, Optional, List, Any, Union
+import asyncio
+import inspect
 import re
 import logging
+import time
 
 from luminescent_cluster.chatbot.adapters.base import ChatMessage
 from luminescent_cluster.chatbot.context import ThreadContextManager, ContextConfig
+from luminescent_cluster.chatbot.llm_provider import LLMCapabilities, LLMResponse
+from luminescent_cluster.chatbot.metrics import ChatMetrics
+from luminescent_cluster.chatbot.response_cache import (
+    CACHE_HIT,
+    CACHE_MISS,
+    LLMResponseCache,
+    ResponseCacheConfig,
+    cache_scope,
+)
 from luminescent_cluster.chatbot.rate_limiter import TokenBucketRateLimiter, RateLimitConfig
 from luminescent_cluster.extensions.registry import ExtensionRegistry
 
@@ -182,6 +194,15 @@ class GatewayConfig:
         enable_context: Enable conversation context
         enable_rate_limiting: Enable rate limiting
         enable_mcp: Enable MCP integration
+        prepare_budget_ms: Latency budget for the concurrent pre-LLM stages,
+            measured from the start of the request
+        mcp_timeout_ms: Timeout for MCP knowledge retrieval
+        context_timeout_ms: Timeout for loading thread context
+        capabilities_timeout_ms: Timeout for model capability detection
+        enable_response_cache: Cache LLM responses and coalesce identical
+            in-flight requests (scoped by channel visibility and workspace)
+        response_cache_ttl_seconds: How long a cached response is reused
+        response_cache_max_entries: Maximum cached responses
     """
 
     default_model: str = "gpt-4o-mini"
@@ -190,6 +211,13 @@ class GatewayConfig:
     enable_context: bool = True
     enable_rate_limiting: bool = True
     enable_mcp: bool = False
+    prepare_budget_ms: int = 2000
+    mcp_timeout_ms: int = 1500
+    context_timeout_ms: int = 1000
+    capabilities_timeout_ms: int = 500
+    enable_response_cache: bool = False
+    response_cache_ttl_seconds: float = 300.0
+    response_cache_max_entries: int = 1000
 
 
 @dataclass
@@ -238,6 +266,76 @@ class GatewayResponse:
     error: Optional[str] = None
 
 
+@dataclass
+class GatewayStreamChunk:
+    """
+    Incremental update from ChatbotGateway.process_stream.
+
+    Attributes:
+        content: Full (filtered) response text so far
+        done: True for the final chunk
+        response: Final GatewayResponse (only set when done)
+    """
+
+    content: str
+    done: bool = False
+    response: Optional[GatewayResponse] = None
+
+
+@dataclass
+class StageStats:
+    """
+    Running latency and outcome counters for one pipeline stage.
+
+    Attributes:
+        count: Number of times the stage ran
+        total_ms: Sum of stage latencies in milliseconds
+        max_ms: Slowest observed latency in milliseconds
+        timeouts: Runs abandoned because of a timeout or budget
+        errors: Runs that raised an exception
+    """
+
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    timeouts: int = 0
+    errors: int = 0
+
+    def record(self, latency_ms: float, outcome: str = "ok") -> None:
+        """Record one run with outcome "ok", "timeout" or "error"."""
+        self.count += 1
+        self.total_ms += latency_ms
+        self.max_ms = max(self.max_ms, latency_ms)
+        if outcome == "timeout":
+            self.timeouts += 1
+        elif outcome == "error":
+            self.errors += 1
+
+    def to_dict(self) -> Dict[str, float]:
+        """Return a summary suitable for metrics export."""
+        return {
+            "count": self.count,
+            "avg_ms": self.total_ms / self.count if self.count else 0.0,
+            "max_ms": self.max_ms,
+            "timeouts": self.timeouts,
+            "errors": self.errors,
+        }
+
+
+@dataclass
+class _PreparedRequest:
+    """Request state that passed pre-LLM checks."""
+
+    content: str
+    thread_id: str
+    messages: List[dict[str, str]]
+    registry: ExtensionRegistry
+    is_public_channel: bool = True
+    max_tokens: Optional[int] = None
+    supports_streaming: bool = True
+    stage_latency_ms: Dict[str, float] = field(default_factory=dict)
+
+
 # =============================================================================
 # ChatbotGateway Implementation
 # =============================================================================
@@ -265,6 +363,8 @@ class ChatbotGateway:
         )
         response = await gateway.process(request)
         print(response.content)
+
+        await gateway.close()  # on shutdown: closes the LLM provider's pool
     """
 
     def __init__(
@@ -288,6 +388,11 @@ class ChatbotGateway:
         self.rate_limiter: Optional[TokenBucketRateLimiter] = None
         self.mcp_client = None
         self.mcp_enabled = self.config.enable_mcp
+        self.metrics: Optional[ChatMetrics] = None
+        self.response_cache: Optional[LLMResponseCache] = None
+
+        # Per-stage latency/timeout counters (see get_stage_metrics)
+        self._stage_stats: Dict[str, StageStats] = {}
 
         # Initialize context manager if enabled
         if self.config.enable_context:
@@ -297,6 +402,39 @@ class ChatbotGateway:
         if self.config.enable_rate_limiting:
             self.rate_limiter = TokenBucketRateLimiter()
 
+        # Initialize response cache if enabled
+        if self.config.enable_response_cache:
+            self.response_cache = LLMResponseCache(
+                ResponseCacheConfig(
+                    ttl_seconds=self.config.response_cache_ttl_seconds,
+                    max_entries=self.config.response_cache_max_entries,
+                )
+            )
+
+    async def close(self) -> None:
+        """
+        Release resources held by the gateway's components.
+
+        Closes the LLM provider (and with it any HTTP connection pool it
+        created) and flushes pending thread-context writes. Call once on
+        shutdown, or use the gateway as an async context manager.
+        """
+        close = getattr(self.llm_provider, "close", None)
+        if close is not None:
+            result = close()
+            if inspect.isawaitable(result):
+                await result
+        if self.context_manager is not None:
+            await self.context_manager.close()
+
+    async def __aenter__(self) -> "ChatbotGateway":
+        """Use the gateway for the duration of an async with block."""
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Close the gateway's components."""
+        await self.close()
+
     async def process(self, request: GatewayRequest) -> Optional[GatewayResponse]:
         """
         Process an incoming chat message.
@@ -307,10 +445,245 @@ class ChatbotGateway:
         Returns:
             GatewayResponse if bot should respond, None otherwise
         """
-        import time
+        start_time = time.time()
+
+        prepared = await self._prepare(request, start_time)
+        if not isinstance(prepared, _PreparedRequest):
+            return prepared
+        return await self._respond(request, prepared, start_time)
+
+    async def _respond(
+        self, request: GatewayRequest, prepared: "_PreparedRequest", start_time: float
+    ) -> GatewayResponse:
+        """Call the LLM without streaming and build the final response."""
+        try:
+            llm_start = time.perf_counter()
+            try:
+                llm_response, cache_outcome = await self._call_llm(request, prepared)
+            except Exception:
+                self._record_stage(prepared, "llm", llm_start, "error")
+                raise
+            self._record_stage(prepared, "llm", llm_start)
+            return self._finish(request, prepared, llm_response, cache_outcome, start_time)
+
+        except Exception as e:
+            logger.error(f"LLM request failed: {e}")
+            return GatewayResponse(
+                content="I'm sorry, I encountered an error processing your request.",
+                tokens_used=0,
+                error=str(e),
+            )
+
+    def _finish(
+        self,
+        request: GatewayRequest,
+        prepared: "_PreparedRequest",
+        llm_response: Any,
+        cache_outcome: Optional[str],
+        start_time: float,
+    ) -> GatewayResponse:
+        """Record a completed LLM response and build the filtered reply."""
+        # Only the request that actually reached the LLM is billed
+        tokens_used = llm_response.tokens_used if cache_outcome in (None, CACHE_MISS) else 0
+
+        latency_ms = self._complete(
+            request,
+            prepared,
+            response_content=llm_response.content,
+            tokens_used=tokens_used,
+            model=llm_response.model,
+            start_time=start_time,
+        )
+
+        # Apply response filtering if configured (ADR-007)
+        response_content = self._filter_response(prepared, llm_response.content)
+
+        metadata: dict[str, Any] = {"stage_latency_ms": prepared.stage_latency_ms}
+        if cache_outcome is not None:
+            metadata["cache"] = cache_outcome
 
+        return GatewayResponse(
+            content=response_content,
+            tokens_used=tokens_used,
+            model=llm_response.model,
+            latency_ms=latency_ms,
+            metadata=metadata,
+        )
+
+    async def process_stream(self, request: GatewayRequest) -> AsyncIterator[GatewayStreamChunk]:
+        """
+        Process an incoming chat message, streaming the response.
+
+        Runs the same checks as process(), then yields the response as it
+        is generated. Each chunk carries the full filtered text so far, so
+        adapters can edit a single message in place. Text after the last
+        whitespace is held back until the word completes, so the response
+        filter never sees (or lets through) a half-written token.
+
+        A response cache hit is sent as a single final chunk; on a miss the
+        finished text is cached under the same key process() uses. If the
+        provider has no chat_stream() or reports that the model cannot
+        stream, the response comes from process()'s path as a single final
+        chunk.
+
+        Args:
+            request: The gateway request
+
+        Yields:
+            GatewayStreamChunk snapshots; the last one has done=True and
+            carries the final GatewayResponse. Nothing is yielded if the
+            bot should not respond.
+        """
         start_time = time.time()
 
+        prepared = await self._prepare(request, start_time)
+        if prepared is None:
+            return
+        if isinstance(prepared, GatewayResponse):
+            yield GatewayStreamChunk(content=prepared.content, done=True, response=prepared)
+            return
+
+        chat_stream = getattr(self.llm_provider, "chat_stream", None)
+        if chat_stream is None or not prepared.supports_streaming:
+            response = await self._respond(request, prepared, start_time)
+            yield GatewayStreamChunk(content=response.content, done=True, response=response)
+            return
+
+        cache_key = self._cache_key(request, prepared)
+        if cache_key is not None:
+            cached = self.response_cache.get(cache_key)
+            if self.metrics:
+                self.metrics.record_cache_lookup(CACHE_HIT if cached is not None else CACHE_MISS)
+            if cached is not None:
+                response = self._finish(request, prepared, cached, CACHE_HIT, start_time)
+                yield GatewayStreamChunk(content=response.content, done=True, response=response)
+                return
+
+        parts: List[str] = []
+        tokens_used = 0
+        model = None
+        finish_reason = None
+        emitted = ""
+
+        llm_start = time.perf_counter()
+        first_chunk = True
+
+        stream = chat_stream(messages=prepared.messages, max_tokens=prepared.max_tokens)
+        try:
+            async for chunk in stream:
+                if first_chunk:
+                    self._record_stage(prepared, "llm_first_chunk", llm_start)
+                    first_chunk = False
+                if chunk.model:
+                    model = chunk.model
+                if chunk.usage:
+                    tokens_used = chunk.usage.get("total_tokens", tokens_used)
+                if chunk.finish_reason:
+                    finish_reason = chunk.finish_reason
+                if not chunk.content:
+                    continue
+
+                parts.append(chunk.content)
+                text = "".join(parts)
+                boundary = max(text.rfind(" "), text.rfind("\n"))
+                if boundary <= 0:
+                    continue
+
+                filtered = self._filter_response(prepared, text[:boundary])
+                if filtered != emitted:
+                    emitted = filtered
+                    yield GatewayStreamChunk(content=filtered)
+
+        except Exception as e:
+            self._record_stage(prepared, "llm", llm_start, "error")
+            logger.error(f"LLM stream failed: {e}")
+            response = GatewayResponse(
+                content="I'm sorry, I encountered an error processing your request.",
+                tokens_used=0,
+                error=str(e),
+            )
+            yield GatewayStreamChunk(content=response.content, done=True, response=response)
+            return
+        finally:
+            # Stop the provider stream promptly if our consumer stops early
+            aclose = getattr(stream, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+        self._record_stage(prepared, "llm", llm_start)
+
+        llm_response = LLMResponse(
+            content="".join(parts),
+            model=model or self.config.default_model,
+            tokens_used=tokens_used,
+            finish_reason=finish_reason or "stop",
+        )
+        cache_outcome = None
+        if cache_key is not None:
+            self.response_cache.put(cache_key, llm_response)
+            cache_outcome = CACHE_MISS
+
+        response = self._finish(request, prepared, llm_response, cache_outcome, start_time)
+        yield GatewayStreamChunk(content=response.content, done=True, response=response)
+
+    async def reply(self, request: GatewayRequest, adapter: Any) -> Optional[GatewayResponse]:
+        """
+        Process a request and deliver the reply through a platform adapter.
+
+        Adapters with send_message_stream() (Discord, Slack, Telegram) get
+        the reply as one progressively edited message fed by
+        process_stream(); others (WhatsApp) get a single send_message()
+        once process() finishes.
+
+        Args:
+            request: The gateway request
+            adapter: Platform adapter the request arrived on
+
+        Returns:
+            The final GatewayResponse, or None if the bot stayed silent
+        """
+        message = request.message
+        send_stream = getattr(adapter, "send_message_stream", None)
+        if send_stream is None:
+            response = await self.process(request)
+            if response is not None and response.content:
+                await adapter.send_message(
+                    message.channel_id, response.content, reply_to=message.id
+                )
+            return response
+
+        final: List[GatewayResponse] = []
+
+        async def updates() -> AsyncIterator[str]:
+            async for chunk in self.process_stream(request):
+                if chunk.done:
+                    final.append(chunk.response)
+                yield chunk.content
+
+        await send_stream(message.channel_id, updates(), reply_to=message.id)
+        return final[0] if final else None
+
+    async def _prepare(
+        self, request: GatewayRequest, start_time: float
+    ) -> Union["_PreparedRequest", GatewayResponse, None]:
+        """
+        Run pre-LLM checks and build the prompt.
+
+        The cheap checks (invocation, access control, rate limits) run
+        first and in order. Once they pass, thread-context loading, MCP
+        retrieval and capability detection run concurrently, each bounded
+        by its own timeout and by what is left of prepare_budget_ms. A
+        stage that misses its deadline is dropped: the LLM call goes ahead
+        without its contribution.
+
+        Args:
+            request: The gateway request
+            start_time: time.time() when processing started
+
+        Returns:
+            _PreparedRequest to continue with, a GatewayResponse to return
+            immediately (denied or rate limited), or None to stay silent.
+        """
         message = request.message
 
         # Check if we should respond
@@ -362,104 +735,277 @@ class ChatbotGateway:
         # Get thread ID for context
         thread_id = request.thread_id or message.thread_id or message.id
 
-        # Build message list for LLM
-        messages = self._build_messages(
+        prepared = _PreparedRequest(
+            content=content,
+            thread_id=thread_id,
+            messages=[],
+            registry=registry,
+            is_public_channel=not message.is_direct_message,
+            max_tokens=self.config.max_response_tokens,
+        )
+        prepared.stage_latency_ms["checks"] = (time.time() - start_time) * 1000
+
+        # Run the independent stages concurrently within the latency budget
+        remaining_s = max(
+            0.0, self.config.prepare_budget_ms / 1000 - (time.time() - start_time)
+        )
+        stages: Dict[str, Awaitable[Any]] = {}
+        timeouts: Dict[str, float] = {}
+
+        if self.context_manager and self.config.enable_context:
+            stages["context"] = self._load_context(thread_id, message.channel_id)
+            timeouts["context"] = self.config.context_timeout_ms / 1000
+
+        if self.mcp_enabled and request.use_mcp and self.mcp_client:
+            stages["mcp"] = self.mcp_client.query(content)
+            timeouts["mcp"] = self.config.mcp_timeout_ms / 1000
+
+        if self.llm_provider is not None and hasattr(self.llm_provider, "get_capabilities"):
+            stages["capabilities"] = self.llm_provider.get_capabilities()
+            timeouts["capabilities"] = self.config.capabilities_timeout_ms / 1000
+
+        names = list(stages)
+        results = await asyncio.gather(
+            *(
+                self._run_stage(prepared, name, stages[name], min(timeouts[name], remaining_s))
+                for name in names
+            )
+        )
+        outcome = dict(zip(names, results))
+
+        # Build message list for LLM. A context stage that missed its
+        # deadline yields None, so the in-memory history is used instead
+        prepared.messages = self._build_messages(
             content=content,
             thread_id=thread_id,
             channel_id=message.channel_id,
             system_prompt=request.system_prompt,
+            context_messages=outcome.get("context"),
         )
 
-        # Query MCP if enabled and requested
-        if self.mcp_enabled and request.use_mcp and self.mcp_client:
-            try:
-                mcp_results = await self.mcp_client.query(content)
-                if mcp_results and mcp_results.get("results"):
-                    # Add MCP context to messages
-                    mcp_context = self._format_mcp_context(mcp_results)
-                    messages = self._inject_mcp_context(messages, mcp_context)
-            except Exception as e:
-                logger.warning(f"MCP query failed: {e}")
+        mcp_results = outcome.get("mcp")
+        if mcp_results and mcp_results.get("results"):
+            # Add MCP context to messages
+            mcp_context = self._format_mcp_context(mcp_results)
+            prepared.messages = self._inject_mcp_context(prepared.messages, mcp_context)
 
-        # Call LLM
-        try:
-            llm_response = await self.llm_provider.chat(
-                messages=messages,
-                max_tokens=self.config.max_response_tokens,
+        capabilities = outcome.get("capabilities")
+        if isinstance(capabilities, LLMCapabilities):
+            prepared.max_tokens = min(prepared.max_tokens, capabilities.max_output_tokens)
+            prepared.supports_streaming = capabilities.supports_streaming
+
+        return prepared
+
+    async def _call_llm(
+        self, request: GatewayRequest, prepared: "_PreparedRequest"
+    ) -> tuple[Any, Optional[str]]:
+        """
+        Call the LLM, through the response cache when enabled.
+
+        Args:
+            request: The gateway request
+            prepared: Result of _prepare()
+
+        Returns:
+            Tuple of (LLM response, cache outcome or None if uncached)
+        """
+
+        def call() -> Awaitable[Any]:
+            return self.llm_provider.chat(
+                messages=prepared.messages,
+                max_tokens=prepared.max_tokens,
             )
 
-            # Record usage
-            if self.rate_limiter:
-                self.rate_limiter.record(
-                    user_id=message.author.id,
-                    tokens_used=llm_response.tokens_used,
-                    channel_id=message.channel_id,
-                    workspace_id=request.workspace_id,
-                )
+        key = self._cache_key(request, prepared)
+        if key is None:
+            return await call(), None
 
-            # Update context with both user message and response
-            if self.context_manager and self.config.enable_context:
-                self.context_manager.add_message(
-                    thread_id=thread_id,
-                    role="user",
-                    content=content,
-                    message_id=message.id,
-                )
-                self.context_manager.add_message(
-                    thread_id=thread_id,
-                    role="assistant",
-                    content=llm_response.content,
-                )
+        response, outcome = await self.response_cache.get_or_compute(key, call)
+        if self.metrics:
+            self.metrics.record_cache_lookup(outcome)
+        return response, outcome
 
-            latency_ms = (time.time() - start_time) * 1000
-
-            # Track usage for billing/quotas if configured (ADR-007)
-            if registry.usage_tracker:
-                try:
-                    registry.usage_tracker.track(
-                        operation="chatbot_response",
-                        tokens=llm_response.tokens_used,
-                        metadata={
-                            "user_id": message.author.id,
-                            "workspace_id": request.workspace_id or "",
-                            "channel_id": message.channel_id,
-                            "platform": request.platform,
-                            "model": str(llm_response.model) if llm_response.model else "",
-                            "latency_ms": latency_ms,
-                        },
-                    )
-                except Exception as e:
-                    logger.warning(f"Usage tracking failed: {e}")
-                    # Don't fail the request due to tracking errors
-
-            # Apply response filtering if configured (ADR-007)
-            response_content = llm_response.content
-            if registry.response_filter:
-                try:
-                    is_public_channel = not message.is_direct_message
-                    response_content = registry.response_filter.filter_response(
-                        query=content,
-                        response=llm_response.content,
-                        is_public_channel=is_public_channel,
-                    )
-                except Exception as e:
-                    logger.warning(f"Response filter failed, using original: {e}")
-                    # Fall back to original response on filter failure
+    def _cache_key(self, request: GatewayRequest, prepared: "_PreparedRequest") -> Optional[str]:
+        """Return the response cache key for a request, or None if caching is off."""
+        if self.response_cache is None:
+            return None
 
-            return GatewayResponse(
+        message = request.message
+        scope = cache_scope(
+            is_public_channel=prepared.is_public_channel,
+            workspace_id=request.workspace_id,
+            channel_id=message.channel_id,
+            user_id=message.author.id,
+        )
+        return self.response_cache.make_key(
+            scope,
+            prepared.messages,
+            model=self.config.default_model,
+            max_tokens=prepared.max_tokens,
+        )
+
+    async def _load_context(self, thread_id: str, channel_id: str) -> List[dict[str, str]]:
+        """Load thread history, from persistent storage if configured."""
+        if self.context_manager.context_store:
+            await self.context_manager.get_or_create_async(thread_id, channel_id)
+        return self.context_manager.format_for_llm(thread_id)
+
+    async def _run_stage(
+        self,
+        prepared: "_PreparedRequest",
+        name: str,
+        awaitable: Awaitable[Any],
+        timeout_s: float,
+    ) -> Any:
+        """
+        Await one pipeline stage with a timeout, recording its latency.
+
+        Args:
+            prepared: Request state; receives the stage latency
+            name: Stage name used in metrics
+            awaitable: Stage coroutine
+            timeout_s: Seconds before the stage is abandoned
+
+        Returns:
+            Stage result, or None if it timed out or failed
+        """
+        started = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(awaitable, timeout=timeout_s)
+        except asyncio.TimeoutError:
+            logger.warning(f"Gateway stage '{name}' exceeded {timeout_s * 1000:.0f}ms, skipping")
+            self._record_stage(prepared, name, started, "timeout")
+            return None
+        except Exception as e:
+            if name == "mcp":
+                logger.warning(f"MCP query failed: {e}")
+            else:
+                logger.warning(f"Gateway stage '{name}' failed: {e}")
+            self._record_stage(prepared, name, started, "error")
+            return None
+
+        self._record_stage(prepared, name, started)
+        return result
+
+    def _record_stage(
+        self,
+        prepared: "_PreparedRequest",
+        name: str,
+        started: float,
+        outcome: str = "ok",
+    ) -> None:
+        """Record a stage latency (from a perf_counter start) and outcome."""
+        latency_ms = (time.perf_counter() - started) * 1000
+        prepared.stage_latency_ms[name] = latency_ms
+        self._stage_stats.setdefault(name, StageStats()).record(latency_ms, outcome)
+
+    def get_stage_metrics(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get per-stage latency and timeout counters.
+
+        Returns:
+            Mapping of stage name (checks, context, mcp, capabilities,
+            llm, llm_first_chunk) to StageStats.to_dict()
+        """
+        return {name: stats.to_dict() for name, stats in self._stage_stats.items()}
+
+    def _complete(
+        self,
+        request: GatewayRequest,
+        prepared: "_PreparedRequest",
+        response_content: str,
+        tokens_used: int,
+        model: Optional[str],
+        start_time: float,
+    ) -> float:
+        """
+        Record usage and context for a completed LLM response.
+
+        Args:
+            request: The gateway request
+            prepared: Result of _prepare()
+            response_content: Unfiltered LLM response text
+            tokens_used: Total tokens used
+            model: Model that generated the response
+            start_time: time.time() when processing started
+
+        Returns:
+            Processing latency in milliseconds
+        """
+        message = request.message
+        registry = prepared.registry
+
+        # Record usage
+        if self.rate_limiter:
+            self.rate_limiter.record(
+                user_id=message.author.id,
+                tokens_used=tokens_used,
+                channel_id=message.channel_id,
+                workspace_id=request.workspace_id,
+            )
+
+        # Update context with both user message and response
+        if self.context_manager and self.config.enable_context:
+            self.context_manager.add_message(
+                thread_id=prepared.thread_id,
+                role="user",
+                content=prepared.content,
+                message_id=message.id,
+            )
+            self.context_manager.add_message(
+                thread_id=prepared.thread_id,
+                role="assistant",
                 content=response_content,
-                tokens_used=llm_response.tokens_used,
-                model=llm_response.model,
-                latency_ms=latency_ms,
             )
 
-        except Exception as e:
-            logger.error(f"LLM request failed: {e}")
-            return GatewayResponse(
-                content="I'm sorry, I encountered an error processing your request.",
-                tokens_used=0,
-                error=str(e),
+        latency_ms = (time.time() - start_time) * 1000
+
+        # Track usage for billing/quotas if configured (ADR-007)
+        if registry.usage_tracker:
+            try:
+                registry.usage_tracker.track(
+                    operation="chatbot_response",
+                    tokens=tokens_used,
+                    metadata={
+                        "user_id": message.author.id,
+                        "workspace_id": request.workspace_id or "",
+                        "channel_id": message.channel_id,
+                        "platform": request.platform,
+                        "model": str(model) if model else "",
+                        "latency_ms": latency_ms,
+                    },
+                )
+            except Exception as e:
+                logger.warning(f"Usage tracking failed: {e}")
+                # Don't fail the request due to tracking errors
+
+        return latency_ms
+
+    def _filter_response(self, prepared: "_PreparedRequest", response: str) -> str:
+        """
+        Apply the registered response filter (ADR-007), if any.
+
+        Args:
+            prepared: Result of _prepare()
+            response: LLM response text (complete or partial)
+
+        Returns:
+            Filtered text, or the original text if the filter fails
+        """
+        registry = prepared.registry
+        if not registry.response_filter:
+            return response
+
+        try:
+            return registry.response_filter.filter_response(
+                query=prepared.content,
+                response=response,
+                is_public_channel=prepared.is_public_channel,
             )
+        except Exception as e:
+            logger.warning(f"Response filter failed, using original: {e}")
+            # Fall back to original response on filter failure
+            return response
 
     def _build_messages(
         self,
@@ -467,6 +1013,7 @@ class ChatbotGateway:
         thread_id: str,
         channel_id: str,
         system_prompt: Optional[str] = None,
+        context_messages: Optional[List[dict[str, str]]] = None,
     ) -> List[dict[str, str]]:
         """
         Build message list for LLM call.
@@ -476,6 +1023,8 @@ class ChatbotGateway:
             thread_id: Thread ID for context
             channel_id: Channel ID
             system_prompt: Optional system prompt override
+            context_messages: Pre-loaded thread history; read from the
+                context manager when omitted
 
         Returns:
             List of message dicts for LLM
@@ -488,9 +1037,10 @@ class ChatbotGateway:
             messages.append({"role": "system", "content": prompt})
 
         # Add conversation context if available
-        if self.context_manager and self.config.enable_context:
-            context_messages = self.context_manager.format_for_llm(thread_id)
+        if context_messages is not None:
             messages.extend(context_messages)
+        elif self.context_manager and self.config.enable_context:
+            messages.extend(self.context_manager.format_for_llm(thread_id))
 
         # Add current user message
         messages.append({"role": "user", "content": content})
@@ -0,0 +1,194 @@
+# Copyright 2024-2025 Amiable Development
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Pooled HTTP clients for the chatbot layer.
+
+Opening a fresh client per request pays TCP and TLS setup on every call.
+This module keeps long-lived, keep-alive clients that are created lazily
+and closed explicitly when their owner shuts down:
+
+- HTTPClientPool: one ``httpx.AsyncClient`` per base URL (HTTP/2 when the
+  ``h2`` package is installed), used by LLMProvider.
+- SharedClientSession: one ``aiohttp.ClientSession`` per owner, used by
+  the platform adapters that talk to webhook/REST endpoints.
+
+Both are safe to share between coroutines on the same event loop.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+import asyncio
+import importlib.util
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def http2_available() -> bool:
+    """Return True if httpx can negotiate HTTP/2 (requires ``h2``)."""
+    return importlib.util.find_spec("h2") is not None
+
+
+@dataclass
+class HTTPPoolConfig:
+    """
+    Connection pool limits.
+
+    Attributes:
+        max_connections: Maximum concurrent connections per client
+        max_keepalive_connections: Idle connections kept open per client
+        keepalive_expiry: Seconds an idle connection is kept alive
+        http2: Use HTTP/2 when available (ignored if ``h2`` is missing)
+    """
+
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    http2: bool = True
+
+
+class HTTPClientPool:
+    """
+    Lazily created ``httpx.AsyncClient`` instances keyed by base URL.
+
+    Requests to the same base URL reuse one client and therefore one
+    connection pool. Per-request timeouts are passed at call time, so
+    callers with different timeouts still share connections.
+
+    Example:
+        pool = HTTPClientPool()
+        client = await pool.get_client("https://api.openai.com/v1")
+        response = await client.post("/chat/completions", json=payload)
+        ...
+        await pool.aclose()
+    """
+
+    def __init__(self, config: Optional[HTTPPoolConfig] = None):
+        """
+        Initialize the pool.
+
+        Args:
+            config: Pool limits (defaults to HTTPPoolConfig())
+        """
+        self.config = config or HTTPPoolConfig()
+        self._clients: Dict[str, Any] = {}
+        self._lock = asyncio.Lock()
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        """Return True once aclose() has been called."""
+        return self._closed
+
+    def __len__(self) -> int:
+        """Return the number of open clients."""
+        return len(self._clients)
+
+    async def get_client(self, base_url: str) -> Any:
+        """
+        Get (or create) the client for a base URL.
+
+        Args:
+            base_url: Base URL the client is bound to
+
+        Returns:
+            Shared ``httpx.AsyncClient``
+
+        Raises:
+            RuntimeError: If the pool has been closed
+        """
+        if self._closed:
+            raise RuntimeError("HTTPClientPool is closed")
+
+        key = base_url.rstrip("/")
+        client = self._clients.get(key)
+        if client is not None and not client.is_closed:
+            return client
+
+        async with self._lock:
+            client = self._clients.get(key)
+            if client is None or client.is_closed:
+                client = self._create_client(key)
+                self._clients[key] = client
+            return client
+
+    def _create_client(self, base_url: str) -> Any:
+        """Create a keep-alive client for base_url."""
+        import httpx
+
+        limits = httpx.Limits(
+            max_connections=self.config.max_connections,
+            max_keepalive_connections=self.config.max_keepalive_connections,
+            keepalive_expiry=self.config.keepalive_expiry,
+        )
+        http2 = self.config.http2 and http2_available()
+        logger.debug(f"Opening HTTP client for {base_url} (http2={http2})")
+        return httpx.AsyncClient(base_url=base_url, limits=limits, http2=http2)
+
+    async def aclose(self) -> None:
+        """Close every client. The pool cannot be reused afterwards."""
+        self._closed = True
+        clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"Error closing HTTP client: {e}")
+
+
+class SharedClientSession:
+    """
+    A single lazily created ``aiohttp.ClientSession`` with a bounded connector.
+
+    aiohttp pools connections per host inside one session, so a single
+    session per owner gives keep-alive reuse across all of its endpoints.
+    A closed session is transparently replaced on the next call.
+    """
+
+    def __init__(self, config: Optional[HTTPPoolConfig] = None):
+        """
+        Initialize the holder.
+
+        Args:
+            config: Pool limits (defaults to HTTPPoolConfig())
+        """
+        self.config = config or HTTPPoolConfig()
+        self._session: Optional[Any] = None
+
+    async def get(self) -> Any:
+        """
+        Get (or create) the shared session.
+
+        Returns:
+            Shared ``aiohttp.ClientSession``
+        """
+        if self._session is None or self._session.closed is True:
+            import aiohttp
+
+            connector = aiohttp.TCPConnector(
+                limit=self.config.max_connections,
+                keepalive_timeout=self.config.keepalive_expiry,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def close(self) -> None:
+        """Close the session if one is open."""
+        session, self._session = self._session, None
+        if session is not None:
+            try:
+                await session.close()
+            except Exception as e:
+                logger.warning(f"Error closing HTTP session: {e}")
@@ -30,11 +30,14 @@ Version: 1.0.0
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum, auto
-from typing import Optional, Any
+from typing import AsyncIterator, Optional, Any
+import json
 import time
 import asyncio
 import logging
 
+from luminescent_cluster.chatbot.http_pool import HTTPClientPool, HTTPPoolConfig
+
 logger = logging.getLogger(__name__)
 
 
@@ -149,6 +152,10 @@ class LLMConfig:
         circuit_breaker_enabled: Enable circuit breaker pattern
         circuit_breaker_threshold: Failures before opening circuit
         circuit_breaker_timeout: Recovery timeout in seconds
+        http_max_connections: Maximum pooled connections to the API
+        http_max_keepalive_connections: Idle connections kept open
+        http_keepalive_expiry: Seconds an idle connection is kept alive
+        http2: Use HTTP/2 when the ``h2`` package is installed
     """
 
     provider: str
@@ -161,6 +168,10 @@ class LLMConfig:
     circuit_breaker_enabled: bool = True
     circuit_breaker_threshold: int = 5
     circuit_breaker_timeout: float = 30.0
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry: float = 30.0
+    http2: bool = True
 
     def __post_init__(self):
         """Set provider-specific defaults."""
@@ -194,6 +205,43 @@ class LLMResponse:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass
+class LLMStreamChunk:
+    """
+    One incremental piece of a streamed completion.
+
+    Attributes:
+        content: Text delta carried by this chunk (may be empty)
+        model: Model that generated the response (if reported)
+        finish_reason: Why generation stopped (final chunk only)
+        usage: Token usage dict (final chunk only, if the API reports it)
+    """
+
+    content: str
+    model: Optional[str] = None
+    finish_reason: Optional[str] = None
+    usage: Optional[dict[str, Any]] = None
+
+
+def parse_sse_line(line: str) -> Optional[dict]:
+    """
+    Parse one line of an OpenAI-style server-sent event stream.
+
+    Args:
+        line: Raw line from the response body
+
+    Returns:
+        Decoded JSON payload, or None for blank lines, comments, non-data
+        fields and the terminating ``[DONE]`` marker.
+    """
+    if not line.startswith("data:"):
+        return None
+    data = line[5:].strip()
+    if not data or data == "[DONE]":
+        return None
+    return json.loads(data)
+
+
 @dataclass
 class LLMCapabilities:
     """
@@ -303,6 +351,7 @@ class LLMProvider:
         - Automatic capability detection
         - Circuit breaker for fault tolerance
         - Request/response normalization
+        - Pooled keep-alive HTTP connections (call close() on shutdown)
 
     Example:
         config = LLMConfig(
@@ -318,16 +367,30 @@ class LLMProvider:
         print(response.content)
     """
 
-    def __init__(self, config: LLMConfig):
+    def __init__(self, config: LLMConfig, http_pool: Optional[HTTPClientPool] = None):
         """
         Initialize LLM provider.
 
         Args:
             config: LLM configuration
+            http_pool: Shared HTTP client pool. If omitted, the provider
+                creates and owns its own pool, closed by close().
         """
         self.config = config
         self._capabilities_cache: Optional[LLMCapabilities] = None
 
+        self._owns_http_pool = http_pool is None
+        if http_pool is None:
+            http_pool = HTTPClientPool(
+                HTTPPoolConfig(
+                    max_connections=config.http_max_connections,
+                    max_keepalive_connections=config.http_max_keepalive_connections,
+                    keepalive_expiry=config.http_keepalive_expiry,
+                    http2=config.http2,
+                )
+            )
+        self.http_pool = http_pool
+
         # Initialize circuit breaker if enabled
         if config.circuit_breaker_enabled:
             self.circuit_breaker = CircuitBreaker(
@@ -419,20 +482,129 @@ class LLMProvider:
         Returns:
             Raw API response dict
         """
-        # In production, this would use httpx or aiohttp
-        # For now, this is a placeholder that tests can mock
-        import httpx
-
         headers = {"Content-Type": "application/json"}
         if self.config.api_key:
             headers["Authorization"] = f"Bearer {self.config.api_key}"
 
-        url = f"{self.config.base_url}/chat/completions"
+        client = await self.http_pool.get_client(self.config.base_url)
+        response = await client.post(
+            "chat/completions", json=kwargs, headers=headers, timeout=self.config.timeout
+        )
+        response.raise_for_status()
+        return response.json()
+
+    async def chat_stream(
+        self,
+        messages: list[dict[str, str]],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs,
+    ) -> AsyncIterator[LLMStreamChunk]:
+        """
+        Send a streaming chat completion request.
+
+        Yields chunks as the API produces them, so the first tokens can be
+        shown before generation finishes. The circuit breaker records the
+        outcome once the stream is fully consumed, fails, or is closed
+        early by the consumer (recorded as a success).
+
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+            temperature: Override config temperature
+            max_tokens: Override config max_tokens
+            **kwargs: Additional provider-specific parameters
+
+        Yields:
+            LLMStreamChunk for each delta; the last carries finish_reason
+            and usage when the API reports them
 
-        async with httpx.AsyncClient(timeout=self.config.timeout) as client:
-            response = await client.post(url, json=kwargs, headers=headers)
+        Raises:
+            Exception: If circuit breaker is open or request fails
+        """
+        if self.circuit_breaker and not self.circuit_breaker.allow_request():
+            raise Exception("Circuit breaker open: LLM service unavailable")
+
+        request_params = {
+            "messages": messages,
+            "model": self.config.model,
+            "temperature": temperature or self.config.temperature,
+            "stream": True,
+            "stream_options": {"include_usage": True},
+        }
+
+        if max_tokens or self.config.max_tokens:
+            request_params["max_tokens"] = max_tokens or self.config.max_tokens
+
+        request_params.update(kwargs)
+
+        failed = False
+        events = self._make_stream_request(**request_params)
+        try:
+            async for event in events:
+                choices = event.get("choices") or [{}]
+                choice = choices[0]
+                yield LLMStreamChunk(
+                    content=(choice.get("delta") or {}).get("content") or "",
+                    model=event.get("model"),
+                    finish_reason=choice.get("finish_reason"),
+                    usage=event.get("usage"),
+                )
+
+        except Exception:
+            failed = True
+            raise
+
+        finally:
+            # Also runs when the consumer stops iterating early; the API
+            # was answering, so that counts as a success
+            await events.aclose()
+            if self.circuit_breaker:
+                if failed:
+                    self.circuit_breaker.record_failure()
+                else:
+                    self.circuit_breaker.record_success()
+
+    async def _make_stream_request(self, **kwargs) -> AsyncIterator[dict]:
+        """
+        Make a streaming HTTP request to the LLM API.
+
+        Args:
+            **kwargs: Request parameters (including ``stream=True``)
+
+        Yields:
+            Decoded SSE event payloads
+        """
+        headers = {"Content-Type": "application/json", "Accept": "text/event-stream"}
+        if self.config.api_key:
+            headers["Authorization"] = f"Bearer {self.config.api_key}"
+
+        client = await self.http_pool.get_client(self.config.base_url)
+        async with client.stream(
+            "POST", "chat/completions", json=kwargs, headers=headers, timeout=self.config.timeout
+        ) as response:
             response.raise_for_status()
-            return response.json()
+            async for line in response.aiter_lines():
+                event = parse_sse_line(line)
+                if event is not None:
+                    yield event
+
+    async def close(self) -> None:
+        """
+        Release pooled HTTP connections.
+
+        Only closes the pool if this provider created it; a pool passed in
+        by the caller is left for the caller to close.
+        """
+        if self._owns_http_pool:
+            await self.http_pool.aclose()
+
+    async def __aenter__(self) -> "LLMProvider":
+        """Use the provider for the duration of an async with block."""
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Release pooled HTTP connections."""
+        await self.close()
 
     async def get_capabilities(self) -> LLMCapabilities:
         """
@@ -490,14 +662,10 @@ class LLMProvider:
         Returns:
             Model info dict
         """
-        import httpx
-
-        url = f"{self.config.base_url}/api/show"
-
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(url, json={"name": self.config.model})
-            response.raise_for_status()
-            return response.json()
+        client = await self.http_pool.get_client(self.config.base_url)
+        response = await client.post("api/show", json={"name": self.config.model}, timeout=10.0)
+        response.raise_for_status()
+        return response.json()
 
     async def list_models(self) -> list[str]:
         """
@@ -518,12 +686,8 @@ class LLMProvider:
         if self.config.provider != "ollama":
             raise NotImplementedError("list_models only supported for Ollama")
 
-        import httpx
-
-        url = f"{self.config.base_url}/api/tags"
-
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(url)
-            response.raise_for_status()
-            data = response.json()
-            return [m["name"] for m in data.get("models", [])]
+        client = await self.http_pool.get_client(self.config.base_url)
+        response = await client.get("api/tags", timeout=10.0)
+        response.raise_for_status()
+        data = response.json()
+        return [m["name"] for m in data.get("models", [])]
@@ -20,6 +20,7 @@ Provides observability metrics for chatbot operations including:
 - Memory retrieval relevance
 - Token usage
 - Error rates by provider
+- LLM response cache hits, misses and coalesced requests
 - Degraded status detection
 
 Design (from ADR-006):
@@ -27,15 +28,21 @@ Design (from ADR-006):
 - Calculate memory_relevance as memory_hits / tokens_used
 - Detect degraded status based on latency and error thresholds
 
+All aggregates are fixed-memory streaming structures (log-linear latency
+histograms, running totals, sliding-window counters), so memory and the
+cost of stats, health checks and export() do not grow with traffic.
+Only the most recent raw records are retained for inspection.
+
 Version: 1.0.0
 """
 
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, Dict, List, Any
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 import threading
-import statistics
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -91,12 +98,194 @@ class ErrorMetric:
     timestamp: datetime = field(default_factory=datetime.now)
 
 
+class LatencyHistogram:
+    """
+    Fixed-memory log-linear latency histogram (HDR-style).
+
+    Values below ``2 ** precision_bits`` are counted exactly; larger
+    values fall into buckets whose width is at most ``2 / 2 **
+    precision_bits`` of their value (about 3% with the default 6 bits).
+    Histograms with the same precision can be merged.
+
+    Example:
+        hist = LatencyHistogram()
+        hist.record(120)
+        hist.percentile(95)
+    """
+
+    __slots__ = ("precision_bits", "_sub_buckets", "_counts", "count", "total", "min", "max")
+
+    def __init__(self, precision_bits: int = 6):
+        """
+        Initialize an empty histogram.
+
+        Args:
+            precision_bits: log2 of the number of exact low-value buckets
+        """
+        self.precision_bits = precision_bits
+        self._sub_buckets = 1 << precision_bits
+        self._counts: List[int] = []
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+
+    def _index(self, value: int) -> int:
+        """Return the bucket index for a non-negative value."""
+        if value < self._sub_buckets:
+            return value
+        exponent = value.bit_length() - self.precision_bits
+        half = self._sub_buckets >> 1
+        return self._sub_buckets + (exponent - 1) * half + (value >> exponent) - half
+
+    def _bounds(self, index: int) -> Tuple[int, int]:
+        """Return the inclusive (low, high) values covered by a bucket."""
+        if index < self._sub_buckets:
+            return index, index
+        half = self._sub_buckets >> 1
+        exponent, offset = divmod(index - self._sub_buckets, half)
+        exponent += 1
+        low = (half + offset) << exponent
+        return low, low + (1 << exponent) - 1
+
+    def record(self, value: int) -> None:
+        """
+        Record a value.
+
+        Args:
+            value: Latency in milliseconds (negative values count as 0)
+        """
+        value = max(0, int(value))
+        index = self._index(value)
+        if index >= len(self._counts):
+            self._counts.extend([0] * (index + 1 - len(self._counts)))
+        self._counts[index] += 1
+
+        if self.count == 0 or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.count += 1
+        self.total += value
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """
+        Add another histogram's counts into this one.
+
+        Args:
+            other: Histogram with the same precision_bits
+
+        Raises:
+            ValueError: If the precisions differ
+        """
+        if other.precision_bits != self.precision_bits:
+            raise ValueError("Cannot merge histograms with different precision")
+        if other.count == 0:
+            return
+        if len(other._counts) > len(self._counts):
+            self._counts.extend([0] * (len(other._counts) - len(self._counts)))
+        for i, c in enumerate(other._counts):
+            self._counts[i] += c
+
+        self.min = other.min if self.count == 0 else min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.count += other.count
+        self.total += other.total
+
+    def percentile(self, percentile: float) -> int:
+        """
+        Estimate a percentile.
+
+        Args:
+            percentile: Percentile between 0 and 100
+
+        Returns:
+            Estimated value (bucket midpoint, clamped to the observed range)
+        """
+        if self.count == 0:
+            return 0
+        rank = max(1, int(round(self.count * percentile / 100)))
+        seen = 0
+        for index, c in enumerate(self._counts):
+            seen += c
+            if seen >= rank:
+                low, high = self._bounds(index)
+                return min(max((low + high) // 2, self.min), self.max)
+        return self.max
+
+    def mean(self) -> int:
+        """Return the integer mean of recorded values."""
+        return self.total // self.count if self.count else 0
+
+
+class SlidingWindowCounter:
+    """
+    Event count over a trailing time window, kept in fixed slots.
+
+    The window is split into ``slots`` equal intervals; counts older than
+    the window are discarded lazily as their slot is reused.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float = 300.0,
+        slots: int = 60,
+        clock: Optional[Callable[[], float]] = None,
+    ):
+        """
+        Initialize the counter.
+
+        Args:
+            window_seconds: Length of the trailing window
+            slots: Number of slots the window is divided into
+            clock: Time source in seconds (defaults to time.monotonic)
+        """
+        self.window_seconds = window_seconds
+        self._slots = max(1, slots)
+        self._slot_width = window_seconds / self._slots
+        self._clock = clock or time.monotonic
+        self._counts = [0] * self._slots
+        self._epochs = [-1] * self._slots
+
+    def add(self, amount: int = 1) -> None:
+        """Count events at the current time."""
+        epoch = int(self._clock() / self._slot_width)
+        i = epoch % self._slots
+        if self._epochs[i] != epoch:
+            self._epochs[i] = epoch
+            self._counts[i] = 0
+        self._counts[i] += amount
+
+    def total(self) -> int:
+        """Return the number of events within the window."""
+        epoch = int(self._clock() / self._slot_width)
+        return sum(
+            c for c, e in zip(self._counts, self._epochs) if 0 <= epoch - e < self._slots
+        )
+
+    def clear(self) -> None:
+        """Forget all counts."""
+        self._counts = [0] * self._slots
+        self._epochs = [-1] * self._slots
+
+
+@dataclass
+class _PlatformStats:
+    """Running aggregates for one platform."""
+
+    queries: int = 0
+    tokens: int = 0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+
 class ChatMetrics:
     """
     Telemetry metrics for chatbot operations.
 
     Tracks query latency, memory relevance, token usage, and error rates.
-    Thread-safe for concurrent access.
+    Thread-safe for concurrent access. Memory use is bounded regardless of
+    traffic: statistics come from streaming aggregates, and only the most
+    recent ``max_recent_records`` raw records are kept.
 
     Example:
         metrics = ChatMetrics()
@@ -118,6 +307,8 @@ class ChatMetrics:
         self,
         degraded_latency_threshold_ms: int = 5000,
         degraded_error_rate_threshold: float = 0.1,
+        error_window_seconds: float = 300.0,
+        max_recent_records: int = 1000,
     ):
         """
         Initialize ChatMetrics.
@@ -125,10 +316,25 @@ class ChatMetrics:
         Args:
             degraded_latency_threshold_ms: Latency threshold for degraded status
             degraded_error_rate_threshold: Error rate threshold for degraded status
+            error_window_seconds: Trailing window for the degraded error rate
+            max_recent_records: Raw query and error records kept for get_metrics()
+                and get_errors()
         """
         self._lock = threading.RLock()
-        self._metrics: List[QueryMetric] = []
-        self._errors: List[ErrorMetric] = []
+        self._metrics: Deque[QueryMetric] = deque(maxlen=max_recent_records)
+        self._errors: Deque[ErrorMetric] = deque(maxlen=max_recent_records)
+        self._cache_lookups: Dict[str, int] = {"hit": 0, "miss": 0, "coalesced": 0}
+
+        self._platforms: Dict[str, _PlatformStats] = {}
+        self._total_queries = 0
+        self._total_tokens = 0
+        self._total_errors = 0
+        self._errors_by_provider: Dict[str, int] = {}
+        self._last_latency_ms: Optional[int] = None
+
+        self.error_window_seconds = error_window_seconds
+        self._recent_queries = SlidingWindowCounter(error_window_seconds)
+        self._recent_errors = SlidingWindowCounter(error_window_seconds)
 
         self.degraded_latency_threshold_ms = degraded_latency_threshold_ms
         self.degraded_error_rate_threshold = degraded_error_rate_threshold
@@ -164,6 +370,16 @@ class ChatMetrics:
 
         with self._lock:
             self._metrics.append(metric)
+            stats = self._platforms.get(platform)
+            if stats is None:
+                stats = self._platforms[platform] = _PlatformStats()
+            stats.queries += 1
+            stats.tokens += tokens_used
+            stats.latency.record(latency_ms)
+            self._total_queries += 1
+            self._total_tokens += tokens_used
+            self._last_latency_ms = latency_ms
+            self._recent_queries.add()
 
         logger.debug(
             f"Recorded query: platform={platform}, latency={latency_ms}ms, "
@@ -192,16 +408,52 @@ class ChatMetrics:
 
         with self._lock:
             self._errors.append(error)
+            self._total_errors += 1
+            self._errors_by_provider[provider] = self._errors_by_provider.get(provider, 0) + 1
+            self._recent_errors.add()
 
         logger.warning(f"Recorded error: platform={platform}, type={error_type}")
 
+    def record_cache_lookup(self, outcome: str) -> None:
+        """
+        Record an LLM response cache lookup.
+
+        Args:
+            outcome: "hit", "miss" or "coalesced" (joined an in-flight request)
+        """
+        with self._lock:
+            self._cache_lookups[outcome] = self._cache_lookups.get(outcome, 0) + 1
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get LLM response cache statistics.
+
+        Returns:
+            Dict with hits, misses, coalesced, lookups and hit_rate, where
+            hit_rate counts both cache hits and coalesced requests as
+            avoided upstream calls
+        """
+        with self._lock:
+            hits = self._cache_lookups.get("hit", 0)
+            misses = self._cache_lookups.get("miss", 0)
+            coalesced = self._cache_lookups.get("coalesced", 0)
+
+        lookups = hits + misses + coalesced
+        return {
+            "hits": hits,
+            "misses": misses,
+            "coalesced": coalesced,
+            "lookups": lookups,
+            "hit_rate": (hits + coalesced) / lookups if lookups else 0.0,
+        }
+
     def get_metrics(self) -> List[QueryMetric]:
-        """Get all recorded query metrics."""
+        """Get the most recent query metrics (up to max_recent_records)."""
         with self._lock:
             return list(self._metrics)
 
     def get_errors(self) -> List[ErrorMetric]:
-        """Get all recorded error metrics."""
+        """Get the most recent error metrics (up to max_recent_records)."""
         with self._lock:
             return list(self._errors)
 
@@ -209,6 +461,8 @@ class ChatMetrics:
         """
         Get latency statistics for a platform.
 
+        Percentiles are estimated from a log-linear histogram (within ~3%).
+
         Args:
             platform: Platform name
 
@@ -216,39 +470,28 @@ class ChatMetrics:
             Dict with count, avg_ms, p50, p95 statistics
         """
         with self._lock:
-            latencies = [m.latency_ms for m in self._metrics if m.platform == platform]
-
-        if not latencies:
-            return {"count": 0, "avg_ms": 0, "p50": 0, "p95": 0}
-
-        latencies_sorted = sorted(latencies)
-        count = len(latencies)
+            stats = self._platforms.get(platform)
+            if stats is None or stats.latency.count == 0:
+                return {"count": 0, "avg_ms": 0, "p50": 0, "p95": 0}
 
-        return {
-            "count": count,
-            "avg_ms": sum(latencies) // count,
-            "p50": self._percentile(latencies_sorted, 50),
-            "p95": self._percentile(latencies_sorted, 95),
-        }
-
-    def _percentile(self, sorted_data: List[int], percentile: int) -> int:
-        """Calculate percentile from sorted data."""
-        if not sorted_data:
-            return 0
-        k = (len(sorted_data) - 1) * (percentile / 100)
-        f = int(k)
-        c = f + 1 if f < len(sorted_data) - 1 else f
-        return int(sorted_data[f] + (sorted_data[c] - sorted_data[f]) * (k - f))
+            latency = stats.latency
+            return {
+                "count": latency.count,
+                "avg_ms": latency.mean(),
+                "p50": latency.percentile(50),
+                "p95": latency.percentile(95),
+            }
 
     def get_total_tokens(self) -> int:
         """Get total tokens used across all queries."""
         with self._lock:
-            return sum(m.tokens_used for m in self._metrics)
+            return self._total_tokens
 
     def get_tokens_by_platform(self, platform: str) -> int:
         """Get tokens used for a specific platform."""
         with self._lock:
-            return sum(m.tokens_used for m in self._metrics if m.platform == platform)
+            stats = self._platforms.get(platform)
+            return stats.tokens if stats else 0
 
     def get_error_rate(self, provider: Optional[str] = None) -> float:
         """
@@ -261,11 +504,11 @@ class ChatMetrics:
             Error rate as float (0.0 to 1.0)
         """
         with self._lock:
-            total_queries = len(self._metrics)
+            total_queries = self._total_queries
             if provider:
-                error_count = sum(1 for e in self._errors if e.provider == provider)
+                error_count = self._errors_by_provider.get(provider, 0)
             else:
-                error_count = len(self._errors)
+                error_count = self._total_errors
 
         total = total_queries + error_count
         if total == 0:
@@ -273,27 +516,38 @@ class ChatMetrics:
 
         return error_count / total
 
+    def get_recent_error_rate(self) -> float:
+        """
+        Get the error rate over the trailing error window.
+
+        Returns:
+            Error rate as float (0.0 to 1.0)
+        """
+        with self._lock:
+            errors = self._recent_errors.total()
+            total = self._recent_queries.total() + errors
+
+        return errors / total if total else 0.0
+
     def is_degraded(self) -> bool:
         """
         Check if system is in degraded state.
 
         Degraded status is triggered when:
         - Recent latency exceeds threshold
-        - Error rate exceeds threshold
+        - Error rate within the trailing error window exceeds threshold
 
         Returns:
             True if system is degraded
         """
         with self._lock:
             # Check latency threshold
-            if self._metrics:
-                recent_latency = self._metrics[-1].latency_ms
-                if recent_latency > self.degraded_latency_threshold_ms:
+            if self._last_latency_ms is not None:
+                if self._last_latency_ms > self.degraded_latency_threshold_ms:
                     return True
 
             # Check error rate threshold
-            error_rate = self.get_error_rate()
-            if error_rate > self.degraded_error_rate_threshold:
+            if self.get_recent_error_rate() > self.degraded_error_rate_threshold:
                 return True
 
         return False
@@ -306,24 +560,25 @@ class ChatMetrics:
             Dict containing all metrics data
         """
         with self._lock:
-            platforms = set(m.platform for m in self._metrics)
-
-            platform_stats = {}
-            for platform in platforms:
-                platform_stats[platform] = {
-                    "queries": sum(1 for m in self._metrics if m.platform == platform),
-                    "tokens": self.get_tokens_by_platform(platform),
-                    "latency": self.get_latency_stats(platform),
+            latency = {p: self.get_latency_stats(p) for p in self._platforms}
+            platform_stats = {
+                platform: {
+                    "queries": stats.queries,
+                    "tokens": stats.tokens,
+                    "latency": latency[platform],
                 }
+                for platform, stats in self._platforms.items()
+            }
 
             return {
-                "total_queries": len(self._metrics),
-                "total_errors": len(self._errors),
-                "total_tokens": self.get_total_tokens(),
+                "total_queries": self._total_queries,
+                "total_errors": self._total_errors,
+                "total_tokens": self._total_tokens,
                 "platforms": platform_stats,
-                "latency": {p: self.get_latency_stats(p) for p in platforms},
+                "latency": latency,
                 "error_rate": self.get_error_rate(),
                 "is_degraded": self.is_degraded(),
+                "response_cache": self.get_cache_stats(),
             }
 
     def reset(self) -> None:
@@ -331,4 +586,13 @@ class ChatMetrics:
         with self._lock:
             self._metrics.clear()
             self._errors.clear()
+            self._cache_lookups = {"hit": 0, "miss": 0, "coalesced": 0}
+            self._platforms.clear()
+            self._total_queries = 0
+            self._total_tokens = 0
+            self._total_errors = 0
+            self._errors_by_provider.clear()
+            self._last_latency_ms = None
+            self._recent_queries.clear()
+            self._recent_errors.clear()
         logger.info("Metrics reset")
@@ -24,17 +24,21 @@ Implements rate limiting with support for:
 Design (from ADR-006):
 - Token bucket algorithm for smooth rate limiting
 - Burst capacity for handling traffic spikes
-- Thread-safe for concurrent access
+- Thread-safe for concurrent access (lock striping by key hash)
+- Idle (fully refilled) buckets are evicted to bound memory
 
 Version: 1.0.0
 """
 
+from contextlib import ExitStack
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Optional, Dict
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 import threading
 import time
 
+from luminescent_cluster.rate_limit_backend import RateLimitBackend
+
 
 @dataclass
 class RateLimitConfig:
@@ -48,6 +52,9 @@ class RateLimitConfig:
         user_requests_per_minute: Per-user request limit (optional)
         channel_requests_per_minute: Per-channel request limit (optional)
         workspace_requests_per_minute: Per-workspace request limit (optional)
+        lock_stripes: Number of bucket lock stripes (rounded up to a power of two)
+        idle_eviction_interval_seconds: How often each stripe (and a shared
+            backend) drops fully refilled buckets (0 disables automatic eviction)
     """
 
     requests_per_minute: int = 60
@@ -56,6 +63,8 @@ class RateLimitConfig:
     user_requests_per_minute: Optional[int] = None
     channel_requests_per_minute: Optional[int] = None
     workspace_requests_per_minute: Optional[int] = None
+    lock_stripes: int = 16
+    idle_eviction_interval_seconds: float = 60.0
 
 
 @dataclass
@@ -78,7 +87,7 @@ class RateLimitResult:
     reason: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenBucket:
     """
     A single token bucket for rate limiting.
@@ -113,6 +122,47 @@ class TokenBucket:
         """Get current token count without consuming."""
         return self.tokens
 
+    def is_full(self, current_time: float) -> bool:
+        """Return True if the bucket would be full at current_time."""
+        elapsed = current_time - self.last_refill
+        return self.tokens + elapsed * self.refill_rate >= self.capacity
+
+
+@dataclass
+class RateLimitRequest:
+    """
+    One request in a check_many() batch.
+
+    Attributes:
+        user_id: User making the request
+        channel_id: Channel context (optional)
+        workspace_id: Workspace context (optional)
+        tokens: Token count for this request (optional)
+    """
+
+    user_id: str
+    channel_id: Optional[str] = None
+    workspace_id: Optional[str] = None
+    tokens: int = 0
+
+
+class _Stripe:
+    """A lock and the buckets whose keys hash to it."""
+
+    __slots__ = ("lock", "buckets", "last_sweep")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.buckets: Dict[Tuple[str, str], TokenBucket] = {}
+        self.last_sweep = 0.0
+
+
+# Bucket kinds (first element of a stripe's bucket key)
+_USER_REQUESTS = "user_requests"
+_USER_TOKENS = "user_tokens"
+_CHANNEL = "channel"
+_WORKSPACE = "workspace"
+
 
 class TokenBucketRateLimiter:
     """
@@ -124,6 +174,15 @@ class TokenBucketRateLimiter:
     - Per-channel
     - Per-workspace
 
+    Buckets are spread over lock stripes by key hash, so checks for
+    unrelated users and channels do not contend on one lock. Buckets that
+    have refilled completely are indistinguishable from new ones and are
+    dropped by a periodic sweep, keeping memory proportional to recently
+    active keys.
+
+    With a RateLimitBackend, bucket state lives in the backend instead,
+    so replicas sharing it enforce one combined limit.
+
     Example:
         config = RateLimitConfig(
             requests_per_minute=60,
@@ -136,16 +195,32 @@ class TokenBucketRateLimiter:
             print(f"Rate limited: {result.reason}")
     """
 
-    def __init__(self, config: Optional[RateLimitConfig] = None):
-        """Initialize rate limiter with configuration."""
+    def __init__(
+        self,
+        config: Optional[RateLimitConfig] = None,
+        backend: Optional[RateLimitBackend] = None,
+    ):
+        """
+        Initialize rate limiter with configuration.
+
+        Args:
+            config: Rate limit configuration
+            backend: Shared bucket state for multi-replica deployments
+                (default: in-process buckets)
+        """
         self.config = config or RateLimitConfig()
-        self._lock = threading.RLock()
+        self.backend = backend
 
-        # Buckets for different scopes
-        self._user_request_buckets: Dict[str, TokenBucket] = {}
-        self._user_token_buckets: Dict[str, TokenBucket] = {}
-        self._channel_buckets: Dict[str, TokenBucket] = {}
-        self._workspace_buckets: Dict[str, TokenBucket] = {}
+        # Lock stripes (power of two so the hash can be masked)
+        stripes = 1
+        while stripes < max(1, self.config.lock_stripes):
+            stripes <<= 1
+        self._stripes = [_Stripe() for _ in range(stripes)]
+        self._stripe_mask = stripes - 1
+        self._backend_last_sweep = 0.0
+
+        # reset_at only changes resolution once per second
+        self._reset_cache: Tuple[int, datetime] = (-1, datetime.now())
 
         # Time offset for testing
         self._time_offset: float = 0.0
@@ -158,25 +233,68 @@ class TokenBucketRateLimiter:
         """Advance time for testing purposes."""
         self._time_offset += seconds
 
+    def _reset_at(self, now: float) -> datetime:
+        """Return the window reset time, recomputed at most once per second."""
+        second, reset_at = self._reset_cache
+        if int(now) != second:
+            reset_at = datetime.now() + timedelta(minutes=1)
+            self._reset_cache = (int(now), reset_at)
+        return reset_at
+
+    def _stripe(self, key: str) -> _Stripe:
+        """Return the stripe that owns a key."""
+        return self._stripes[hash(key) & self._stripe_mask]
+
+    def _stripes_for(self, requests: Iterable[RateLimitRequest]) -> List[_Stripe]:
+        """Return the distinct stripes a batch touches, in lock order."""
+        indexes = set()
+        for req in requests:
+            indexes.add(hash(req.user_id) & self._stripe_mask)
+            if req.channel_id and self.config.channel_requests_per_minute:
+                indexes.add(hash(req.channel_id) & self._stripe_mask)
+            if req.workspace_id and self.config.workspace_requests_per_minute:
+                indexes.add(hash(req.workspace_id) & self._stripe_mask)
+        return [self._stripes[i] for i in sorted(indexes)]
+
     def _get_or_create_bucket(
         self,
-        buckets: Dict[str, TokenBucket],
+        kind: str,
         key: str,
         capacity: float,
         refill_rate: float,
+        now: float,
     ) -> TokenBucket:
-        """Get or create a token bucket."""
-        if key not in buckets:
-            buckets[key] = TokenBucket(
+        """Get or create a token bucket (caller holds the key's stripe lock)."""
+        buckets = self._stripe(key).buckets
+        bucket = buckets.get((kind, key))
+        if bucket is None:
+            bucket = buckets[(kind, key)] = TokenBucket(
                 capacity=capacity * self.config.burst_multiplier,
                 tokens=capacity * self.config.burst_multiplier,
                 refill_rate=refill_rate,
-                last_refill=self._current_time(),
+                last_refill=now,
             )
-        bucket = buckets[key]
-        bucket.refill(self._current_time())
+        else:
+            bucket.refill(now)
         return bucket
 
+    def _sweep(self, stripe: _Stripe, now: float) -> int:
+        """Drop full buckets from a stripe (caller holds its lock)."""
+        stripe.last_sweep = now
+        idle = [k for k, b in stripe.buckets.items() if b.is_full(now)]
+        for k in idle:
+            del stripe.buckets[k]
+        return len(idle)
+
+    def _maybe_sweep(self, stripes: List[_Stripe], now: float) -> None:
+        """Sweep locked stripes whose eviction interval has elapsed."""
+        interval = self.config.idle_eviction_interval_seconds
+        if interval <= 0:
+            return
+        for stripe in stripes:
+            if now - stripe.last_sweep >= interval:
+                self._sweep(stripe, now)
+
     def check(
         self,
         user_id: str,
@@ -196,98 +314,168 @@ class TokenBucketRateLimiter:
         Returns:
             RateLimitResult indicating if request is allowed
         """
-        with self._lock:
-            now = self._current_time()
-            reset_at = datetime.now() + timedelta(minutes=1)
+        return self.check_many([RateLimitRequest(user_id, channel_id, workspace_id, tokens)])[0]
 
-            # Check user request limit
-            user_req_bucket = self._get_or_create_bucket(
-                self._user_request_buckets,
-                user_id,
-                capacity=self.config.user_requests_per_minute or self.config.requests_per_minute,
-                refill_rate=(
-                    self.config.user_requests_per_minute or self.config.requests_per_minute
+    def check_many(self, requests: Sequence[RateLimitRequest]) -> List[RateLimitResult]:
+        """
+        Check a burst of requests under a single lock acquisition.
+
+        Requests are evaluated in order, exactly as if check() were called
+        for each one, but the clock is read once and each stripe involved
+        is locked once for the whole batch.
+
+        Args:
+            requests: Requests to check
+
+        Returns:
+            One RateLimitResult per request, in the same order
+        """
+        if not requests:
+            return []
+
+        stripes = self._stripes_for(requests)
+        now = self._current_time()
+        reset_at = self._reset_at(now)
+
+        with ExitStack() as stack:
+            for stripe in stripes:
+                stack.enter_context(stripe.lock)
+            self._maybe_sweep(stripes, now)
+            results = [
+                self._check_locked(
+                    req.user_id, req.channel_id, req.workspace_id, req.tokens, now, reset_at
                 )
-                / 60.0,
+                for req in requests
+            ]
+        self._maybe_evict_backend(now)
+        return results
+
+    def _maybe_evict_backend(self, now: float) -> None:
+        """Evict idle shared state once per eviction interval."""
+        interval = self.config.idle_eviction_interval_seconds
+        if self.backend is None or interval <= 0 or now - self._backend_last_sweep < interval:
+            return
+        self._backend_last_sweep = now
+        self.backend.evict_idle(now)
+
+    def _take(
+        self,
+        kind: str,
+        key: str,
+        amount: float,
+        per_minute: float,
+        now: float,
+        force: bool = False,
+    ) -> Tuple[bool, float]:
+        """
+        Refill and consume from one bucket (caller holds the key's stripe lock).
+
+        Args:
+            kind: Bucket kind (user requests, user tokens, channel, workspace)
+            key: User, channel or workspace ID
+            amount: Tokens to consume; 0 peeks, negative amounts refund
+            per_minute: Configured limit for this bucket
+            now: Current time
+            force: Consume even below zero (clamped), as record() does
+
+        Returns:
+            Tuple of (granted, tokens remaining)
+        """
+        if self.backend is not None:
+            return self.backend.take(
+                f"{kind}:{key}",
+                amount,
+                per_minute * self.config.burst_multiplier,
+                per_minute / 60.0,
+                now,
+                force,
             )
 
-            if not user_req_bucket.consume(1.0):
+        bucket = self._get_or_create_bucket(
+            kind, key, capacity=per_minute, refill_rate=per_minute / 60.0, now=now
+        )
+        if force or amount <= 0:
+            bucket.tokens = min(bucket.capacity, max(0.0, bucket.tokens - amount))
+            return True, bucket.tokens
+        return bucket.consume(amount), bucket.tokens
+
+    def _check_locked(
+        self,
+        user_id: str,
+        channel_id: Optional[str],
+        workspace_id: Optional[str],
+        tokens: int,
+        now: float,
+        reset_at: datetime,
+    ) -> RateLimitResult:
+        """Check one request (caller holds the relevant stripe locks)."""
+        user_rpm = self.config.user_requests_per_minute or self.config.requests_per_minute
+        tpm = self.config.tokens_per_minute
+
+        # Check user request limit
+        allowed, remaining_requests = self._take(_USER_REQUESTS, user_id, 1.0, user_rpm, now)
+        if not allowed:
+            _, remaining_tokens = self._take(_USER_TOKENS, user_id, 0, tpm, now)
+            return RateLimitResult(
+                allowed=False,
+                remaining_requests=0,
+                remaining_tokens=int(remaining_tokens),
+                reset_at=reset_at,
+                reason=f"User rate limit exceeded: {user_rpm} requests per minute",
+            )
+
+        # Check user token limit (a zero amount just reads the level)
+        allowed, remaining_tokens = self._take(_USER_TOKENS, user_id, tokens, tpm, now)
+        if not allowed:
+            # Restore request token
+            _, remaining_requests = self._take(_USER_REQUESTS, user_id, -1.0, user_rpm, now)
+            return RateLimitResult(
+                allowed=False,
+                remaining_requests=int(remaining_requests),
+                remaining_tokens=0,
+                reset_at=reset_at,
+                reason=f"Token limit exceeded: {tpm} tokens per minute",
+            )
+
+        # Check channel limit if applicable
+        channel_rpm = self.config.channel_requests_per_minute
+        channel_taken = False
+        if channel_id and channel_rpm:
+            allowed, _ = self._take(_CHANNEL, channel_id, 1.0, channel_rpm, now)
+            if not allowed:
+                # Restore user tokens
+                self._take(_USER_REQUESTS, user_id, -1.0, user_rpm, now)
                 return RateLimitResult(
                     allowed=False,
                     remaining_requests=0,
-                    remaining_tokens=int(self._get_user_token_bucket(user_id).peek()),
+                    remaining_tokens=int(remaining_tokens),
                     reset_at=reset_at,
-                    reason=f"User rate limit exceeded: {self.config.user_requests_per_minute or self.config.requests_per_minute} requests per minute",
-                )
-
-            # Check user token limit
-            if tokens > 0:
-                user_token_bucket = self._get_user_token_bucket(user_id)
-                if not user_token_bucket.consume(tokens):
-                    # Restore request token
-                    user_req_bucket.tokens += 1
-                    return RateLimitResult(
-                        allowed=False,
-                        remaining_requests=int(user_req_bucket.peek()),
-                        remaining_tokens=0,
-                        reset_at=reset_at,
-                        reason=f"Token limit exceeded: {self.config.tokens_per_minute} tokens per minute",
-                    )
-
-            # Check channel limit if applicable
-            if channel_id and self.config.channel_requests_per_minute:
-                channel_bucket = self._get_or_create_bucket(
-                    self._channel_buckets,
-                    channel_id,
-                    capacity=self.config.channel_requests_per_minute,
-                    refill_rate=self.config.channel_requests_per_minute / 60.0,
+                    reason=f"Channel rate limit exceeded: {channel_rpm} requests per minute",
                 )
-                if not channel_bucket.consume(1.0):
-                    # Restore user tokens
-                    user_req_bucket.tokens += 1
-                    return RateLimitResult(
-                        allowed=False,
-                        remaining_requests=0,
-                        remaining_tokens=int(self._get_user_token_bucket(user_id).peek()),
-                        reset_at=reset_at,
-                        reason=f"Channel rate limit exceeded: {self.config.channel_requests_per_minute} requests per minute",
-                    )
-
-            # Check workspace limit if applicable
-            if workspace_id and self.config.workspace_requests_per_minute:
-                ws_bucket = self._get_or_create_bucket(
-                    self._workspace_buckets,
-                    workspace_id,
-                    capacity=self.config.workspace_requests_per_minute,
-                    refill_rate=self.config.workspace_requests_per_minute / 60.0,
+            channel_taken = True
+
+        # Check workspace limit if applicable
+        workspace_rpm = self.config.workspace_requests_per_minute
+        if workspace_id and workspace_rpm:
+            allowed, _ = self._take(_WORKSPACE, workspace_id, 1.0, workspace_rpm, now)
+            if not allowed:
+                # Restore user and channel tokens
+                self._take(_USER_REQUESTS, user_id, -1.0, user_rpm, now)
+                if channel_taken:
+                    self._take(_CHANNEL, channel_id, -1.0, channel_rpm, now)
+                return RateLimitResult(
+                    allowed=False,
+                    remaining_requests=0,
+                    remaining_tokens=int(remaining_tokens),
+                    reset_at=reset_at,
+                    reason=f"Workspace rate limit exceeded: {workspace_rpm} requests per minute",
                 )
-                if not ws_bucket.consume(1.0):
-                    # Restore user and channel tokens
-                    user_req_bucket.tokens += 1
-                    if channel_id and self.config.channel_requests_per_minute:
-                        self._channel_buckets[channel_id].tokens += 1
-                    return RateLimitResult(
-                        allowed=False,
-                        remaining_requests=0,
-                        remaining_tokens=int(self._get_user_token_bucket(user_id).peek()),
-                        reset_at=reset_at,
-                        reason=f"Workspace rate limit exceeded: {self.config.workspace_requests_per_minute} requests per minute",
-                    )
-
-            return RateLimitResult(
-                allowed=True,
-                remaining_requests=int(user_req_bucket.peek()),
-                remaining_tokens=int(self._get_user_token_bucket(user_id).peek()),
-                reset_at=reset_at,
-            )
 
-    def _get_user_token_bucket(self, user_id: str) -> TokenBucket:
-        """Get or create user token bucket."""
-        return self._get_or_create_bucket(
-            self._user_token_buckets,
-            user_id,
-            capacity=self.config.tokens_per_minute,
-            refill_rate=self.config.tokens_per_minute / 60.0,
+        return RateLimitResult(
+            allowed=True,
+            remaining_requests=int(remaining_requests),
+            remaining_tokens=int(remaining_tokens),
+            reset_at=reset_at,
         )
 
     def record(
@@ -308,8 +496,35 @@ class TokenBucketRateLimiter:
             channel_id: Channel context (optional)
             workspace_id: Workspace context (optional)
         """
-        with self._lock:
-            if tokens_used > 0:
-                token_bucket = self._get_user_token_bucket(user_id)
-                # Consume the tokens (may already be partially consumed from check)
-                token_bucket.tokens = max(0, token_bucket.tokens - tokens_used)
+        if tokens_used <= 0:
+            return
+        with self._stripe(user_id).lock:
+            # Consume the tokens (may already be partially consumed from check)
+            self._take(
+                _USER_TOKENS,
+                user_id,
+                tokens_used,
+                self.config.tokens_per_minute,
+                self._current_time(),
+                force=True,
+            )
+
+    def evict_idle(self) -> int:
+        """
+        Drop every bucket that has fully refilled.
+
+        Returns:
+            Number of buckets removed (including from a shared backend)
+        """
+        now = self._current_time()
+        removed = 0
+        for stripe in self._stripes:
+            with stripe.lock:
+                removed += self._sweep(stripe, now)
+        if self.backend is not None:
+            removed += self.backend.evict_idle(now)
+        return removed
+
+    def bucket_count(self) -> int:
+        """Return the number of buckets currently held in memory."""
+        return sum(len(stripe.buckets) for stripe in self._stripes)
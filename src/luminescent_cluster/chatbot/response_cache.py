@@ -0,0 +1,251 @@
+# Copyright 2024-2025 Amiable Development
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+LLM response cache with in-flight request coalescing.
+
+In busy channels several users often ask the same question within
+seconds. This cache lets the gateway answer repeats without another LLM
+call, and lets concurrent duplicates share a single upstream request.
+
+Privacy (ADR-007):
+- Entries are scoped by channel visibility and workspace. Public-channel
+  answers are shared within one workspace only; direct-message answers
+  are scoped to the individual channel and user, so private context can
+  never be served to someone else.
+- Keys cover the full normalized prompt (system prompt, thread history,
+  MCP context and question), never just the question.
+
+Version: 1.0.0
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+import asyncio
+import hashlib
+import json
+import re
+import time
+
+# Lookup outcomes reported to ChatMetrics.record_cache_lookup
+CACHE_HIT = "hit"
+CACHE_MISS = "miss"
+CACHE_COALESCED = "coalesced"
+
+_WHITESPACE = re.compile(r"\s+")
+
+# Handed to coalesced waiters when the request they joined was cancelled
+_ABANDONED = object()
+
+
+@dataclass
+class ResponseCacheConfig:
+    """
+    Configuration for the LLM response cache.
+
+    Attributes:
+        ttl_seconds: How long a cached response stays valid
+        max_entries: Maximum cached responses (least recently used evicted)
+    """
+
+    ttl_seconds: float = 300.0
+    max_entries: int = 1000
+
+
+def cache_scope(
+    is_public_channel: bool,
+    workspace_id: Optional[str],
+    channel_id: str,
+    user_id: str,
+) -> str:
+    """
+    Build the sharing scope for a cached response.
+
+    Args:
+        is_public_channel: Whether the request came from a public channel
+        workspace_id: Workspace/guild ID (may be None)
+        channel_id: Channel ID
+        user_id: Requesting user ID
+
+    Returns:
+        Scope string; responses are only shared within the same scope
+    """
+    workspace = workspace_id or ""
+    if is_public_channel:
+        return f"public:{workspace}"
+    return f"private:{workspace}:{channel_id}:{user_id}"
+
+
+def normalize_prompt(messages: List[Dict[str, str]]) -> List[Tuple[str, str]]:
+    """
+    Normalize a message list so trivially different prompts share a key.
+
+    Content is case-folded and whitespace is collapsed.
+
+    Args:
+        messages: LLM message dicts with 'role' and 'content'
+
+    Returns:
+        List of (role, normalized content) tuples
+    """
+    return [
+        (m.get("role", ""), _WHITESPACE.sub(" ", m.get("content", "")).strip().casefold())
+        for m in messages
+    ]
+
+
+class LLMResponseCache:
+    """
+    TTL + LRU cache of LLM responses with in-flight coalescing.
+
+    Example:
+        cache = LLMResponseCache()
+        key = cache.make_key(scope, messages, model="gpt-4o-mini", max_tokens=512)
+        response, outcome = await cache.get_or_compute(key, lambda: provider.chat(...))
+    """
+
+    def __init__(self, config: Optional[ResponseCacheConfig] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            config: Cache configuration (defaults to ResponseCacheConfig())
+        """
+        self.config = config or ResponseCacheConfig()
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._in_flight: Dict[str, "asyncio.Future[Any]"] = {}
+
+    def __len__(self) -> int:
+        """Return the number of cached entries (including expired ones)."""
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(
+        scope: str,
+        messages: List[Dict[str, str]],
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+    ) -> str:
+        """
+        Build a cache key from the scope and normalized prompt.
+
+        Args:
+            scope: Sharing scope from cache_scope()
+            messages: Full LLM message list
+            model: Model name
+            max_tokens: Requested output limit
+
+        Returns:
+            Hex digest identifying the request
+        """
+        payload = json.dumps(
+            [scope, model, max_tokens, normalize_prompt(messages)],
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a cached response if present and not expired.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        """
+        Store a response.
+
+        Args:
+            key: Cache key
+            value: Response to cache
+        """
+        self._entries[key] = (time.monotonic() + self.config.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.config.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+    ) -> Tuple[Any, str]:
+        """
+        Return a cached response, join an identical in-flight request, or compute.
+
+        Failures are propagated to every coalesced waiter and are not cached.
+        If the request being joined is cancelled, one waiter takes over the
+        call and the others join it; the cancellation itself stays with
+        the cancelled caller.
+
+        Args:
+            key: Cache key
+            compute: Zero-argument coroutine factory making the upstream call
+
+        Returns:
+            Tuple of (response, outcome) where outcome is CACHE_HIT,
+            CACHE_COALESCED or CACHE_MISS
+        """
+        while True:
+            cached = self.get(key)
+            if cached is not None:
+                return cached, CACHE_HIT
+
+            pending = self._in_flight.get(key)
+            if pending is None:
+                break
+            value = await asyncio.shield(pending)
+            if value is not _ABANDONED:
+                return value, CACHE_COALESCED
+
+        future: "asyncio.Future[Any]" = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            value = await compute()
+        except asyncio.CancelledError:
+            # Unregister first so the woken waiters start a new call
+            self._in_flight.pop(key, None)
+            future.set_result(_ABANDONED)
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an un-awaited failure is not logged as lost
+            future.exception()
+            raise
+        else:
+            self.put(key, value)
+            future.set_result(value)
+            return value, CACHE_MISS
+        finally:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+
+    def clear(self) -> None:
+        """Drop all cached entries (in-flight requests are unaffected)."""
+        self._entries.clear()
@@ -19,7 +19,7 @@ ADR Reference: ADR-003 Memory Architecture, Phase 2 (Context Engineering)
 """
 
 from .assembler import BlockAssembler
-from .compressor import HistoryCompressor
+from .compressor import HistoryCompressor, estimate_tokens
 from .schemas import (
     BlockType,
     DEFAULT_BLOCK_PRIORITIES,
@@ -36,4 +36,5 @@ __all__ = [
     "Provenance",
     "DEFAULT_BLOCK_PRIORITIES",
     "DEFAULT_TOKEN_BUDGETS",
+    "estimate_tokens",
 ]
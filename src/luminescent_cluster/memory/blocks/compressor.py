@@ -28,6 +28,38 @@ class Message(Protocol):
     content: str
 
 
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of tokens in text.
+
+    Uses a hybrid word/character approximation. For production,
+    use tiktoken with the actual model's tokenizer.
+
+    Security Note (Council Round 9): Word-only counting allows DoS
+    via strings without spaces. We use max(word_count, char_count/4)
+    to ensure accurate counting for all inputs.
+
+    Args:
+        text: Text to count tokens for
+
+    Returns:
+        Approximate token count
+    """
+    if not text:
+        return 0
+
+    # Word-based approximation: ~1.3 tokens per word
+    words = text.split()
+    word_based = int(len(words) * 1.3)
+
+    # Character-based approximation: ~4 chars per token
+    # This catches strings without spaces (DoS vector)
+    char_based = len(text) // 4
+
+    # Use the maximum to prevent budget bypass attacks
+    return max(word_based, char_based)
+
+
 class HistoryCompressor:
     """
     Compresses conversation history to fit within token budget.
@@ -49,32 +81,13 @@ class HistoryCompressor:
         """
         Count tokens in text.
 
-        Uses a hybrid word/character approximation. For production,
-        use tiktoken with the actual model's tokenizer.
-
-        Security Note (Council Round 9): Word-only counting allows DoS
-        via strings without spaces. We use max(word_count, char_count/4)
-        to ensure accurate counting for all inputs.
-
         Args:
             text: Text to count tokens for
 
         Returns:
-            Approximate token count
+            Approximate token count (see estimate_tokens)
         """
-        if not text:
-            return 0
-
-        # Word-based approximation: ~1.3 tokens per word
-        words = text.split()
-        word_based = int(len(words) * 1.3)
-
-        # Character-based approximation: ~4 chars per token
-        # This catches strings without spaces (DoS vector)
-        char_based = len(text) // 4
-
-        # Use the maximum to prevent budget bypass attacks
-        return max(word_based, char_based)
+        return estimate_tokens(text)
 
     def compress(
         self,
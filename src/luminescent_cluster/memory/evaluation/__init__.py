@@ -19,6 +19,7 @@ from .brute_force import BruteForceResult, BruteForceSearcher, Document
 from .embedding_version import EmbeddingVersion, EmbeddingVersionTracker
 from .harness import EvaluationHarness
 from .metrics import f1_score, precision, recall
+from .quantization import QuantizationReport, QuantizationResult, measure_quantization_recall
 from .recall_health import RecallHealthMonitor, RecallHealthResult
 from .reporter import EvaluationReport
 from .token_efficiency import TokenEfficiencyMetric
@@ -40,6 +41,10 @@ __all__ = [
     "RecallBaseline",
     "EmbeddingVersionTracker",
     "EmbeddingVersion",
+    # Quantized vector storage recall report
+    "QuantizationReport",
+    "QuantizationResult",
+    "measure_quantization_recall",
     # Phase 2 token efficiency
     "TokenEfficiencyMetric",
 ]
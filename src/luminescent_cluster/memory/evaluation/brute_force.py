@@ -109,6 +109,29 @@ class BruteForceSearcher:
         """Return True if a corpus has been indexed."""
         return self._embeddings is not None and len(self._documents) > 0
 
+    @property
+    def embeddings(self) -> np.ndarray | None:
+        """Return the normalized corpus embeddings (one row per document)."""
+        return self._embeddings
+
+    def embed_query(self, query: str) -> np.ndarray:
+        """Return the normalized embedding of a query.
+
+        Args:
+            query: Query text.
+
+        Returns:
+            Embedding array of shape (1, embedding_dim).
+        """
+        query_embedding = self._model.encode([query])
+        if query_embedding.ndim == 1:
+            query_embedding = query_embedding.reshape(1, -1)
+
+        query_norm = np.linalg.norm(query_embedding)
+        if query_norm > 0:
+            query_embedding = query_embedding / query_norm
+        return query_embedding
+
     def index_corpus(self, documents: list[Document]) -> None:
         """Pre-compute embeddings for all documents.
 
@@ -164,15 +187,7 @@ class BruteForceSearcher:
         if k < 1:
             raise ValueError("k must be at least 1")
 
-        # Compute query embedding
-        query_embedding = self._model.encode([query])
-        if query_embedding.ndim == 1:
-            query_embedding = query_embedding.reshape(1, -1)
-
-        # Normalize query
-        query_norm = np.linalg.norm(query_embedding)
-        if query_norm > 0:
-            query_embedding = query_embedding / query_norm
+        query_embedding = self.embed_query(query)
 
         # Compute cosine similarities (dot product of normalized vectors)
         similarities = np.dot(self._embeddings, query_embedding.T).flatten()
@@ -223,15 +238,7 @@ class BruteForceSearcher:
         if k < 1:
             raise ValueError("k must be at least 1")
 
-        # Compute query embedding
-        query_embedding = self._model.encode([query])
-        if query_embedding.ndim == 1:
-            query_embedding = query_embedding.reshape(1, -1)
-
-        # Normalize query
-        query_norm = np.linalg.norm(query_embedding)
-        if query_norm > 0:
-            query_embedding = query_embedding / query_norm
+        query_embedding = self.embed_query(query)
 
         # Filter documents and compute similarities only for matching docs
         filtered_results = []
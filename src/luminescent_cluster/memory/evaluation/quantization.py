@@ -0,0 +1,172 @@
+# Copyright 2024-2025 Amiable Development
+# SPDX-License-Identifier: Apache-2.0
+
+"""Recall-versus-memory report for quantized vector storage.
+
+Runs the same queries against VectorSearch indexes in every storage mode
+(float32, float16, int8) and compares their top-k with brute-force
+ground truth, so operators can pick a mode from measured numbers rather
+than rules of thumb.
+
+Related ADR: ADR-003 Memory Architecture, Phase 0 (HNSW Recall Health Monitoring)
+"""
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from luminescent_cluster.memory.evaluation.brute_force import BruteForceSearcher
+from luminescent_cluster.memory.retrieval.vector_search import STORAGE_MODES, VectorSearch
+
+_REPORT_USER = "__quantization_report__"
+
+
+@dataclass
+class QuantizationResult:
+    """Recall and footprint of one storage mode.
+
+    Attributes:
+        storage: Storage mode (float32, float16 or int8).
+        recall_at_k: Mean Recall@k against brute-force ground truth.
+        bytes_per_vector: Stored bytes per embedding, including scales.
+        compression_ratio: float32 bytes divided by this mode's bytes.
+        individual_recalls: Per-query recall values for analysis.
+    """
+
+    storage: str
+    recall_at_k: float
+    bytes_per_vector: float
+    compression_ratio: float
+    individual_recalls: list[float] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            "storage": self.storage,
+            "recall_at_k": self.recall_at_k,
+            "bytes_per_vector": self.bytes_per_vector,
+            "compression_ratio": self.compression_ratio,
+        }
+
+
+@dataclass
+class QuantizationReport:
+    """Recall-versus-memory comparison across storage modes.
+
+    Attributes:
+        k: The k value used for Recall@k.
+        query_count: Number of queries evaluated.
+        corpus_size: Number of indexed documents.
+        rescore_factor: Shortlist multiplier used by the searches.
+        results: One result per storage mode, in the order measured.
+    """
+
+    k: int
+    query_count: int
+    corpus_size: int
+    rescore_factor: int
+    results: list[QuantizationResult] = field(default_factory=list)
+
+    def get(self, storage: str) -> QuantizationResult | None:
+        """Return the result for a storage mode, if measured."""
+        return next((r for r in self.results if r.storage == storage), None)
+
+    def recommend(self, max_recall_loss: float = 0.01) -> str:
+        """Return the smallest storage mode within a recall budget.
+
+        Recall loss is measured against the float32 result when present,
+        otherwise against perfect recall.
+
+        Args:
+            max_recall_loss: Largest acceptable absolute drop in Recall@k.
+
+        Returns:
+            Name of the storage mode with the fewest bytes per vector.
+        """
+        reference = self.get("float32")
+        baseline = reference.recall_at_k if reference is not None else 1.0
+        eligible = [r for r in self.results if baseline - r.recall_at_k <= max_recall_loss]
+        if not eligible:
+            return "float32"
+        return min(eligible, key=lambda r: r.bytes_per_vector).storage
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            "k": self.k,
+            "query_count": self.query_count,
+            "corpus_size": self.corpus_size,
+            "rescore_factor": self.rescore_factor,
+            "results": [r.to_dict() for r in self.results],
+        }
+
+
+def measure_quantization_recall(
+    brute_force: BruteForceSearcher,
+    queries: list[str],
+    k: int = 10,
+    storage_modes: tuple[str, ...] = STORAGE_MODES,
+    rescore_factor: int = VectorSearch.DEFAULT_RESCORE_FACTOR,
+) -> QuantizationReport:
+    """Measure Recall@k and memory footprint of each storage mode.
+
+    The corpus embeddings of the brute-force searcher are loaded into a
+    VectorSearch per mode, so no model calls are repeated.
+
+    Args:
+        brute_force: Searcher with an indexed corpus (ground truth).
+        queries: Query texts to evaluate.
+        k: Number of results per query.
+        storage_modes: Storage modes to measure.
+        rescore_factor: Shortlist multiplier for quantized modes.
+
+    Returns:
+        QuantizationReport with one result per mode.
+
+    Raises:
+        RuntimeError: If the brute-force corpus is not indexed.
+        ValueError: If queries is empty or k is less than 1.
+    """
+    embeddings = brute_force.embeddings
+    if not brute_force.is_indexed or embeddings is None:
+        raise RuntimeError("Corpus not indexed. Call index_corpus() first.")
+    if not queries:
+        raise ValueError("queries must not be empty")
+    if k < 1:
+        raise ValueError("k must be at least 1")
+
+    doc_ids = brute_force.get_document_ids()
+    query_embeddings = [brute_force.embed_query(query) for query in queries]
+    ground_truth = [
+        {result.document_id for result in brute_force.search(query, k)} for query in queries
+    ]
+    float32_bytes = embeddings.shape[1] * 4
+
+    report = QuantizationReport(
+        k=k,
+        query_count=len(queries),
+        corpus_size=len(doc_ids),
+        rescore_factor=rescore_factor,
+    )
+    for storage in storage_modes:
+        search = VectorSearch(storage=storage, rescore_factor=rescore_factor)
+        search.index_embeddings(_REPORT_USER, doc_ids, embeddings)
+
+        recalls: list[float] = []
+        for query_embedding, expected in zip(query_embeddings, ground_truth):
+            found = {
+                doc_id for doc_id, _ in search.search_by_embedding(_REPORT_USER, query_embedding, k)
+            }
+            recalls.append(len(found & expected) / len(expected) if expected else 1.0)
+
+        bytes_per_vector = search.index_stats(_REPORT_USER)["embedding_bytes"] / len(doc_ids)
+        report.results.append(
+            QuantizationResult(
+                storage=storage,
+                recall_at_k=sum(recalls) / len(recalls),
+                bytes_per_vector=bytes_per_vector,
+                compression_ratio=float32_bytes / bytes_per_vector,
+                individual_recalls=recalls,
+            )
+        )
+
+    return report
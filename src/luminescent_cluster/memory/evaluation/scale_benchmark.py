@@ -0,0 +1,708 @@
+# Copyright 2024-2025 Amiable Development
+# SPDX-License-Identifier: Apache-2.0
+
+"""Scale benchmarks with baseline regression gating.
+
+Generates deterministic synthetic corpora (1k, 10k and 100k memories
+across several users, with entities, timestamps, expiring memories and
+near-duplicates) and measures throughput and p50/p95/p99 latency for:
+
+- bulk_store: ``store_many`` batches into a hybrid-retrieval provider
+- store: single stores into the fully loaded hybrid provider
+- retrieve: ``retrieve`` on a default (substring matching) provider
+- hybrid_search: ``retrieve`` on the hybrid provider (BM25 + vector + RRF)
+- context_assembly: hybrid retrieval followed by BlockAssembler.assemble
+- janitor: JanitorRunner.run_all for one user on the default provider
+
+Embeddings come from HashingEncoder, a deterministic feature-hashing
+stand-in for the sentence-transformers model, so runs measure the memory
+system rather than model inference and need no model download.
+
+Results are stored as JSON baselines in ``scale_baselines/`` next to this
+module. Comparing a run against them flags any latency or throughput
+regression beyond a tolerance; the command line entry point exits
+non-zero when one is found::
+
+    python -m luminescent_cluster.memory.evaluation.scale_benchmark --sizes 1k 10k
+    python -m luminescent_cluster.memory.evaluation.scale_benchmark --sizes 1k --update-baseline
+
+ADR Reference: ADR-003 Memory Architecture, Phase 0 (Evaluation)
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import platform
+import random
+import sys
+import time
+import zlib
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Generator, Optional, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from luminescent_cluster.memory.observability.metrics import LatencyStats
+from luminescent_cluster.memory.schemas import Memory, MemoryType
+
+# Named corpus sizes
+SCALE_SIZES: dict[str, int] = {"1k": 1_000, "10k": 10_000, "100k": 100_000}
+
+# Allowed relative slowdown before a metric counts as a regression
+DEFAULT_TOLERANCE: float = 0.5
+
+# Latency increases smaller than this are treated as timer noise
+DEFAULT_NOISE_FLOOR_MS: float = 0.5
+
+# Committed baselines, one JSON file per corpus size
+BASELINE_DIR: Path = Path(__file__).parent / "scale_baselines"
+
+OPERATIONS: tuple[str, ...] = (
+    "bulk_store",
+    "store",
+    "retrieve",
+    "hybrid_search",
+    "context_assembly",
+    "janitor",
+)
+
+_SERVICES = (
+    "auth-service",
+    "payment-api",
+    "billing-service",
+    "search-api",
+    "notification-service",
+    "user-service",
+    "api-gateway",
+    "inventory-service",
+)
+_DEPENDENCIES = (
+    "PostgreSQL",
+    "Redis",
+    "Kafka",
+    "Elasticsearch",
+    "RabbitMQ",
+    "MongoDB",
+    "S3",
+    "DynamoDB",
+)
+_FRAMEWORKS = ("FastAPI", "Django", "React", "Flask", "Celery", "Spring")
+_PURPOSES = (
+    "session storage",
+    "caching",
+    "event streaming",
+    "full-text search",
+    "audit logging",
+    "rate limiting",
+    "background jobs",
+    "feature flags",
+)
+_REASONS = (
+    "latency under load",
+    "operational cost",
+    "team familiarity",
+    "licensing",
+    "better replication",
+)
+
+# Fixed reference time so corpora are identical across runs
+_EPOCH = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+_DUPLICATE_RATE = 0.05
+_EXPIRING_RATE = 0.05
+
+# Untimed queries run before the retrieval phases
+_WARMUP_QUERIES = 5
+
+
+def parse_size(label: str) -> int:
+    """Parse a corpus size such as "10k" or "2500".
+
+    Args:
+        label: Named size from SCALE_SIZES or a positive integer.
+
+    Returns:
+        Number of memories.
+
+    Raises:
+        ValueError: If the label is not a known size or positive integer.
+    """
+    if label in SCALE_SIZES:
+        return SCALE_SIZES[label]
+    size = int(label)
+    if size < 1:
+        raise ValueError(f"Corpus size must be positive: {label}")
+    return size
+
+
+def size_label(size: int) -> str:
+    """Return the short label used for a corpus size ("10k" for 10000)."""
+    for label, value in SCALE_SIZES.items():
+        if value == size:
+            return label
+    return str(size)
+
+
+@contextmanager
+def _paused_gc() -> Generator[None, None, None]:
+    """Collect garbage, then keep the collector off for a timed phase.
+
+    A loaded corpus holds hundreds of thousands of objects, so a full
+    collection landing inside a timed call would dominate its latency.
+    """
+    gc.collect()
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def generate_corpus(size: int, seed: int = 0, users: int = 10) -> list[Memory]:
+    """Generate a deterministic synthetic corpus.
+
+    Memories mention services, dependencies and frameworks (recorded as
+    entities in metadata), are spread over a year of timestamps and over
+    ``users`` users. About 5% repeat an earlier memory of the same user
+    and about 5% carry an expiry date.
+
+    Args:
+        size: Number of memories.
+        seed: Random seed; the same seed always yields the same corpus.
+        users: Number of distinct user IDs.
+
+    Returns:
+        The generated memories.
+    """
+    rng = random.Random(seed)
+    memories: list[Memory] = []
+    contents_by_user: dict[str, list[tuple[str, MemoryType, list[dict[str, Any]]]]] = {}
+
+    for i in range(size):
+        user_id = f"user-{rng.randrange(users)}"
+        previous = contents_by_user.setdefault(user_id, [])
+        if previous and rng.random() < _DUPLICATE_RATE:
+            content, memory_type, entities = previous[rng.randrange(len(previous))]
+        else:
+            service = rng.choice(_SERVICES)
+            dependency = rng.choice(_DEPENDENCIES)
+            roll = rng.random()
+            if roll < 0.5:
+                memory_type = MemoryType.FACT
+                content = (
+                    f"{service} uses {dependency} for {rng.choice(_PURPOSES)} "
+                    f"(note {rng.randrange(100_000)})"
+                )
+                entities = [
+                    {"name": service, "type": "service"},
+                    {"name": dependency, "type": "dependency"},
+                ]
+            elif roll < 0.8:
+                memory_type = MemoryType.DECISION
+                target = rng.choice(_DEPENDENCIES)
+                content = (
+                    f"Decided to move {service} from {dependency} to {target} "
+                    f"because of {rng.choice(_REASONS)} (ticket {rng.randrange(100_000)})"
+                )
+                entities = [
+                    {"name": service, "type": "service"},
+                    {"name": dependency, "type": "dependency"},
+                    {"name": target, "type": "dependency"},
+                ]
+            else:
+                memory_type = MemoryType.PREFERENCE
+                framework = rng.choice(_FRAMEWORKS)
+                content = (
+                    f"Prefers {framework} for {rng.choice(_PURPOSES)} in {service} "
+                    f"(session {rng.randrange(100_000)})"
+                )
+                entities = [
+                    {"name": service, "type": "service"},
+                    {"name": framework, "type": "framework"},
+                ]
+            previous.append((content, memory_type, entities))
+
+        created_at = _EPOCH + timedelta(seconds=rng.randrange(365 * 86400))
+        expires_at = (
+            created_at + timedelta(days=rng.randrange(1, 90))
+            if rng.random() < _EXPIRING_RATE
+            else None
+        )
+        memories.append(
+            Memory(
+                user_id=user_id,
+                content=content,
+                memory_type=memory_type,
+                confidence=round(rng.uniform(0.5, 1.0), 3),
+                source="scale-benchmark",
+                created_at=created_at,
+                last_accessed_at=created_at + timedelta(hours=rng.randrange(24 * 30)),
+                expires_at=expires_at,
+                metadata={"entities": entities, "sequence": i},
+            )
+        )
+    return memories
+
+
+def generate_queries(count: int, seed: int = 0, users: int = 10) -> list[tuple[str, str]]:
+    """Generate deterministic (user_id, query) pairs for a corpus.
+
+    Args:
+        count: Number of queries.
+        seed: Random seed.
+        users: Number of users in the corpus.
+
+    Returns:
+        List of (user_id, query) tuples.
+    """
+    rng = random.Random(seed + 1_000_003)
+    queries = []
+    for _ in range(count):
+        if rng.random() < 0.5:
+            query = f"{rng.choice(_DEPENDENCIES)} {rng.choice(_PURPOSES)}"
+        else:
+            query = f"{rng.choice(_SERVICES)} {rng.choice(_DEPENDENCIES)}"
+        queries.append((f"user-{rng.randrange(users)}", query))
+    return queries
+
+
+class HashingEncoder:
+    """Deterministic feature-hashing embedder.
+
+    Implements the part of the sentence-transformers ``encode`` API that
+    VectorSearch uses. Each lowercased token adds +1 or -1 to one of
+    ``dimension`` buckets chosen by CRC32, so texts that share words get
+    similar vectors.
+    """
+
+    def __init__(self, dimension: int = 384):
+        """Initialize the encoder.
+
+        Args:
+            dimension: Embedding dimension.
+        """
+        self.dimension = dimension
+
+    def encode(
+        self,
+        sentences: list[str] | str,
+        batch_size: int = 32,
+        show_progress_bar: bool = False,
+        normalize_embeddings: bool = True,
+    ) -> NDArray[np.float32]:
+        """Embed one or more texts.
+
+        Args:
+            sentences: Text or list of texts.
+            batch_size: Ignored (kept for API compatibility).
+            show_progress_bar: Ignored (kept for API compatibility).
+            normalize_embeddings: L2-normalize each row.
+
+        Returns:
+            Array of shape (n, dimension).
+        """
+        if isinstance(sentences, str):
+            sentences = [sentences]
+        embeddings = np.zeros((len(sentences), self.dimension), dtype=np.float32)
+        for row, text in enumerate(sentences):
+            for token in text.lower().split():
+                digest = zlib.crc32(token.encode("utf-8"))
+                embeddings[row, digest % self.dimension] += 1.0 if digest & 1 << 31 else -1.0
+        if normalize_embeddings:
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings /= np.where(norms == 0, 1.0, norms)
+        return embeddings
+
+
+@dataclass
+class OperationResult:
+    """Throughput and latency percentiles for one benchmarked operation.
+
+    Attributes:
+        operation: Operation name (see OPERATIONS).
+        count: Number of timed calls.
+        items: Number of items processed (memories for bulk_store,
+            otherwise equal to count).
+        total_seconds: Summed call latency.
+        throughput: Items per second of summed latency.
+        p50_ms: Median call latency.
+        p95_ms: 95th percentile call latency.
+        p99_ms: 99th percentile call latency.
+    """
+
+    operation: str
+    count: int
+    items: int
+    total_seconds: float
+    throughput: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+
+    @classmethod
+    def from_stats(
+        cls, operation: str, stats: LatencyStats, items: Optional[int] = None
+    ) -> "OperationResult":
+        """Summarize a latency histogram.
+
+        Args:
+            operation: Operation name.
+            stats: Recorded call latencies.
+            items: Items processed (defaults to the call count).
+
+        Returns:
+            The operation result.
+        """
+        items = stats.count if items is None else items
+        total_seconds = stats.total_ms / 1000
+        return cls(
+            operation=operation,
+            count=stats.count,
+            items=items,
+            total_seconds=total_seconds,
+            throughput=items / total_seconds if total_seconds > 0 else 0.0,
+            p50_ms=stats.p50_ms,
+            p95_ms=stats.p95_ms,
+            p99_ms=stats.p99_ms,
+        )
+
+
+@dataclass
+class ScaleBenchmarkResult:
+    """Results of one benchmark run at one corpus size.
+
+    Attributes:
+        size: Number of memories in the corpus.
+        seed: Corpus seed.
+        users: Number of users in the corpus.
+        operations: Results keyed by operation name.
+        created_at: When the run finished.
+        environment: Python version and platform of the run.
+    """
+
+    size: int
+    seed: int
+    users: int
+    operations: dict[str, OperationResult]
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    environment: dict[str, str] = field(
+        default_factory=lambda: {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        }
+    )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        data = asdict(self)
+        data["created_at"] = self.created_at.isoformat()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ScaleBenchmarkResult":
+        """Create from dictionary."""
+        data = data.copy()
+        data["created_at"] = datetime.fromisoformat(data["created_at"])
+        data["operations"] = {
+            name: OperationResult(**result) for name, result in data["operations"].items()
+        }
+        return cls(**data)
+
+
+@dataclass
+class Regression:
+    """A metric that got worse than its baseline by more than the tolerance.
+
+    Attributes:
+        size: Corpus size.
+        operation: Operation name.
+        metric: Metric name (p50_ms, p95_ms, p99_ms or throughput).
+        baseline: Baseline value.
+        current: Current value.
+    """
+
+    size: int
+    operation: str
+    metric: str
+    baseline: float
+    current: float
+
+    def __str__(self) -> str:
+        """Describe the regression."""
+        return (
+            f"{size_label(self.size)} {self.operation} {self.metric}: "
+            f"{self.baseline:.3f} -> {self.current:.3f}"
+        )
+
+
+def compare_to_baseline(
+    current: ScaleBenchmarkResult,
+    baseline: ScaleBenchmarkResult,
+    tolerance: float = DEFAULT_TOLERANCE,
+    noise_floor_ms: float = DEFAULT_NOISE_FLOOR_MS,
+) -> list[Regression]:
+    """Find metrics that regressed beyond the tolerance.
+
+    A latency percentile regresses when it exceeds the baseline by more
+    than ``tolerance`` (relative) and ``noise_floor_ms`` (absolute).
+    Throughput regresses when it falls below ``baseline / (1 + tolerance)``.
+    Operations missing from either run are skipped.
+
+    Args:
+        current: Result of the current run.
+        baseline: Stored baseline for the same corpus size.
+        tolerance: Allowed relative slowdown (0.5 allows 50%).
+        noise_floor_ms: Smallest latency increase that can count.
+
+    Returns:
+        Regressions found (empty if none).
+    """
+    regressions = []
+    for name, result in current.operations.items():
+        reference = baseline.operations.get(name)
+        if reference is None:
+            continue
+        for metric in ("p50_ms", "p95_ms", "p99_ms"):
+            value, limit = getattr(result, metric), getattr(reference, metric)
+            if value > limit * (1 + tolerance) and value - limit > noise_floor_ms:
+                regressions.append(Regression(current.size, name, metric, limit, value))
+        if result.throughput < reference.throughput / (1 + tolerance):
+            regressions.append(
+                Regression(
+                    current.size, name, "throughput", reference.throughput, result.throughput
+                )
+            )
+    return regressions
+
+
+def baseline_path(size: int, directory: Path = BASELINE_DIR) -> Path:
+    """Return the baseline file for a corpus size."""
+    return directory / f"scale_{size_label(size)}.json"
+
+
+def save_baseline(result: ScaleBenchmarkResult, directory: Path = BASELINE_DIR) -> Path:
+    """Write a run as the baseline for its corpus size.
+
+    Args:
+        result: Benchmark result.
+        directory: Baseline directory.
+
+    Returns:
+        Path of the written file.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    path = baseline_path(result.size, directory)
+    path.write_text(json.dumps(result.to_dict(), indent=2) + "\n")
+    return path
+
+
+def load_baseline(size: int, directory: Path = BASELINE_DIR) -> Optional[ScaleBenchmarkResult]:
+    """Load the baseline for a corpus size.
+
+    Args:
+        size: Corpus size.
+        directory: Baseline directory.
+
+    Returns:
+        The baseline, or None if none is stored.
+    """
+    path = baseline_path(size, directory)
+    if not path.exists():
+        return None
+    return ScaleBenchmarkResult.from_dict(json.loads(path.read_text()))
+
+
+async def run_scale_benchmark(
+    size: int,
+    seed: int = 0,
+    users: int = 10,
+    query_count: int = 100,
+    store_samples: int = 200,
+    batch_size: int = 500,
+    janitor_users: int = 1,
+    encoder: Optional[Any] = None,
+) -> ScaleBenchmarkResult:
+    """Run every benchmark operation against a corpus of one size.
+
+    Args:
+        size: Number of memories in the corpus.
+        seed: Corpus and query seed.
+        users: Number of users in the corpus.
+        query_count: Queries timed for each retrieval operation.
+        store_samples: Single stores timed on the loaded hybrid provider.
+        batch_size: Memories per ``store_many`` call when loading.
+        janitor_users: Users the janitor is run for (it runs last, since
+            it modifies the corpus).
+        encoder: Embedding model for the hybrid provider (default:
+            HashingEncoder).
+
+    Returns:
+        The benchmark result.
+    """
+    from luminescent_cluster.memory.blocks.assembler import BlockAssembler
+    from luminescent_cluster.memory.janitor.runner import JanitorRunner
+    from luminescent_cluster.memory.providers.local import LocalMemoryProvider
+
+    corpus = generate_corpus(size, seed=seed, users=users)
+    queries = generate_queries(query_count, seed=seed, users=users)
+    stats: dict[str, LatencyStats] = {name: LatencyStats() for name in OPERATIONS}
+
+    def timed(operation: str, start: float) -> None:
+        stats[operation].record((time.perf_counter() - start) * 1000)
+
+    simple = LocalMemoryProvider()
+    hybrid = LocalMemoryProvider(
+        use_hybrid_retrieval=True, use_cross_encoder=False, use_query_rewriter=False
+    )
+    assert hybrid._hybrid_retriever is not None
+    hybrid._hybrid_retriever.vector._model = encoder or HashingEncoder()
+
+    async def assemble_context(user_id: str, query: str) -> None:
+        memories = await hybrid.retrieve(query, user_id, limit=10)
+        await assembler.assemble(
+            user_id=user_id,
+            task_context=query,
+            conversation_history=[{"role": "memory", "content": m.content} for m in memories],
+            query=query,
+        )
+
+    assembler = BlockAssembler()
+    await simple.store_many(corpus, {})
+    with _paused_gc():
+        for offset in range(0, size, batch_size):
+            batch = corpus[offset : offset + batch_size]
+            start = time.perf_counter()
+            await hybrid.store_many(batch, {})
+            timed("bulk_store", start)
+
+    with _paused_gc():
+        for memory in generate_corpus(store_samples, seed=seed + 1, users=users):
+            start = time.perf_counter()
+            await hybrid.store(memory, {})
+            timed("store", start)
+
+    # Untimed calls so lazy initialization is not counted
+    for user_id, query in queries[:_WARMUP_QUERIES]:
+        await simple.retrieve(query, user_id, limit=10)
+        await assemble_context(user_id, query)
+
+    with _paused_gc():
+        for user_id, query in queries:
+            start = time.perf_counter()
+            await simple.retrieve(query, user_id, limit=10)
+            timed("retrieve", start)
+
+    with _paused_gc():
+        for user_id, query in queries:
+            start = time.perf_counter()
+            await hybrid.retrieve(query, user_id, limit=10)
+            timed("hybrid_search", start)
+
+    with _paused_gc():
+        for user_id, query in queries:
+            start = time.perf_counter()
+            await assemble_context(user_id, query)
+            timed("context_assembly", start)
+
+    janitor = JanitorRunner(simple)
+    with _paused_gc():
+        for user_index in range(min(janitor_users, users)):
+            start = time.perf_counter()
+            await janitor.run_all(user_id=f"user-{user_index}")
+            timed("janitor", start)
+
+    operations = {
+        name: OperationResult.from_stats(
+            name, op_stats, items=size if name == "bulk_store" else None
+        )
+        for name, op_stats in stats.items()
+        if op_stats.count
+    }
+    return ScaleBenchmarkResult(size=size, seed=seed, users=users, operations=operations)
+
+
+def format_result(result: ScaleBenchmarkResult) -> str:
+    """Format a run as a plain-text table.
+
+    Args:
+        result: Benchmark result.
+
+    Returns:
+        One header line and one line per operation.
+    """
+    lines = [
+        f"{size_label(result.size):>6} {'operation':<17} {'count':>6} {'items/s':>11} "
+        f"{'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}"
+    ]
+    for op in result.operations.values():
+        lines.append(
+            f"{size_label(result.size):>6} {op.operation:<17} {op.count:>6} "
+            f"{op.throughput:>11.1f} {op.p50_ms:>9.3f} {op.p95_ms:>9.3f} {op.p99_ms:>9.3f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run the scale benchmarks from the command line.
+
+    Args:
+        argv: Command line arguments (default: sys.argv[1:]).
+
+    Returns:
+        Exit code: 0 on success, 1 if any metric regressed.
+    """
+    parser = argparse.ArgumentParser(description="Memory scale benchmarks")
+    parser.add_argument("--sizes", nargs="+", default=["1k", "10k"], help="e.g. 1k 10k 100k")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--store-samples", type=int, default=200)
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--baseline-dir", type=Path, default=BASELINE_DIR)
+    parser.add_argument(
+        "--update-baseline", action="store_true", help="Store results as the new baselines"
+    )
+    parser.add_argument("--output", type=Path, help="Also write all results to this JSON file")
+    args = parser.parse_args(argv)
+
+    results = []
+    regressions: list[Regression] = []
+    for label in args.sizes:
+        result = asyncio.run(
+            run_scale_benchmark(
+                parse_size(label),
+                seed=args.seed,
+                users=args.users,
+                query_count=args.queries,
+                store_samples=args.store_samples,
+            )
+        )
+        results.append(result)
+        print(format_result(result))
+
+        if args.update_baseline:
+            print(f"Baseline written to {save_baseline(result, args.baseline_dir)}")
+            continue
+        baseline = load_baseline(result.size, args.baseline_dir)
+        if baseline is None:
+            print(f"No baseline for {size_label(result.size)}; skipping comparison")
+            continue
+        regressions.extend(compare_to_baseline(result, baseline, args.tolerance))
+
+    if args.output is not None:
+        args.output.write_text(json.dumps([r.to_dict() for r in results], indent=2) + "\n")
+
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -68,7 +68,12 @@ class GraphBuilder:
         self.user_id = user_id
         self._graph = KnowledgeGraph(user_id=user_id)
         self._pending_nodes: dict[str, dict[str, Any]] = {}
-        self._pending_edges: list[dict[str, Any]] = []
+        # (source_id, target_id) -> memory_id -> edge data; the most
+        # recently added memory's edge wins when the graph is built
+        self._pending_edges: dict[tuple[str, str], dict[str, dict[str, Any]]] = {}
+        # Reverse indexes so one memory can be re-linked without a rebuild
+        self._memory_nodes: dict[str, set[str]] = {}
+        self._memory_edges: dict[str, set[tuple[str, str]]] = {}
 
     def add_memory(self, memory: Memory, memory_id: str) -> None:
         """Add a memory's entities to the graph.
@@ -100,6 +105,8 @@ class GraphBuilder:
                 }
             )
 
+            self._memory_nodes.setdefault(memory_id, set()).add(entity_id)
+
             # Create or update pending node
             if entity_id not in self._pending_nodes:
                 self._pending_nodes[entity_id] = {
@@ -254,14 +261,127 @@ class GraphBuilder:
             memory_id: Source memory ID.
             confidence: Confidence score.
         """
-        self._pending_edges.append(
-            {
-                "source_id": source_id,
-                "target_id": target_id,
-                "relationship": relationship,
-                "memory_id": memory_id,
-                "confidence": confidence,
-            }
+        pair = (source_id, target_id)
+        by_memory = self._pending_edges.setdefault(pair, {})
+        # Re-adding moves this memory's edge to the end (most recent)
+        by_memory.pop(memory_id, None)
+        by_memory[memory_id] = {
+            "source_id": source_id,
+            "target_id": target_id,
+            "relationship": relationship,
+            "memory_id": memory_id,
+            "confidence": confidence,
+        }
+        self._memory_edges.setdefault(memory_id, set()).add(pair)
+
+    def _forget_memory(self, memory_id: str) -> tuple[set[str], set[tuple[str, str]]]:
+        """Drop a memory's contributions from the pending nodes and edges.
+
+        Args:
+            memory_id: ID of the memory to forget.
+
+        Returns:
+            Tuple of (node IDs, edge pairs) the memory contributed to.
+        """
+        node_ids = self._memory_nodes.pop(memory_id, set())
+        pairs = self._memory_edges.pop(memory_id, set())
+
+        for node_id in node_ids:
+            node_data = self._pending_nodes.get(node_id)
+            if node_data is None:
+                continue
+            if memory_id in node_data["memory_ids"]:
+                node_data["memory_ids"].remove(memory_id)
+            if not node_data["memory_ids"]:
+                del self._pending_nodes[node_id]
+
+        for pair in pairs:
+            by_memory = self._pending_edges.get(pair)
+            if by_memory is None:
+                continue
+            by_memory.pop(memory_id, None)
+            if not by_memory:
+                del self._pending_edges[pair]
+
+        return node_ids, pairs
+
+    def _sync(self, node_ids: set[str], pairs: set[tuple[str, str]]) -> None:
+        """Bring the given nodes and edges of the built graph up to date.
+
+        Args:
+            node_ids: Node IDs whose pending state may have changed.
+            pairs: Edge (source, target) pairs whose pending state may have changed.
+        """
+        for node_id in node_ids:
+            node_data = self._pending_nodes.get(node_id)
+            if node_data is None:
+                self._graph.remove_node(node_id)
+            else:
+                self._graph.add_node(self._make_node(node_data))
+
+        for pair in pairs:
+            by_memory = self._pending_edges.get(pair)
+            if by_memory is None:
+                self._graph.remove_edge(*pair)
+            else:
+                self._graph.add_edge(self._make_edge(next(reversed(by_memory.values()))))
+
+    def update_memory(self, memory: Memory, memory_id: str) -> KnowledgeGraph:
+        """Re-link one memory and patch the built graph in place.
+
+        Only nodes and edges the memory contributed to before or after the
+        update are touched, so the cost is proportional to the memory's
+        entities rather than the size of the graph.
+
+        Args:
+            memory: The updated memory.
+            memory_id: ID of the memory.
+
+        Returns:
+            The updated KnowledgeGraph.
+        """
+        old_nodes, old_pairs = self._forget_memory(memory_id)
+        self.add_memory(memory, memory_id)
+        self._sync(
+            old_nodes | self._memory_nodes.get(memory_id, set()),
+            old_pairs | self._memory_edges.get(memory_id, set()),
+        )
+        return self._graph
+
+    def remove_memory(self, memory_id: str) -> KnowledgeGraph:
+        """Unlink one memory and patch the built graph in place.
+
+        Nodes referenced by no other memory are removed.
+
+        Args:
+            memory_id: ID of the memory to remove.
+
+        Returns:
+            The updated KnowledgeGraph.
+        """
+        self._sync(*self._forget_memory(memory_id))
+        return self._graph
+
+    @staticmethod
+    def _make_node(node_data: dict[str, Any]) -> GraphNode:
+        """Create a GraphNode from pending node data."""
+        return GraphNode(
+            id=node_data["id"],
+            entity_type=node_data["entity_type"],
+            name=node_data["name"],
+            memory_ids=node_data["memory_ids"],
+            metadata=node_data["metadata"],
+        )
+
+    @staticmethod
+    def _make_edge(edge_data: dict[str, Any]) -> GraphEdge:
+        """Create a GraphEdge from pending edge data."""
+        return GraphEdge(
+            source_id=edge_data["source_id"],
+            target_id=edge_data["target_id"],
+            relationship=edge_data["relationship"],
+            memory_id=edge_data["memory_id"],
+            confidence=edge_data["confidence"],
         )
 
     def build(self) -> KnowledgeGraph:
@@ -272,26 +392,10 @@ class GraphBuilder:
         """
         # Add all pending nodes
         for node_data in self._pending_nodes.values():
-            self._graph.add_node(
-                GraphNode(
-                    id=node_data["id"],
-                    entity_type=node_data["entity_type"],
-                    name=node_data["name"],
-                    memory_ids=node_data["memory_ids"],
-                    metadata=node_data["metadata"],
-                )
-            )
+            self._graph.add_node(self._make_node(node_data))
 
-        # Add all pending edges
-        for edge_data in self._pending_edges:
-            self._graph.add_edge(
-                GraphEdge(
-                    source_id=edge_data["source_id"],
-                    target_id=edge_data["target_id"],
-                    relationship=edge_data["relationship"],
-                    memory_id=edge_data["memory_id"],
-                    confidence=edge_data["confidence"],
-                )
-            )
+        # Add all pending edges (the most recent memory's edge per pair)
+        for by_memory in self._pending_edges.values():
+            self._graph.add_edge(self._make_edge(next(reversed(by_memory.values()))))
 
         return self._graph
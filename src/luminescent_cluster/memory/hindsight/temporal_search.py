@@ -263,14 +263,7 @@ class TemporalSearch:
 
         # Filter by keywords if no other filters matched
         if parsed.keywords and not results:
-            all_events = list(self.timeline._events.values())
-            results = [
-                e for e in all_events if any(kw in e.content.lower() for kw in parsed.keywords)
-            ]
-
-            # Apply time range if specified
-            if parsed.time_range:
-                results = [e for e in results if parsed.time_range.contains(e.timestamp)]
+            results = self.timeline.query_by_keywords(parsed.keywords, parsed.time_range)
 
         return results[:limit]
 
@@ -7,11 +7,18 @@ Timeline is the core storage component for temporal memory:
 
 Design decisions:
 - In-memory storage for Phase 4.2 (persistence in Phase 4.3)
-- Events are stored in a sorted list by timestamp
-- Multiple indexes (by entity, by network) for efficient queries
-- State reconstruction uses supersedes chain
+- Events are kept in sorted indexes keyed on (timestamp, insertion order):
+  one global, one per entity and one per network. Range queries bisect
+  into the narrowest index, so they cost O(log n + k) and need no sort.
+- A token -> event ID postings index serves keyword queries without
+  scanning every event's text
+- State reconstruction walks one entity's index backwards from the query
+  time and follows the supersedes chain; results are cached per entity
+  and invalidated when that entity's events change
 """
 
+import re
+from bisect import bisect_left, bisect_right
 from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
@@ -19,6 +26,83 @@ from typing import Any, Optional
 
 from luminescent_cluster.memory.hindsight.types import NetworkType, TemporalEvent, TimeRange
 
+# Index entries sort by event time, then insertion order (ties keep the
+# order events were added, like a stable sort)
+_IndexKey = tuple[datetime, int, str]
+
+# Maximum cached state-at lookups per entity
+_STATE_CACHE_SIZE = 256
+
+# Terms indexed for keyword queries
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def _terms(text: str) -> set[str]:
+    """Return the distinct lowercase terms of a text."""
+    return set(_TOKEN_PATTERN.findall(text.lower()))
+
+
+class _SortedIndex:
+    """Event keys kept in chronological order for bisection.
+
+    In-order inserts are appends. Out-of-order inserts are appended too
+    and the list is re-sorted on the next read; Timsort handles the
+    mostly-sorted result in near-linear time, so bulk loads stay cheap.
+    """
+
+    __slots__ = ("_keys", "_sorted")
+
+    def __init__(self) -> None:
+        self._keys: list[_IndexKey] = []
+        self._sorted = True
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, key: _IndexKey) -> None:
+        """Insert a key."""
+        if self._keys and key < self._keys[-1]:
+            self._sorted = False
+        self._keys.append(key)
+
+    def keys(self) -> list[_IndexKey]:
+        """Return the keys in chronological order (not a copy)."""
+        if not self._sorted:
+            self._keys.sort()
+            self._sorted = True
+        return self._keys
+
+    def discard(self, key: _IndexKey) -> None:
+        """Remove a key if present (located by bisection)."""
+        keys = self.keys()
+        i = bisect_left(keys, key)
+        if i < len(keys) and keys[i] == key:
+            del keys[i]
+
+    def before(self, at_time: datetime) -> int:
+        """Return how many keys have a timestamp at or before ``at_time``."""
+        return bisect_right(self.keys(), (at_time, float("inf")))
+
+    def range(self, time_range: Optional[TimeRange]) -> list[_IndexKey]:
+        """Return the keys inside a time range, in chronological order.
+
+        Args:
+            time_range: Range to select, or None for every key
+
+        Returns:
+            The matching keys
+        """
+        keys = self.keys()
+        if time_range is None:
+            return keys
+        lo = bisect_left(keys, (time_range.start,))
+        if time_range.end is None:
+            return keys[lo:]
+        return keys[lo : self.before(time_range.end)]
+
+
+_EMPTY_INDEX = _SortedIndex()
+
 
 @dataclass
 class Timeline:
@@ -37,12 +121,25 @@ class Timeline:
 
     # Internal storage
     _events: dict[str, TemporalEvent] = field(default_factory=dict)
-    _events_by_entity: dict[str, list[str]] = field(default_factory=lambda: defaultdict(list))
-    _events_by_network: dict[NetworkType, list[str]] = field(
-        default_factory=lambda: defaultdict(list)
+    _keys: dict[str, _IndexKey] = field(default_factory=dict)
+    _next_seq: int = 0
+
+    # Sorted indexes of (timestamp, seq, event_id)
+    _time_index: _SortedIndex = field(default_factory=_SortedIndex)
+    _events_by_entity: dict[str, _SortedIndex] = field(
+        default_factory=lambda: defaultdict(_SortedIndex)
+    )
+    _events_by_network: dict[NetworkType, _SortedIndex] = field(
+        default_factory=lambda: defaultdict(_SortedIndex)
     )
     _supersedes_index: dict[str, str] = field(default_factory=dict)
 
+    # term -> IDs of events whose content contains it
+    _events_by_term: dict[str, set[str]] = field(default_factory=lambda: defaultdict(set))
+
+    # entity_id -> {at_time: event_id or None}
+    _state_cache: dict[str, dict[datetime, Optional[str]]] = field(default_factory=dict)
+
     def count(self) -> int:
         """Return the number of events in the timeline."""
         return len(self._events)
@@ -53,19 +150,29 @@ class Timeline:
         Args:
             event: The TemporalEvent to add
         """
+        # Re-adding an ID replaces the previous event
+        if event.id in self._events:
+            self.remove_event(event.id)
+
         # Store the event
         self._events[event.id] = event
+        key = (event.timestamp, self._next_seq, event.id)
+        self._next_seq += 1
+        self._keys[event.id] = key
 
-        # Index by entity
-        self._events_by_entity[event.entity_id].append(event.id)
-
-        # Index by network
-        self._events_by_network[event.network].append(event.id)
+        # Index by time, entity and network
+        self._time_index.add(key)
+        self._events_by_entity[event.entity_id].add(key)
+        self._events_by_network[event.network].add(key)
+        for term in _terms(event.content):
+            self._events_by_term[term].add(event.id)
 
         # Index supersedes relationship
         if event.supersedes:
             self._supersedes_index[event.supersedes] = event.id
 
+        self._invalidate_state(event)
+
     def get_event(self, event_id: str) -> Optional[TemporalEvent]:
         """Get an event by ID.
 
@@ -92,22 +199,45 @@ class Timeline:
 
         # Remove from main storage
         del self._events[event_id]
-
-        # Remove from entity index
-        if event_id in self._events_by_entity[event.entity_id]:
-            self._events_by_entity[event.entity_id].remove(event_id)
-
-        # Remove from network index
-        if event_id in self._events_by_network[event.network]:
-            self._events_by_network[event.network].remove(event_id)
+        key = self._keys.pop(event_id)
+
+        # Remove from the sorted indexes
+        self._time_index.discard(key)
+        self._events_by_entity[event.entity_id].discard(key)
+        self._events_by_network[event.network].discard(key)
+        if not self._events_by_entity[event.entity_id]:
+            del self._events_by_entity[event.entity_id]
+        for term in _terms(event.content):
+            postings = self._events_by_term.get(term)
+            if postings is not None:
+                postings.discard(event_id)
+                if not postings:
+                    del self._events_by_term[term]
 
         # Remove from supersedes index
         if event.supersedes and event.supersedes in self._supersedes_index:
             if self._supersedes_index[event.supersedes] == event_id:
                 del self._supersedes_index[event.supersedes]
 
+        self._invalidate_state(event)
         return True
 
+    def _invalidate_state(self, event: TemporalEvent) -> None:
+        """Drop cached state lookups that the given event may affect.
+
+        Args:
+            event: An event that was added or removed
+        """
+        self._state_cache.pop(event.entity_id, None)
+        superseded = self._events.get(event.supersedes) if event.supersedes else None
+        if superseded is not None:
+            self._state_cache.pop(superseded.entity_id, None)
+
+    def _resolve(self, keys: list[_IndexKey]) -> list[TemporalEvent]:
+        """Map index keys to their events."""
+        events = self._events
+        return [events[event_id] for _, _, event_id in keys]
+
     def query_by_time(self, time_range: TimeRange) -> list[TemporalEvent]:
         """Query events within a time range.
 
@@ -117,11 +247,7 @@ class Timeline:
         Returns:
             List of events within the time range, sorted chronologically
         """
-        results = [event for event in self._events.values() if time_range.contains(event.timestamp)]
-
-        # Sort by timestamp
-        results.sort(key=lambda e: e.timestamp)
-        return results
+        return self._resolve(self._time_index.range(time_range))
 
     def query_by_entity(self, entity_id: str) -> list[TemporalEvent]:
         """Query events for a specific entity.
@@ -132,10 +258,7 @@ class Timeline:
         Returns:
             List of events for the entity, sorted chronologically
         """
-        event_ids = self._events_by_entity.get(entity_id, [])
-        results = [self._events[eid] for eid in event_ids if eid in self._events]
-        results.sort(key=lambda e: e.timestamp)
-        return results
+        return self._resolve(self._events_by_entity.get(entity_id, _EMPTY_INDEX).keys())
 
     def query_by_entities(self, entity_ids: list[str]) -> list[TemporalEvent]:
         """Query events for multiple entities.
@@ -146,20 +269,68 @@ class Timeline:
         Returns:
             List of events for the entities, sorted chronologically
         """
-        results = []
-        for entity_id in entity_ids:
-            results.extend(self.query_by_entity(entity_id))
+        merged: set[_IndexKey] = set()
+        for entity_id in set(entity_ids):
+            merged.update(self._events_by_entity.get(entity_id, _EMPTY_INDEX).keys())
+        return self._resolve(sorted(merged))
+
+    def query_by_keywords(
+        self,
+        keywords: list[str],
+        time_range: Optional[TimeRange] = None,
+    ) -> list[TemporalEvent]:
+        """Query events whose content contains any of the keywords.
 
-        # Deduplicate and sort
-        seen = set()
-        unique_results = []
-        for event in results:
-            if event.id not in seen:
-                seen.add(event.id)
-                unique_results.append(event)
+        Matching is a case-insensitive substring test, as in a full scan.
+        Candidates come from the term postings: every word piece of a
+        keyword must occur inside some term of the event. Candidates are
+        then intersected with the time range (whichever side is smaller
+        is iterated) and verified against the content.
 
-        unique_results.sort(key=lambda e: e.timestamp)
-        return unique_results
+        Args:
+            keywords: Keywords to look for (any may match)
+            time_range: Optional time range filter
+
+        Returns:
+            List of matching events, sorted chronologically
+        """
+        needles = [kw.lower() for kw in keywords if kw]
+        if not needles:
+            return []
+
+        candidates: Optional[set[str]] = set()
+        for needle in needles:
+            pieces = _TOKEN_PATTERN.findall(needle)
+            if not pieces:
+                # No word characters to look up; verify every event in range
+                candidates = None
+                break
+            matching: Optional[set[str]] = None
+            for piece in pieces:
+                ids: set[str] = set()
+                for term, postings in self._events_by_term.items():
+                    if piece in term:
+                        ids |= postings
+                matching = ids if matching is None else matching & ids
+                if not matching:
+                    break
+            candidates |= matching or set()
+
+        if candidates is None:
+            keys = self._time_index.range(time_range)
+        elif time_range is not None and len(self._time_index.range(time_range)) < len(candidates):
+            keys = [k for k in self._time_index.range(time_range) if k[2] in candidates]
+        else:
+            keys = sorted(self._keys[eid] for eid in candidates if eid in self._keys)
+            if time_range is not None:
+                keys = [k for k in keys if time_range.contains(k[0])]
+
+        results = []
+        for event in self._resolve(keys):
+            content = event.content.lower()
+            if any(needle in content for needle in needles):
+                results.append(event)
+        return results
 
     def query_by_network(self, network: NetworkType) -> list[TemporalEvent]:
         """Query events by network type.
@@ -170,10 +341,7 @@ class Timeline:
         Returns:
             List of events for the network, sorted chronologically
         """
-        event_ids = self._events_by_network.get(network, [])
-        results = [self._events[eid] for eid in event_ids if eid in self._events]
-        results.sort(key=lambda e: e.timestamp)
-        return results
+        return self._resolve(self._events_by_network.get(network, _EMPTY_INDEX).keys())
 
     def query(
         self,
@@ -191,23 +359,19 @@ class Timeline:
         Returns:
             List of events matching all filters, sorted chronologically
         """
-        # Start with all events
-        results = list(self._events.values())
-
-        # Apply time range filter
-        if time_range:
-            results = [e for e in results if time_range.contains(e.timestamp)]
-
-        # Apply entity filter
+        # Start from the narrowest sorted index, then bisect the time range
         if entity_id:
-            results = [e for e in results if e.entity_id == entity_id]
+            index = self._events_by_entity.get(entity_id, _EMPTY_INDEX)
+        elif network:
+            index = self._events_by_network.get(network, _EMPTY_INDEX)
+        else:
+            index = self._time_index
 
-        # Apply network filter
-        if network:
-            results = [e for e in results if e.network == network]
+        results = self._resolve(index.range(time_range))
 
-        # Sort by timestamp
-        results.sort(key=lambda e: e.timestamp)
+        # Entity index already filtered the entity; apply network if needed
+        if entity_id and network:
+            results = [e for e in results if e.network == network]
         return results
 
     def get_entity_state_at(
@@ -227,22 +391,37 @@ class Timeline:
         Returns:
             The event representing the state, or None if no state exists
         """
-        # Get all events for this entity that occurred before at_time
-        entity_events = self.query_by_entity(entity_id)
-        candidates = [
-            e
-            for e in entity_events
-            if e.timestamp <= at_time and (e.valid_from is None or e.valid_from <= at_time)
-        ]
-
-        if not candidates:
-            return None
-
-        # Find the most recent event that wasn't superseded before at_time
-        # Sort by timestamp descending
-        candidates.sort(key=lambda e: e.timestamp, reverse=True)
-
-        for candidate in candidates:
+        cache = self._state_cache.setdefault(entity_id, {})
+        if at_time in cache:
+            event_id = cache[at_time]
+            return self._events[event_id] if event_id is not None else None
+
+        state = self._find_state_at(entity_id, at_time)
+
+        if len(cache) >= _STATE_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[at_time] = state.id if state is not None else None
+        return state
+
+    def _find_state_at(self, entity_id: str, at_time: datetime) -> Optional[TemporalEvent]:
+        """Uncached lookup behind get_entity_state_at.
+
+        Args:
+            entity_id: The entity to get state for
+            at_time: The point in time to query
+
+        Returns:
+            The event representing the state, or None if no state exists
+        """
+        index = self._events_by_entity.get(entity_id, _EMPTY_INDEX)
+        keys = index.keys()
+
+        # Walk back from the last event recorded at or before at_time
+        for i in range(index.before(at_time) - 1, -1, -1):
+            candidate = self._events[keys[i][2]]
+            if candidate.valid_from is not None and candidate.valid_from > at_time:
+                continue
+
             # Check if this event was superseded by something before at_time
             superseding_id = self._supersedes_index.get(candidate.id)
             if superseding_id:
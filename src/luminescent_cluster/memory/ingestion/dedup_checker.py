@@ -46,12 +46,15 @@ class DuplicateCheckResult:
         existing_memory_id: ID of the matching memory (if duplicate).
         similarity_score: Highest similarity score found.
         checked_count: Number of memories checked.
+        batch_index: Index of the matching earlier item when the duplicate
+            was found within a batch rather than in the provider.
     """
 
     is_duplicate: bool
     existing_memory_id: Optional[str]
     similarity_score: float
     checked_count: int
+    batch_index: Optional[int] = None
 
 
 class DedupChecker:
@@ -158,6 +161,99 @@ class DedupChecker:
             checked_count=len(existing_memories),
         )
 
+    async def check_duplicates(
+        self,
+        items: list[tuple[str, str, Optional[str]]],
+        storable: Optional[list[bool]] = None,
+    ) -> list[DuplicateCheckResult]:
+        """Check a batch of contents against the corpus and each other.
+
+        The provider is searched once per distinct (user_id, memory_type)
+        pair rather than once per item. Each item is compared against that
+        corpus and against earlier items in the batch with the same scope
+        that will be stored, so a batch cannot smuggle in two copies of the
+        same memory. An earlier item counts only if it is not a duplicate
+        itself and is marked storable. A within-batch match has no
+        ``existing_memory_id`` and reports the item in ``batch_index``.
+
+        Args:
+            items: List of (content, user_id, memory_type) tuples.
+            storable: Optional per-item flags; items marked False (e.g.
+                blocked for other reasons) are not compared against.
+
+        Returns:
+            One DuplicateCheckResult per item, in input order.
+
+        Raises:
+            DedupCheckError: If any provider search fails.
+        """
+        corpora: dict[tuple[str, Optional[str]], list[tuple[Optional[str], set[str]]]] = {}
+        for _content, user_id, memory_type in items:
+            scope = (user_id, memory_type)
+            if scope in corpora:
+                continue
+
+            filters: dict[str, Any] = {}
+            if memory_type:
+                filters["memory_type"] = memory_type
+            try:
+                existing_memories = await self.provider.search(
+                    user_id=user_id,
+                    filters=filters,
+                    limit=self.MAX_MEMORIES_TO_CHECK,
+                )
+            except Exception as e:
+                raise DedupCheckError(f"Cannot verify uniqueness due to provider error: {e}") from e
+
+            corpus = []
+            for memory in existing_memories or []:
+                memory_content = self._get_content(memory)
+                if memory_content:
+                    corpus.append((self._get_id(memory), self._tokenize(memory_content)))
+            corpora[scope] = corpus
+
+        checked_counts = {scope: len(corpus) for scope, corpus in corpora.items()}
+        batch_seen: dict[tuple[str, Optional[str]], list[tuple[int, set[str]]]] = {}
+        results: list[DuplicateCheckResult] = []
+        for index, (content, user_id, memory_type) in enumerate(items):
+            scope = (user_id, memory_type)
+            content_words = self._tokenize(content)
+
+            highest_similarity = 0.0
+            matching_id: Optional[str] = None
+            matching_index: Optional[int] = None
+            for memory_id, existing_words in corpora[scope]:
+                similarity = self._jaccard_similarity(content_words, existing_words)
+                if similarity > highest_similarity:
+                    highest_similarity = similarity
+                    if similarity >= self.similarity_threshold:
+                        matching_id = memory_id
+                        matching_index = None
+            for batch_index, batch_words in batch_seen.get(scope, []):
+                similarity = self._jaccard_similarity(content_words, batch_words)
+                if similarity > highest_similarity:
+                    highest_similarity = similarity
+                    if similarity >= self.similarity_threshold:
+                        matching_id = None
+                        matching_index = batch_index
+
+            is_duplicate = highest_similarity >= self.similarity_threshold
+            results.append(
+                DuplicateCheckResult(
+                    is_duplicate=is_duplicate,
+                    existing_memory_id=matching_id,
+                    similarity_score=highest_similarity,
+                    checked_count=checked_counts[scope],
+                    batch_index=matching_index,
+                )
+            )
+
+            # Later items are also checked against this one if it is stored
+            if not is_duplicate and (storable is None or storable[index]):
+                batch_seen.setdefault(scope, []).append((index, content_words))
+
+        return results
+
     def calculate_similarity(self, text1: str, text2: str) -> float:
         """Calculate similarity between two texts.
 
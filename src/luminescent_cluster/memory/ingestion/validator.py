@@ -23,10 +23,14 @@ from luminescent_cluster.memory.ingestion.citation_detector import CitationDetec
 from luminescent_cluster.memory.ingestion.dedup_checker import (
     DedupCheckError,
     DedupChecker,
+    DuplicateCheckResult,
     MemoryProviderProtocol,
 )
 from luminescent_cluster.memory.ingestion.evidence import EvidenceObject
-from luminescent_cluster.memory.ingestion.hedge_detector import HedgeDetector
+from luminescent_cluster.memory.ingestion.hedge_detector import (
+    HedgeDetectionResult,
+    HedgeDetector,
+)
 from luminescent_cluster.memory.ingestion.result import IngestionTier, ValidationResult
 
 
@@ -119,6 +123,91 @@ class IngestionValidator:
             user_id: User ID for deduplication scope.
             metadata: Optional additional metadata.
 
+        Returns:
+            ValidationResult with tier, evidence, and check details.
+        """
+        dedup_result: Optional[DuplicateCheckResult] = None
+        dedup_check_failed = False
+        if self.dedup_checker and self.enable_dedup:
+            try:
+                dedup_result = await self.dedup_checker.check_duplicate(
+                    content, user_id, memory_type
+                )
+            except DedupCheckError:
+                # SECURITY: Fail-closed - cannot verify uniqueness, flag for review
+                dedup_check_failed = True
+
+        return self._build_result(
+            content, memory_type, source, metadata, dedup_result, dedup_check_failed
+        )
+
+    async def validate_many(
+        self,
+        items: list[dict[str, Any]],
+    ) -> list[ValidationResult]:
+        """Validate a batch of memories in one pass.
+
+        Equivalent to calling ``validate`` per item, except that duplicate
+        detection searches the provider once per (user_id, memory_type) pair
+        and also catches duplicates within the batch itself. Items are only
+        compared against earlier items that are not blocked.
+
+        Args:
+            items: Dicts with ``content``, ``memory_type``, ``source``,
+                ``user_id`` and optional ``metadata`` keys.
+
+        Returns:
+            One ValidationResult per item, in input order.
+        """
+        hedge_results = [self.hedge_detector.analyze(item["content"]) for item in items]
+        dedup_results: list[Optional[DuplicateCheckResult]] = [None] * len(items)
+        dedup_check_failed = False
+        if self.dedup_checker and self.enable_dedup and items:
+            try:
+                dedup_results = list(
+                    await self.dedup_checker.check_duplicates(
+                        [(i["content"], i["user_id"], i["memory_type"]) for i in items],
+                        storable=[not h.is_speculative for h in hedge_results],
+                    )
+                )
+            except DedupCheckError:
+                # SECURITY: Fail-closed for the whole batch
+                dedup_check_failed = True
+
+        return [
+            self._build_result(
+                item["content"],
+                item["memory_type"],
+                item["source"],
+                item.get("metadata"),
+                dedup_result,
+                dedup_check_failed,
+                hedge_result,
+            )
+            for item, dedup_result, hedge_result in zip(items, dedup_results, hedge_results)
+        ]
+
+    def _build_result(
+        self,
+        content: str,
+        memory_type: str,
+        source: str,
+        metadata: Optional[dict[str, Any]],
+        dedup_result: Optional[DuplicateCheckResult],
+        dedup_check_failed: bool,
+        hedge_result: Optional[HedgeDetectionResult] = None,
+    ) -> ValidationResult:
+        """Run the content checks and combine them with a dedup outcome.
+
+        Args:
+            content: Memory content to validate.
+            memory_type: Type of memory.
+            source: Source of the memory.
+            metadata: Optional additional metadata.
+            dedup_result: Duplicate check outcome, or None if dedup did not run.
+            dedup_check_failed: Whether the duplicate check raised.
+            hedge_result: Hedge analysis already computed for this content.
+
         Returns:
             ValidationResult with tier, evidence, and check details.
         """
@@ -139,7 +228,8 @@ class IngestionValidator:
             source_id = None
 
         # === Check 2: Hedge word detection ===
-        hedge_result = self.hedge_detector.analyze(content)
+        if hedge_result is None:
+            hedge_result = self.hedge_detector.analyze(content)
         has_hedge_words = hedge_result.is_speculative
 
         if has_hedge_words:
@@ -150,24 +240,19 @@ class IngestionValidator:
 
         # === Check 3: Deduplication ===
         is_duplicate = False
-        dedup_check_failed = False
-        if self.dedup_checker and self.enable_dedup:
-            try:
-                dedup_result = await self.dedup_checker.check_duplicate(
-                    content, user_id, memory_type
-                )
-                is_duplicate = dedup_result.is_duplicate
-                similarity_score = dedup_result.similarity_score
-
-                if is_duplicate:
-                    checks_failed.append(f"duplicate_detected: {dedup_result.existing_memory_id}")
-                    conflicting_memory_id = dedup_result.existing_memory_id
-                else:
-                    checks_passed.append("unique_content")
-            except DedupCheckError:
-                # SECURITY: Fail-closed - cannot verify uniqueness, flag for review
-                dedup_check_failed = True
-                checks_failed.append("dedup_check_failed: cannot verify uniqueness")
+        if dedup_check_failed:
+            checks_failed.append("dedup_check_failed: cannot verify uniqueness")
+        elif dedup_result is not None:
+            is_duplicate = dedup_result.is_duplicate
+            similarity_score = dedup_result.similarity_score
+
+            if is_duplicate and dedup_result.batch_index is not None:
+                checks_failed.append(f"duplicate_detected: batch item {dedup_result.batch_index}")
+            elif is_duplicate:
+                checks_failed.append(f"duplicate_detected: {dedup_result.existing_memory_id}")
+                conflicting_memory_id = dedup_result.existing_memory_id
+            else:
+                checks_passed.append("unique_content")
 
         # === Determine tier ===
         tier = self._determine_tier(
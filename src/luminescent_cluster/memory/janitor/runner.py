@@ -17,6 +17,7 @@ from typing import Any, Dict, Optional
 from luminescent_cluster.memory.janitor.contradiction import ContradictionHandler
 from luminescent_cluster.memory.janitor.deduplication import Deduplicator
 from luminescent_cluster.memory.janitor.expiration import ExpirationCleaner
+from luminescent_cluster.memory.observability.metrics import MemoryMetrics
 
 
 class JanitorRunner:
@@ -30,6 +31,7 @@ class JanitorRunner:
         deduplicator: Deduplication task handler.
         contradiction_handler: Contradiction resolution handler.
         expiration_cleaner: Expiration cleanup handler.
+        memory_metrics: Collector for per-task latency histograms.
 
     Example:
         >>> runner = JanitorRunner(provider)
@@ -43,6 +45,7 @@ class JanitorRunner:
         deduplicator: Optional[Deduplicator] = None,
         contradiction_handler: Optional[ContradictionHandler] = None,
         expiration_cleaner: Optional[ExpirationCleaner] = None,
+        memory_metrics: Optional[MemoryMetrics] = None,
     ):
         """Initialize the janitor runner.
 
@@ -51,11 +54,16 @@ class JanitorRunner:
             deduplicator: Custom deduplicator (creates default if not provided).
             contradiction_handler: Custom handler (creates default if not provided).
             expiration_cleaner: Custom cleaner (creates default if not provided).
+            memory_metrics: Collector for task latencies (operations
+                "janitor.deduplication", "janitor.contradiction",
+                "janitor.expiration" and "janitor.run_all"). Pass the
+                provider's collector to expose them together.
         """
         self.provider = provider
         self.deduplicator = deduplicator or Deduplicator()
         self.contradiction_handler = contradiction_handler or ContradictionHandler()
         self.expiration_cleaner = expiration_cleaner or ExpirationCleaner()
+        self.memory_metrics = memory_metrics or MemoryMetrics()
 
     async def run_deduplication(self, user_id: str) -> Dict[str, Any]:
         """Run deduplication task.
@@ -66,7 +74,8 @@ class JanitorRunner:
         Returns:
             Deduplication statistics.
         """
-        return await self.deduplicator.run(self.provider, user_id)
+        with self.memory_metrics.timer("janitor.deduplication"):
+            return await self.deduplicator.run(self.provider, user_id)
 
     async def run_contradiction_resolution(self, user_id: str) -> Dict[str, Any]:
         """Run contradiction resolution task.
@@ -77,7 +86,8 @@ class JanitorRunner:
         Returns:
             Contradiction resolution statistics.
         """
-        return await self.contradiction_handler.run(self.provider, user_id)
+        with self.memory_metrics.timer("janitor.contradiction"):
+            return await self.contradiction_handler.run(self.provider, user_id)
 
     async def run_expiration_cleanup(self, user_id: str) -> Dict[str, Any]:
         """Run expiration cleanup task.
@@ -88,7 +98,8 @@ class JanitorRunner:
         Returns:
             Expiration cleanup statistics.
         """
-        return await self.expiration_cleaner.run(self.provider, user_id)
+        with self.memory_metrics.timer("janitor.expiration"):
+            return await self.expiration_cleaner.run(self.provider, user_id)
 
     async def run_all(self, user_id: Optional[str] = None) -> Dict[str, Any]:
         """Run all cleanup tasks.
@@ -112,6 +123,7 @@ class JanitorRunner:
 
         end_time = time.perf_counter()
         duration_ms = (end_time - start_time) * 1000
+        self.memory_metrics.record_latency("janitor.run_all", duration_ms)
 
         # Combine results
         total_processed = (
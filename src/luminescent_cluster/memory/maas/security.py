@@ -23,6 +23,8 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Optional
 
+from luminescent_cluster.rate_limit_backend import RateLimitBackend
+
 
 # =============================================================================
 # MEXTRA Validator
@@ -242,22 +244,28 @@ class MemoryPoisoningDefense:
 class AgentRateLimiter:
     """Rate limiter for agent operations.
 
-    Implements sliding window rate limiting per agent.
+    Implements sliding window rate limiting per agent. With a shared
+    RateLimitBackend (e.g. SQLite for several processes on one host) the
+    limit is enforced across every process as a token bucket of
+    ``requests_per_minute`` refilled over ``window_seconds``.
     """
 
     def __init__(
         self,
         requests_per_minute: int = 60,
         window_seconds: float = 60.0,
+        backend: Optional[RateLimitBackend] = None,
     ):
         """Initialize rate limiter.
 
         Args:
             requests_per_minute: Max requests per minute.
             window_seconds: Window size in seconds.
+            backend: Optional shared bucket state (default: in-process).
         """
         self.max_requests = requests_per_minute
         self.window_seconds = window_seconds
+        self.backend = backend
         self._requests: dict[str, list[float]] = {}
         self._lock = threading.RLock()
 
@@ -270,6 +278,18 @@ class AgentRateLimiter:
         Returns:
             Tuple of (allowed, reason).
         """
+        if self.backend is not None:
+            allowed, _ = self.backend.take(
+                f"agent:{agent_id}",
+                1.0,
+                float(self.max_requests),
+                self.max_requests / self.window_seconds,
+                time.time(),
+            )
+            if not allowed:
+                return False, f"Rate limit exceeded ({self.max_requests}/min)"
+            return True, None
+
         with self._lock:
             now = time.time()
 
@@ -15,6 +15,7 @@ ADR Reference: ADR-003 Memory Architecture, Phase 1a (Storage)
 """
 
 from luminescent_cluster.memory.mcp.tools import (
+    create_memories,
     create_memory,
     delete_memory,
     get_memories,
@@ -28,6 +29,7 @@ from luminescent_cluster.memory.mcp.tools import (
 
 __all__ = [
     "create_memory",
+    "create_memories",
     "get_memories",
     "get_memory_by_id",
     "search_memories",
@@ -7,7 +7,7 @@ Provides MCP-compatible tool functions for creating, reading,
 searching, and deleting memories.
 
 Related GitHub Issues:
-- #86: create_memory MCP Tool
+- #86: create_memory MCP Tool (create_memories for batches)
 - #87: get_memories MCP Tool
 - #88: search_memories MCP Tool
 - #89: delete_memory MCP Tool
@@ -35,6 +35,9 @@ _local_provider: Optional[LocalMemoryProvider] = None
 _ingestion_validator: Optional[IngestionValidator] = None
 _review_queue: Optional[ReviewQueue] = None
 
+# Arguments every create_memories entry must provide
+_REQUIRED_MEMORY_FIELDS = ("user_id", "content", "memory_type", "source")
+
 
 def _log_audit_event(
     actor: str,
@@ -290,6 +293,180 @@ async def create_memory(
     }
 
 
+async def create_memories(
+    memories: list[dict[str, Any]],
+    bypass_validation: bool = False,
+) -> dict[str, Any]:
+    """Create several memories in one call with batched validation.
+
+    MCP Tool for backfills and conversation-extraction bursts. Applies the
+    same 3-tier validation as create_memory, but duplicate detection runs
+    once against existing memories and also across the batch itself, and
+    approved memories are stored and indexed in a single provider call.
+
+    Args:
+        memories: Dicts with the create_memory arguments: ``user_id``,
+            ``content``, ``memory_type``, ``source`` and optional
+            ``confidence``, ``raw_source`` and ``metadata``.
+        bypass_validation: Skip validation (for internal/trusted sources).
+
+    Returns:
+        Dict with one create_memory-style result per input (in order)
+        and counts of created, pending, blocked and invalid entries.
+        Entries missing a required field or with an unknown memory_type
+        get an error result; the rest of the batch is still processed.
+
+    Example:
+        >>> result = await create_memories([
+        ...     {"user_id": "user-123", "content": "Prefers tabs",
+        ...      "memory_type": "preference", "source": "conversation"},
+        ... ])
+        >>> print(result["created"])
+    """
+    results: list[Optional[dict[str, Any]]] = [None] * len(memories)
+
+    # Reject malformed entries up front so they never reach the provider
+    valid_indexes: list[int] = []
+    for index, item in enumerate(memories):
+        if not isinstance(item, dict):
+            results[index] = {"error": "Invalid memory: expected an object"}
+            continue
+        missing = [key for key in _REQUIRED_MEMORY_FIELDS if item.get(key) is None]
+        if missing:
+            results[index] = {"error": f"Missing required field(s): {', '.join(missing)}"}
+            continue
+        try:
+            MemoryType(item.get("memory_type"))
+        except ValueError:
+            results[index] = {"error": f"Invalid memory_type: {item.get('memory_type')}"}
+            continue
+        valid_indexes.append(index)
+
+    # === ADR-003 Phase 2: Grounded Ingestion Validation (batched) ===
+    to_store: list[tuple[int, dict[str, Any]]] = []
+    if bypass_validation:
+        to_store = [(i, dict(memories[i].get("metadata") or {})) for i in valid_indexes]
+    else:
+        validator = _get_validator()
+        validation_results = await validator.validate_many(
+            [
+                {
+                    "content": memories[i]["content"],
+                    "memory_type": memories[i]["memory_type"],
+                    "source": memories[i]["source"],
+                    "user_id": memories[i]["user_id"],
+                    "metadata": memories[i].get("metadata"),
+                }
+                for i in valid_indexes
+            ]
+        )
+
+        for index, validation_result in zip(valid_indexes, validation_results):
+            item = memories[index]
+
+            # Tier 3: Block speculative/duplicate content
+            if validation_result.tier == IngestionTier.BLOCK:
+                _log_audit_event(
+                    actor=item["user_id"],
+                    resource="memory:blocked",
+                    action="create",
+                    outcome="blocked",
+                    details={
+                        "memory_type": item["memory_type"],
+                        "source": item["source"],
+                        "reason": validation_result.reason,
+                        "checks_failed": validation_result.checks_failed,
+                    },
+                )
+                results[index] = {
+                    "error": "blocked",
+                    "reason": validation_result.reason,
+                    "tier": validation_result.tier.value,
+                    "checks_failed": validation_result.checks_failed,
+                }
+                continue
+
+            # Tier 2: Queue for human review
+            if validation_result.tier == IngestionTier.FLAG_REVIEW:
+                queue_id = await _get_review_queue().enqueue(
+                    user_id=item["user_id"],
+                    content=item["content"],
+                    memory_type=item["memory_type"],
+                    source=item["source"],
+                    evidence=validation_result.evidence,
+                    validation_result=validation_result,
+                    metadata=item.get("metadata"),
+                )
+                _log_audit_event(
+                    actor=item["user_id"],
+                    resource=f"memory:pending:{queue_id}",
+                    action="create",
+                    outcome="pending_review",
+                    details={
+                        "memory_type": item["memory_type"],
+                        "source": item["source"],
+                        "queue_id": queue_id,
+                    },
+                )
+                results[index] = {
+                    "status": "pending_review",
+                    "queue_id": queue_id,
+                    "reason": validation_result.reason,
+                    "tier": validation_result.tier.value,
+                    "message": "Memory queued for review. Use approve_pending_memory() to approve.",
+                }
+                continue
+
+            # Tier 1: Auto-approve - attach evidence and store
+            metadata = dict(item.get("metadata") or {})
+            metadata["evidence"] = validation_result.evidence.to_dict()
+            metadata["validation_tier"] = validation_result.tier.value
+            to_store.append((index, metadata))
+
+    # Store all approved memories in one provider call
+    new_memories = [
+        Memory(
+            user_id=memories[index]["user_id"],
+            content=memories[index]["content"],
+            memory_type=MemoryType(memories[index]["memory_type"]),
+            source=memories[index]["source"],
+            confidence=memories[index].get("confidence", 1.0),
+            raw_source=memories[index].get("raw_source"),
+            metadata=metadata,
+        )
+        for index, metadata in to_store
+    ]
+
+    provider = _get_provider()
+    store_many = getattr(provider, "store_many", None)
+    if store_many is not None:
+        memory_ids = await store_many(new_memories, {})
+    else:
+        memory_ids = [await provider.store(memory, {}) for memory in new_memories]
+
+    for (index, _metadata), memory_id in zip(to_store, memory_ids):
+        item = memories[index]
+        _log_audit_event(
+            actor=item["user_id"],
+            resource=f"memory:{memory_id}",
+            action="create",
+            outcome="success",
+            details={"memory_type": item["memory_type"], "source": item["source"]},
+        )
+        results[index] = {
+            "memory_id": memory_id,
+            "message": "Memory created successfully",
+        }
+
+    return {
+        "results": results,
+        "created": len(memory_ids),
+        "pending_review": sum(1 for r in results if r and r.get("status") == "pending_review"),
+        "blocked": sum(1 for r in results if r and r.get("error") == "blocked"),
+        "invalid": len(memories) - len(valid_indexes),
+    }
+
+
 async def get_memories(
     query: str,
     user_id: str,
@@ -23,10 +23,19 @@ from luminescent_cluster.memory.observability.graph_metrics import (
     QueryMeasurementContext,
 )
 from luminescent_cluster.memory.observability.metrics import (
+    BUCKET_BOUNDS_MS,
     METRIC_PREFIX,
     LatencyStats,
     MemoryMetrics,
 )
+from luminescent_cluster.memory.observability.otlp import (
+    OTLPJsonExporter,
+    spans_to_otlp,
+)
+from luminescent_cluster.memory.observability.prometheus import (
+    DEFAULT_METRICS_PORT,
+    PrometheusMetricsServer,
+)
 from luminescent_cluster.memory.observability.scale_milestones import (
     MilestoneCheckResult,
     ScaleMilestone,
@@ -34,6 +43,7 @@ from luminescent_cluster.memory.observability.scale_milestones import (
     STANDARD_MILESTONES,
 )
 from luminescent_cluster.memory.observability.tracing import (
+    DEFAULT_MAX_SPANS,
     TRACER_NAME,
     MemoryTracer,
     SpanContext,
@@ -45,11 +55,17 @@ __all__ = [
     "METRIC_PREFIX",
     "MemoryMetrics",
     "LatencyStats",
+    "BUCKET_BOUNDS_MS",
+    "PrometheusMetricsServer",
+    "DEFAULT_METRICS_PORT",
     # Tracing
     "TRACER_NAME",
+    "DEFAULT_MAX_SPANS",
     "MemoryTracer",
     "SpanContext",
     "SpanNames",
+    "OTLPJsonExporter",
+    "spans_to_otlp",
     # Scale Milestones (Phase D)
     "ScaleMilestone",
     "STANDARD_MILESTONES",
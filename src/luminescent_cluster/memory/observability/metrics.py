@@ -6,20 +6,40 @@
 Provides OpenTelemetry-compatible metrics for memory operations
 including counters, latency histograms, and operation tracking.
 
+Latencies are recorded into fixed-bucket histograms so percentiles can
+be estimated and histograms from different threads or processes can be
+merged by adding bucket counts. Each thread records into its own shard;
+shards are only merged when statistics are read.
+
 Related GitHub Issues:
 - #82: Memory Observability
 
 ADR Reference: ADR-003 Memory Architecture, Phase 0 (Foundations)
 """
 
+import math
+import re
+import threading
 import time
+from bisect import bisect_left
 from collections import defaultdict
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from typing import Any, Generator, Optional
 
 # Metric name prefix for all memory metrics
 METRIC_PREFIX: str = "memory"
 
+# Histogram bucket upper bounds in milliseconds: 0.01 ms to ~84 s with
+# four buckets per doubling, so each bucket is at most ~19% wide. The
+# last bucket (index len(BUCKET_BOUNDS_MS)) holds everything larger.
+BUCKET_BOUNDS_MS: tuple[float, ...] = tuple(0.01 * 2 ** (i / 4) for i in range(93))
+
+
+def _empty_buckets() -> list[int]:
+    """Return zeroed bucket counts, including the overflow bucket."""
+    return [0] * (len(BUCKET_BOUNDS_MS) + 1)
+
 
 @dataclass
 class LatencyStats:
@@ -30,12 +50,15 @@ class LatencyStats:
         total_ms: Total latency in milliseconds.
         min_ms: Minimum latency in milliseconds.
         max_ms: Maximum latency in milliseconds.
+        buckets: Histogram counts per BUCKET_BOUNDS_MS bucket, plus an
+            overflow bucket.
     """
 
     count: int = 0
     total_ms: float = 0.0
     min_ms: float = float("inf")
     max_ms: float = 0.0
+    buckets: list[int] = field(default_factory=_empty_buckets)
 
     def record(self, latency_ms: float) -> None:
         """Record a latency measurement."""
@@ -43,6 +66,21 @@ class LatencyStats:
         self.total_ms += latency_ms
         self.min_ms = min(self.min_ms, latency_ms)
         self.max_ms = max(self.max_ms, latency_ms)
+        self.buckets[bisect_left(BUCKET_BOUNDS_MS, latency_ms)] += 1
+
+    def merge(self, other: "LatencyStats") -> None:
+        """Add another histogram's measurements to this one.
+
+        Args:
+            other: Statistics to merge in.
+        """
+        self.count += other.count
+        self.total_ms += other.total_ms
+        self.min_ms = min(self.min_ms, other.min_ms)
+        self.max_ms = max(self.max_ms, other.max_ms)
+        for i, bucket_count in enumerate(other.buckets):
+            if bucket_count:
+                self.buckets[i] += bucket_count
 
     @property
     def avg_ms(self) -> float:
@@ -51,6 +89,46 @@ class LatencyStats:
             return 0.0
         return self.total_ms / self.count
 
+    def percentile(self, percent: float) -> float:
+        """Estimate a latency percentile from the histogram.
+
+        Interpolates linearly inside the bucket holding the requested
+        rank and clamps to the observed min and max.
+
+        Args:
+            percent: Percentile in [0, 100].
+
+        Returns:
+            Estimated latency in milliseconds (0.0 with no measurements).
+        """
+        if self.count == 0:
+            return 0.0
+        rank = max(1, math.ceil(percent / 100 * self.count))
+        seen = 0
+        for i, bucket_count in enumerate(self.buckets):
+            if seen + bucket_count >= rank:
+                lower = BUCKET_BOUNDS_MS[i - 1] if i > 0 else 0.0
+                upper = BUCKET_BOUNDS_MS[i] if i < len(BUCKET_BOUNDS_MS) else self.max_ms
+                estimate = lower + (upper - lower) * (rank - seen) / bucket_count
+                return min(max(estimate, self.min_ms), self.max_ms)
+            seen += bucket_count
+        return self.max_ms
+
+    @property
+    def p50_ms(self) -> float:
+        """Median latency in milliseconds."""
+        return self.percentile(50)
+
+    @property
+    def p95_ms(self) -> float:
+        """95th percentile latency in milliseconds."""
+        return self.percentile(95)
+
+    @property
+    def p99_ms(self) -> float:
+        """99th percentile latency in milliseconds."""
+        return self.percentile(99)
+
 
 class MemoryMetrics:
     """Metrics collector for memory operations.
@@ -58,18 +136,61 @@ class MemoryMetrics:
     Provides methods for recording metrics about memory operations
     in an OpenTelemetry-compatible format.
 
+    Latencies are recorded without locking into a per-thread shard and
+    merged when read, so worker threads (e.g. the hybrid retriever's
+    parallel searches) never contend with each other. Shards of threads
+    that have exited are folded into one retired shard, so servers that
+    start a thread per request do not accumulate them.
+
     Example:
         >>> metrics = MemoryMetrics()
         >>> metrics.record_store(memory_type="fact", user_id="user-123")
         >>> metrics.record_latency("store", 45.2)
+        >>> with metrics.timer("retrieve"):
+        ...     ...  # Do the retrieve operation
         >>> stats = metrics.get_stats()
     """
 
     def __init__(self):
         """Initialize the metrics collector."""
         self._counters: dict[str, int] = defaultdict(int)
-        self._latencies: dict[str, LatencyStats] = defaultdict(LatencyStats)
         self._labels: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self._local = threading.local()
+        self._shards: list[tuple[threading.Thread, dict[str, LatencyStats]]] = []
+        # Merged latencies of exited threads; replaced, never mutated, so
+        # readers can merge a snapshot outside the lock
+        self._retired: dict[str, LatencyStats] = {}
+        self._shards_lock = threading.Lock()
+
+    def _shard(self) -> dict[str, LatencyStats]:
+        """Return the calling thread's latency shard."""
+        shard = getattr(self._local, "latencies", None)
+        if shard is None:
+            shard = defaultdict(LatencyStats)
+            with self._shards_lock:
+                self._retire_dead_shards()
+                self._shards.append((threading.current_thread(), shard))
+            self._local.latencies = shard
+        return shard
+
+    def _retire_dead_shards(self) -> None:
+        """Fold shards of exited threads into the retired shard.
+
+        Must be called with _shards_lock held.
+        """
+        live = [(thread, shard) for thread, shard in self._shards if thread.is_alive()]
+        if len(live) == len(self._shards):
+            return
+
+        retired: dict[str, LatencyStats] = defaultdict(LatencyStats)
+        for operation, stats in self._retired.items():
+            retired[operation].merge(stats)
+        for thread, shard in self._shards:
+            if not thread.is_alive():
+                for operation, stats in shard.items():
+                    retired[operation].merge(stats)
+        self._retired = dict(retired)
+        self._shards = live
 
     def record_store(
         self,
@@ -118,7 +239,58 @@ class MemoryMetrics:
             operation: Name of the operation (store, retrieve, search, delete).
             latency_ms: Latency in milliseconds.
         """
-        self._latencies[operation].record(latency_ms)
+        self._shard()[operation].record(latency_ms)
+
+    @contextmanager
+    def timer(self, operation: str) -> Generator[None, None, None]:
+        """Record the wall-clock latency of a block, including failures.
+
+        Args:
+            operation: Name of the operation.
+
+        Example:
+            >>> with metrics.timer("hybrid.bm25"):
+            ...     results = bm25.search(user_id, query)
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_latency(operation, (time.perf_counter() - start) * 1000)
+
+    def get_latency(self, operation: str) -> LatencyStats:
+        """Get merged latency statistics for one operation.
+
+        Args:
+            operation: Name of the operation.
+
+        Returns:
+            Statistics merged across all threads (empty if never recorded).
+        """
+        merged = LatencyStats()
+        for shard in self._snapshot_shards():
+            stats = shard.get(operation)
+            if stats is not None:
+                merged.merge(stats)
+        return merged
+
+    def get_latencies(self) -> dict[str, LatencyStats]:
+        """Get merged latency statistics for every operation.
+
+        Returns:
+            Mapping of operation name to statistics merged across threads.
+        """
+        merged: dict[str, LatencyStats] = defaultdict(LatencyStats)
+        for shard in self._snapshot_shards():
+            for operation, stats in list(shard.items()):
+                merged[operation].merge(stats)
+        return dict(merged)
+
+    def _snapshot_shards(self) -> list[dict[str, LatencyStats]]:
+        """Return the retired shard followed by every live thread's shard."""
+        with self._shards_lock:
+            self._retire_dead_shards()
+            return [self._retired] + [shard for _, shard in self._shards]
 
     def increment_counter(
         self,
@@ -145,12 +317,15 @@ class MemoryMetrics:
             Dictionary containing all metrics and statistics.
         """
         latency_stats = {}
-        for op, stats in self._latencies.items():
+        for op, stats in self.get_latencies().items():
             latency_stats[op] = {
                 "count": stats.count,
                 "avg_ms": stats.avg_ms,
                 "min_ms": stats.min_ms if stats.count > 0 else 0.0,
                 "max_ms": stats.max_ms,
+                "p50_ms": stats.p50_ms,
+                "p95_ms": stats.p95_ms,
+                "p99_ms": stats.p99_ms,
             }
 
         return {
@@ -159,8 +334,61 @@ class MemoryMetrics:
             "labels": {k: dict(v) for k, v in self._labels.items()},
         }
 
+    def to_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format.
+
+        Latencies become one ``memory_operation_duration_seconds``
+        histogram labelled by operation; counters become ``_total``
+        counters.
+
+        Returns:
+            Exposition text, ending with a newline.
+        """
+        name = f"{METRIC_PREFIX}_operation_duration_seconds"
+        lines = [
+            f"# HELP {name} Latency of memory operations.",
+            f"# TYPE {name} histogram",
+        ]
+        for operation, stats in sorted(self.get_latencies().items()):
+            label = f'operation="{_escape_label(operation)}"'
+            cumulative = 0
+            for bound_ms, bucket_count in zip(BUCKET_BOUNDS_MS, stats.buckets):
+                cumulative += bucket_count
+                lines.append(f'{name}_bucket{{{label},le="{bound_ms / 1000:.6g}"}} {cumulative}')
+            lines.append(f'{name}_bucket{{{label},le="+Inf"}} {stats.count}')
+            lines.append(f"{name}_sum{{{label}}} {stats.total_ms / 1000:.9g}")
+            lines.append(f"{name}_count{{{label}}} {stats.count}")
+
+        for counter, value in sorted(self._counters.items()):
+            metric = _metric_name(counter)
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric} {value}")
+
+        for counter, values in sorted(self._labels.items()):
+            metric = _metric_name(counter)
+            lines.append(f"# TYPE {metric} counter")
+            for value, count in sorted(values.items(), key=lambda item: str(item[0])):
+                lines.append(f'{metric}{{value="{_escape_label(str(value))}"}} {count}')
+
+        return "\n".join(lines) + "\n"
+
     def reset(self) -> None:
         """Reset all metrics (for testing)."""
         self._counters.clear()
-        self._latencies.clear()
+        with self._shards_lock:
+            self._retired = {}
+            shards = [shard for _, shard in self._shards]
+        for shard in shards:
+            shard.clear()
         self._labels.clear()
+
+
+def _metric_name(counter: str) -> str:
+    """Return the Prometheus counter name for a counter key."""
+    name = re.sub(r"[^a-zA-Z0-9_]", "_", f"{METRIC_PREFIX}_{counter}")
+    return name if name.endswith("_total") else f"{name}_total"
+
+
+def _escape_label(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
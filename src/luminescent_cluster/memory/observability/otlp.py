@@ -0,0 +1,255 @@
+# Copyright 2024-2025 Amiable Development
+# SPDX-License-Identifier: Apache-2.0
+
+"""OTLP/JSON export for MemoryTracer spans.
+
+Converts finished spans to the OTLP JSON encoding of
+ExportTraceServiceRequest and ships them from a background thread, either
+appended as JSON lines to a local file (the layout of the OpenTelemetry
+Collector file exporter) or POSTed to an OTLP/HTTP collector endpoint
+such as ``http://localhost:4318/v1/traces``. Only the standard library
+is used, so no OpenTelemetry SDK is required.
+
+Related GitHub Issues:
+- #82: Memory Observability
+
+ADR Reference: ADR-003 Memory Architecture, Phase 0 (Foundations)
+"""
+
+import json
+import logging
+import threading
+import urllib.request
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from luminescent_cluster.memory.observability.tracing import MemoryTracer, SpanContext
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SERVICE_NAME: str = "luminescent-cluster"
+
+# OTLP Span.kind INTERNAL and Status.code values
+_SPAN_KIND_INTERNAL = 1
+_STATUS_OK = 1
+_STATUS_ERROR = 2
+
+
+def _any_value(value: Any) -> dict[str, Any]:
+    """Encode a Python value as an OTLP AnyValue."""
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    if isinstance(value, (list, tuple)):
+        return {"arrayValue": {"values": [_any_value(v) for v in value]}}
+    return {"stringValue": str(value)}
+
+
+def _key_values(attributes: dict[str, Any]) -> list[dict[str, Any]]:
+    """Encode an attribute dict as OTLP KeyValue pairs."""
+    return [{"key": key, "value": _any_value(value)} for key, value in attributes.items()]
+
+
+def _nanos(timestamp: float) -> str:
+    """Encode a unix timestamp as OTLP fixed64 nanoseconds."""
+    return str(int(timestamp * 1_000_000_000))
+
+
+def span_to_otlp(span: SpanContext) -> dict[str, Any]:
+    """Convert a finished span to an OTLP JSON Span.
+
+    Args:
+        span: Finished, sampled span.
+
+    Returns:
+        OTLP JSON Span object.
+    """
+    encoded: dict[str, Any] = {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": _SPAN_KIND_INTERNAL,
+        "startTimeUnixNano": _nanos(span.start_time),
+        "endTimeUnixNano": _nanos(span.end_time or span.start_time),
+        "attributes": _key_values(span.attributes),
+        "events": [
+            {
+                "timeUnixNano": _nanos(event["timestamp"]),
+                "name": event["name"],
+                "attributes": _key_values(event.get("attributes", {})),
+            }
+            for event in span.events
+        ],
+        "status": {"code": _STATUS_ERROR if span.status == "error" else _STATUS_OK},
+    }
+    if span.parent_span_id:
+        encoded["parentSpanId"] = span.parent_span_id
+    if span.error:
+        encoded["status"]["message"] = span.error
+    return encoded
+
+
+def spans_to_otlp(
+    spans: list[SpanContext],
+    service_name: str = DEFAULT_SERVICE_NAME,
+    scope_name: str = "luminescent.memory",
+) -> dict[str, Any]:
+    """Build an OTLP JSON ExportTraceServiceRequest.
+
+    Args:
+        spans: Finished, sampled spans.
+        service_name: Value of the service.name resource attribute.
+        scope_name: Instrumentation scope name (the tracer name).
+
+    Returns:
+        Request body as a JSON-serializable dict.
+    """
+    return {
+        "resourceSpans": [
+            {
+                "resource": {"attributes": _key_values({"service.name": service_name})},
+                "scopeSpans": [
+                    {
+                        "scope": {"name": scope_name},
+                        "spans": [span_to_otlp(span) for span in spans],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+class OTLPJsonExporter:
+    """Drain a MemoryTracer in the background and export OTLP JSON.
+
+    Every ``interval_seconds`` the exporter takes up to ``batch_size``
+    spans from the tracer's ring buffer (repeating until it is empty) and
+    writes each batch as one ExportTraceServiceRequest. Export failures
+    are logged and the batch is dropped; they never reach the traced code.
+
+    Example:
+        >>> tracer = MemoryTracer(sample_rate=0.05)
+        >>> exporter = OTLPJsonExporter(tracer, path="/var/log/luminescent/traces.jsonl")
+        >>> exporter.start()
+        >>> ...
+        >>> exporter.stop()  # flushes remaining spans
+    """
+
+    def __init__(
+        self,
+        tracer: MemoryTracer,
+        path: Optional[Union[str, Path]] = None,
+        endpoint: Optional[str] = None,
+        service_name: str = DEFAULT_SERVICE_NAME,
+        interval_seconds: float = 5.0,
+        batch_size: int = 512,
+        timeout_seconds: float = 5.0,
+    ):
+        """Initialize the exporter.
+
+        Args:
+            tracer: Tracer whose spans are exported.
+            path: JSON-lines file to append to.
+            endpoint: OTLP/HTTP traces URL to POST to.
+            service_name: Value of the service.name resource attribute.
+            interval_seconds: Time between background exports.
+            batch_size: Maximum spans per request.
+            timeout_seconds: HTTP request timeout.
+
+        Raises:
+            ValueError: If neither or both of path and endpoint are given.
+        """
+        if (path is None) == (endpoint is None):
+            raise ValueError("Exactly one of path or endpoint must be given")
+        self.tracer = tracer
+        self.path = Path(path) if path is not None else None
+        self.endpoint = endpoint
+        self.service_name = service_name
+        self.interval_seconds = interval_seconds
+        self.batch_size = batch_size
+        self.timeout_seconds = timeout_seconds
+        self.exported_spans = 0
+        self.failed_spans = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._export_lock = threading.Lock()
+
+    def export_once(self) -> int:
+        """Export everything currently buffered.
+
+        Returns:
+            Number of spans exported successfully.
+        """
+        exported = 0
+        with self._export_lock:
+            while True:
+                batch = self.tracer.drain(self.batch_size)
+                if not batch:
+                    break
+                request = spans_to_otlp(batch, self.service_name, self.tracer.tracer_name)
+                try:
+                    self._send(request)
+                except Exception as e:
+                    self.failed_spans += len(batch)
+                    logger.warning(f"Failed to export {len(batch)} spans: {e}")
+                else:
+                    exported += len(batch)
+        self.exported_spans += exported
+        return exported
+
+    def _send(self, request: dict[str, Any]) -> None:
+        """Write one request to the file or collector."""
+        body = json.dumps(request, separators=(",", ":"))
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as f:
+                f.write(body + "\n")
+            return
+
+        assert self.endpoint is not None
+        http_request = urllib.request.Request(
+            self.endpoint,
+            data=body.encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(http_request, timeout=self.timeout_seconds) as response:
+            response.read()
+
+    def _run(self) -> None:
+        """Background loop."""
+        while not self._stop.wait(self.interval_seconds):
+            self.export_once()
+
+    def start(self) -> None:
+        """Start the background export thread (no-op if running)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="otlp-span-exporter", daemon=True)
+        self._thread.start()
+
+    def stop(self, flush: bool = True) -> None:
+        """Stop the background thread.
+
+        Args:
+            flush: Export remaining buffered spans before returning.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if flush:
+            self.export_once()
+
+    def __enter__(self) -> "OTLPJsonExporter":
+        """Start exporting for the duration of a with block."""
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Stop and flush."""
+        self.stop()
@@ -0,0 +1,127 @@
+# Copyright 2024-2025 Amiable Development
+# SPDX-License-Identifier: Apache-2.0
+
+"""Local Prometheus endpoint for MemoryMetrics.
+
+Serves ``MemoryMetrics.to_prometheus()`` at ``/metrics`` from a daemon
+thread using only the standard library HTTP server. It binds to
+localhost by default; put a reverse proxy or the Prometheus agent next
+to it rather than exposing it publicly.
+
+Related GitHub Issues:
+- #82: Memory Observability
+
+ADR Reference: ADR-003 Memory Architecture, Phase 0 (Foundations)
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional
+
+from luminescent_cluster.memory.observability.metrics import MemoryMetrics
+
+# Default port (the OpenTelemetry Prometheus exporter convention)
+DEFAULT_METRICS_PORT: int = 9464
+
+_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class PrometheusMetricsServer:
+    """Serve memory metrics in the Prometheus text format.
+
+    Example:
+        >>> metrics = MemoryMetrics()
+        >>> provider = LocalMemoryProvider(memory_metrics=metrics)
+        >>> server = PrometheusMetricsServer(metrics)
+        >>> server.start()  # curl http://127.0.0.1:9464/metrics
+        >>> ...
+        >>> server.stop()
+    """
+
+    def __init__(
+        self,
+        metrics: MemoryMetrics,
+        host: str = "127.0.0.1",
+        port: int = DEFAULT_METRICS_PORT,
+    ):
+        """Initialize the server.
+
+        Args:
+            metrics: Metrics to expose.
+            host: Interface to bind.
+            port: Port to bind (0 picks a free port).
+        """
+        self.metrics = metrics
+        self.host = host
+        self._requested_port = port
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def port(self) -> int:
+        """The bound port (the requested port until started)."""
+        if self._server is not None:
+            return self._server.server_address[1]
+        return self._requested_port
+
+    @property
+    def url(self) -> str:
+        """URL of the metrics endpoint."""
+        return f"http://{self.host}:{self.port}/metrics"
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        """Build a request handler bound to this server's metrics."""
+        metrics = self.metrics
+
+        class _MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = metrics.to_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", _CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                # Scrapes are frequent; keep them out of stderr
+                pass
+
+        return _MetricsHandler
+
+    def start(self) -> None:
+        """Bind and start serving (no-op if running).
+
+        Raises:
+            OSError: If the address cannot be bound.
+        """
+        if self._server is not None:
+            return
+        self._server = ThreadingHTTPServer((self.host, self._requested_port), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="prometheus-metrics", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+        self._server = None
+        self._thread = None
+
+    def __enter__(self) -> "PrometheusMetricsServer":
+        """Serve for the duration of a with block."""
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Stop serving."""
+        self.stop()
@@ -12,14 +12,21 @@ Related GitHub Issues:
 ADR Reference: ADR-003 Memory Architecture, Phase 0 (Foundations)
 """
 
+import contextvars
+import os
+import random
 import time
+from collections import deque
 from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Any, Generator, Optional
+from typing import Any, ContextManager, Generator, Optional
 
 # Tracer name for memory operations
 TRACER_NAME: str = "luminescent.memory"
 
+# Default capacity of the finished-span ring buffer
+DEFAULT_MAX_SPANS: int = 2048
+
 
 class SpanNames:
     """Standard span names for memory operations.
@@ -29,12 +36,23 @@ class SpanNames:
     """
 
     STORE: str = "memory.store"
+    STORE_MANY: str = "memory.store_many"
+    UPDATE: str = "memory.update"
     RETRIEVE: str = "memory.retrieve"
     SEARCH: str = "memory.search"
     DELETE: str = "memory.delete"
     GET_BY_ID: str = "memory.get_by_id"
     EXTRACTION: str = "memory.extraction"
     RANKING: str = "memory.ranking"
+    CACHE_LOOKUP: str = "memory.cache.lookup"
+
+    # Hybrid retrieval stages
+    HYBRID_RETRIEVE: str = "memory.hybrid.retrieve"
+    BM25: str = "memory.hybrid.bm25"
+    VECTOR: str = "memory.hybrid.vector"
+    GRAPH: str = "memory.hybrid.graph"
+    FUSION: str = "memory.hybrid.fusion"
+    RERANK: str = "memory.hybrid.rerank"
 
 
 @dataclass
@@ -48,6 +66,12 @@ class SpanContext:
         events: Recorded events.
         status: Span status ("ok", "error").
         error: Error message if status is "error".
+        end_time: When the span ended (unix timestamp).
+        trace_id: 32-hex-digit trace ID shared by a span tree.
+        span_id: 16-hex-digit span ID.
+        parent_span_id: Span ID of the parent, if any.
+        sampled: False for spans dropped by head sampling; their
+            attributes and events are discarded.
     """
 
     name: str
@@ -57,6 +81,11 @@ class SpanContext:
     status: str = "ok"
     error: Optional[str] = None
     end_time: Optional[float] = None
+    trace_id: str = ""
+    span_id: str = ""
+    parent_span_id: Optional[str] = None
+    sampled: bool = True
+    _token: Optional[contextvars.Token] = field(default=None, repr=False, compare=False)
 
     @property
     def duration_ms(self) -> float:
@@ -64,37 +93,115 @@ class SpanContext:
         end = self.end_time or time.time()
         return (end - self.start_time) * 1000
 
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set an attribute (ignored for unsampled spans).
+
+        Args:
+            key: Attribute key.
+            value: Attribute value.
+        """
+        if self.sampled:
+            self.attributes[key] = value
+
+    def add_event(self, name: str, attributes: Optional[dict[str, Any]] = None) -> None:
+        """Record an event (ignored for unsampled spans).
+
+        Args:
+            name: Name of the event.
+            attributes: Event attributes.
+        """
+        if self.sampled:
+            self.events.append(
+                {"name": name, "timestamp": time.time(), "attributes": attributes or {}}
+            )
+
+
+# Returned by disabled tracers; never recorded
+_DISABLED_SPAN = SpanContext(name="", start_time=0.0, sampled=False)
+
+
+class _DisabledSpanContext:
+    """Context manager yielding the shared disabled span."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> SpanContext:
+        return _DISABLED_SPAN
+
+    def __exit__(self, *exc_info: Any) -> bool:
+        return False
+
+
+_DISABLED_CONTEXT = _DisabledSpanContext()
+
 
 class MemoryTracer:
     """Tracer for memory operations.
 
     Provides tracing capabilities for memory operations in an
-    OpenTelemetry-compatible format. When no OpenTelemetry tracer
-    is configured, operations are tracked in-memory for debugging.
+    OpenTelemetry-compatible format. Finished spans go into a ring buffer
+    of ``max_spans`` entries (oldest dropped first); an exporter such as
+    OTLPJsonExporter drains it in the background.
+
+    Sampling is decided once per trace at the root span and inherited by
+    its children. With ``sample_rate=0`` the tracer is disabled and
+    trace_operation() returns a shared no-op context.
+
+    Parent spans are tracked with a context variable, so spans started in
+    tasks or ``asyncio.to_thread`` workers nest under the span that was
+    active when they were scheduled.
 
     Example:
-        >>> tracer = MemoryTracer()
+        >>> tracer = MemoryTracer(sample_rate=0.1)
         >>> with tracer.trace_operation("memory.store") as span:
         ...     span.set_attribute("memory_type", "fact")
         ...     # Do the store operation
     """
 
-    def __init__(self, tracer_name: str = TRACER_NAME):
+    def __init__(
+        self,
+        tracer_name: str = TRACER_NAME,
+        sample_rate: float = 1.0,
+        max_spans: int = DEFAULT_MAX_SPANS,
+    ):
         """Initialize the memory tracer.
 
         Args:
             tracer_name: Name for the tracer (default: luminescent.memory).
+            sample_rate: Fraction of traces to record (0.0 disables tracing).
+            max_spans: Capacity of the finished-span ring buffer.
+
+        Raises:
+            ValueError: If sample_rate is outside [0, 1] or max_spans < 1.
         """
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("sample_rate must be between 0 and 1")
+        if max_spans < 1:
+            raise ValueError("max_spans must be at least 1")
         self.tracer_name = tracer_name
-        self._current_span: Optional[SpanContext] = None
-        self._spans: list[SpanContext] = []
+        self.sample_rate = sample_rate
+        self.dropped_spans = 0
+        self._spans: deque[SpanContext] = deque(maxlen=max_spans)
+        self._current: contextvars.ContextVar[Optional[SpanContext]] = contextvars.ContextVar(
+            f"memory_tracer_{id(self)}", default=None
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """True unless the sample rate is zero."""
+        return self.sample_rate > 0.0
+
+    @property
+    def _current_span(self) -> Optional[SpanContext]:
+        """The span active in the current context."""
+        return self._current.get()
 
     def start_span(
         self,
         name: str,
         attributes: Optional[dict[str, Any]] = None,
     ) -> SpanContext:
-        """Start a new span.
+        """Start a new span as a child of the active span.
 
         Args:
             name: Name of the span.
@@ -103,43 +210,82 @@ class MemoryTracer:
         Returns:
             The created SpanContext.
         """
-        span = SpanContext(
-            name=name,
-            attributes=attributes or {},
-        )
-        self._current_span = span
+        if not self.enabled:
+            return _DISABLED_SPAN
+
+        parent = self._current.get()
+        if parent is None:
+            sampled = self.sample_rate >= 1.0 or random.random() < self.sample_rate
+            trace_id = os.urandom(16).hex() if sampled else ""
+        else:
+            sampled = parent.sampled
+            trace_id = parent.trace_id
+
+        if sampled:
+            span = SpanContext(
+                name=name,
+                attributes=dict(attributes) if attributes else {},
+                trace_id=trace_id,
+                span_id=os.urandom(8).hex(),
+                parent_span_id=parent.span_id if parent is not None else None,
+            )
+        else:
+            span = SpanContext(name=name, start_time=0.0, sampled=False)
+        span._token = self._current.set(span)
         return span
 
     def end_span(self, span: SpanContext) -> None:
-        """End a span and record it.
+        """End a span, restore its parent as active and record it.
 
         Args:
             span: The span to end.
         """
+        if span is _DISABLED_SPAN:
+            return
+        token, span._token = span._token, None
+        if token is not None:
+            try:
+                self._current.reset(token)
+            except ValueError:
+                # Ended in a different context than it started in
+                pass
+        if not span.sampled:
+            return
+
         span.end_time = time.time()
+        if len(self._spans) == self._spans.maxlen:
+            self.dropped_spans += 1
         self._spans.append(span)
-        if self._current_span == span:
-            self._current_span = None
 
-    @contextmanager
     def trace_operation(
         self,
         name: str,
         attributes: Optional[dict[str, Any]] = None,
-    ) -> Generator[SpanContext, None, None]:
+    ) -> ContextManager[SpanContext]:
         """Context manager for tracing an operation.
 
         Args:
             name: Name of the span.
             attributes: Initial attributes for the span.
 
-        Yields:
-            The SpanContext for the operation.
+        Returns:
+            Context manager yielding the SpanContext for the operation.
 
         Example:
             >>> with tracer.trace_operation("memory.store") as span:
-            ...     span.attributes["memory_type"] = "fact"
+            ...     span.set_attribute("memory_type", "fact")
         """
+        if not self.enabled:
+            return _DISABLED_CONTEXT
+        return self._trace(name, attributes)
+
+    @contextmanager
+    def _trace(
+        self,
+        name: str,
+        attributes: Optional[dict[str, Any]],
+    ) -> Generator[SpanContext, None, None]:
+        """Span lifecycle behind trace_operation()."""
         span = self.start_span(name, attributes)
         try:
             yield span
@@ -162,14 +308,9 @@ class MemoryTracer:
             name: Name of the event.
             attributes: Event attributes.
         """
-        if self._current_span:
-            self._current_span.events.append(
-                {
-                    "name": name,
-                    "timestamp": time.time(),
-                    "attributes": attributes or {},
-                }
-            )
+        span = self._current.get()
+        if span is not None:
+            span.add_event(name, attributes)
 
     def set_attribute(self, key: str, value: Any) -> None:
         """Set an attribute on the current span.
@@ -178,18 +319,39 @@ class MemoryTracer:
             key: Attribute key.
             value: Attribute value.
         """
-        if self._current_span:
-            self._current_span.attributes[key] = value
+        span = self._current.get()
+        if span is not None:
+            span.set_attribute(key, value)
 
     def get_spans(self) -> list[SpanContext]:
-        """Get all recorded spans.
+        """Get the finished spans currently buffered.
+
+        Returns:
+            List of recorded SpanContext objects, oldest first.
+        """
+        return list(self._spans)
+
+    def drain(self, max_spans: Optional[int] = None) -> list[SpanContext]:
+        """Remove and return buffered spans, oldest first.
+
+        Safe to call from an exporter thread while spans are recorded.
+
+        Args:
+            max_spans: Maximum number of spans to remove (None for all).
 
         Returns:
-            List of recorded SpanContext objects.
+            The removed spans.
         """
-        return self._spans.copy()
+        drained: list[SpanContext] = []
+        while max_spans is None or len(drained) < max_spans:
+            try:
+                drained.append(self._spans.popleft())
+            except IndexError:
+                break
+        return drained
 
     def reset(self) -> None:
         """Reset all recorded spans (for testing)."""
         self._spans.clear()
-        self._current_span = None
+        self._current.set(None)
+        self.dropped_spans = 0
@@ -25,12 +25,15 @@ import uuid
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Optional
 
+from luminescent_cluster.memory.observability.metrics import MemoryMetrics
+from luminescent_cluster.memory.observability.tracing import MemoryTracer, SpanNames
 from luminescent_cluster.memory.schemas import Memory, MemoryType
 
 if TYPE_CHECKING:
     from luminescent_cluster.memory.graph.graph_builder import GraphBuilder
     from luminescent_cluster.memory.graph.graph_search import GraphSearch
     from luminescent_cluster.memory.retrieval.cache import RetrievalCache
+    from luminescent_cluster.memory.retrieval.filters import MemoryFilter
     from luminescent_cluster.memory.retrieval.hybrid import HybridRetriever, RetrievalMetrics
 
 
@@ -88,6 +91,8 @@ class LocalMemoryProvider:
         use_cache: bool = False,
         cache_ttl_seconds: float = 3600,
         cache_max_size: int = 1000,
+        tracer: Optional[MemoryTracer] = None,
+        memory_metrics: Optional[MemoryMetrics] = None,
     ):
         """Initialize the local memory provider.
 
@@ -105,6 +110,11 @@ class LocalMemoryProvider:
                 Default: False.
             cache_ttl_seconds: Cache TTL in seconds. Default: 3600 (1 hour).
             cache_max_size: Maximum cache entries. Default: 1000.
+            tracer: Tracer for provider and retrieval-stage spans.
+                Default: a disabled tracer.
+            memory_metrics: Collector for operation counters and latency
+                histograms, shared with the hybrid retriever.
+                Default: a new collector.
         """
         self._memories: dict[str, Memory] = {}
         self._memory_ids_by_user: dict[str, list[str]] = {}
@@ -115,6 +125,8 @@ class LocalMemoryProvider:
         self._hybrid_retriever: Optional["HybridRetriever"] = None
         self._graph_search: Optional["GraphSearch"] = None
         self._graph_builders: dict[str, "GraphBuilder"] = {}
+        self._tracer = tracer or MemoryTracer(sample_rate=0.0)
+        self._memory_metrics = memory_metrics or MemoryMetrics()
 
         # Cache configuration
         self._use_cache = use_cache
@@ -155,6 +167,8 @@ class LocalMemoryProvider:
                 graph=self._graph_search,
                 use_cross_encoder=self._use_cross_encoder,
                 query_rewriter=None,  # Will be set if needed
+                tracer=self._tracer,
+                memory_metrics=self._memory_metrics,
             )
 
             if self._use_query_rewriter:
@@ -165,6 +179,8 @@ class LocalMemoryProvider:
             self._hybrid_retriever = create_hybrid_retriever(
                 use_cross_encoder=self._use_cross_encoder,
                 use_query_rewriter=self._use_query_rewriter,
+                tracer=self._tracer,
+                memory_metrics=self._memory_metrics,
             )
 
     async def store(self, memory: Memory, context: dict) -> str:
@@ -177,30 +193,87 @@ class LocalMemoryProvider:
         Returns:
             A unique memory ID string.
         """
-        memory_id = str(uuid.uuid4())
-        # Store a copy to prevent external mutation
-        stored_memory = memory.model_copy()
-        self._memories[memory_id] = stored_memory
-
-        # Track memory IDs by user for hybrid indexing
-        user_id = memory.user_id
-        if user_id not in self._memory_ids_by_user:
-            self._memory_ids_by_user[user_id] = []
-        self._memory_ids_by_user[user_id].append(memory_id)
-
-        # Index in hybrid retriever if enabled
-        if self._hybrid_retriever is not None:
-            self._hybrid_retriever.add_memory(user_id, stored_memory, memory_id)
-
-        # Update graph if enabled
-        if self._use_graph and self._graph_search is not None:
-            self._update_graph(user_id, stored_memory, memory_id)
+        with (
+            self._tracer.trace_operation(SpanNames.STORE, {"user_id": memory.user_id}),
+            self._memory_metrics.timer("store"),
+        ):
+            memory_id = str(uuid.uuid4())
+            # Store a copy to prevent external mutation
+            stored_memory = memory.model_copy()
+            self._memories[memory_id] = stored_memory
+
+            # Track memory IDs by user for hybrid indexing
+            user_id = memory.user_id
+            if user_id not in self._memory_ids_by_user:
+                self._memory_ids_by_user[user_id] = []
+            self._memory_ids_by_user[user_id].append(memory_id)
+
+            # Index in hybrid retriever if enabled
+            if self._hybrid_retriever is not None:
+                self._hybrid_retriever.add_memory(user_id, stored_memory, memory_id)
+
+            # Update graph if enabled
+            if self._use_graph and self._graph_search is not None:
+                self._update_graph(user_id, stored_memory, memory_id)
+
+            # Invalidate cache for user (new memory may affect results)
+            if self._cache is not None:
+                self._cache.invalidate_user(user_id)
+
+            self._memory_metrics.record_store(memory_type=memory.memory_type.value, user_id=user_id)
+            return memory_id
+
+    async def store_many(self, memories: list[Memory], context: dict) -> list[str]:
+        """Store several memories and return their IDs.
+
+        Indexes are updated once per user rather than once per memory:
+        embeddings are computed as one batch, BM25 statistics are recomputed
+        once, and the knowledge graph is rebuilt once.
 
-        # Invalidate cache for user (new memory may affect results)
-        if self._cache is not None:
-            self._cache.invalidate_user(user_id)
+        Args:
+            memories: The memories to store.
+            context: Additional context (unused in local implementation).
 
-        return memory_id
+        Returns:
+            Memory IDs in the same order as ``memories``.
+        """
+        with (
+            self._tracer.trace_operation(SpanNames.STORE_MANY, {"count": len(memories)}),
+            self._memory_metrics.timer("store_many"),
+        ):
+            memory_ids: list[str] = []
+            by_user: dict[str, tuple[list[Memory], list[str]]] = {}
+
+            for memory in memories:
+                memory_id = str(uuid.uuid4())
+                # Store a copy to prevent external mutation
+                stored_memory = memory.model_copy()
+                self._memories[memory_id] = stored_memory
+                self._memory_ids_by_user.setdefault(memory.user_id, []).append(memory_id)
+
+                user_memories, user_ids = by_user.setdefault(memory.user_id, ([], []))
+                user_memories.append(stored_memory)
+                user_ids.append(memory_id)
+                memory_ids.append(memory_id)
+
+            for user_id, (user_memories, user_ids) in by_user.items():
+                # Index in hybrid retriever if enabled
+                if self._hybrid_retriever is not None:
+                    self._hybrid_retriever.add_memories(user_id, user_memories, user_ids)
+
+                # Update graph if enabled
+                if self._use_graph and self._graph_search is not None:
+                    self._update_graph_many(user_id, user_memories, user_ids)
+
+                # Invalidate cache for user (new memories may affect results)
+                if self._cache is not None:
+                    self._cache.invalidate_user(user_id)
+
+            for memory in memories:
+                self._memory_metrics.record_store(
+                    memory_type=memory.memory_type.value, user_id=memory.user_id
+                )
+            return memory_ids
 
     def _update_graph(self, user_id: str, memory: Memory, memory_id: str) -> None:
         """Update the knowledge graph with a new memory.
@@ -224,7 +297,36 @@ class LocalMemoryProvider:
         if self._graph_search is not None:
             self._graph_search.register_graph(user_id, graph)
 
-    async def retrieve(self, query: str, user_id: str, limit: int = 5) -> list[Memory]:
+    def _update_graph_many(
+        self, user_id: str, memories: list[Memory], memory_ids: list[str]
+    ) -> None:
+        """Add several memories to the knowledge graph with a single rebuild.
+
+        Args:
+            user_id: User ID.
+            memories: Memories to add to graph.
+            memory_ids: IDs of the memories, in the same order.
+        """
+        from luminescent_cluster.memory.graph.graph_builder import GraphBuilder
+
+        if user_id not in self._graph_builders:
+            self._graph_builders[user_id] = GraphBuilder(user_id)
+
+        builder = self._graph_builders[user_id]
+        for memory, memory_id in zip(memories, memory_ids):
+            builder.add_memory(memory, memory_id)
+
+        graph = builder.build()
+        if self._graph_search is not None:
+            self._graph_search.register_graph(user_id, graph)
+
+    async def retrieve(
+        self,
+        query: str,
+        user_id: str,
+        limit: int = 5,
+        memory_filter: Optional["MemoryFilter"] = None,
+    ) -> list[Memory]:
         """Retrieve memories matching a query for a user.
 
         When caching is enabled, checks cache first and returns
@@ -236,27 +338,58 @@ class LocalMemoryProvider:
 
         Otherwise, uses simple substring matching.
 
+        A memory_filter is applied before results are ranked and limited,
+        so up to ``limit`` matching memories are returned even when the
+        filter is selective.
+
         Args:
             query: Search query string.
             user_id: User ID to filter memories.
             limit: Maximum number of memories to return.
+            memory_filter: Optional metadata filter (type, scope, expiry).
 
         Returns:
             List of matching Memory objects.
         """
+        with (
+            self._tracer.trace_operation(
+                SpanNames.RETRIEVE, {"user_id": user_id, "limit": limit}
+            ) as span,
+            self._memory_metrics.timer("retrieve"),
+        ):
+            results = await self._retrieve(query, user_id, limit, memory_filter)
+            span.set_attribute("result_count", len(results))
+        self._memory_metrics.record_retrieve(user_id=user_id, result_count=len(results))
+        return results
+
+    async def _retrieve(
+        self,
+        query: str,
+        user_id: str,
+        limit: int,
+        memory_filter: Optional["MemoryFilter"],
+    ) -> list[Memory]:
+        """Cache lookup and retrieval behind retrieve()."""
+        cache_params = {} if memory_filter is None else {"memory_filter": memory_filter}
+
         # Check cache first
         if self._cache is not None:
-            cached = self._cache.get(user_id=user_id, query=query, limit=limit)
+            with (
+                self._tracer.trace_operation(SpanNames.CACHE_LOOKUP) as span,
+                self._memory_metrics.timer("cache_lookup"),
+            ):
+                cached = self._cache.get(user_id=user_id, query=query, limit=limit, **cache_params)
+                span.set_attribute("cache.hit", cached is not None)
             if cached is not None:
                 # Return copies of cached memories
                 return [Memory(**m) if isinstance(m, dict) else m.model_copy() for m in cached]
 
         # Use hybrid retrieval if enabled
         if self._hybrid_retriever is not None:
-            results = await self._retrieve_hybrid(query, user_id, limit)
+            results = await self._retrieve_hybrid(query, user_id, limit, memory_filter)
         else:
             # Fallback to simple substring matching
-            results = self._retrieve_simple(query, user_id, limit)
+            results = self._retrieve_simple(query, user_id, limit, memory_filter)
 
         # Cache results
         if self._cache is not None and results:
@@ -266,17 +399,25 @@ class LocalMemoryProvider:
                 query=query,
                 limit=limit,
                 results=[m.model_dump() for m in results],
+                **cache_params,
             )
 
         return results
 
-    async def _retrieve_hybrid(self, query: str, user_id: str, limit: int) -> list[Memory]:
+    async def _retrieve_hybrid(
+        self,
+        query: str,
+        user_id: str,
+        limit: int,
+        memory_filter: Optional["MemoryFilter"] = None,
+    ) -> list[Memory]:
         """Retrieve using two-stage hybrid retrieval.
 
         Args:
             query: Search query string.
             user_id: User ID to filter memories.
             limit: Maximum number of results.
+            memory_filter: Optional metadata filter.
 
         Returns:
             List of matching Memory objects.
@@ -294,6 +435,7 @@ class LocalMemoryProvider:
             top_k=limit,
             expand_query=self._use_query_rewriter,
             use_reranker=self._use_cross_encoder,
+            memory_filter=memory_filter,
         )
 
         # Filter out invalidated memories and return copies
@@ -305,13 +447,20 @@ class LocalMemoryProvider:
 
         return valid_results
 
-    def _retrieve_simple(self, query: str, user_id: str, limit: int) -> list[Memory]:
+    def _retrieve_simple(
+        self,
+        query: str,
+        user_id: str,
+        limit: int,
+        memory_filter: Optional["MemoryFilter"] = None,
+    ) -> list[Memory]:
         """Retrieve using simple substring matching.
 
         Args:
             query: Search query string.
             user_id: User ID to filter memories.
             limit: Maximum number of results.
+            memory_filter: Optional metadata filter.
 
         Returns:
             List of matching Memory objects.
@@ -328,6 +477,9 @@ class LocalMemoryProvider:
             if memory.metadata.get("is_valid") is False:
                 continue
 
+            if memory_filter is not None and not memory_filter.matches(memory):
+                continue
+
             # Simple substring match
             if query_lower in memory.content.lower():
                 results.append(memory.model_copy())
@@ -360,31 +512,35 @@ class LocalMemoryProvider:
         Returns:
             True if the memory was deleted, False if not found.
         """
-        if memory_id not in self._memories:
-            return False
+        with (
+            self._tracer.trace_operation(SpanNames.DELETE),
+            self._memory_metrics.timer("delete"),
+        ):
+            if memory_id not in self._memories:
+                return False
 
-        memory = self._memories[memory_id]
-        user_id = memory.user_id
+            memory = self._memories[memory_id]
+            user_id = memory.user_id
 
-        # Remove from main storage
-        del self._memories[memory_id]
+            # Remove from main storage
+            del self._memories[memory_id]
 
-        # Remove from user tracking
-        if user_id in self._memory_ids_by_user:
-            try:
-                self._memory_ids_by_user[user_id].remove(memory_id)
-            except ValueError:
-                pass
+            # Remove from user tracking
+            if user_id in self._memory_ids_by_user:
+                try:
+                    self._memory_ids_by_user[user_id].remove(memory_id)
+                except ValueError:
+                    pass
 
-        # Remove from hybrid retriever if enabled
-        if self._hybrid_retriever is not None:
-            self._hybrid_retriever.remove_memory(user_id, memory_id)
+            # Remove from hybrid retriever if enabled
+            if self._hybrid_retriever is not None:
+                self._hybrid_retriever.remove_memory(user_id, memory_id)
 
-        # Invalidate cache for user
-        if self._cache is not None:
-            self._cache.invalidate_user(user_id)
+            # Invalidate cache for user
+            if self._cache is not None:
+                self._cache.invalidate_user(user_id)
 
-        return True
+            return True
 
     async def search(self, user_id: str, filters: dict, limit: int = 10) -> list[Memory]:
         """Search memories with filters.
@@ -402,46 +558,53 @@ class LocalMemoryProvider:
         Returns:
             List of matching Memory objects.
         """
-        results = []
-
-        memory_type_filter = filters.get("memory_type")
-        source_filter = filters.get("source")
-        min_confidence = filters.get("min_confidence", 0.0)
-        include_invalid = filters.get("include_invalid", False)
+        with (
+            self._tracer.trace_operation(SpanNames.SEARCH, {"user_id": user_id}),
+            self._memory_metrics.timer("search"),
+        ):
+            results = []
+
+            memory_type_filter = filters.get("memory_type")
+            source_filter = filters.get("source")
+            min_confidence = filters.get("min_confidence", 0.0)
+            include_invalid = filters.get("include_invalid", False)
+
+            for memory in self._memories.values():
+                # Filter by user
+                if memory.user_id != user_id:
+                    continue
 
-        for memory in self._memories.values():
-            # Filter by user
-            if memory.user_id != user_id:
-                continue
+                # Skip invalidated memories unless explicitly included
+                if not include_invalid and memory.metadata.get("is_valid") is False:
+                    continue
 
-            # Skip invalidated memories unless explicitly included
-            if not include_invalid and memory.metadata.get("is_valid") is False:
-                continue
+                # Filter by memory type
+                if memory_type_filter is not None:
+                    if memory.memory_type != memory_type_filter:
+                        continue
 
-            # Filter by memory type
-            if memory_type_filter is not None:
-                if memory.memory_type != memory_type_filter:
-                    continue
+                # Filter by source
+                if source_filter is not None:
+                    if memory.source != source_filter:
+                        continue
 
-            # Filter by source
-            if source_filter is not None:
-                if memory.source != source_filter:
+                # Filter by confidence
+                if memory.confidence < min_confidence:
                     continue
 
-            # Filter by confidence
-            if memory.confidence < min_confidence:
-                continue
-
-            results.append(memory.model_copy())
+                results.append(memory.model_copy())
 
-            if len(results) >= limit:
-                break
+                if len(results) >= limit:
+                    break
 
-        return results
+            return results
 
     async def update(self, memory_id: str, updates: dict[str, Any]) -> Optional[Memory]:
         """Update a memory's fields.
 
+        Retrieval indexes, the knowledge graph and the cache are updated
+        for this memory only; nothing is rebuilt.
+
         Args:
             memory_id: The memory ID to update.
             updates: Dictionary of fields to update.
@@ -449,37 +612,85 @@ class LocalMemoryProvider:
         Returns:
             The updated Memory if found, None otherwise.
         """
-        if memory_id not in self._memories:
-            return None
-
-        memory = self._memories[memory_id]
-
-        # Track update in metadata
-        update_history = memory.metadata.get("update_history", [])
-        update_history.append(
-            {
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "fields": list(updates.keys()),
-                "previous_content": memory.content if "content" in updates else None,
-                "previous_source": memory.source if "source" in updates else None,
-            }
-        )
+        with (
+            self._tracer.trace_operation(SpanNames.UPDATE, {"fields": sorted(updates)}),
+            self._memory_metrics.timer("update"),
+        ):
+            if memory_id not in self._memories:
+                return None
+
+            memory = self._memories[memory_id]
+
+            # Track update in metadata
+            update_history = memory.metadata.get("update_history", [])
+            update_history.append(
+                {
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                    "fields": list(updates.keys()),
+                    "previous_content": memory.content if "content" in updates else None,
+                    "previous_source": memory.source if "source" in updates else None,
+                }
+            )
+
+            # Create updated memory
+            new_data = memory.model_dump()
+            new_data["metadata"] = {**memory.metadata, "update_history": update_history}
+            new_data["metadata"]["last_modified_at"] = datetime.now(timezone.utc).isoformat()
+
+            # Apply updates
+            for key, value in updates.items():
+                if key == "metadata":
+                    # Merge metadata updates
+                    new_data["metadata"] = {**new_data["metadata"], **value}
+                elif key in new_data:
+                    new_data[key] = value
+
+            updated = Memory(**new_data)
+            self._memories[memory_id] = updated
+            self._reindex(memory_id, memory, updated)
+            return updated.model_copy()
 
-        # Create updated memory
-        new_data = memory.model_dump()
-        new_data["metadata"] = {**memory.metadata, "update_history": update_history}
-        new_data["metadata"]["last_modified_at"] = datetime.now(timezone.utc).isoformat()
+    def _reindex(self, memory_id: str, previous: Memory, updated: Memory) -> None:
+        """Bring the indexes up to date after a single memory changed.
 
-        # Apply updates
-        for key, value in updates.items():
-            if key == "metadata":
-                # Merge metadata updates
-                new_data["metadata"] = {**new_data["metadata"], **value}
-            elif key in new_data:
-                new_data[key] = value
+        Only the changed memory is touched: its BM25 postings are patched,
+        it is re-embedded only if its content changed, and only the graph
+        nodes and edges it links are updated.
 
-        self._memories[memory_id] = Memory(**new_data)
-        return self._memories[memory_id].model_copy()
+        Args:
+            memory_id: ID of the updated memory.
+            previous: The memory before the update.
+            updated: The memory after the update.
+        """
+        old_user, new_user = previous.user_id, updated.user_id
+
+        if old_user != new_user:
+            # Ownership moved: unindex from the old user, index for the new one
+            if memory_id in self._memory_ids_by_user.get(old_user, []):
+                self._memory_ids_by_user[old_user].remove(memory_id)
+            self._memory_ids_by_user.setdefault(new_user, []).append(memory_id)
+            if self._hybrid_retriever is not None:
+                self._hybrid_retriever.remove_memory(old_user, memory_id)
+            if self._graph_search is not None and old_user in self._graph_builders:
+                graph = self._graph_builders[old_user].remove_memory(memory_id)
+                self._graph_search.register_graph(old_user, graph)
+
+        if self._hybrid_retriever is not None:
+            self._hybrid_retriever.update_memory(new_user, updated, memory_id)
+
+        if self._use_graph and self._graph_search is not None:
+            from luminescent_cluster.memory.graph.graph_builder import GraphBuilder
+
+            if new_user not in self._graph_builders:
+                self._graph_builders[new_user] = GraphBuilder(new_user)
+
+            graph = self._graph_builders[new_user].update_memory(updated, memory_id)
+            self._graph_search.register_graph(new_user, graph)
+
+        if self._cache is not None:
+            self._cache.invalidate_user(old_user)
+            if new_user != old_user:
+                self._cache.invalidate_user(new_user)
 
     def clear(self) -> None:
         """Clear all stored memories (for testing)."""
@@ -515,6 +726,11 @@ class LocalMemoryProvider:
         """Check if Knowledge Graph is enabled."""
         return self._use_graph and self._graph_search is not None
 
+    @property
+    def memory_metrics(self) -> MemoryMetrics:
+        """Operation counters and latency histograms for this provider."""
+        return self._memory_metrics
+
     @property
     def use_cache(self) -> bool:
         """Check if caching is enabled."""
@@ -23,11 +23,12 @@ ADR Reference: ADR-003 Memory Architecture
 
 # Phase 1c: Original retrieval components
 from luminescent_cluster.memory.retrieval.query_rewriter import QueryRewriter
-from luminescent_cluster.memory.retrieval.ranker import MemoryRanker
+from luminescent_cluster.memory.retrieval.ranker import MemoryRanker, RankingFeatures
 from luminescent_cluster.memory.retrieval.scoped import MemoryScope, ScopedRetriever
 
 # Phase 3: Two-Stage Retrieval Architecture
 from luminescent_cluster.memory.retrieval.bm25 import BM25Search
+from luminescent_cluster.memory.retrieval.filters import MemoryFilter
 from luminescent_cluster.memory.retrieval.fusion import FusedResult, RRFFusion
 from luminescent_cluster.memory.retrieval.hybrid import (
     HybridResult,
@@ -46,12 +47,14 @@ from luminescent_cluster.memory.retrieval.vector_search import VectorSearch
 __all__ = [
     # Phase 1c: Original components
     "MemoryRanker",
+    "RankingFeatures",
     "QueryRewriter",
     "ScopedRetriever",
     "MemoryScope",
     # Phase 3: Two-Stage Retrieval
     "BM25Search",
     "VectorSearch",
+    "MemoryFilter",
     "RRFFusion",
     "FusedResult",
     "CrossEncoderReranker",
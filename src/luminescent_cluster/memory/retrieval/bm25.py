@@ -22,6 +22,9 @@ from collections import Counter
 from dataclasses import dataclass, field
 from typing import Optional
 
+import numpy as np
+
+from luminescent_cluster.memory.retrieval.filters import MemoryFilter, MetadataIndex
 from luminescent_cluster.memory.schemas import Memory
 
 
@@ -39,6 +42,7 @@ class BM25Index:
         doc_freq: Number of documents containing each term.
         total_docs: Total number of documents.
         avg_doc_length: Average document length.
+        metadata: Metadata columns aligned with doc_ids, for filtering.
     """
 
     doc_ids: list[str] = field(default_factory=list)
@@ -47,6 +51,7 @@ class BM25Index:
     doc_freq: dict[str, int] = field(default_factory=dict)
     total_docs: int = 0
     avg_doc_length: float = 0.0
+    metadata: MetadataIndex = field(default_factory=MetadataIndex)
 
 
 class BM25Search:
@@ -169,6 +174,7 @@ class BM25Search:
             # Store document info
             index.doc_ids.append(mem_id)
             index.doc_lengths.append(len(tokens))
+            index.metadata.append(memory)
 
             # Calculate term frequencies for this document
             term_freqs = Counter(tokens)
@@ -201,6 +207,21 @@ class BM25Search:
             memory: Memory to add.
             memory_id: ID for the memory.
         """
+        self.add_memories(user_id, [memory], [memory_id])
+
+    def add_memories(
+        self,
+        user_id: str,
+        memories: list[Memory],
+        memory_ids: list[str],
+    ) -> None:
+        """Add several memories to the index, updating statistics once.
+
+        Args:
+            user_id: User ID.
+            memories: Memories to add.
+            memory_ids: IDs for the memories, in the same order.
+        """
         # Create index if it doesn't exist
         if user_id not in self._indexes:
             self._indexes[user_id] = BM25Index()
@@ -208,28 +229,30 @@ class BM25Search:
 
         index = self._indexes[user_id]
 
-        # Tokenize content
-        tokens = self.tokenize(memory.content)
+        for memory, memory_id in zip(memories, memory_ids):
+            # Tokenize content
+            tokens = self.tokenize(memory.content)
 
-        # Store document info
-        index.doc_ids.append(memory_id)
-        index.doc_lengths.append(len(tokens))
+            # Store document info
+            index.doc_ids.append(memory_id)
+            index.doc_lengths.append(len(tokens))
+            index.metadata.append(memory)
 
-        # Calculate term frequencies
-        term_freqs = Counter(tokens)
-        index.doc_term_freqs.append(dict(term_freqs))
+            # Calculate term frequencies
+            term_freqs = Counter(tokens)
+            index.doc_term_freqs.append(dict(term_freqs))
 
-        # Update document frequencies
-        for term in set(tokens):
-            index.doc_freq[term] = index.doc_freq.get(term, 0) + 1
+            # Update document frequencies
+            for term in set(tokens):
+                index.doc_freq[term] = index.doc_freq.get(term, 0) + 1
 
-        # Store memory
-        self._memory_contents[user_id][memory_id] = memory
+            # Store memory
+            self._memory_contents[user_id][memory_id] = memory
 
         # Update statistics
-        index.total_docs += 1
-        total_length = sum(index.doc_lengths)
-        index.avg_doc_length = total_length / index.total_docs
+        index.total_docs = len(index.doc_ids)
+        if index.total_docs > 0:
+            index.avg_doc_length = sum(index.doc_lengths) / index.total_docs
 
     def remove_memory(self, user_id: str, memory_id: str) -> bool:
         """Remove a memory from the index.
@@ -267,6 +290,7 @@ class BM25Search:
         index.doc_ids.pop(doc_idx)
         index.doc_lengths.pop(doc_idx)
         index.doc_term_freqs.pop(doc_idx)
+        index.metadata.delete(doc_idx)
 
         # Remove from memory store
         self._memory_contents[user_id].pop(memory_id, None)
@@ -280,6 +304,52 @@ class BM25Search:
 
         return True
 
+    def update_memory(
+        self,
+        user_id: str,
+        memory: Memory,
+        memory_id: str,
+    ) -> None:
+        """Re-index one memory in place.
+
+        Only the postings of the changed document are patched; the
+        average document length is adjusted incrementally. A memory that
+        is not indexed yet is added.
+
+        Args:
+            user_id: User ID.
+            memory: Updated memory.
+            memory_id: ID of the memory.
+        """
+        index = self._indexes.get(user_id)
+        try:
+            doc_idx = index.doc_ids.index(memory_id) if index is not None else -1
+        except ValueError:
+            doc_idx = -1
+        if doc_idx < 0:
+            self.add_memory(user_id, memory, memory_id)
+            return
+
+        self._memory_contents[user_id][memory_id] = memory
+        index.metadata.replace(doc_idx, memory)
+        old_freqs = index.doc_term_freqs[doc_idx]
+        tokens = self.tokenize(memory.content)
+        new_freqs = dict(Counter(tokens))
+        if new_freqs == old_freqs:
+            return
+
+        for term in old_freqs.keys() - new_freqs.keys():
+            index.doc_freq[term] -= 1
+            if index.doc_freq[term] <= 0:
+                del index.doc_freq[term]
+        for term in new_freqs.keys() - old_freqs.keys():
+            index.doc_freq[term] = index.doc_freq.get(term, 0) + 1
+
+        old_length = index.doc_lengths[doc_idx]
+        index.doc_term_freqs[doc_idx] = new_freqs
+        index.doc_lengths[doc_idx] = len(tokens)
+        index.avg_doc_length += (len(tokens) - old_length) / index.total_docs
+
     def _calculate_idf(self, term: str, index: BM25Index) -> float:
         """Calculate Inverse Document Frequency for a term.
 
@@ -349,6 +419,7 @@ class BM25Search:
         user_id: str,
         query: str,
         top_k: int = 50,
+        memory_filter: Optional[MemoryFilter] = None,
     ) -> list[tuple[str, float]]:
         """Search for memories using BM25 ranking.
 
@@ -356,6 +427,8 @@ class BM25Search:
             user_id: User ID to search for.
             query: Search query.
             top_k: Maximum number of results to return.
+            memory_filter: Optional filter; documents it excludes are
+                never scored.
 
         Returns:
             List of (memory_id, score) tuples sorted by score descending.
@@ -374,10 +447,14 @@ class BM25Search:
         if not query_terms:
             return []
 
-        # Score all documents
+        # Score all documents that pass the filter
+        candidates: range | list[int] = range(index.total_docs)
+        if memory_filter is not None:
+            candidates = np.flatnonzero(index.metadata.mask(memory_filter)).tolist()
+
         scores: list[tuple[str, float]] = []
 
-        for doc_idx in range(index.total_docs):
+        for doc_idx in candidates:
             score = self._score_document(query_terms, doc_idx, index)
             if score > 0:
                 scores.append((index.doc_ids[doc_idx], score))
@@ -392,6 +469,7 @@ class BM25Search:
         user_id: str,
         query: str,
         top_k: int = 50,
+        memory_filter: Optional[MemoryFilter] = None,
     ) -> list[tuple[Memory, float]]:
         """Search and return Memory objects with scores.
 
@@ -399,11 +477,12 @@ class BM25Search:
             user_id: User ID to search for.
             query: Search query.
             top_k: Maximum number of results to return.
+            memory_filter: Optional filter applied before ranking.
 
         Returns:
             List of (Memory, score) tuples sorted by score descending.
         """
-        results = self.search(user_id, query, top_k)
+        results = self.search(user_id, query, top_k, memory_filter)
         memories = self._memory_contents.get(user_id, {})
 
         return [(memories[mem_id], score) for mem_id, score in results if mem_id in memories]
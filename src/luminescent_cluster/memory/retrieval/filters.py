@@ -0,0 +1,228 @@
+# Copyright 2024-2025 Amiable Development
+# SPDX-License-Identifier: Apache-2.0
+
+"""Metadata filters applied inside the Stage 1 search indexes.
+
+A MemoryFilter restricts retrieval by memory type, scope, project,
+expiry and validity. BM25Search and VectorSearch resolve it to a boolean
+mask over their rows before top-k selection, so a selective filter still
+returns up to top_k matches and rows it excludes are never scored.
+
+Each index keeps a MetadataIndex aligned with its rows: one
+dictionary-encoded column per attribute, plus a cache of per-value
+bitmaps that is dropped whenever a row changes.
+
+ADR Reference: ADR-003 Memory Architecture, Phase 1c (Retrieval & Ranking)
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Hashable, Optional
+
+import numpy as np
+from numpy.typing import NDArray
+
+from luminescent_cluster.memory.schemas import Memory, MemoryType
+
+_CATEGORICAL = ("memory_type", "scope", "project_id", "is_valid")
+
+
+def _memory_scope(memory: Memory) -> str:
+    """Return a memory's scope, treating missing or None as "user"."""
+    scope = memory.metadata.get("scope", "user")
+    return "user" if scope is None else scope
+
+
+def _attributes(memory: Memory) -> dict[str, Hashable]:
+    """Return the categorical attributes indexed for a memory."""
+    return {
+        "memory_type": memory.memory_type,
+        "scope": _memory_scope(memory),
+        "project_id": memory.metadata.get("project_id"),
+        "is_valid": memory.metadata.get("is_valid") is not False,
+    }
+
+
+def _expiry(memory: Memory) -> float:
+    """Return a memory's expiry as epoch seconds (inf if it never expires)."""
+    if memory.expires_at is None:
+        return float("inf")
+    expires_at = memory.expires_at
+    if expires_at.tzinfo is None:
+        expires_at = expires_at.replace(tzinfo=timezone.utc)
+    return expires_at.timestamp()
+
+
+@dataclass(frozen=True)
+class MemoryFilter:
+    """Restrictions applied to retrieval candidates before ranking.
+
+    Scope semantics match ScopedRetriever: "user" also matches memories
+    without a scope, and "project" matches any project unless project_id
+    is given.
+
+    Attributes:
+        memory_types: Allowed memory types (None allows all).
+        scope: Required scope ("user", "project" or "global").
+        project_id: Required project ID.
+        include_expired: If False, memories past expires_at are excluded.
+        include_invalid: If False, memories marked is_valid=False are excluded.
+        now: Time used for expiry checks (default: current time).
+    """
+
+    memory_types: Optional[frozenset[MemoryType]] = None
+    scope: Optional[str] = None
+    project_id: Optional[str] = None
+    include_expired: bool = False
+    include_invalid: bool = False
+    now: Optional[datetime] = None
+
+    def _now_seconds(self) -> float:
+        """Return the expiry reference time as epoch seconds."""
+        now = self.now or datetime.now(timezone.utc)
+        if now.tzinfo is None:
+            now = now.replace(tzinfo=timezone.utc)
+        return now.timestamp()
+
+    def matches(self, memory: Memory) -> bool:
+        """Check a single memory against the filter.
+
+        Args:
+            memory: Memory to check.
+
+        Returns:
+            True if the memory passes every restriction.
+        """
+        if self.memory_types is not None and memory.memory_type not in self.memory_types:
+            return False
+        if self.scope is not None and _memory_scope(memory) != self.scope:
+            return False
+        if self.project_id is not None and memory.metadata.get("project_id") != self.project_id:
+            return False
+        if not self.include_invalid and memory.metadata.get("is_valid") is False:
+            return False
+        if not self.include_expired and _expiry(memory) <= self._now_seconds():
+            return False
+        return True
+
+
+class MetadataIndex:
+    """Per-attribute columns aligned with a search index's rows.
+
+    Categorical attributes are dictionary-encoded into integer columns.
+    Bitmaps for (attribute, value) pairs are built on first use and kept
+    until the next mutation.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._codes: dict[str, dict[Hashable, int]] = {attr: {} for attr in _CATEGORICAL}
+        self._columns: dict[str, list[int]] = {attr: [] for attr in _CATEGORICAL}
+        self._expiry: list[float] = []
+        self._arrays: dict[str, NDArray[Any]] = {}
+        self._bitmaps: dict[tuple[str, Hashable], NDArray[np.bool_]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return len(self._expiry)
+
+    def _encode(self, memory: Memory) -> dict[str, int]:
+        """Return the column codes for a memory, assigning new codes."""
+        return {
+            attr: self._codes[attr].setdefault(value, len(self._codes[attr]))
+            for attr, value in _attributes(memory).items()
+        }
+
+    def _changed(self) -> None:
+        """Drop materialized arrays and bitmaps after a mutation."""
+        self._arrays.clear()
+        self._bitmaps.clear()
+
+    def append(self, memory: Memory) -> None:
+        """Add a row for a memory.
+
+        Args:
+            memory: Memory at the new last row.
+        """
+        for attr, code in self._encode(memory).items():
+            self._columns[attr].append(code)
+        self._expiry.append(_expiry(memory))
+        self._changed()
+
+    def replace(self, row: int, memory: Memory) -> None:
+        """Overwrite a row with a memory's attributes.
+
+        Args:
+            row: Row to overwrite.
+            memory: Memory now stored at that row.
+        """
+        for attr, code in self._encode(memory).items():
+            self._columns[attr][row] = code
+        self._expiry[row] = _expiry(memory)
+        self._changed()
+
+    def delete(self, row: int) -> None:
+        """Remove a row, shifting later rows up.
+
+        Args:
+            row: Row to remove.
+        """
+        for column in self._columns.values():
+            column.pop(row)
+        self._expiry.pop(row)
+        self._changed()
+
+    def _array(self, attr: str) -> NDArray[Any]:
+        """Return a column as a NumPy array."""
+        array = self._arrays.get(attr)
+        if array is None:
+            values = self._expiry if attr == "expires_at" else self._columns[attr]
+            array = np.asarray(values, dtype=np.float64 if attr == "expires_at" else np.int64)
+            self._arrays[attr] = array
+        return array
+
+    def bitmap(self, attr: str, value: Hashable) -> NDArray[np.bool_]:
+        """Return the rows whose attribute equals a value.
+
+        Args:
+            attr: Categorical attribute name.
+            value: Attribute value.
+
+        Returns:
+            Boolean mask with one entry per row.
+        """
+        key = (attr, value)
+        bitmap = self._bitmaps.get(key)
+        if bitmap is None:
+            code = self._codes[attr].get(value)
+            if code is None:
+                bitmap = np.zeros(len(self), dtype=np.bool_)
+            else:
+                bitmap = self._array(attr) == code
+            self._bitmaps[key] = bitmap
+        return bitmap
+
+    def mask(self, memory_filter: MemoryFilter) -> NDArray[np.bool_]:
+        """Resolve a filter to a boolean mask over the rows.
+
+        Args:
+            memory_filter: Filter to apply.
+
+        Returns:
+            Boolean mask, True for rows that pass the filter.
+        """
+        mask = np.ones(len(self), dtype=np.bool_)
+        if memory_filter.memory_types is not None:
+            allowed = np.zeros(len(self), dtype=np.bool_)
+            for memory_type in memory_filter.memory_types:
+                allowed |= self.bitmap("memory_type", memory_type)
+            mask &= allowed
+        if memory_filter.scope is not None:
+            mask &= self.bitmap("scope", memory_filter.scope)
+        if memory_filter.project_id is not None:
+            mask &= self.bitmap("project_id", memory_filter.project_id)
+        if not memory_filter.include_invalid:
+            mask &= self.bitmap("is_valid", True)
+        if not memory_filter.include_expired:
+            mask &= self._array("expires_at") > memory_filter._now_seconds()
+        return mask
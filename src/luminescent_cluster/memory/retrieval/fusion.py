@@ -16,6 +16,10 @@ Benefits:
 - Effective: Empirically strong performance
 - Simple: No hyperparameter tuning needed
 
+Item IDs are mapped to dense integer slots and contributions are
+accumulated in a NumPy array, so fusing several hundred candidates per
+source costs one pass over the lists plus a partial sort for the top-k.
+
 Reference: Cormack, G. V., Clarke, C. L., & Buettcher, S. (2009).
 "Reciprocal Rank Fusion Outperforms Condorcet and Individual Rank
 Learning Methods."
@@ -24,11 +28,41 @@ ADR Reference: ADR-003 Memory Architecture, Phase 3 (Two-Stage Retrieval)
 """
 
 from dataclasses import dataclass
-from typing import Generic, TypeVar
+from typing import Generic, Optional, TypeVar
+
+import numpy as np
+from numpy.typing import NDArray
 
 T = TypeVar("T")
 
 
+def top_k_indices(scores: NDArray[np.float64], limit: Optional[int] = None) -> NDArray[np.int64]:
+    """Return indexes ordered by descending score without a full sort.
+
+    Candidates are narrowed with a partition and only the selected ones
+    are sorted. Ties keep index order, like a stable sort.
+
+    Args:
+        scores: Scores to rank.
+        limit: Maximum number of indexes to return (None for all).
+
+    Returns:
+        Indexes of the top scores, best first.
+    """
+    n = len(scores)
+    if limit is not None and limit < n:
+        if limit <= 0:
+            return np.empty(0, dtype=np.int64)
+        # Keep every index tied with the k-th score so the stable
+        # tie-break below sees all of them
+        kth = np.partition(scores, n - limit)[n - limit]
+        selected = np.flatnonzero(scores >= kth)
+    else:
+        selected = np.arange(n)
+    order = np.lexsort((selected, -scores[selected]))
+    return selected[order][:limit]
+
+
 @dataclass
 class FusedResult(Generic[T]):
     """A result from rank fusion.
@@ -106,22 +140,57 @@ class RRFFusion:
         Returns:
             Fused list of (item_id, rrf_score) tuples sorted by score descending.
         """
-        if not ranked_lists:
-            return []
+        return self.fuse_top_k(None, self.weights, **ranked_lists)[0]
 
-        # Calculate RRF scores with optional weights
-        rrf_scores: dict[str, float] = {}
+    def fuse_top_k(
+        self,
+        top_k: Optional[int],
+        weights: Optional[dict[str, float]] = None,
+        **ranked_lists: list[tuple[str, float]],
+    ) -> tuple[list[tuple[str, float]], int]:
+        """Fuse ranked lists with array accumulation and return the top-k.
+
+        Each distinct item gets a dense integer slot; weighted
+        ``1/(k + rank)`` contributions are summed with ``np.add.at`` and
+        only the top-k are sorted. Ties keep first-seen order.
+
+        Args:
+            top_k: Number of fused results to return (None for all).
+            weights: Per-source weights (default 1.0). Defaults to the
+                weights given at construction.
+            **ranked_lists: Named ranked lists, each a list of
+                           (item_id, score) tuples sorted by score descending.
+
+        Returns:
+            Tuple of (fused (item_id, rrf_score) tuples sorted by score
+            descending, number of distinct items fused).
+        """
+        weights = self.weights if weights is None else weights
+        slots: dict[str, int] = {}
+        slot_parts: list[NDArray[np.int64]] = []
+        contribution_parts: list[NDArray[np.float64]] = []
 
         for list_name, results in ranked_lists.items():
-            weight = self.weights.get(list_name, 1.0)
-            for rank, (item_id, _) in enumerate(results, start=1):
-                score = weight * (1.0 / (self.k + rank))
-                rrf_scores[item_id] = rrf_scores.get(item_id, 0.0) + score
+            if not results:
+                continue
+            slot_parts.append(
+                np.fromiter(
+                    (slots.setdefault(item_id, len(slots)) for item_id, _ in results),
+                    dtype=np.int64,
+                    count=len(results),
+                )
+            )
+            ranks = np.arange(1, len(results) + 1, dtype=np.float64)
+            contribution_parts.append(weights.get(list_name, 1.0) / (self.k + ranks))
 
-        # Sort by RRF score descending
-        sorted_results = sorted(rrf_scores.items(), key=lambda x: x[1], reverse=True)
+        if not slots:
+            return [], 0
 
-        return sorted_results
+        scores = np.zeros(len(slots), dtype=np.float64)
+        np.add.at(scores, np.concatenate(slot_parts), np.concatenate(contribution_parts))
+
+        items = list(slots)
+        return [(items[i], float(scores[i])) for i in top_k_indices(scores, top_k)], len(items)
 
     def fuse_with_details(
         self,
@@ -211,21 +280,7 @@ class RRFFusion:
         Returns:
             Fused list of (item_id, weighted_rrf_score) tuples.
         """
-        if not ranked_lists:
-            return []
-
-        rrf_scores: dict[str, float] = {}
-
-        for list_name, results in ranked_lists.items():
-            weight = weights.get(list_name, 1.0)
-
-            for rank, (item_id, _) in enumerate(results, start=1):
-                score = weight / (self.k + rank)
-                rrf_scores[item_id] = rrf_scores.get(item_id, 0.0) + score
-
-        sorted_results = sorted(rrf_scores.items(), key=lambda x: x[1], reverse=True)
-
-        return sorted_results
+        return self.fuse_top_k(None, weights, **ranked_lists)[0]
 
     def interleave(
         self,
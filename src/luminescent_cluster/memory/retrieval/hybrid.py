@@ -25,9 +25,12 @@ import asyncio
 import logging
 import time
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Any, Callable, Optional
 
+from luminescent_cluster.memory.observability.metrics import MemoryMetrics
+from luminescent_cluster.memory.observability.tracing import MemoryTracer, SpanNames
 from luminescent_cluster.memory.retrieval.bm25 import BM25Search
+from luminescent_cluster.memory.retrieval.filters import MemoryFilter
 from luminescent_cluster.memory.retrieval.fusion import RRFFusion
 from luminescent_cluster.memory.retrieval.query_rewriter import QueryRewriter
 from luminescent_cluster.memory.retrieval.reranker import (
@@ -135,6 +138,8 @@ class HybridRetriever:
         bm25_weight: float = 1.0,
         vector_weight: float = 1.0,
         graph_weight: float = 1.0,
+        tracer: Optional[MemoryTracer] = None,
+        memory_metrics: Optional[MemoryMetrics] = None,
     ):
         """Initialize the hybrid retriever.
 
@@ -149,6 +154,10 @@ class HybridRetriever:
             bm25_weight: Weight for BM25 in RRF fusion.
             vector_weight: Weight for vector in RRF fusion.
             graph_weight: Weight for graph in RRF fusion.
+            tracer: Tracer for per-stage spans. Defaults to a disabled tracer.
+            memory_metrics: Collector for per-stage latency histograms
+                (operations "hybrid.retrieve", "hybrid.bm25", ...).
+                Created if not provided.
         """
         self.bm25 = bm25 or BM25Search()
         self.vector = vector or VectorSearch(lazy_load=True)
@@ -166,6 +175,8 @@ class HybridRetriever:
         self.bm25_weight = bm25_weight
         self.vector_weight = vector_weight
         self.graph_weight = graph_weight
+        self.tracer = tracer or MemoryTracer(sample_rate=0.0)
+        self.memory_metrics = memory_metrics or MemoryMetrics()
 
     def index_memories(
         self,
@@ -202,6 +213,24 @@ class HybridRetriever:
         self.bm25.add_memory(user_id, memory, memory_id)
         self.vector.add_memory(user_id, memory, memory_id)
 
+    def add_memories(
+        self,
+        user_id: str,
+        memories: list[Memory],
+        memory_ids: list[str],
+    ) -> None:
+        """Add several memories to both indexes in one pass.
+
+        Embeddings are computed as a single batch.
+
+        Args:
+            user_id: User ID.
+            memories: Memories to add.
+            memory_ids: IDs for the memories, in the same order.
+        """
+        self.bm25.add_memories(user_id, memories, memory_ids)
+        self.vector.add_memories(user_id, memories, memory_ids)
+
     def remove_memory(self, user_id: str, memory_id: str) -> bool:
         """Remove a memory from both indexes.
 
@@ -216,6 +245,25 @@ class HybridRetriever:
         vector_removed = self.vector.remove_memory(user_id, memory_id)
         return bm25_removed or vector_removed
 
+    def update_memory(
+        self,
+        user_id: str,
+        memory: Memory,
+        memory_id: str,
+    ) -> None:
+        """Re-index one updated memory in both indexes.
+
+        BM25 postings are patched for that document only, and the memory
+        is re-embedded only if its content changed.
+
+        Args:
+            user_id: User ID.
+            memory: Updated memory.
+            memory_id: ID of the memory.
+        """
+        self.bm25.update_memory(user_id, memory, memory_id)
+        self.vector.update_memory(user_id, memory, memory_id)
+
     def clear_index(self, user_id: str) -> None:
         """Clear both indexes for a user.
 
@@ -235,6 +283,7 @@ class HybridRetriever:
         bm25_top_k: int = DEFAULT_BM25_TOP_K,
         vector_top_k: int = DEFAULT_VECTOR_TOP_K,
         graph_top_k: int = DEFAULT_GRAPH_TOP_K,
+        memory_filter: Optional[MemoryFilter] = None,
     ) -> tuple[list[HybridResult], RetrievalMetrics]:
         """Perform two-stage hybrid retrieval.
 
@@ -250,10 +299,48 @@ class HybridRetriever:
             bm25_top_k: Number of BM25 candidates.
             vector_top_k: Number of vector candidates.
             graph_top_k: Number of graph candidates.
+            memory_filter: Optional metadata filter. BM25 and vector search
+                apply it before their own top-k; graph candidates are
+                checked individually.
 
         Returns:
             Tuple of (results, metrics).
         """
+        with (
+            self.tracer.trace_operation(
+                SpanNames.HYBRID_RETRIEVE, {"user_id": user_id, "top_k": top_k}
+            ) as span,
+            self.memory_metrics.timer("hybrid.retrieve"),
+        ):
+            results, metrics = await self._retrieve(
+                query,
+                user_id,
+                top_k,
+                expand_query,
+                use_reranker,
+                bm25_top_k,
+                vector_top_k,
+                graph_top_k,
+                memory_filter,
+            )
+            span.set_attribute("result_count", len(results))
+            span.set_attribute("fused_candidates", metrics.fused_candidates)
+            span.set_attribute("reranker_used", metrics.reranker_used)
+        return results, metrics
+
+    async def _retrieve(
+        self,
+        query: str,
+        user_id: str,
+        top_k: int,
+        expand_query: bool,
+        use_reranker: bool,
+        bm25_top_k: int,
+        vector_top_k: int,
+        graph_top_k: int,
+        memory_filter: Optional[MemoryFilter],
+    ) -> tuple[list[HybridResult], RetrievalMetrics]:
+        """Two-stage retrieval behind retrieve()."""
         start_time = time.perf_counter()
         metrics = RetrievalMetrics()
 
@@ -268,14 +355,40 @@ class HybridRetriever:
 
         # Build list of search coroutines
         search_tasks = [
-            asyncio.to_thread(self.bm25.search, user_id, effective_query, bm25_top_k),
-            asyncio.to_thread(self.vector.search, user_id, effective_query, vector_top_k),
+            asyncio.to_thread(
+                self._traced_search,
+                SpanNames.BM25,
+                "hybrid.bm25",
+                self.bm25.search,
+                user_id,
+                effective_query,
+                bm25_top_k,
+                memory_filter,
+            ),
+            asyncio.to_thread(
+                self._traced_search,
+                SpanNames.VECTOR,
+                "hybrid.vector",
+                self.vector.search,
+                user_id,
+                effective_query,
+                vector_top_k,
+                memory_filter,
+            ),
         ]
 
         # Add graph search if available
         if self.graph is not None:
             search_tasks.append(
-                asyncio.to_thread(self.graph.search, user_id, effective_query, graph_top_k)
+                asyncio.to_thread(
+                    self._traced_search,
+                    SpanNames.GRAPH,
+                    "hybrid.graph",
+                    self.graph.search,
+                    user_id,
+                    effective_query,
+                    graph_top_k,
+                )
             )
 
         # Run all searches in parallel
@@ -284,6 +397,12 @@ class HybridRetriever:
         bm25_results = search_results[0]
         vector_results = search_results[1]
         graph_results = search_results[2] if len(search_results) > 2 else []
+        if memory_filter is not None and graph_results:
+            graph_results = [
+                (mem_id, score)
+                for mem_id, score in graph_results
+                if self._matches_filter(user_id, mem_id, memory_filter)
+            ]
 
         metrics.bm25_candidates = len(bm25_results)
         metrics.vector_candidates = len(vector_results)
@@ -305,38 +424,48 @@ class HybridRetriever:
         weights_differ = (
             self.bm25_weight != 1.0 or self.vector_weight != 1.0 or self.graph_weight != 1.0
         )
+        weights: Optional[dict[str, float]] = None
         if weights_differ:
             weights = {
                 "bm25": self.bm25_weight,
                 "vector": self.vector_weight,
+                "graph": self.graph_weight,
             }
-            if graph_results:
-                weights["graph"] = self.graph_weight
-            fused = self.fusion.weighted_fuse(weights, **fusion_sources)
-        else:
-            fused = self.fusion.fuse(**fusion_sources)
-
-        metrics.fused_candidates = len(fused)
 
-        # Prepare candidates for reranking
-        candidates: list[tuple[str, Memory, float]] = []
-        for mem_id, rrf_score in fused:
-            # Get memory from either index
-            memory = self.bm25.get_memory(user_id, mem_id)
-            if memory is None:
-                memory = self.vector.get_memory(user_id, mem_id)
-            if memory is not None:
-                candidates.append((mem_id, memory, rrf_score))
+        # The cross-encoder rescores every fused candidate; the RRF
+        # fallback only needs the fused top-k
+        use_cross_encoder = use_reranker and isinstance(self.reranker, CrossEncoderReranker)
+        fuse_limit = None if use_cross_encoder else top_k
+        with (
+            self.tracer.trace_operation(SpanNames.FUSION) as span,
+            self.memory_metrics.timer("hybrid.fusion"),
+        ):
+            fused, metrics.fused_candidates = self.fusion.fuse_top_k(
+                fuse_limit, weights, **fusion_sources
+            )
+            candidates = self._lookup_candidates(user_id, fused)
+            if len(candidates) < len(fused) and len(fused) < metrics.fused_candidates:
+                # Some fused IDs are no longer indexed (e.g. stale graph nodes);
+                # fall back to the full fused list to fill top_k
+                fused, _ = self.fusion.fuse_top_k(None, weights, **fusion_sources)
+                candidates = self._lookup_candidates(user_id, fused)
+            span.set_attribute("fused_candidates", metrics.fused_candidates)
+            span.set_attribute("candidates", len(candidates))
 
         # Rerank if enabled and we have a cross-encoder
-        if use_reranker and isinstance(self.reranker, CrossEncoderReranker):
-            rerank_results = self.reranker.rerank(query, candidates, top_k=top_k)
-            metrics.reranker_used = True
-        else:
-            # Use fallback (sort by RRF score)
-            fallback = FallbackReranker()
-            rerank_results = fallback.rerank(query, candidates, top_k=top_k)
-            metrics.reranker_used = False
+        with (
+            self.tracer.trace_operation(SpanNames.RERANK) as span,
+            self.memory_metrics.timer("hybrid.rerank"),
+        ):
+            if use_cross_encoder:
+                rerank_results = self.reranker.rerank(query, candidates, top_k=top_k)
+                metrics.reranker_used = True
+            else:
+                # Use fallback (sort by RRF score)
+                fallback = FallbackReranker()
+                rerank_results = fallback.rerank(query, candidates, top_k=top_k)
+                metrics.reranker_used = False
+            span.set_attribute("cross_encoder", metrics.reranker_used)
 
         metrics.stage2_time_ms = (time.perf_counter() - stage2_start) * 1000
 
@@ -348,6 +477,73 @@ class HybridRetriever:
 
         return results, metrics
 
+    def _traced_search(
+        self,
+        span_name: str,
+        operation: str,
+        search: Callable[..., list[tuple[str, float]]],
+        *args: Any,
+    ) -> list[tuple[str, float]]:
+        """Run one Stage 1 search inside its own span and timer.
+
+        Called on the worker thread, where the context copied by
+        asyncio.to_thread makes the retrieve span the parent.
+
+        Args:
+            span_name: Span name for the search stage.
+            operation: Latency histogram name for the search stage.
+            search: Search callable.
+            *args: Arguments for the search callable.
+
+        Returns:
+            The search results.
+        """
+        with self.tracer.trace_operation(span_name) as span, self.memory_metrics.timer(operation):
+            results = search(*args)
+            span.set_attribute("candidates", len(results))
+        return results
+
+    def _matches_filter(self, user_id: str, memory_id: str, memory_filter: MemoryFilter) -> bool:
+        """Check an indexed memory against a filter (False if not indexed).
+
+        Args:
+            user_id: User ID.
+            memory_id: Memory ID.
+            memory_filter: Filter to apply.
+
+        Returns:
+            True if the memory is indexed and passes the filter.
+        """
+        memory = self.bm25.get_memory(user_id, memory_id) or self.vector.get_memory(
+            user_id, memory_id
+        )
+        return memory is not None and memory_filter.matches(memory)
+
+    def _lookup_candidates(
+        self,
+        user_id: str,
+        fused: list[tuple[str, float]],
+    ) -> list[tuple[str, Memory, float]]:
+        """Resolve fused memory IDs to indexed memories.
+
+        Args:
+            user_id: User ID.
+            fused: Fused (memory_id, rrf_score) tuples.
+
+        Returns:
+            List of (memory_id, memory, rrf_score) tuples in fused order,
+            skipping IDs neither index knows about.
+        """
+        candidates: list[tuple[str, Memory, float]] = []
+        for mem_id, rrf_score in fused:
+            # Get memory from either index
+            memory = self.bm25.get_memory(user_id, mem_id)
+            if memory is None:
+                memory = self.vector.get_memory(user_id, mem_id)
+            if memory is not None:
+                candidates.append((mem_id, memory, rrf_score))
+        return candidates
+
     def _build_results(
         self,
         rerank_results: list[RerankResult],
@@ -412,6 +608,7 @@ class HybridRetriever:
         query: str,
         user_id: str,
         top_k: int = 10,
+        memory_filter: Optional[MemoryFilter] = None,
     ) -> list[tuple[Memory, float]]:
         """Simplified retrieval returning (Memory, score) tuples.
 
@@ -419,11 +616,12 @@ class HybridRetriever:
             query: Search query.
             user_id: User ID to search for.
             top_k: Number of results to return.
+            memory_filter: Optional metadata filter.
 
         Returns:
             List of (Memory, score) tuples.
         """
-        results, _ = await self.retrieve(query, user_id, top_k)
+        results, _ = await self.retrieve(query, user_id, top_k, memory_filter=memory_filter)
         return [(r.memory, r.score) for r in results]
 
     def has_index(self, user_id: str) -> bool:
@@ -464,6 +662,8 @@ def create_hybrid_retriever(
     use_query_rewriter: bool = True,
     bm25_weight: float = 1.0,
     vector_weight: float = 1.0,
+    tracer: Optional[MemoryTracer] = None,
+    memory_metrics: Optional[MemoryMetrics] = None,
 ) -> HybridRetriever:
     """Factory function to create a HybridRetriever.
 
@@ -472,6 +672,8 @@ def create_hybrid_retriever(
         use_query_rewriter: If True, include query rewriter.
         bm25_weight: Weight for BM25 in RRF fusion.
         vector_weight: Weight for vector in RRF fusion.
+        tracer: Tracer for per-stage spans.
+        memory_metrics: Collector for per-stage latency histograms.
 
     Returns:
         Configured HybridRetriever instance.
@@ -483,4 +685,6 @@ def create_hybrid_retriever(
         use_cross_encoder=use_cross_encoder,
         bm25_weight=bm25_weight,
         vector_weight=vector_weight,
+        tracer=tracer,
+        memory_metrics=memory_metrics,
     )
@@ -5,6 +5,13 @@
 
 Combines semantic similarity, recency, and confidence for ranking.
 
+Candidate batches are scored column-wise: RankingFeatures holds token
+IDs, timestamps and confidences in NumPy arrays (reusable across
+queries), and the top-k is selected with argpartition. Plain memory
+lists are scored in one pass that reuses each content's word set from a
+bounded per-ranker cache, so per-query ranking needs no prebuilt
+features.
+
 Related GitHub Issues:
 - #97: Memory Ranking Logic
 - #100: Memory Decay Scoring
@@ -12,13 +19,144 @@ Related GitHub Issues:
 ADR Reference: ADR-003 Memory Architecture, Phase 1c (Retrieval & Ranking)
 """
 
+import itertools
 import math
+import threading
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
 
 from luminescent_cluster.memory.blocks.schemas import Provenance
+from luminescent_cluster.memory.retrieval.fusion import top_k_indices
 from luminescent_cluster.memory.schemas import Memory
 
+# Separates contents in RankingFeatures.text; queries containing it fall
+# back to a per-candidate substring test
+_SEPARATOR = "\x00"
+
+_SECONDS_PER_DAY = 24 * 60 * 60
+
+# Distinct contents whose lowercased text and word set a ranker keeps
+DEFAULT_WORD_CACHE_SIZE = 10_000
+
+
+def _epoch_seconds(dt: datetime) -> float:
+    """Return a datetime as epoch seconds, treating naive values as UTC."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+@dataclass
+class RankingFeatures:
+    """Columnar features of a candidate batch.
+
+    Build once with from_memories() and reuse for every query ranked
+    against the same candidates.
+
+    Attributes:
+        memories: The candidates, in input order.
+        vocabulary: Word -> token ID for every word in the candidates.
+        token_ids: Distinct token IDs of all candidates, concatenated.
+        token_owner: Candidate index of each entry in token_ids.
+        set_sizes: Number of distinct words per candidate.
+        text: Lowercased contents joined by a separator.
+        offsets: Start of each candidate's content in text.
+        timestamps: last_accessed_at as epoch seconds.
+        confidences: Extraction confidence per candidate.
+    """
+
+    memories: List[Memory]
+    vocabulary: dict[str, int]
+    token_ids: NDArray[np.int64]
+    token_owner: NDArray[np.int64]
+    set_sizes: NDArray[np.int64]
+    text: str
+    offsets: NDArray[np.int64]
+    timestamps: NDArray[np.float64]
+    confidences: NDArray[np.float64]
+
+    def __len__(self) -> int:
+        return len(self.memories)
+
+    @classmethod
+    def from_memories(cls, memories: List[Memory]) -> "RankingFeatures":
+        """Extract ranking features from memories.
+
+        Args:
+            memories: Candidates to rank.
+
+        Returns:
+            RankingFeatures for the candidates.
+        """
+        vocabulary: dict[str, int] = {}
+        token_ids: list[int] = []
+        token_owner: list[int] = []
+        set_sizes: list[int] = []
+        lowered: list[str] = []
+
+        for i, memory in enumerate(memories):
+            content = memory.content.lower()
+            lowered.append(content)
+            words = set(content.split())
+            set_sizes.append(len(words))
+            for word in words:
+                token_ids.append(vocabulary.setdefault(word, len(vocabulary)))
+            token_owner.extend([i] * len(words))
+
+        offsets = np.zeros(len(memories), dtype=np.int64)
+        if lowered:
+            lengths = np.fromiter((len(c) + 1 for c in lowered[:-1]), dtype=np.int64)
+            offsets[1:] = np.cumsum(lengths)
+
+        return cls(
+            memories=list(memories),
+            vocabulary=vocabulary,
+            token_ids=np.asarray(token_ids, dtype=np.int64),
+            token_owner=np.asarray(token_owner, dtype=np.int64),
+            set_sizes=np.asarray(set_sizes, dtype=np.int64),
+            text=_SEPARATOR.join(lowered),
+            offsets=offsets,
+            timestamps=np.fromiter(
+                (_epoch_seconds(m.last_accessed_at) for m in memories),
+                dtype=np.float64,
+                count=len(memories),
+            ),
+            confidences=np.fromiter(
+                (m.confidence for m in memories), dtype=np.float64, count=len(memories)
+            ),
+        )
+
+    def substring_mask(self, needle: str) -> NDArray[np.bool_]:
+        """Return which candidates contain a lowercase substring.
+
+        Args:
+            needle: Lowercase text to look for.
+
+        Returns:
+            Boolean mask over candidates.
+        """
+        mask = np.zeros(len(self.memories), dtype=bool)
+        if _SEPARATOR in needle:
+            for i, memory in enumerate(self.memories):
+                mask[i] = needle in memory.content.lower()
+            return mask
+
+        # One C-level scan over the joined text; a match cannot span
+        # candidates because the needle has no separator
+        start = self.text.find(needle)
+        while start != -1:
+            owner = int(np.searchsorted(self.offsets, start, side="right")) - 1
+            mask[owner] = True
+            next_offset = (
+                self.offsets[owner + 1] if owner + 1 < len(self.offsets) else len(self.text)
+            )
+            start = self.text.find(needle, int(next_offset))
+        return mask
+
 
 class MemoryRanker:
     """Ranks memories based on combined scoring factors.
@@ -49,6 +187,7 @@ class MemoryRanker:
         confidence_weight: float = 0.2,
         decay_enabled: bool = True,
         decay_half_life_days: int = 30,
+        word_cache_size: int = DEFAULT_WORD_CACHE_SIZE,
     ):
         """Initialize the ranker with weights.
 
@@ -58,12 +197,29 @@ class MemoryRanker:
             confidence_weight: Weight for confidence score.
             decay_enabled: Enable decay-based recency scoring.
             decay_half_life_days: Half-life for exponential decay.
+            word_cache_size: Distinct contents whose word sets are kept
+                between calls (0 disables the cache).
         """
         self.similarity_weight = similarity_weight
         self.recency_weight = recency_weight
         self.confidence_weight = confidence_weight
         self.decay_enabled = decay_enabled
         self.decay_half_life_days = decay_half_life_days
+        self.word_cache_size = word_cache_size
+        self._word_cache: dict[str, Tuple[str, frozenset[str]]] = {}
+        self._word_cache_lock = threading.Lock()
+
+    def _remember_words(self, entries: dict[str, Tuple[str, frozenset[str]]]) -> None:
+        """Add word sets to the cache, evicting the oldest beyond word_cache_size."""
+        if self.word_cache_size <= 0 or not entries:
+            return
+        with self._word_cache_lock:
+            self._word_cache.update(entries)
+            excess = len(self._word_cache) - self.word_cache_size
+            if excess > 0:
+                # Oldest first; contents of a live corpus are re-added
+                for content in list(itertools.islice(self._word_cache, excess)):
+                    del self._word_cache[content]
 
     def calculate_similarity(self, query: str, content: str) -> float:
         """Calculate similarity between query and content.
@@ -160,11 +316,133 @@ class MemoryRanker:
 
         return score
 
+    def calculate_scores(
+        self,
+        query: str,
+        candidates: List[Memory] | RankingFeatures,
+    ) -> NDArray[np.float64]:
+        """Calculate combined scores for a batch of candidates at once.
+
+        Equivalent to calculate_score() for each candidate, computed over
+        columnar arrays.
+
+        Args:
+            query: Search query.
+            candidates: Memories, or features built from them.
+
+        Returns:
+            Scores in candidate order.
+        """
+        if isinstance(candidates, RankingFeatures):
+            similarity = self._feature_similarity(query, candidates)
+            timestamps = candidates.timestamps
+            confidences = candidates.confidences
+        else:
+            similarity = self._memory_similarity(query, candidates)
+            timestamps = np.fromiter(
+                (_epoch_seconds(m.last_accessed_at) for m in candidates),
+                dtype=np.float64,
+                count=len(candidates),
+            )
+            confidences = np.fromiter(
+                (m.confidence for m in candidates), dtype=np.float64, count=len(candidates)
+            )
+        n = len(candidates)
+
+        # Recency
+        now = datetime.now(timezone.utc).timestamp()
+        age_days = np.maximum(0.0, (now - timestamps) / _SECONDS_PER_DAY)
+        if not self.decay_enabled:
+            recency = np.maximum(0.0, 1.0 - age_days / 90)
+        elif self.decay_half_life_days <= 0:
+            recency = np.zeros(n, dtype=np.float64)
+        else:
+            recency = np.power(0.5, age_days / self.decay_half_life_days)
+
+        return (
+            self.similarity_weight * similarity
+            + self.recency_weight * recency
+            + self.confidence_weight * confidences
+        )
+
+    def _memory_similarity(self, query: str, memories: List[Memory]) -> NDArray[np.float64]:
+        """Jaccard similarity plus substring boost, in one pass over memories."""
+        n = len(memories)
+        similarity = np.zeros(n, dtype=np.float64)
+        query_lower = query.lower()
+        query_words = frozenset(query_lower.split())
+        if not query_words or not n:
+            return similarity
+
+        intersection = np.zeros(n, dtype=np.float64)
+        set_sizes = np.zeros(n, dtype=np.float64)
+        boosted = np.zeros(n, dtype=bool)
+        cached = self._word_cache.get
+        misses: dict[str, Tuple[str, frozenset[str]]] = {}
+        for i, memory in enumerate(memories):
+            entry = cached(memory.content)
+            if entry is None:
+                lowered = memory.content.lower()
+                entry = misses[memory.content] = (lowered, frozenset(lowered.split()))
+            lowered, words = entry
+            set_sizes[i] = len(words)
+            intersection[i] = len(query_words & words)
+            boosted[i] = query_lower in lowered
+        self._remember_words(misses)
+
+        has_words = set_sizes > 0
+        union = len(query_words) + set_sizes - intersection
+        similarity[has_words] = intersection[has_words] / union[has_words]
+
+        # Boost for exact substring match
+        boosted &= has_words
+        similarity[boosted] = np.minimum(1.0, similarity[boosted] + 0.3)
+        return np.minimum(1.0, similarity)
+
+    def _feature_similarity(self, query: str, features: RankingFeatures) -> NDArray[np.float64]:
+        """Jaccard similarity plus substring boost over precomputed features."""
+        n = len(features)
+        similarity = np.zeros(n, dtype=np.float64)
+        query_lower = query.lower()
+        query_words = set(query_lower.split())
+        if query_words and n:
+            query_ids = [features.vocabulary[w] for w in query_words if w in features.vocabulary]
+            in_query = np.zeros(len(features.vocabulary), dtype=bool)
+            in_query[query_ids] = True
+            intersection = np.bincount(
+                features.token_owner[in_query[features.token_ids]], minlength=n
+            )
+            union = len(query_words) + features.set_sizes - intersection
+            has_words = features.set_sizes > 0
+            similarity[has_words] = intersection[has_words] / union[has_words]
+
+            # Boost for exact substring match
+            boosted = features.substring_mask(query_lower) & has_words
+            similarity[boosted] = np.minimum(1.0, similarity[boosted] + 0.3)
+            similarity = np.minimum(1.0, similarity)
+        return similarity
+
+    @staticmethod
+    def top_k(scores: NDArray[np.float64], limit: int | None = None) -> NDArray[np.int64]:
+        """Return candidate indexes by descending score.
+
+        Uses a partial sort; ties keep input order, like a stable sort.
+
+        Args:
+            scores: Candidate scores.
+            limit: Maximum number of indexes to return.
+
+        Returns:
+            Indexes of the top candidates, best first.
+        """
+        return top_k_indices(scores, limit)
+
     def rank(
         self,
         query: str,
         memories: List[Memory],
         limit: int | None = None,
+        features: Optional[RankingFeatures] = None,
     ) -> List[Tuple[Memory, float]]:
         """Rank memories by relevance to query.
 
@@ -172,6 +450,7 @@ class MemoryRanker:
             query: Search query.
             memories: List of memories to rank.
             limit: Maximum number of results to return.
+            features: Precomputed features for ``memories`` (optional).
 
         Returns:
             List of (memory, score) tuples sorted by score descending.
@@ -179,17 +458,8 @@ class MemoryRanker:
         if not memories:
             return []
 
-        # Score each memory
-        scored = [(memory, self.calculate_score(query, memory)) for memory in memories]
-
-        # Sort by score descending
-        scored.sort(key=lambda x: x[1], reverse=True)
-
-        # Apply limit
-        if limit is not None:
-            scored = scored[:limit]
-
-        return scored
+        scores = self.calculate_scores(query, features if features is not None else memories)
+        return [(memories[i], float(scores[i])) for i in self.top_k(scores, limit)]
 
     def rank_with_provenance(
         self,
@@ -215,10 +485,12 @@ class MemoryRanker:
         if not memories:
             return []
 
-        # Score and attach provenance to each memory
+        scores = self.calculate_scores(query, memories)
+
+        # Attach provenance to the selected memories only
         scored = []
-        for memory in memories:
-            score = self.calculate_score(query, memory)
+        for i in self.top_k(scores, limit):
+            memory, score = memories[i], float(scores[i])
 
             if attach_provenance:
                 # Preserve existing provenance if present, just add retrieval_score
@@ -244,11 +516,4 @@ class MemoryRanker:
             else:
                 scored.append((memory, score))
 
-        # Sort by score descending
-        scored.sort(key=lambda x: x[1], reverse=True)
-
-        # Apply limit
-        if limit is not None:
-            scored = scored[:limit]
-
         return scored
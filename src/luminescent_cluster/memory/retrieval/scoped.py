@@ -11,9 +11,11 @@ Related GitHub Issues:
 ADR Reference: ADR-003 Memory Architecture, Phase 1c (Retrieval & Ranking)
 """
 
+import inspect
 from enum import IntEnum
 from typing import Any, List, Optional
 
+from luminescent_cluster.memory.retrieval.filters import MemoryFilter
 from luminescent_cluster.memory.retrieval.ranker import MemoryRanker
 from luminescent_cluster.memory.schemas import Memory
 
@@ -67,6 +69,16 @@ class ScopedRetriever:
         """
         self.provider = provider
         self.ranker = ranker or MemoryRanker()
+        self._provider_filters = self._accepts_memory_filter(provider)
+
+    @staticmethod
+    def _accepts_memory_filter(provider: Any) -> bool:
+        """Check whether provider.retrieve() takes a memory_filter argument."""
+        try:
+            parameters = inspect.signature(provider.retrieve).parameters
+        except (AttributeError, TypeError, ValueError):
+            return False
+        return "memory_filter" in parameters
 
     async def retrieve(
         self,
@@ -155,36 +167,43 @@ class ScopedRetriever:
         Returns:
             List of memories matching scope and query.
         """
-        # Build filters for scope
-        filters = self._build_scope_filters(scope, project_id)
+        memory_filter = self._build_scope_filter(scope, project_id)
 
-        # Get all memories for user first
-        all_memories = await self.provider.retrieve(query, user_id, limit=limit * 2)
+        if self._provider_filters:
+            # The provider applies the scope before ranking, so `limit`
+            # matches come back however selective the scope is
+            return await self.provider.retrieve(
+                query, user_id, limit=limit, memory_filter=memory_filter
+            )
 
-        # Filter by scope
-        scope_memories = []
-        for memory in all_memories:
-            if self._matches_scope(memory, scope, project_id):
-                scope_memories.append(memory)
+        # Providers without filter support: over-fetch, then filter by scope
+        all_memories = await self.provider.retrieve(query, user_id, limit=limit * 2)
+        scope_memories = [memory for memory in all_memories if memory_filter.matches(memory)]
 
         return scope_memories[:limit]
 
-    def _build_scope_filters(self, scope: str, project_id: Optional[str]) -> dict[str, Any]:
-        """Build filter dictionary for a scope.
+    def _build_scope_filter(self, scope: str, project_id: Optional[str]) -> MemoryFilter:
+        """Build the metadata filter for a scope.
+
+        Only scope membership is enforced; expiry and validity are left
+        to the provider as before. An unknown scope matches every memory,
+        and an empty project_id matches any project.
 
         Args:
             scope: Scope to filter by.
             project_id: Project ID for project scope.
 
         Returns:
-            Filter dictionary.
+            MemoryFilter for the scope.
         """
-        filters: dict[str, Any] = {}
-
-        if scope == "project" and project_id:
-            filters["project_id"] = project_id
-
-        return filters
+        if scope not in ("user", "project", "global"):
+            return MemoryFilter(include_expired=True, include_invalid=True)
+        return MemoryFilter(
+            scope=scope,
+            project_id=(project_id or None) if scope == "project" else None,
+            include_expired=True,
+            include_invalid=True,
+        )
 
     def _matches_scope(
         self,
@@ -202,22 +221,7 @@ class ScopedRetriever:
         Returns:
             True if memory matches scope.
         """
-        memory_scope = memory.metadata.get("scope", "user")
-
-        if scope == "user":
-            return memory_scope == "user" or memory_scope is None
-
-        if scope == "project":
-            if memory_scope != "project":
-                return False
-            if project_id:
-                return memory.metadata.get("project_id") == project_id
-            return True
-
-        if scope == "global":
-            return memory_scope == "global"
-
-        return True
+        return self._build_scope_filter(scope, project_id).matches(memory)
 
     async def retrieve_all_scopes(
         self,
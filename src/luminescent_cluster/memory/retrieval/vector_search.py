@@ -13,6 +13,13 @@ Vector search complements BM25 by handling:
 
 Model: all-MiniLM-L6-v2 (384-dim, fast, good quality)
 
+Embeddings can be stored as float32 (default), float16 (2x smaller) or
+int8 with one float32 scale per vector (~4x smaller). Quantized indexes
+are scanned in the stored precision and a shortlist of
+``top_k * rescore_factor`` candidates is rescored in float32 against the
+unquantized query. See memory.evaluation.quantization for measuring the
+recall cost of each mode on a corpus.
+
 ADR Reference: ADR-003 Memory Architecture, Phase 3 (Two-Stage Retrieval)
 """
 
@@ -23,10 +30,57 @@ from typing import Optional, Protocol, cast
 import numpy as np
 from numpy.typing import NDArray
 
+from luminescent_cluster.memory.retrieval.filters import MemoryFilter, MetadataIndex
+from luminescent_cluster.memory.retrieval.fusion import top_k_indices
 from luminescent_cluster.memory.schemas import Memory
 
 logger = logging.getLogger(__name__)
 
+STORAGE_MODES = ("float32", "float16", "int8")
+
+# Rows converted to float32 at a time when scanning a quantized index,
+# bounding the temporary memory of a search
+_SCAN_CHUNK_ROWS = 4096
+
+
+def _quantize(
+    embeddings: NDArray[np.float32], storage: str
+) -> tuple[NDArray, Optional[NDArray[np.float32]]]:
+    """Convert embeddings (1D or 2D) to a storage format.
+
+    Args:
+        embeddings: Float embeddings, one per row.
+        storage: One of STORAGE_MODES.
+
+    Returns:
+        Tuple of (stored values, per-vector scales for int8 or None).
+    """
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    if storage == "float16":
+        return embeddings.astype(np.float16), None
+    if storage == "int8":
+        peak = np.abs(embeddings).max(axis=-1)
+        scales = np.where(peak > 0, peak / 127.0, 1.0).astype(np.float32)
+        codes = np.rint(embeddings / scales[..., None]).astype(np.int8)
+        return codes, scales
+    return embeddings, None
+
+
+def _dequantize(values: NDArray, scales: Optional[NDArray[np.float32]]) -> NDArray[np.float32]:
+    """Convert stored embeddings back to float32.
+
+    Args:
+        values: Stored values from _quantize.
+        scales: Per-vector scales, or None for float formats.
+
+    Returns:
+        Float32 embeddings with the same shape as values.
+    """
+    embeddings = values.astype(np.float32)
+    if scales is not None:
+        embeddings *= np.asarray(scales, dtype=np.float32)[..., None]
+    return embeddings
+
 
 class EmbeddingModel(Protocol):
     """Protocol for embedding models."""
@@ -48,11 +102,16 @@ class VectorIndex:
 
     Attributes:
         doc_ids: List of document IDs.
-        embeddings: Normalized embedding matrix (num_docs x embedding_dim).
+        embeddings: Normalized embedding matrix (num_docs x embedding_dim),
+            in the search's storage dtype.
+        scales: Per-row dequantization scales for int8 storage.
+        metadata: Metadata columns aligned with doc_ids, for filtering.
     """
 
     doc_ids: list[str] = field(default_factory=list)
-    embeddings: Optional[NDArray[np.float32]] = None
+    embeddings: Optional[NDArray] = None
+    scales: Optional[NDArray[np.float32]] = None
+    metadata: MetadataIndex = field(default_factory=MetadataIndex)
 
 
 class VectorSearch:
@@ -71,17 +130,23 @@ class VectorSearch:
     Attributes:
         model_name: Name of the sentence-transformers model.
         embedding_dim: Dimension of embeddings.
+        storage: Embedding storage format (float32, float16 or int8).
+        rescore_factor: Shortlist size, as a multiple of top_k, rescored
+            in float32 when storage is quantized.
     """
 
     # Default model - fast and good quality
     DEFAULT_MODEL = "all-MiniLM-L6-v2"
     DEFAULT_EMBEDDING_DIM = 384
+    DEFAULT_RESCORE_FACTOR = 4
 
     def __init__(
         self,
         model_name: str = DEFAULT_MODEL,
         embedding_dim: int = DEFAULT_EMBEDDING_DIM,
         lazy_load: bool = True,
+        storage: str = "float32",
+        rescore_factor: int = DEFAULT_RESCORE_FACTOR,
     ):
         """Initialize vector search.
 
@@ -89,9 +154,20 @@ class VectorSearch:
             model_name: Sentence-transformers model name.
             embedding_dim: Expected embedding dimension.
             lazy_load: If True, load model on first use.
+            storage: Embedding storage format, one of STORAGE_MODES.
+            rescore_factor: Shortlist multiplier for quantized storage.
+
+        Raises:
+            ValueError: If storage or rescore_factor is invalid.
         """
+        if storage not in STORAGE_MODES:
+            raise ValueError(f"storage must be one of {STORAGE_MODES}, got {storage!r}")
+        if rescore_factor < 1:
+            raise ValueError("rescore_factor must be at least 1")
         self.model_name = model_name
         self.embedding_dim = embedding_dim
+        self.storage = storage
+        self.rescore_factor = rescore_factor
         self._model: Optional[EmbeddingModel] = None
         self._indexes: dict[str, VectorIndex] = {}
         self._memory_contents: dict[str, dict[str, Memory]] = {}
@@ -202,15 +278,40 @@ class VectorSearch:
                 mem_id = memory.metadata.get("memory_id", f"mem-{i}")
 
             index.doc_ids.append(mem_id)
+            index.metadata.append(memory)
             texts.append(memory.content)
             self._memory_contents[user_id][mem_id] = memory
 
         # Generate embeddings in batches
         embeddings = self.embed(texts, normalize=True)
-        index.embeddings = embeddings
+        index.embeddings, index.scales = _quantize(embeddings, self.storage)
 
         self._indexes[user_id] = index
 
+    def index_embeddings(
+        self,
+        user_id: str,
+        memory_ids: list[str],
+        embeddings: NDArray[np.float32],
+    ) -> None:
+        """Build a user's index from precomputed normalized embeddings.
+
+        No Memory objects are stored, so get_memory() and
+        search_with_memories() know nothing about these IDs.
+
+        Args:
+            user_id: User ID to index for.
+            memory_ids: IDs, one per embedding row.
+            embeddings: Normalized embedding matrix (num_docs x embedding_dim).
+        """
+        index = VectorIndex(doc_ids=list(memory_ids))
+        if len(memory_ids) > 0:
+            index.embeddings, index.scales = _quantize(
+                np.asarray(embeddings).reshape(len(memory_ids), -1), self.storage
+            )
+        self._indexes[user_id] = index
+        self._memory_contents[user_id] = {}
+
     def add_memory(
         self,
         user_id: str,
@@ -224,6 +325,24 @@ class VectorSearch:
             memory: Memory to add.
             memory_id: ID for the memory.
         """
+        self.add_memories(user_id, [memory], [memory_id])
+
+    def add_memories(
+        self,
+        user_id: str,
+        memories: list[Memory],
+        memory_ids: list[str],
+    ) -> None:
+        """Add several memories with one batched embedding call.
+
+        Args:
+            user_id: User ID.
+            memories: Memories to add.
+            memory_ids: IDs for the memories, in the same order.
+        """
+        if not memories:
+            return
+
         # Create index if it doesn't exist
         if user_id not in self._indexes:
             self._indexes[user_id] = VectorIndex()
@@ -231,19 +350,30 @@ class VectorSearch:
 
         index = self._indexes[user_id]
 
-        # Generate embedding
-        embedding = self.embed_single(memory.content, normalize=True)
+        # Generate embeddings in one batch
+        embeddings = self.embed([m.content for m in memories], normalize=True)
+        embeddings = embeddings.reshape(len(memories), -1)
+        values, scales = _quantize(embeddings, self.storage)
+
+        # Metadata is only kept while it lines up with doc_ids; an index
+        # built from raw embeddings has none, and no filter can use it
+        aligned = len(index.metadata) == len(index.doc_ids)
 
         # Add to index
-        index.doc_ids.append(memory_id)
+        index.doc_ids.extend(memory_ids)
 
         if index.embeddings is None:
-            index.embeddings = embedding.reshape(1, -1)
+            index.embeddings, index.scales = values, scales
         else:
-            index.embeddings = np.vstack([index.embeddings, embedding])
+            index.embeddings = np.vstack([index.embeddings, values])
+            if scales is not None and index.scales is not None:
+                index.scales = np.concatenate([index.scales, scales])
 
-        # Store memory
-        self._memory_contents[user_id][memory_id] = memory
+        # Store memories
+        for memory, memory_id in zip(memories, memory_ids):
+            if aligned:
+                index.metadata.append(memory)
+            self._memory_contents[user_id][memory_id] = memory
 
     def remove_memory(self, user_id: str, memory_id: str) -> bool:
         """Remove a memory from the index.
@@ -266,19 +396,62 @@ class VectorSearch:
             return False
 
         # Remove from doc_ids
+        if len(index.metadata) == len(index.doc_ids):
+            index.metadata.delete(doc_idx)
         index.doc_ids.pop(doc_idx)
 
         # Remove from embeddings
         if index.embeddings is not None and len(index.doc_ids) > 0:
             index.embeddings = np.delete(index.embeddings, doc_idx, axis=0)
+            if index.scales is not None:
+                index.scales = np.delete(index.scales, doc_idx)
         else:
             index.embeddings = None
+            index.scales = None
 
         # Remove from memory store
         self._memory_contents[user_id].pop(memory_id, None)
 
         return True
 
+    def update_memory(
+        self,
+        user_id: str,
+        memory: Memory,
+        memory_id: str,
+    ) -> None:
+        """Re-index one memory in place.
+
+        The memory is only re-embedded when its content changed, and only
+        its own row of the embedding matrix is replaced. A memory that is
+        not indexed yet is added.
+
+        Args:
+            user_id: User ID.
+            memory: Updated memory.
+            memory_id: ID of the memory.
+        """
+        index = self._indexes.get(user_id)
+        previous = self._memory_contents.get(user_id, {}).get(memory_id)
+        try:
+            doc_idx = index.doc_ids.index(memory_id) if index is not None else -1
+        except ValueError:
+            doc_idx = -1
+        if doc_idx < 0 or index.embeddings is None:
+            self.add_memory(user_id, memory, memory_id)
+            return
+
+        self._memory_contents[user_id][memory_id] = memory
+        if len(index.metadata) == len(index.doc_ids):
+            index.metadata.replace(doc_idx, memory)
+        if previous is not None and previous.content == memory.content:
+            return
+
+        values, scales = _quantize(self.embed_single(memory.content, normalize=True), self.storage)
+        index.embeddings[doc_idx] = values
+        if scales is not None and index.scales is not None:
+            index.scales[doc_idx] = scales
+
     def _cosine_similarity(
         self,
         query_embedding: NDArray[np.float32],
@@ -302,11 +475,107 @@ class VectorSearch:
 
         return similarities
 
+    def _scan(
+        self,
+        embeddings: NDArray,
+        scales: Optional[NDArray[np.float32]],
+        query_embedding: NDArray[np.float32],
+    ) -> NDArray[np.float32]:
+        """Score stored embeddings against the query in their stored precision.
+
+        For quantized storage the query is quantized like the rows and
+        rows are converted to float32 in chunks.
+
+        Args:
+            embeddings: Stored embedding rows.
+            scales: Per-row int8 scales, or None.
+            query_embedding: 1D float32 query embedding.
+
+        Returns:
+            Similarity (approximate when quantized) for each row.
+        """
+        if embeddings.dtype == np.float32:
+            return self._cosine_similarity(query_embedding, embeddings)
+
+        query_values, query_scale = _quantize(query_embedding, self.storage)
+        query_values = query_values.astype(np.float32)
+
+        num_rows = len(embeddings)
+        scores = np.empty(num_rows, dtype=np.float32)
+        for start in range(0, num_rows, _SCAN_CHUNK_ROWS):
+            block = embeddings[start : start + _SCAN_CHUNK_ROWS]
+            scores[start : start + len(block)] = block.astype(np.float32) @ query_values
+
+        if scales is not None and query_scale is not None:
+            scores *= scales * query_scale
+        return scores
+
+    def _search_index(
+        self,
+        index: VectorIndex,
+        query_embedding: NDArray[np.float32],
+        top_k: int,
+        memory_filter: Optional[MemoryFilter] = None,
+    ) -> list[tuple[str, float]]:
+        """Return the top-k rows of an index for a query embedding.
+
+        Args:
+            index: Non-empty index to search.
+            query_embedding: Normalized query embedding (1D or 2D).
+            top_k: Maximum number of results to return.
+            memory_filter: Optional filter applied before top-k selection.
+
+        Returns:
+            List of (memory_id, similarity_score) tuples sorted by score descending.
+
+        Raises:
+            ValueError: If a filter is given for an index built without
+                memories (see index_embeddings).
+        """
+        assert index.embeddings is not None
+        if query_embedding.ndim == 2:
+            query_embedding = query_embedding[0]
+        query_embedding = np.asarray(query_embedding, dtype=np.float32)
+
+        rows: Optional[NDArray[np.intp]] = None
+        if memory_filter is not None:
+            if len(index.metadata) != len(index.doc_ids):
+                raise ValueError("Index has no memory metadata to filter on")
+            rows = np.flatnonzero(index.metadata.mask(memory_filter))
+            if len(rows) == 0:
+                return []
+
+        if rows is not None and len(rows) * 2 <= len(index.doc_ids):
+            # Selective filter: only score the rows it keeps
+            scales = index.scales[rows] if index.scales is not None else None
+            scores = self._scan(index.embeddings[rows], scales, query_embedding)
+        else:
+            scores = self._scan(index.embeddings, index.scales, query_embedding)
+            if rows is not None:
+                scores = scores[rows]
+
+        if index.embeddings.dtype == np.float32:
+            top = top_k_indices(scores, top_k)
+            top_rows = top if rows is None else rows[top]
+            return [(index.doc_ids[row], float(scores[i])) for row, i in zip(top_rows, top)]
+
+        # Quantized scan, then exact float32 rescoring of a shortlist
+        shortlist = top_k_indices(scores, top_k * self.rescore_factor)
+        if rows is not None:
+            shortlist = rows[shortlist]
+        scales = index.scales[shortlist] if index.scales is not None else None
+        similarities = _dequantize(index.embeddings[shortlist], scales) @ query_embedding
+        return [
+            (index.doc_ids[shortlist[i]], float(similarities[i]))
+            for i in top_k_indices(similarities, top_k)
+        ]
+
     def search(
         self,
         user_id: str,
         query: str,
         top_k: int = 50,
+        memory_filter: Optional[MemoryFilter] = None,
     ) -> list[tuple[str, float]]:
         """Search for memories using semantic similarity.
 
@@ -314,6 +583,8 @@ class VectorSearch:
             user_id: User ID to search for.
             query: Search query.
             top_k: Maximum number of results to return.
+            memory_filter: Optional filter; rows it excludes are masked out
+                before top-k selection.
 
         Returns:
             List of (memory_id, similarity_score) tuples sorted by score descending.
@@ -329,28 +600,14 @@ class VectorSearch:
         # Generate query embedding
         query_embedding = self.embed_single(query, normalize=True)
 
-        # Calculate similarities
-        similarities = self._cosine_similarity(query_embedding, index.embeddings)
-
-        # Get top-k indices
-        if len(similarities) <= top_k:
-            top_indices = np.argsort(similarities)[::-1]
-        else:
-            top_indices = np.argpartition(similarities, -top_k)[-top_k:]
-            top_indices = top_indices[np.argsort(similarities[top_indices])[::-1]]
-
-        # Build results
-        results: list[tuple[str, float]] = []
-        for idx in top_indices:
-            results.append((index.doc_ids[idx], float(similarities[idx])))
-
-        return results
+        return self._search_index(index, query_embedding, top_k, memory_filter)
 
     def search_with_memories(
         self,
         user_id: str,
         query: str,
         top_k: int = 50,
+        memory_filter: Optional[MemoryFilter] = None,
     ) -> list[tuple[Memory, float]]:
         """Search and return Memory objects with scores.
 
@@ -358,11 +615,12 @@ class VectorSearch:
             user_id: User ID to search for.
             query: Search query.
             top_k: Maximum number of results to return.
+            memory_filter: Optional filter applied before ranking.
 
         Returns:
             List of (Memory, score) tuples sorted by score descending.
         """
-        results = self.search(user_id, query, top_k)
+        results = self.search(user_id, query, top_k, memory_filter)
         memories = self._memory_contents.get(user_id, {})
 
         return [(memories[mem_id], score) for mem_id, score in results if mem_id in memories]
@@ -372,6 +630,7 @@ class VectorSearch:
         user_id: str,
         query_embedding: NDArray[np.float32],
         top_k: int = 50,
+        memory_filter: Optional[MemoryFilter] = None,
     ) -> list[tuple[str, float]]:
         """Search using a pre-computed embedding.
 
@@ -379,6 +638,7 @@ class VectorSearch:
             user_id: User ID to search for.
             query_embedding: Pre-computed query embedding.
             top_k: Maximum number of results to return.
+            memory_filter: Optional filter applied before top-k selection.
 
         Returns:
             List of (memory_id, similarity_score) tuples.
@@ -391,22 +651,7 @@ class VectorSearch:
         if index.embeddings is None or len(index.doc_ids) == 0:
             return []
 
-        # Calculate similarities
-        similarities = self._cosine_similarity(query_embedding, index.embeddings)
-
-        # Get top-k indices
-        if len(similarities) <= top_k:
-            top_indices = np.argsort(similarities)[::-1]
-        else:
-            top_indices = np.argpartition(similarities, -top_k)[-top_k:]
-            top_indices = top_indices[np.argsort(similarities[top_indices])[::-1]]
-
-        # Build results
-        results: list[tuple[str, float]] = []
-        for idx in top_indices:
-            results.append((index.doc_ids[idx], float(similarities[idx])))
-
-        return results
+        return self._search_index(index, query_embedding, top_k, memory_filter)
 
     def get_memory(self, user_id: str, memory_id: str) -> Optional[Memory]:
         """Get a memory by ID.
@@ -443,7 +688,8 @@ class VectorSearch:
         if index.embeddings is None:
             return None
 
-        return index.embeddings[doc_idx]
+        scales = index.scales[doc_idx] if index.scales is not None else None
+        return _dequantize(index.embeddings[doc_idx], scales)
 
     def has_index(self, user_id: str) -> bool:
         """Check if an index exists for a user.
@@ -478,13 +724,20 @@ class VectorSearch:
             return {
                 "total_docs": 0,
                 "embedding_dim": self.embedding_dim,
+                "embedding_bytes": 0,
                 "model_loaded": self._model is not None,
             }
 
         index = self._indexes[user_id]
+        embedding_bytes = 0
+        if index.embeddings is not None:
+            embedding_bytes = index.embeddings.nbytes
+        if index.scales is not None:
+            embedding_bytes += index.scales.nbytes
         return {
             "total_docs": len(index.doc_ids),
             "embedding_dim": (index.embeddings.shape[1] if index.embeddings is not None else 0),
+            "embedding_bytes": embedding_bytes,
             "model_loaded": self._model is not None,
         }
 
@@ -0,0 +1,438 @@
+# Copyright 2024-2025 Amiable Development
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Shared-state backends for token bucket rate limiting.
+
+In-process limiters multiply every limit by the number of replicas. A
+RateLimitBackend holds bucket state where all replicas can see it and
+exposes one atomic operation, take(): refill a bucket for the elapsed
+time and consume from it.
+
+Backends:
+- InMemoryRateLimitBackend: process-local state (tests, single process)
+- SQLiteRateLimitBackend: a WAL-mode SQLite file shared by every process
+  on one host; each take() is a single short IMMEDIATE transaction
+- LeasedRateLimitBackend: wraps a shared backend and leases tokens in
+  chunks, so most requests are served locally without a round-trip
+
+Used by chatbot.rate_limiter.TokenBucketRateLimiter and
+memory.maas.security.AgentRateLimiter.
+
+Version: 1.0.0
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Protocol, Tuple, Union, runtime_checkable
+import sqlite3
+import threading
+import time
+
+
+@runtime_checkable
+class RateLimitBackend(Protocol):
+    """
+    Storage for token buckets shared between limiter instances.
+
+    Bucket parameters are passed on every call, so a backend only stores
+    the token level and the time it was last updated.
+    """
+
+    def take(
+        self,
+        key: str,
+        amount: float,
+        capacity: float,
+        refill_rate: float,
+        now: float,
+        force: bool = False,
+    ) -> Tuple[bool, float]:
+        """
+        Atomically refill a bucket and consume from it.
+
+        A missing bucket starts full. A negative amount returns tokens
+        (capped at capacity).
+
+        Args:
+            key: Bucket key
+            amount: Tokens to consume
+            capacity: Bucket capacity
+            refill_rate: Tokens added per second
+            now: Current wall-clock time (seconds since the epoch)
+            force: Consume even if the bucket has too few tokens
+                (the level is clamped at zero)
+
+        Returns:
+            Tuple of (granted, tokens remaining after the operation)
+        """
+        ...
+
+    def evict_idle(self, now: float) -> int:
+        """
+        Drop buckets that have fully refilled.
+
+        Args:
+            now: Current wall-clock time
+
+        Returns:
+            Number of buckets removed
+        """
+        ...
+
+
+def _apply(
+    tokens: float,
+    updated: float,
+    amount: float,
+    capacity: float,
+    refill_rate: float,
+    now: float,
+    force: bool,
+) -> Tuple[bool, float]:
+    """Refill-and-consume arithmetic shared by every backend."""
+    # max() guards against small clock skew between processes
+    tokens = min(capacity, tokens + max(0.0, now - updated) * refill_rate)
+    if not force and amount > tokens:
+        return False, tokens
+    return True, min(capacity, max(0.0, tokens - amount))
+
+
+def _full_at(tokens: float, capacity: float, refill_rate: float, now: float) -> float:
+    """Return when a bucket at this level will be full again."""
+    if tokens >= capacity or refill_rate <= 0:
+        return now if tokens >= capacity else float("inf")
+    return now + (capacity - tokens) / refill_rate
+
+
+class InMemoryRateLimitBackend:
+    """
+    Process-local backend.
+
+    Useful for tests and as a reference implementation; a plain
+    TokenBucketRateLimiter without a backend is faster in one process.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty backend."""
+        self._lock = threading.Lock()
+        # key -> [tokens, updated, full_at]
+        self._buckets: Dict[str, List[float]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of stored buckets."""
+        return len(self._buckets)
+
+    def take(
+        self,
+        key: str,
+        amount: float,
+        capacity: float,
+        refill_rate: float,
+        now: float,
+        force: bool = False,
+    ) -> Tuple[bool, float]:
+        """Atomically refill a bucket and consume from it (see RateLimitBackend)."""
+        with self._lock:
+            state = self._buckets.get(key)
+            tokens, updated = (capacity, now) if state is None else (state[0], state[1])
+            granted, tokens = _apply(tokens, updated, amount, capacity, refill_rate, now, force)
+            self._buckets[key] = [tokens, now, _full_at(tokens, capacity, refill_rate, now)]
+            return granted, tokens
+
+    def evict_idle(self, now: float) -> int:
+        """Drop buckets that have fully refilled."""
+        with self._lock:
+            idle = [k for k, state in self._buckets.items() if state[2] <= now]
+            for k in idle:
+                del self._buckets[k]
+            return len(idle)
+
+
+class SQLiteRateLimitBackend:
+    """
+    Bucket state in a SQLite database shared by processes on one host.
+
+    The database runs in WAL mode with synchronous=NORMAL, so readers never
+    block and a take() is one short BEGIN IMMEDIATE transaction (tens of
+    microseconds on local disk). Each OS thread gets its own connection.
+
+    Example:
+        backend = SQLiteRateLimitBackend("/var/run/luminescent/ratelimit.db")
+        limiter = TokenBucketRateLimiter(config, backend=backend)
+    """
+
+    def __init__(self, path: Union[str, Path], busy_timeout_seconds: float = 5.0):
+        """
+        Initialize the backend.
+
+        Args:
+            path: Database file (created if missing)
+            busy_timeout_seconds: How long to wait for another writer
+        """
+        self.path = str(path)
+        self.busy_timeout_seconds = busy_timeout_seconds
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._conn()  # create the schema eagerly so errors surface here
+
+    def _conn(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it if needed."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.path,
+                timeout=self.busy_timeout_seconds,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limit_buckets ("
+                "key TEXT PRIMARY KEY, tokens REAL NOT NULL, "
+                "updated REAL NOT NULL, full_at REAL NOT NULL)"
+            )
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def take(
+        self,
+        key: str,
+        amount: float,
+        capacity: float,
+        refill_rate: float,
+        now: float,
+        force: bool = False,
+    ) -> Tuple[bool, float]:
+        """Atomically refill a bucket and consume from it (see RateLimitBackend)."""
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT tokens, updated FROM rate_limit_buckets WHERE key = ?", (key,)
+            ).fetchone()
+            tokens, updated = (capacity, now) if row is None else row
+            granted, tokens = _apply(tokens, updated, amount, capacity, refill_rate, now, force)
+            conn.execute(
+                "INSERT INTO rate_limit_buckets (key, tokens, updated, full_at) "
+                "VALUES (?, ?, ?, ?) ON CONFLICT(key) DO UPDATE SET "
+                "tokens = excluded.tokens, updated = excluded.updated, "
+                "full_at = excluded.full_at",
+                (key, tokens, now, _full_at(tokens, capacity, refill_rate, now)),
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return granted, tokens
+
+    def evict_idle(self, now: float) -> int:
+        """Drop buckets that have fully refilled."""
+        cursor = self._conn().execute("DELETE FROM rate_limit_buckets WHERE full_at <= ?", (now,))
+        return cursor.rowcount
+
+    def close(self) -> None:
+        """Close every connection opened by this backend."""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+
+
+@dataclass
+class _Lease:
+    """
+    Tokens leased from the shared backend for one bucket.
+
+    ``tokens`` are already consumed from the shared bucket and are spent
+    locally; ``debt`` is forced usage beyond them that the shared bucket
+    has not seen yet. At most one of the two is non-zero. ``shared`` is
+    the shared bucket's level at the last round-trip, not counting the
+    leased tokens.
+    """
+
+    tokens: float
+    expires_at: float
+    capacity: float
+    refill_rate: float
+    shared: float
+    debt: float = 0.0
+
+    @property
+    def remaining(self) -> float:
+        """Bucket level as seen by this replica: last shared read plus local changes."""
+        return self.shared + self.tokens - self.debt
+
+    def adjust(self, amount: float) -> None:
+        """Spend (positive amount) or refund (negative amount) locally."""
+        if amount >= 0:
+            spent = min(self.tokens, amount)
+            self.tokens -= spent
+            self.debt += amount - spent
+        else:
+            repaid = min(self.debt, -amount)
+            self.debt -= repaid
+            self.tokens += -amount - repaid
+
+
+class LeasedRateLimitBackend:
+    """
+    Serve most take() calls from tokens leased from a shared backend.
+
+    When a bucket's local lease runs out, the next take() asks the shared
+    backend for the shortfall plus ``lease_size`` tokens (falling back to
+    just the shortfall). Peeks, refunds and forced usage are applied to
+    the lease and settled with the shared backend when the lease is
+    refilled or expires. Expired leases are settled by take() at most once
+    per ``lease_ttl_seconds``, and by evict_idle() and release_all().
+    The remaining count returned is the shared level read at the last
+    round-trip, adjusted by local usage since; a peek with no lease reads
+    the shared level without leasing anything.
+
+    Across N replicas a limit can be exceeded transiently by at most
+    N * lease_size tokens per bucket, plus forced usage not yet settled;
+    in exchange most requests cost a dict lookup instead of a database
+    transaction.
+    """
+
+    def __init__(
+        self,
+        shared: RateLimitBackend,
+        lease_size: float = 5.0,
+        lease_ttl_seconds: float = 1.0,
+    ):
+        """
+        Initialize the wrapper.
+
+        Args:
+            shared: Backend holding the authoritative bucket state
+            lease_size: Extra tokens to lease per round-trip
+            lease_ttl_seconds: How long a lease is used before it is settled
+        """
+        self.shared = shared
+        self.lease_size = lease_size
+        self.lease_ttl_seconds = lease_ttl_seconds
+        self._lock = threading.Lock()
+        self._leases: Dict[str, _Lease] = {}
+        self._last_sweep = 0.0
+        self.round_trips = 0
+
+    def __len__(self) -> int:
+        """Return the number of live leases."""
+        return len(self._leases)
+
+    def take(
+        self,
+        key: str,
+        amount: float,
+        capacity: float,
+        refill_rate: float,
+        now: float,
+        force: bool = False,
+    ) -> Tuple[bool, float]:
+        """Consume from the local lease, topping it up from the shared backend."""
+        if now - self._last_sweep >= self.lease_ttl_seconds:
+            self._settle_expired(now)
+
+        with self._lock:
+            lease = self._leases.get(key)
+            if lease is not None and (force or amount <= lease.tokens):
+                lease.adjust(amount)
+                return True, lease.remaining
+            if lease is not None:
+                del self._leases[key]
+
+        if lease is None and (force or amount <= 0):
+            # Read the shared level without leasing; the change itself is
+            # applied locally and settled later
+            self.round_trips += 1
+            _, remaining = self.shared.take(key, 0.0, capacity, refill_rate, now)
+            lease = _Lease(0.0, now + self.lease_ttl_seconds, capacity, refill_rate, remaining)
+            lease.adjust(amount)
+            self._store(key, lease)
+            return True, lease.remaining
+
+        leftover = lease.tokens if lease is not None else 0.0
+        debt = lease.debt if lease is not None else 0.0
+
+        # Leftover leased tokens are already consumed from the shared bucket
+        needed = amount - leftover + debt
+        self.round_trips += 1
+        granted, remaining = self.shared.take(
+            key, needed + self.lease_size, capacity, refill_rate, now
+        )
+        leased = self.lease_size
+        if not granted:
+            self.round_trips += 1
+            granted, remaining = self.shared.take(key, needed, capacity, refill_rate, now)
+            leased = 0.0
+        if not granted:
+            if debt > 0:
+                self.round_trips += 1
+                _, remaining = self.shared.take(key, debt, capacity, refill_rate, now, force=True)
+                lease.debt = 0.0
+            if leftover > 0:
+                lease.shared = remaining
+                self._store(key, lease)
+            return False, remaining + leftover
+
+        lease = _Lease(leased, now + self.lease_ttl_seconds, capacity, refill_rate, remaining)
+        self._store(key, lease)
+        return True, lease.remaining
+
+    def _store(self, key: str, lease: _Lease) -> None:
+        """Put a lease back, merging one created by another thread meanwhile."""
+        with self._lock:
+            existing = self._leases.get(key)
+            if existing is not None:
+                lease.adjust(-existing.tokens)
+                lease.adjust(existing.debt)
+            self._leases[key] = lease
+
+    def _settle(self, key: str, lease: _Lease, now: float) -> None:
+        """Return a lease's unused tokens or charge its forced usage."""
+        if lease.tokens > 0:
+            self.round_trips += 1
+            self.shared.take(key, -lease.tokens, lease.capacity, lease.refill_rate, now)
+        elif lease.debt > 0:
+            self.round_trips += 1
+            self.shared.take(key, lease.debt, lease.capacity, lease.refill_rate, now, force=True)
+
+    def _settle_expired(self, now: float) -> None:
+        """Settle and drop every lease past its TTL."""
+        with self._lock:
+            self._last_sweep = now
+            expired = {k: lease for k, lease in self._leases.items() if lease.expires_at <= now}
+            for key in expired:
+                del self._leases[key]
+        for key, lease in expired.items():
+            self._settle(key, lease, now)
+
+    def release_all(self, now: Optional[float] = None) -> None:
+        """Settle every lease with the shared backend (e.g. on shutdown)."""
+        now = time.time() if now is None else now
+        with self._lock:
+            leases, self._leases = self._leases, {}
+        for key, lease in leases.items():
+            self._settle(key, lease, now)
+
+    def evict_idle(self, now: float) -> int:
+        """Settle expired leases and drop idle buckets in the shared backend."""
+        self._settle_expired(now)
+        return self.shared.evict_idle(now)
@@ -33,14 +33,20 @@ from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 import pixeltable as pxt  # Safe to import after version guard
 import json
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable
 from pathlib import Path
+import asyncio
 import os
 import logging
-from datetime import datetime
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter
+from datetime import datetime, timezone
 
 # Extension system for OSS/Cloud separation (ADR-005)
 from luminescent_cluster.extensions import ExtensionRegistry
+from luminescent_cluster.memory.retrieval.cache import RetrievalCache
 
 # Configurable debug logging
 # Set PIXELTABLE_MCP_DEBUG=1 to enable detailed logging
@@ -159,6 +165,306 @@ def log_audit(
             pass
 
 
+# ============================================================================
+# Query Executor
+# ============================================================================
+
+# Worker threads for Pixeltable calls (PIXELTABLE_MCP_MAX_WORKERS)
+DEFAULT_MAX_WORKERS = 4
+
+# Per-call timeout in seconds for read queries (PIXELTABLE_MCP_QUERY_TIMEOUT)
+DEFAULT_QUERY_TIMEOUT = 30.0
+
+# Search result cache sizing (PIXELTABLE_MCP_CACHE_SIZE / PIXELTABLE_MCP_CACHE_TTL).
+# Local writes drop cached results at once; the TTL bounds how long rows
+# written by other processes go unseen, as for the service aggregates
+DEFAULT_CACHE_SIZE = 500
+DEFAULT_CACHE_TTL_SECONDS = 60.0
+
+# Sentinel meaning "use the executor's configured timeout"
+_CONFIGURED_TIMEOUT = object()
+
+
+class QueryExecutor:
+    """
+    Bounded thread pool that keeps blocking Pixeltable calls off the event loop.
+
+    Every call runs on a dedicated, size-limited pool so a slow similarity
+    search cannot stall other MCP tool calls, and concurrent readers proceed
+    in parallel up to ``max_workers``. The timeout covers the whole call,
+    time spent queued behind busy workers included. A call that times out
+    (or is cancelled) while still queued never runs; one that already
+    started stops being awaited but its worker thread runs to completion,
+    since Python threads cannot be cancelled.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ):
+        if max_workers is None:
+            max_workers = int(os.getenv("PIXELTABLE_MCP_MAX_WORKERS", DEFAULT_MAX_WORKERS))
+        if timeout is None:
+            timeout = float(os.getenv("PIXELTABLE_MCP_QUERY_TIMEOUT", DEFAULT_QUERY_TIMEOUT))
+
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="pixeltable-query"
+        )
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._max_queue_depth = 0
+        self._started = 0
+        self._completed = 0
+        self._failed = 0
+        self._timed_out = 0
+        self._total_wait = 0.0
+
+    async def run(
+        self, fn: Callable[..., Any], *args: Any, timeout: Any = _CONFIGURED_TIMEOUT
+    ) -> Any:
+        """
+        Run ``fn(*args)`` on the pool and await its result.
+
+        Args:
+            fn: Blocking callable to execute.
+            *args: Positional arguments for ``fn``.
+            timeout: Seconds to wait, including time queued for a worker.
+                Defaults to the configured timeout; ``None`` waits
+                indefinitely (for writes and long ingests).
+
+        Raises:
+            TimeoutError: If the call does not finish within the timeout.
+        """
+        if timeout is _CONFIGURED_TIMEOUT:
+            timeout = self.timeout
+
+        submitted_at = time.perf_counter()
+        # "queued" until a worker claims the job, or "abandoned" if the
+        # caller gives up first; both transitions happen under _lock
+        state = ["queued"]
+        with self._lock:
+            self._queued += 1
+            self._max_queue_depth = max(self._max_queue_depth, self._queued)
+
+        def _call():
+            with self._lock:
+                if state[0] == "abandoned":
+                    return None
+                state[0] = "running"
+                self._queued -= 1
+                self._running += 1
+                self._started += 1
+                self._total_wait += time.perf_counter() - submitted_at
+            try:
+                return fn(*args)
+            finally:
+                with self._lock:
+                    self._running -= 1
+
+        def _abandon() -> None:
+            with self._lock:
+                if state[0] == "queued":
+                    state[0] = "abandoned"
+                    self._queued -= 1
+
+        future = asyncio.get_running_loop().run_in_executor(self._pool, _call)
+        try:
+            result = await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            _abandon()
+            with self._lock:
+                self._timed_out += 1
+            raise TimeoutError(f"Pixeltable call {fn.__name__} exceeded {timeout}s") from None
+        except asyncio.CancelledError:
+            _abandon()
+            raise
+        except Exception:
+            with self._lock:
+                self._failed += 1
+            raise
+
+        with self._lock:
+            self._completed += 1
+        return result
+
+    def metrics(self) -> Dict[str, Any]:
+        """Queue depth and outcome counters for this executor."""
+        with self._lock:
+            started = self._started
+            return {
+                "max_workers": self.max_workers,
+                "timeout_seconds": self.timeout,
+                "queued": self._queued,
+                "running": self._running,
+                "max_queue_depth": self._max_queue_depth,
+                "completed": self._completed,
+                "failed": self._failed,
+                "timed_out": self._timed_out,
+                "avg_queue_wait_ms": (self._total_wait / started * 1000) if started else 0.0,
+            }
+
+    def shutdown(self) -> None:
+        """Stop accepting work and release worker threads."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+# ============================================================================
+# Per-service aggregates
+# ============================================================================
+
+# Number of incidents reported per service by get_service_context
+RECENT_INCIDENT_LIMIT = 3
+
+# Seconds before aggregates are rebuilt to pick up rows written by other
+# processes (PIXELTABLE_MCP_AGGREGATES_TTL; 0 disables the periodic rebuild)
+DEFAULT_AGGREGATES_TTL_SECONDS = 60.0
+
+
+class ServiceAggregates:
+    """
+    In-process per-service counts and recent incidents for org_knowledge.
+
+    Built from a single projection scan the first time it is needed, then kept
+    current by this process's write paths: incidents are applied
+    incrementally, while deletions and bulk/upsert writes whose effect on
+    counts is unknown mark the aggregates stale so the next read rescans
+    once. Rows written by other processes (ingestion scripts,
+    other servers) are picked up by a rescan once the aggregates are older
+    than ``ttl_seconds``.
+    """
+
+    def __init__(self, ttl_seconds: Optional[float] = None):
+        if ttl_seconds is None:
+            ttl_seconds = float(
+                os.getenv("PIXELTABLE_MCP_AGGREGATES_TTL", DEFAULT_AGGREGATES_TTL_SECONDS)
+            )
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._counts: Dict[Optional[str], Counter] = {}
+        self._recent_incidents: Dict[Optional[str], List[Dict[str, Any]]] = {}
+        self._stale = True
+        self._loaded_at = 0.0
+        # Bumped by every local change, so a rescan can tell it raced one
+        self._version = 0
+
+    def invalidate(self) -> None:
+        """Force a rescan on the next read."""
+        with self._lock:
+            self._stale = True
+            self._version += 1
+
+    def ensure_loaded(self, kb) -> None:
+        """Rebuild from one scan of ``kb`` if the aggregates are stale or expired."""
+        with self._lock:
+            now = time.monotonic()
+            expired = self.ttl_seconds > 0 and now - self._loaded_at >= self.ttl_seconds
+            if not (self._stale or expired):
+                return
+            version = self._version
+
+        # Scan without the lock so readers are never blocked behind it
+        rows = kb.select(kb.type, kb.metadata, kb.title, kb.created_at).collect()
+        counts: Dict[Optional[str], Counter] = {}
+        recent_incidents: Dict[Optional[str], List[Dict[str, Any]]] = {}
+        for row in rows:
+            metadata = row.get("metadata")
+            service = metadata.get("service") if isinstance(metadata, dict) else None
+            _add_row(
+                counts,
+                recent_incidents,
+                service,
+                row.get("type"),
+                row.get("title"),
+                row.get("created_at"),
+            )
+
+        with self._lock:
+            self._counts = counts
+            self._recent_incidents = recent_incidents
+            self._loaded_at = now
+            # A local write during the scan may be missing from it
+            self._stale = self._version != version
+
+    def record(
+        self,
+        service: Optional[str],
+        item_type: str,
+        title: Optional[str] = None,
+        created_at: Optional[datetime] = None,
+    ) -> None:
+        """Apply a single inserted row. No-op while stale (the rescan will see it)."""
+        with self._lock:
+            self._version += 1
+            if not self._stale:
+                _add_row(
+                    self._counts, self._recent_incidents, service, item_type, title, created_at
+                )
+
+    def service_context(self, service: str) -> Dict[str, Any]:
+        """Counts by type and most recent incidents for one service."""
+        with self._lock:
+            counts = self._counts.get(service, Counter())
+            return {
+                "service": service,
+                "code_files": counts["code"],
+                "decisions": counts["decision"],
+                "incidents": counts["incident"],
+                "recent_incidents": [dict(i) for i in self._recent_incidents.get(service, [])],
+            }
+
+    def stats(self) -> Dict[str, Any]:
+        """Knowledge base totals in the shape returned by ``get_knowledge_stats``."""
+        with self._lock:
+            by_type: Counter = Counter()
+            for counts in self._counts.values():
+                by_type.update(counts)
+            services = self._services()
+            return {
+                "total_items": sum(by_type.values()),
+                "by_type": {t: c for t, c in by_type.items() if c > 0},
+                "services_count": len(services),
+                "services": services,
+            }
+
+    def services(self) -> List[str]:
+        """Sorted names of every service with at least one row."""
+        with self._lock:
+            return self._services()
+
+    def _services(self) -> List[str]:
+        return sorted(service for service in self._counts if service)
+
+
+def _add_row(
+    counts: Dict[Optional[str], Counter],
+    recent_incidents: Dict[Optional[str], List[Dict[str, Any]]],
+    service: Optional[str],
+    item_type: Optional[str],
+    title: Optional[str],
+    created_at: Optional[datetime],
+) -> None:
+    """Count one row and keep the service's most recent incidents."""
+    counts.setdefault(service, Counter())[item_type] += 1
+    if item_type != "incident" or created_at is None:
+        return
+    if created_at.tzinfo is not None:
+        # Table rows are naive; compare everything as naive UTC
+        created_at = created_at.astimezone(timezone.utc).replace(tzinfo=None)
+    recent = recent_incidents.setdefault(service, [])
+    recent.append({"title": title, "created_at": created_at})
+    recent.sort(key=lambda i: i["created_at"], reverse=True)
+    del recent[RECENT_INCIDENT_LIMIT:]
+
+
+def _collect_rows(query) -> List[Dict[str, Any]]:
+    """Execute a Pixeltable query and return its rows as dicts."""
+    return [dict(row) for row in query.collect()]
+
+
 class PixeltableMemoryServer:
     """MCP server for Pixeltable long-term memory"""
 
@@ -177,6 +483,26 @@ class PixeltableMemoryServer:
         except Exception:
             self.meetings = None
 
+        self.aggregates = ServiceAggregates()
+        self.executor = QueryExecutor()
+
+        # Query results keyed by kb_version; every local write bumps the
+        # version, and the TTL covers writes from other processes
+        self.kb_version = 0
+        self.result_cache = RetrievalCache(
+            max_size=int(os.getenv("PIXELTABLE_MCP_CACHE_SIZE", DEFAULT_CACHE_SIZE)),
+            ttl_seconds=float(os.getenv("PIXELTABLE_MCP_CACHE_TTL", DEFAULT_CACHE_TTL_SECONDS)),
+        )
+
+    def close(self) -> None:
+        """Release the query executor."""
+        self.executor.shutdown()
+
+    def _bump_kb_version(self) -> None:
+        """Mark org_knowledge as changed so cached query results are not reused."""
+        self.kb_version += 1
+        self.result_cache.invalidate_all()
+
     async def search_knowledge(
         self,
         query: str,
@@ -193,7 +519,49 @@ class PixeltableMemoryServer:
 
         # Apply tenant filter if multi-tenancy is enabled (ADR-005)
         tenant_filter = get_tenant_filter(context)
+        tenant_id = tenant_filter.get("tenant_id", {}).get("$eq") if tenant_filter else None
+
+        cache_args = {
+            "tool": "search_knowledge",
+            "type_filter": type_filter,
+            "service_filter": service_filter,
+            "kb_version": self.kb_version,
+        }
+        result_list = self.result_cache.get(tenant_id or "", query, limit, **cache_args)
+        if result_list is None:
+            result_list = await self._query_knowledge(
+                query, tenant_filter, type_filter, service_filter, limit
+            )
+            self.result_cache.set(tenant_id or "", query, result_list, limit, **cache_args)
 
+        # Track usage for billing (no-op in OSS mode)
+        track_usage(
+            "search",
+            len(query),
+            {"tenant_id": context.get("x-tenant-id"), "result_count": len(result_list)},
+        )
+
+        # Log audit event (no-op in OSS mode)
+        log_audit(
+            "data_access",
+            context.get("user_id", "anonymous"),
+            "knowledge_base",
+            "search",
+            "success",
+            {"query": query[:100], "results": len(result_list)},
+        )
+
+        return result_list
+
+    async def _query_knowledge(
+        self,
+        query: str,
+        tenant_filter: dict,
+        type_filter: Optional[str],
+        service_filter: Optional[str],
+        limit: int,
+    ) -> List[Dict[str, Any]]:
+        """Run the similarity search behind search_knowledge."""
         results = self.kb
 
         # Apply tenant isolation filter
@@ -227,26 +595,7 @@ class PixeltableMemoryServer:
             .limit(limit)
         )
 
-        result_list = [dict(row) for row in matches.collect()]
-
-        # Track usage for billing (no-op in OSS mode)
-        track_usage(
-            "search",
-            len(query),
-            {"tenant_id": context.get("x-tenant-id"), "result_count": len(result_list)},
-        )
-
-        # Log audit event (no-op in OSS mode)
-        log_audit(
-            "data_access",
-            context.get("user_id", "anonymous"),
-            "knowledge_base",
-            "search",
-            "success",
-            {"query": query[:100], "results": len(result_list)},
-        )
-
-        return result_list
+        return await self.executor.run(_collect_rows, matches)
 
     async def get_adrs(
         self, topic: Optional[str] = None, service: Optional[str] = None, limit: int = 5
@@ -256,6 +605,11 @@ class PixeltableMemoryServer:
         if not self.kb:
             return []
 
+        cache_args = {"tool": "get_adrs", "service": service, "kb_version": self.kb_version}
+        cached = self.result_cache.get("", topic or "", limit, **cache_args)
+        if cached is not None:
+            return cached
+
         # Filter for actual ADRs: must be in /adr/ directory OR type='decision'
         adrs = self.kb.where(
             (self.kb.is_adr == True)
@@ -276,7 +630,9 @@ class PixeltableMemoryServer:
             self.kb.path, self.kb.title, self.kb.summary, self.kb.created_at, self.kb.metadata
         ).limit(limit)
 
-        return [dict(row) for row in results.collect()]
+        rows = await self.executor.run(_collect_rows, results)
+        self.result_cache.set("", topic or "", rows, limit, **cache_args)
+        return rows
 
     async def get_incidents(
         self, service: Optional[str] = None, limit: int = 5
@@ -297,7 +653,7 @@ class PixeltableMemoryServer:
             .limit(limit)
         )
 
-        return [dict(row) for row in results.collect()]
+        return await self.executor.run(_collect_rows, results)
 
     async def get_full_content(self, path: str) -> Optional[str]:
         """Get full content for a specific item by path"""
@@ -307,7 +663,7 @@ class PixeltableMemoryServer:
 
         result = self.kb.where(self.kb.path == path).select(self.kb.content).limit(1)
 
-        items = list(result.collect())
+        items = await self.executor.run(_collect_rows, result)
         return items[0]["content"] if items else None
 
     async def search_meetings(self, query: str, limit: int = 3) -> List[Dict[str, Any]]:
@@ -330,7 +686,7 @@ class PixeltableMemoryServer:
             .limit(limit)
         )
 
-        return [dict(row) for row in results.collect()]
+        return await self.executor.run(_collect_rows, results)
 
     async def get_service_context(self, service: str) -> Dict[str, Any]:
         """Get comprehensive context for a specific service"""
@@ -338,35 +694,9 @@ class PixeltableMemoryServer:
         if not self.kb:
             return {}
 
-        # Get counts by type
-        code_count = self.kb.where(
-            (self.kb.metadata["service"] == service) & (self.kb.type == "code")
-        ).count()
-
-        decision_count = self.kb.where(
-            (self.kb.metadata["service"] == service) & (self.kb.type == "decision")
-        ).count()
-
-        incident_count = self.kb.where(
-            (self.kb.metadata["service"] == service) & (self.kb.type == "incident")
-        ).count()
-
-        # Get recent incidents
-        recent_incidents = list(
-            self.kb.where((self.kb.metadata["service"] == service) & (self.kb.type == "incident"))
-            .order_by(self.kb.created_at, asc=False)
-            .select(self.kb.title, self.kb.created_at)
-            .limit(3)
-            .collect()
-        )
-
-        return {
-            "service": service,
-            "code_files": code_count,
-            "decisions": decision_count,
-            "incidents": incident_count,
-            "recent_incidents": [dict(i) for i in recent_incidents],
-        }
+        # Served from maintained aggregates instead of per-type count scans
+        await self.executor.run(self.aggregates.ensure_loaded, self.kb)
+        return self.aggregates.service_context(service)
 
     # Write Operations
     async def ingest_codebase_data(
@@ -400,8 +730,6 @@ class PixeltableMemoryServer:
             return {"success": False, "error": reason}
 
         from pixeltable_setup import ingest_codebase
-        import time
-        import asyncio
 
         start_time = time.time()
 
@@ -411,9 +739,14 @@ class PixeltableMemoryServer:
             logger.debug(f"Starting ingestion from {repo_path}...")
 
             # Run blocking Pixeltable operation in thread pool to avoid blocking event loop
-            count = await asyncio.to_thread(
-                ingest_codebase, self.kb, repo_path, service_name, ext_set
-            )
+            try:
+                count = await self.executor.run(
+                    ingest_codebase, self.kb, repo_path, service_name, ext_set, timeout=None
+                )
+            finally:
+                # Upserts may insert or replace rows, so recount on next read
+                self.aggregates.invalidate()
+                self._bump_kb_version()
 
             duration = time.time() - start_time
             logger.info(f"Ingested {count} files from {service_name} in {duration:.1f}s")
@@ -466,7 +799,13 @@ class PixeltableMemoryServer:
         from pixeltable_setup import ingest_adr
 
         try:
-            ingest_adr(self.kb, adr_path, title, service=service)
+            try:
+                await self.executor.run(
+                    ingest_adr, self.kb, adr_path, title, service, timeout=None
+                )
+            finally:
+                self.aggregates.invalidate()
+                self._bump_kb_version()
             return {"success": True, "adr": title, "path": adr_path, "service": service}
         except Exception as e:
             return {"success": False, "error": str(e)}
@@ -486,21 +825,32 @@ class PixeltableMemoryServer:
             incident_data["date"] = datetime.now()
 
         try:
-            ingest_incident(self.kb, incident_data)
-            return {"success": True, "incident": incident_data["title"]}
+            await self.executor.run(ingest_incident, self.kb, incident_data, timeout=None)
         except Exception as e:
             return {"success": False, "error": str(e)}
 
+        self.aggregates.record(
+            incident_data.get("service"),
+            "incident",
+            incident_data["title"],
+            incident_data["date"],
+        )
+        self._bump_kb_version()
+        return {"success": True, "incident": incident_data["title"]}
+
     # Stats & Info Operations
     async def get_stats(self) -> Dict[str, Any]:
         """Get knowledge base statistics"""
         if not self.kb:
             return {"error": "Knowledge base not initialized"}
 
-        from pixeltable_setup import get_knowledge_stats
-
         try:
-            return get_knowledge_stats(self.kb)
+            await self.executor.run(self.aggregates.ensure_loaded, self.kb)
+            return {
+                **self.aggregates.stats(),
+                "executor": self.executor.metrics(),
+                "result_cache": {**self.result_cache.get_metrics(), "kb_version": self.kb_version},
+            }
         except Exception as e:
             return {"error": str(e)}
 
@@ -509,10 +859,9 @@ class PixeltableMemoryServer:
         if not self.kb:
             return []
 
-        from pixeltable_setup import list_services
-
         try:
-            return list_services(self.kb)
+            await self.executor.run(self.aggregates.ensure_loaded, self.kb)
+            return self.aggregates.services()
         except Exception as e:
             return [f"Error listing services: {str(e)}"]
 
@@ -524,7 +873,7 @@ class PixeltableMemoryServer:
         from pixeltable_setup import snapshot_knowledge_base
 
         try:
-            snapshot_knowledge_base(name, tags or [])
+            await self.executor.run(snapshot_knowledge_base, name, tags or [])
             return {
                 "success": True,
                 "snapshot": name,
@@ -539,7 +888,7 @@ class PixeltableMemoryServer:
         from pixeltable_setup import list_snapshots
 
         try:
-            return list_snapshots()
+            return await self.executor.run(list_snapshots)
         except Exception as e:
             return []
 
@@ -575,7 +924,13 @@ class PixeltableMemoryServer:
         from pixeltable_setup import delete_service_data
 
         try:
-            result = delete_service_data(self.kb, service_name)
+            result = await self.executor.run(
+                delete_service_data, self.kb, service_name, timeout=None
+            )
+            # Rows are deleted by path, which other services' rows (e.g.
+            # incidents without a ticket URL) can share: rescan on next read
+            self.aggregates.invalidate()
+            self._bump_kb_version()
 
             # Log audit event for successful deletion
             log_audit(
@@ -589,6 +944,9 @@ class PixeltableMemoryServer:
 
             return {**result, "success": True}
         except Exception as e:
+            # Some rows may already be gone, so recount on next read
+            self.aggregates.invalidate()
+            self._bump_kb_version()
             log_audit(
                 "admin",
                 context.get("user_id", "anonymous"),
@@ -613,7 +971,9 @@ class PixeltableMemoryServer:
         from pixeltable_setup import prune_old_data
 
         try:
-            result = prune_old_data(self.kb, days_old)
+            result = await self.executor.run(prune_old_data, self.kb, days_old, timeout=None)
+            self.aggregates.invalidate()
+            self._bump_kb_version()
             return {**result, "success": True}
         except Exception as e:
             return {"success": False, "error": str(e)}
@@ -1017,11 +1377,12 @@ async def serve():
             return [TextContent(type="text", text=error_msg)]
 
     # Run server
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(read_stream, write_stream, server.create_initialization_options())
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(read_stream, write_stream, server.create_initialization_options())
+    finally:
+        memory.close()
 
 
 if __name__ == "__main__":
-    import asyncio
-
     asyncio.run(serve())
@@ -29,8 +29,10 @@ Integrates with ADR-003 Memory Architecture for persistent context.
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
+import asyncio
 import git
 import os
+import subprocess
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 import json
@@ -38,6 +40,7 @@ from datetime import datetime, timedelta
 
 # Import memory module tools (ADR-003)
 from luminescent_cluster.memory.mcp import (
+    create_memories,
     create_memory,
     get_memories,
     get_memory_by_id,
@@ -51,6 +54,10 @@ from luminescent_cluster.memory.mcp import (
 # Import extraction pipeline (ADR-003 Phase 1b)
 from luminescent_cluster.memory.extraction import ExtractionPipeline
 
+# Separators for the ``git log`` format used by get_changed_files
+_COMMIT_MARKER = "\x1e"
+_FIELD_SEP = "\x1f"
+
 # Shared extraction pipeline instance
 _extraction_pipeline = None
 
@@ -105,25 +112,68 @@ class SessionMemoryServer:
         return commits
 
     async def get_changed_files(self, since_hours: int = 24) -> List[Dict[str, Any]]:
-        """Get files changed in the last N hours"""
+        """Get files changed in the last N hours.
+
+        Each path is reported once, with the most recent commit that touched it.
+        """
         if not self.repo:
             return []
 
         cutoff_time = datetime.now() - timedelta(hours=since_hours)
-        changed = []
-
-        for commit in self.repo.iter_commits(since=cutoff_time):
-            for file_path in commit.stats.files:
-                if file_path not in [c["path"] for c in changed]:
-                    changed.append(
-                        {
-                            "path": file_path,
-                            "last_modified": commit.committed_datetime.isoformat(),
-                            "last_author": str(commit.author),
-                        }
+        return await asyncio.to_thread(self._collect_changed_files, cutoff_time)
+
+    def _collect_changed_files(self, cutoff_time: datetime) -> List[Dict[str, Any]]:
+        """Stream ``git log --name-only`` and keep the first (newest) entry per path.
+
+        A single git process is read line by line, so large commit windows never
+        materialise per-commit diff stats or the full log in memory.
+        """
+        args = [
+            git.Git.GIT_PYTHON_GIT_EXECUTABLE,
+            "-c",
+            "core.quotepath=off",
+            "log",
+            f"--since={cutoff_time.isoformat()}",
+            "--name-only",
+            "--no-renames",
+            f"--format={_COMMIT_MARKER}%cI{_FIELD_SEP}%an",
+        ]
+        # stderr is discarded rather than piped: nothing would drain the pipe
+        # while stdout is being read, so a chatty git could block on it
+        proc = subprocess.Popen(
+            args,
+            cwd=self.repo.working_dir,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+
+        changed: Dict[str, Dict[str, Any]] = {}
+        last_modified = last_author = None
+        try:
+            for raw_line in proc.stdout:
+                line = raw_line.decode("utf-8", errors="replace").rstrip("\n")
+                if line.startswith(_COMMIT_MARKER):
+                    last_modified, _, last_author = line[len(_COMMIT_MARKER) :].partition(
+                        _FIELD_SEP
                     )
+                elif line and last_modified is not None and line not in changed:
+                    changed[line] = {
+                        "path": line,
+                        "last_modified": last_modified,
+                        "last_author": last_author,
+                    }
+        except BaseException:
+            # Left unread, git would block on a full stdout pipe forever
+            proc.kill()
+            raise
+        finally:
+            proc.stdout.close()
+            status = proc.wait()
+
+        if status != 0:
+            raise git.GitCommandError(args, status)
 
-        return changed
+        return list(changed.values())
 
     async def get_current_diff(self) -> str:
         """Get unstaged changes in the repository"""
@@ -388,6 +438,53 @@ async def serve():
                     "required": ["user_id", "content", "memory_type"],
                 },
             ),
+            Tool(
+                name="create_user_memories",
+                description=(
+                    "Create several persistent memories in one call. "
+                    "Use for backfills or after extracting many memories from a conversation; "
+                    "duplicates are detected against existing memories and within the batch."
+                ),
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "memories": {
+                            "type": "array",
+                            "description": "Memories to create",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "user_id": {
+                                        "type": "string",
+                                        "description": "User who owns this memory",
+                                    },
+                                    "content": {
+                                        "type": "string",
+                                        "description": "The memory content",
+                                    },
+                                    "memory_type": {
+                                        "type": "string",
+                                        "enum": ["preference", "fact", "decision"],
+                                        "description": "Type of memory",
+                                    },
+                                    "source": {
+                                        "type": "string",
+                                        "description": "Where this memory came from",
+                                        "default": "conversation",
+                                    },
+                                    "confidence": {
+                                        "type": "number",
+                                        "description": "Confidence score (0.0-1.0)",
+                                        "default": 1.0,
+                                    },
+                                },
+                                "required": ["user_id", "content", "memory_type"],
+                            },
+                        }
+                    },
+                    "required": ["memories"],
+                },
+            ),
             Tool(
                 name="get_user_memories",
                 description=(
@@ -560,6 +657,13 @@ async def serve():
                     source=arguments.get("source", "conversation"),
                     confidence=arguments.get("confidence", 1.0),
                 )
+            elif name == "create_user_memories":
+                result = await create_memories(
+                    memories=[
+                        {"source": "conversation", "confidence": 1.0, **m}
+                        for m in arguments["memories"]
+                    ],
+                )
             elif name == "get_user_memories":
                 result = await get_memories(
                     query=arguments["query"],
@@ -631,6 +735,4 @@ async def serve():
 
 
 if __name__ == "__main__":
-    import asyncio
-
     asyncio.run(serve())
@@ -435,3 +435,59 @@ class TestProtocolCompliance:
         adapter = MyAdapter(config)
 
         assert isinstance(adapter, BasePlatformAdapter)
+
+
+# =============================================================================
+# Streaming Utilities Tests
+# =============================================================================
+
+
+class TestStreamMessageEdits:
+    """Tests for the progressive-edit helper shared by adapters."""
+
+    @staticmethod
+    async def _snapshots(*texts):
+        for text in texts:
+            yield text
+
+    @pytest.mark.asyncio
+    async def test_throttles_edits_but_flushes_final_text(self):
+        """Rapid snapshots collapse to one send plus a final edit."""
+        from luminescent_cluster.chatbot.adapters.base import stream_message_edits
+
+        sent, edits = [], []
+
+        async def send(text):
+            sent.append(text)
+            return "handle"
+
+        async def edit(handle, text):
+            edits.append((handle, text))
+
+        handle, final = await stream_message_edits(
+            self._snapshots("a", "ab", "abc", "abcd"), send, edit, min_interval=60
+        )
+
+        assert sent == ["a"]
+        assert edits == [("handle", "abcd")]
+        assert (handle, final) == ("handle", "abcd")
+
+    @pytest.mark.asyncio
+    async def test_empty_stream_sends_nothing(self):
+        """No text means no message."""
+        from luminescent_cluster.chatbot.adapters.base import stream_message_edits
+
+        async def fail(*args):
+            raise AssertionError("should not be called")
+
+        handle, final = await stream_message_edits(self._snapshots("", ""), fail, fail)
+
+        assert handle is None
+        assert final == ""
+
+    def test_truncate_for_preview(self):
+        """Long previews are cut to the limit with an ellipsis."""
+        from luminescent_cluster.chatbot.adapters.base import truncate_for_preview
+
+        assert truncate_for_preview("abc", None) == "abc"
+        assert truncate_for_preview("abcdef", 4) == "abc…"
@@ -407,6 +407,28 @@ class TestDiscordMessageSending:
             mock_channel.send.assert_called_once()
             assert result.id == "999"
 
+    @staticmethod
+    async def _snapshots(*texts):
+        for text in texts:
+            yield text
+
+    @pytest.mark.asyncio
+    async def test_send_message_stream_edits_sent_message(self, adapter):
+        """Streamed snapshots edit the first sent message."""
+        sent = MagicMock(id=999)
+        sent.edit = AsyncMock()
+        mock_channel = AsyncMock()
+        mock_channel.send = AsyncMock(return_value=sent)
+
+        with patch.object(adapter, "_get_channel", return_value=mock_channel):
+            result = await adapter.send_message_stream(
+                "channel-123", self._snapshots("Hi", "Hi there"), min_edit_interval=0
+            )
+
+        mock_channel.send.assert_called_once_with(content="Hi")
+        sent.edit.assert_called_once_with(content="Hi there")
+        assert result.id == "999"
+
     @pytest.mark.asyncio
     async def test_send_message_with_reply(self, adapter):
         """Should send message as reply to another message."""
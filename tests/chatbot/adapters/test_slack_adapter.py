@@ -389,6 +389,35 @@ class TestSlackMessageSending:
         adapter._web_client.chat_postMessage.assert_called_once()
         assert result.id is not None
 
+    @staticmethod
+    async def _snapshots(*texts):
+        for text in texts:
+            yield text
+
+    @pytest.mark.asyncio
+    async def test_send_message_stream_edits_in_place(self, adapter):
+        """Streamed snapshots post once, then update the same message."""
+        adapter._web_client = MagicMock()
+        adapter._web_client.chat_postMessage = AsyncMock(return_value={"ok": True, "ts": "111.222"})
+        adapter._web_client.chat_update = AsyncMock(return_value={"ok": True})
+
+        result = await adapter.send_message_stream(
+            "C123",
+            self._snapshots("Hel", "Hello", "Hello world"),
+            reply_to="999.000",
+            min_edit_interval=0,
+        )
+
+        adapter._web_client.chat_postMessage.assert_called_once_with(
+            channel="C123", text="Hel", thread_ts="999.000"
+        )
+        assert adapter._web_client.chat_update.call_count == 2
+        adapter._web_client.chat_update.assert_called_with(
+            channel="C123", ts="111.222", text="Hello world"
+        )
+        assert result.id == "111.222"
+        assert result.content == "Hello world"
+
     @pytest.mark.asyncio
     async def test_send_message_to_thread(self, adapter):
         """Should send message to thread."""
@@ -468,6 +468,28 @@ class TestTelegramMessageSending:
         adapter._api_client = MagicMock()
         return adapter
 
+    @staticmethod
+    async def _snapshots(*texts):
+        for text in texts:
+            yield text
+
+    @pytest.mark.asyncio
+    async def test_send_message_stream_splits_overflow(self, adapter):
+        """Text beyond Telegram's limit is sent as follow-up messages."""
+        adapter._api_client.send_message = AsyncMock(return_value={"message_id": 5})
+        adapter._api_client.edit_message_text = AsyncMock(return_value={})
+        long_text = "x" * 5000
+
+        result = await adapter.send_message_stream(
+            "222", self._snapshots("x", long_text), min_edit_interval=0
+        )
+
+        assert result.id == "5"
+        edits = adapter._api_client.edit_message_text.call_args_list
+        assert edits[-1].kwargs["text"] == "x" * 4096
+        assert adapter._api_client.send_message.call_count == 2
+        assert adapter._api_client.send_message.call_args.kwargs["text"] == "x" * 904
+
     @pytest.mark.asyncio
     async def test_send_simple_message(self, adapter):
         """Should send simple text message."""
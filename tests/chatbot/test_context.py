@@ -37,6 +37,7 @@ from luminescent_cluster.chatbot.context import (
     ContextConfig,
     ThreadContext,
     ContextMessage,
+    approximate_tokens,
 )
 
 
@@ -108,7 +109,7 @@ class TestThreadContext:
 
         assert ctx.thread_id == "thread-123"
         assert ctx.channel_id == "channel-456"
-        assert ctx.messages == []
+        assert list(ctx.messages) == []
 
     def test_context_with_messages(self):
         """ThreadContext should hold messages."""
@@ -244,6 +245,72 @@ class TestTokenLimit:
         total_tokens = sum(m.token_count or 0 for m in ctx.messages)
         assert total_tokens <= 50
 
+    def test_tokens_counted_when_not_supplied(self):
+        """Messages without token_count are counted at insert time."""
+        config = ContextConfig(max_messages=100, max_tokens=30)
+        manager = ThreadContextManager(config)
+
+        for i in range(10):
+            manager.add_message("thread-123", "user", "one two three four five")
+
+        ctx = manager.get_or_create("thread-123", "channel-456")
+        assert ctx.messages[0].token_count == approximate_tokens("one two three four five")
+        assert ctx.token_total == sum(m.token_count for m in ctx.messages)
+        assert ctx.token_total <= 30
+        assert len(ctx.messages) == 30 // ctx.messages[0].token_count
+
+    def test_default_tokenizer_matches_history_compressor(self):
+        """The chatbot and memory blocks share one token approximation."""
+        from luminescent_cluster.memory.blocks import HistoryCompressor
+
+        text = "Thread context " * 20 + "x" * 400
+        assert approximate_tokens(text) == HistoryCompressor().count_tokens(text)
+
+    def test_custom_tokenizer(self):
+        """A pluggable tokenizer replaces the approximation."""
+        config = ContextConfig(max_messages=100, max_tokens=10)
+        manager = ThreadContextManager(config, tokenizer=len)
+
+        manager.add_message("thread-123", "user", "abcdef")
+        manager.add_message("thread-123", "user", "ghijkl")
+
+        ctx = manager.get_or_create("thread-123", "channel-456")
+        assert [m.content for m in ctx.messages] == ["ghijkl"]
+        assert ctx.token_total == 6
+
+
+    def test_oversized_message_is_kept(self):
+        """A single message over the limit replaces the history instead of vanishing."""
+        config = ContextConfig(max_messages=100, max_tokens=50)
+        manager = ThreadContextManager(config)
+
+        manager.add_message("thread-123", "user", "Question", token_count=10)
+        manager.add_message("thread-123", "assistant", "Long answer", token_count=80)
+
+        ctx = manager.get_or_create("thread-123", "channel-456")
+        assert [m.content for m in ctx.messages] == ["Long answer"]
+        assert ctx.token_total == 80
+
+    def test_loaded_messages_are_counted(self):
+        """Messages loaded without token_count still count toward the limit."""
+        config = ContextConfig(max_messages=100, max_tokens=10)
+        manager = ThreadContextManager(config, tokenizer=len)
+        now = datetime.now().isoformat()
+        manager.from_dict(
+            {
+                "thread_id": "thread-123",
+                "channel_id": "channel-456",
+                "created_at": now,
+                "messages": [{"role": "user", "content": "abcdef", "timestamp": now}],
+            }
+        )
+
+        manager.add_message("thread-123", "user", "ghijkl")
+
+        ctx = manager.get_or_create("thread-123", "channel-456")
+        assert [m.content for m in ctx.messages] == ["ghijkl"]
+        assert ctx.token_total == 6
+
 
 class TestTTLExpiration:
     """TDD: Tests for 24h TTL context expiration (Issue #32)."""
@@ -323,6 +390,97 @@ class TestTTLExpiration:
         assert removed == 2  # thread-1 and thread-2
         assert manager.get_or_create("thread-3", "ch").messages[-1].content == "Still here"
 
+    def test_cleanup_skips_superseded_heap_entries(self):
+        """Repeated activity does not let stale expiry entries remove a thread."""
+        config = ContextConfig(ttl_hours=1)
+        manager = ThreadContextManager(config)
+
+        for i in range(200):
+            manager.add_message("busy", "user", f"msg {i}")
+        manager.add_message("idle", "user", "Hello")
+        manager._advance_time(hours=0.75)
+        manager.add_message("busy", "user", "still here")
+        manager._advance_time(hours=0.5)
+
+        assert manager.cleanup_expired() == 1
+        assert manager.is_expired("idle") is True
+        assert manager.is_expired("busy") is False
+        # Compaction keeps the heap proportional to the cached threads
+        assert len(manager._expiry_heap) < 100
+
+
+class TestHotCacheBounds:
+    """Tests for the bounded LRU hot cache."""
+
+    def test_least_recently_used_thread_evicted(self):
+        """Exceeding max_cached_threads evicts the least recently used thread."""
+        manager = ThreadContextManager(ContextConfig(max_cached_threads=2))
+
+        manager.add_message("thread-1", "user", "a")
+        manager.add_message("thread-2", "user", "b")
+        manager.get_or_create("thread-1", "ch")  # touch thread-1
+        manager.add_message("thread-3", "user", "c")
+
+        assert manager.is_expired("thread-2") is True
+        assert manager.format_for_llm("thread-1") == [{"role": "user", "content": "a"}]
+        assert manager.cache_stats()["threads"] == 2
+        assert manager.cache_stats()["evictions"] == 1
+
+    def test_character_bound_evicts(self):
+        """Exceeding max_cached_chars evicts old threads."""
+        manager = ThreadContextManager(ContextConfig(max_cached_chars=10))
+
+        manager.add_message("thread-1", "user", "x" * 6)
+        manager.add_message("thread-2", "user", "y" * 6)
+
+        assert manager.is_expired("thread-1") is True
+        assert manager.cache_stats()["chars"] == 6
+
+    def test_unpersisted_threads_are_not_evicted(self):
+        """Threads with pending saves stay cached until flushed."""
+
+        class Store:
+            async def save(self, thread_id, context_data):
+                pass
+
+            async def load(self, thread_id):
+                return None
+
+            async def delete(self, thread_id):
+                pass
+
+            async def cleanup_expired(self, ttl_days=90):
+                return 0
+
+        manager = ThreadContextManager(
+            ContextConfig(max_cached_threads=1), context_store=Store()
+        )
+
+        manager.add_message("thread-1", "user", "a")
+        manager.add_message("thread-2", "user", "b")
+
+        assert manager.is_expired("thread-1") is False
+        assert manager.cache_stats()["threads"] == 2
+
+    def test_concurrent_threads_do_not_lose_messages(self):
+        """Per-thread locking keeps concurrent appends consistent."""
+        import threading
+
+        manager = ThreadContextManager(ContextConfig(max_messages=1000, max_cached_threads=4))
+
+        def worker(n):
+            for i in range(100):
+                manager.add_message(f"thread-{n}", "user", f"{n}-{i}")
+
+        workers = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for w in workers:
+            w.start()
+        for w in workers:
+            w.join()
+
+        for n in range(4):
+            assert len(manager.format_for_llm(f"thread-{n}")) == 100
+
 
 class TestContextFormatting:
     """TDD: Tests for formatting context for LLM."""
@@ -365,6 +523,38 @@ class TestContextFormatting:
         assert messages == []
 
 
+class TestFormattedCache:
+    """Tests for caching format_for_llm output."""
+
+    def test_cached_until_next_mutation(self):
+        """Formatting is reused until a message is added."""
+        manager = ThreadContextManager(ContextConfig(max_messages=2))
+        manager.add_message("thread-1", "user", "A")
+        manager.add_message("thread-1", "assistant", "B")
+
+        first = manager.format_for_llm("thread-1")
+        second = manager.format_for_llm("thread-1")
+        assert first == second
+        assert first is not second
+        assert first[0] is second[0]
+
+        manager.add_message("thread-1", "user", "C")
+
+        assert manager.format_for_llm("thread-1") == [
+            {"role": "assistant", "content": "B"},
+            {"role": "user", "content": "C"},
+        ]
+
+    def test_returned_list_is_a_copy(self):
+        """Extending the returned list does not corrupt the cache."""
+        manager = ThreadContextManager()
+        manager.add_message("thread-1", "user", "A")
+
+        manager.format_for_llm("thread-1").append({"role": "user", "content": "X"})
+
+        assert manager.format_for_llm("thread-1") == [{"role": "user", "content": "A"}]
+
+
 class TestContextIsolation:
     """TDD: Tests for context isolation between threads/channels."""
 
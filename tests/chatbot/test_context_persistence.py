@@ -25,6 +25,7 @@ Related GitHub Issues:
 ADR Reference: ADR-006 Chatbot Platform Integrations, ADR-003 Pixeltable Patterns
 """
 
+import asyncio
 import pytest
 from datetime import datetime, timedelta
 from typing import Optional, Protocol, runtime_checkable
@@ -199,6 +200,52 @@ class TestThreadContextManagerWithStore:
         await manager.get_or_create_async("thread-111", "ch-1")
         assert len(store.load_calls) == 1  # No additional load
 
+    @pytest.mark.asyncio
+    async def test_absent_threads_are_negatively_cached(self):
+        """A store miss is remembered so evicted empty contexts are not reloaded."""
+        store = MockContextStore()
+        manager = ThreadContextManager(ContextConfig(max_cached_threads=1), context_store=store)
+
+        await manager.get_or_create_async("thread-a", "ch-1")
+        await manager.get_or_create_async("thread-b", "ch-1")  # evicts thread-a
+        await manager.get_or_create_async("thread-a", "ch-1")
+
+        assert store.load_calls == ["thread-a", "thread-b"]
+
+    @pytest.mark.asyncio
+    async def test_negative_cache_cleared_on_write(self):
+        """A thread that gains messages is looked up again after eviction."""
+        store = MockContextStore()
+        manager = ThreadContextManager(ContextConfig(max_cached_threads=1), context_store=store)
+
+        await manager.get_or_create_async("thread-a", "ch-1")
+        manager.add_message("thread-a", "user", "Hello!")
+        await manager.flush()
+        manager.add_message("thread-b", "user", "Hi!")  # evicts flushed thread-a
+        await manager.flush()
+
+        ctx = await manager.get_or_create_async("thread-a", "ch-1")
+
+        assert store.load_calls == ["thread-a", "thread-a"]
+        assert ctx.messages[0].content == "Hello!"
+
+    @pytest.mark.asyncio
+    async def test_thread_created_elsewhere_is_loaded_after_ttl(self):
+        """A thread another replica creates is seen once the miss expires."""
+        store = MockContextStore()
+        config = ContextConfig(max_cached_threads=1, negative_cache_ttl_seconds=0.05)
+        manager = ThreadContextManager(config, context_store=store)
+
+        await manager.get_or_create_async("thread-a", "ch-1")
+        await manager.get_or_create_async("thread-b", "ch-1")  # evicts thread-a
+        other = ThreadContextManager(context_store=store)
+        await other.add_message_async("thread-a", "user", "From elsewhere")
+        await asyncio.sleep(0.06)
+
+        ctx = await manager.get_or_create_async("thread-a", "ch-1")
+
+        assert ctx.messages[0].content == "From elsewhere"
+
     @pytest.mark.asyncio
     async def test_manager_deletes_on_clear(self):
         """Clearing context should delete from store."""
@@ -353,3 +400,235 @@ class TestAsyncContextOperations:
         # Both threads should be persisted
         assert "thread-777" in store._storage
         assert "thread-888" in store._storage
+
+
+class BatchingContextStore(MockContextStore):
+    """Mock store that supports multi-row saves."""
+
+    def __init__(self):
+        super().__init__()
+        self.batches: list[dict] = []
+        self.fail_next = False
+
+    async def save_many(self, contexts: dict) -> None:
+        if self.fail_next:
+            self.fail_next = False
+            raise RuntimeError("store unavailable")
+        self.batches.append(dict(contexts))
+        self._storage.update(contexts)
+
+
+class TestWriteBehindPersistence:
+    """Tests for write-behind batched persistence."""
+
+    def _manager(self, store, **config):
+        from luminescent_cluster.chatbot.context import ContextConfig
+
+        return ThreadContextManager(
+            ContextConfig(write_behind=True, **config), context_store=store
+        )
+
+    @pytest.mark.asyncio
+    async def test_flush_uses_single_batched_save(self):
+        """Without write-behind, flush() still writes all threads in one batch."""
+        store = BatchingContextStore()
+        manager = ThreadContextManager(context_store=store)
+
+        manager.add_message("t1", "user", "a")
+        manager.add_message("t2", "user", "b")
+        await manager.flush()
+
+        assert len(store.batches) == 1
+        assert set(store.batches[0]) == {"t1", "t2"}
+
+    @pytest.mark.asyncio
+    async def test_add_message_async_defers_writes(self):
+        """Messages are coalesced per thread and written by the background task."""
+        store = BatchingContextStore()
+        manager = self._manager(store, flush_interval_seconds=0.05)
+        await manager.start()
+
+        for i in range(5):
+            await manager.add_message_async("t1", "user", f"msg {i}")
+        await manager.add_message_async("t2", "user", "other")
+
+        assert store.batches == []  # nothing written synchronously
+
+        await asyncio.sleep(0.15)
+        await manager.close()
+
+        assert len(store.batches) == 1
+        assert len(store._storage["t1"]["messages"]) == 5
+        assert "t2" in store._storage
+
+    @pytest.mark.asyncio
+    async def test_batch_size_triggers_early_flush(self):
+        """Reaching flush_batch_size wakes the writer before the interval."""
+        store = BatchingContextStore()
+        manager = self._manager(store, flush_interval_seconds=60, flush_batch_size=3)
+        await manager.start()
+
+        for i in range(3):
+            await manager.add_message_async(f"t{i}", "user", "hi")
+        await asyncio.sleep(0.05)
+
+        assert len(store.batches) == 1
+        assert len(store.batches[0]) == 3
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_close_durably_flushes_pending(self):
+        """close() writes everything still pending."""
+        store = BatchingContextStore()
+        manager = self._manager(store, flush_interval_seconds=60)
+        await manager.start()
+
+        await manager.add_message_async("t1", "user", "bye")
+        await manager.close()
+
+        assert "t1" in store._storage
+        assert manager.persister.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_retried(self):
+        """A failed write keeps the threads pending for the next flush."""
+        store = BatchingContextStore()
+        store.fail_next = True
+        manager = self._manager(store, flush_interval_seconds=60)
+
+        manager.add_message("t1", "user", "hello")
+        await manager.flush()
+        assert manager.persister.pending == 1
+        assert manager.persister.failed_batches == 1
+
+        await manager.flush()
+        assert "t1" in store._storage
+        assert manager.persister.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_backpressure_when_queue_full(self):
+        """Producers wait while the pending set is at capacity."""
+        store = BatchingContextStore()
+        release = asyncio.Event()
+        original = store.save_many
+
+        async def slow_save_many(contexts):
+            await release.wait()
+            await original(contexts)
+
+        store.save_many = slow_save_many
+        manager = self._manager(
+            store, flush_interval_seconds=60, flush_batch_size=2, max_pending_threads=2
+        )
+        await manager.start()
+
+        await manager.add_message_async("t1", "user", "a")
+        await manager.add_message_async("t2", "user", "b")
+        await asyncio.sleep(0.01)  # writer picks up t1, t2 and blocks
+        await manager.add_message_async("t3", "user", "c")
+        await manager.add_message_async("t4", "user", "d")
+
+        blocked = asyncio.create_task(manager.add_message_async("t5", "user", "e"))
+        await asyncio.sleep(0.05)
+        assert not blocked.done()
+
+        release.set()
+        await asyncio.wait_for(blocked, timeout=1)
+        await manager.close()
+
+        assert {"t1", "t2", "t3", "t4", "t5"} <= set(store._storage)
+
+    @pytest.mark.asyncio
+    async def test_retry_uses_snapshot_of_failed_batch(self):
+        """A thread that left memory after a failed write is still written."""
+        store = BatchingContextStore()
+        store.fail_next = True
+        manager = self._manager(store, flush_interval_seconds=60)
+
+        manager.add_message("t1", "user", "hello")
+        await manager.flush()
+        with manager._lock:
+            manager._remove("t1")
+
+        await manager.flush()
+
+        assert store._storage["t1"]["messages"][0]["content"] == "hello"
+        assert manager.persister.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_backpressure_lifted_while_store_keeps_failing(self):
+        """Producers stop waiting once several batches in a row have failed."""
+
+        class FailingStore(BatchingContextStore):
+            async def save_many(self, contexts):
+                raise RuntimeError("store unavailable")
+
+        manager = self._manager(
+            FailingStore(),
+            flush_interval_seconds=60,
+            max_pending_threads=2,
+            backpressure_max_failures=2,
+        )
+        await manager.start()
+
+        for i in range(5):
+            await asyncio.wait_for(manager.add_message_async(f"t{i}", "user", "x"), timeout=1)
+
+        assert manager.persister.failed_batches >= 2
+        assert manager.persister.pending == 5
+        await manager.persister.stop()
+
+    @pytest.mark.asyncio
+    async def test_backpressure_wait_is_bounded(self):
+        """A producer gives up waiting after backpressure_timeout_seconds."""
+        store = BatchingContextStore()
+        release = asyncio.Event()
+        original = store.save_many
+
+        async def hung_save_many(contexts):
+            await release.wait()
+            await original(contexts)
+
+        store.save_many = hung_save_many
+        manager = self._manager(
+            store,
+            flush_interval_seconds=60,
+            flush_batch_size=1,
+            max_pending_threads=1,
+            backpressure_timeout_seconds=0.05,
+        )
+        await manager.start()
+
+        await manager.add_message_async("t1", "user", "a")
+        await asyncio.sleep(0.01)  # writer picks up t1 and hangs
+        await manager.add_message_async("t2", "user", "b")
+        await asyncio.wait_for(manager.add_message_async("t3", "user", "c"), timeout=1)
+
+        release.set()
+        await manager.close()
+        assert {"t1", "t2", "t3"} <= set(store._storage)
+
+    @pytest.mark.asyncio
+    async def test_pixeltable_save_many_runs_off_the_event_loop(self):
+        """The blocking multi-row upsert runs in a worker thread."""
+        import sys
+        import threading
+
+        upsert_threads = []
+        mock_pxt = MagicMock()
+        mock_table = MagicMock()
+        mock_table.upsert.side_effect = lambda rows: upsert_threads.append(
+            threading.current_thread()
+        )
+        mock_pxt.get_table.return_value = mock_table
+
+        with patch.dict(sys.modules, {"pixeltable": mock_pxt}):
+            store = PixeltableContextStore()
+            store._init_attempted = False
+            now = datetime.now().isoformat()
+            await store.save_many(
+                {"t1": {"thread_id": "t1", "created_at": now, "last_activity": now}}
+            )
+
+        assert len(upsert_threads) == 1
+        assert upsert_threads[0] is not threading.current_thread()
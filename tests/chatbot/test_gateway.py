@@ -788,3 +788,394 @@ class TestSystemPrompt:
 
         assert system_msg is not None
         assert "translation" in system_msg["content"]
+
+
+class TestStreamingProcess:
+    """Tests for ChatbotGateway.process_stream."""
+
+    @pytest.fixture(autouse=True)
+    def reset_registry(self):
+        """Reset the extension registry around each test."""
+        from luminescent_cluster.extensions.registry import ExtensionRegistry
+
+        ExtensionRegistry.reset()
+        yield
+        ExtensionRegistry.reset()
+
+    @pytest.fixture
+    def gateway(self):
+        """Create gateway with a streaming mock provider."""
+        from luminescent_cluster.chatbot.llm_provider import LLMStreamChunk
+
+        async def chat_stream(**kwargs):
+            for piece in ["Hello ", "secret ", "world", "!"]:
+                yield LLMStreamChunk(content=piece, model="gpt-4o-mini")
+            yield LLMStreamChunk(content="", finish_reason="stop", usage={"total_tokens": 12})
+
+        gateway = ChatbotGateway()
+        gateway.llm_provider = MagicMock()
+        gateway.llm_provider.chat_stream = MagicMock(side_effect=chat_stream)
+        return gateway
+
+    @pytest.fixture
+    def request_dm(self):
+        """A direct-message request the bot responds to."""
+        return GatewayRequest(
+            message=ChatMessage(
+                id="msg-1",
+                content="Say hi",
+                author=MessageAuthor(id="user-1", username="user"),
+                channel_id="ch-1",
+                timestamp=datetime.now(),
+                is_direct_message=True,
+            ),
+            platform="slack",
+            thread_id="thread-1",
+        )
+
+    @pytest.mark.asyncio
+    async def test_yields_growing_snapshots_then_final(self, gateway, request_dm):
+        """Snapshots grow word by word; the final chunk has the full response."""
+        chunks = [c async for c in gateway.process_stream(request_dm)]
+
+        partial = [c.content for c in chunks if not c.done]
+        assert partial == ["Hello", "Hello secret"]
+
+        final = chunks[-1]
+        assert final.done
+        assert final.content == "Hello secret world!"
+        assert final.response.tokens_used == 12
+        assert final.response.model == "gpt-4o-mini"
+
+    @pytest.mark.asyncio
+    async def test_updates_context_with_full_response(self, gateway, request_dm):
+        """Context receives the complete, unfiltered response."""
+        async for _ in gateway.process_stream(request_dm):
+            pass
+
+        history = gateway.context_manager.format_for_llm("thread-1")
+        assert history[-1] == {"role": "assistant", "content": "Hello secret world!"}
+
+    @pytest.mark.asyncio
+    async def test_filter_applied_to_every_snapshot(self, gateway, request_dm):
+        """The response filter sees each partial snapshot and the final text."""
+        from luminescent_cluster.extensions.registry import ExtensionRegistry
+
+        response_filter = MagicMock()
+        response_filter.filter_response.side_effect = lambda query, response, is_public_channel: (
+            response.replace("secret", "[redacted]")
+        )
+        ExtensionRegistry.get().response_filter = response_filter
+
+        chunks = [c async for c in gateway.process_stream(request_dm)]
+
+        assert all("secret" not in c.content for c in chunks)
+        assert chunks[-1].content == "Hello [redacted] world!"
+
+    @pytest.mark.asyncio
+    async def test_stream_failure_yields_error_response(self, gateway, request_dm):
+        """A failing stream ends with an error chunk instead of raising."""
+
+        async def failing(**kwargs):
+            raise ConnectionError("boom")
+            yield  # pragma: no cover
+
+        gateway.llm_provider.chat_stream = MagicMock(side_effect=failing)
+
+        chunks = [c async for c in gateway.process_stream(request_dm)]
+
+        assert len(chunks) == 1
+        assert chunks[0].done
+        assert chunks[0].response.error == "boom"
+
+    @pytest.mark.asyncio
+    async def test_non_triggered_message_yields_nothing(self, gateway):
+        """Messages the bot ignores produce no chunks."""
+        request = GatewayRequest(
+            message=ChatMessage(
+                id="msg-1",
+                content="just chatting",
+                author=MessageAuthor(id="user-1", username="user"),
+                channel_id="ch-1",
+                timestamp=datetime.now(),
+            ),
+            platform="slack",
+        )
+
+        assert [c async for c in gateway.process_stream(request)] == []
+
+    @pytest.mark.asyncio
+    async def test_falls_back_when_model_cannot_stream(self, gateway, request_dm):
+        """A model without streaming support is served by a single chat() call."""
+        from luminescent_cluster.chatbot.llm_provider import LLMCapabilities, LLMResponse
+
+        gateway.llm_provider.get_capabilities = AsyncMock(
+            return_value=LLMCapabilities(supports_streaming=False)
+        )
+        gateway.llm_provider.chat = AsyncMock(
+            return_value=LLMResponse(
+                content="Hi there", model="m", tokens_used=5, finish_reason="stop"
+            )
+        )
+
+        chunks = [c async for c in gateway.process_stream(request_dm)]
+
+        assert len(chunks) == 1
+        assert chunks[0].done
+        assert chunks[0].response.content == "Hi there"
+        gateway.llm_provider.chat_stream.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_when_provider_has_no_stream(self, request_dm):
+        """Providers without chat_stream() go through process()."""
+        from luminescent_cluster.chatbot.llm_provider import LLMResponse
+
+        class ChatOnlyProvider:
+            async def chat(self, messages, max_tokens=None):
+                return LLMResponse(content="Hi", model="m", tokens_used=3, finish_reason="stop")
+
+        gateway = ChatbotGateway()
+        gateway.llm_provider = ChatOnlyProvider()
+
+        chunks = [c async for c in gateway.process_stream(request_dm)]
+
+        assert [(c.content, c.done) for c in chunks] == [("Hi", True)]
+
+    @pytest.mark.asyncio
+    async def test_closing_early_closes_provider_stream(self, gateway, request_dm):
+        """A consumer that stops early closes the provider stream too."""
+        from luminescent_cluster.chatbot.llm_provider import LLMStreamChunk
+
+        closed = []
+
+        async def chat_stream(**kwargs):
+            try:
+                for piece in ["one ", "two ", "three "]:
+                    yield LLMStreamChunk(content=piece)
+            finally:
+                closed.append(True)
+
+        gateway.llm_provider.chat_stream = MagicMock(side_effect=chat_stream)
+
+        stream = gateway.process_stream(request_dm)
+        first = await stream.__anext__()
+        await stream.aclose()
+
+        assert first.content == "one"
+        assert closed == [True]
+
+
+class TestGatewayReply:
+    """Tests for delivering replies through platform adapters."""
+
+    @pytest.fixture(autouse=True)
+    def reset_registry(self):
+        """Reset the extension registry around each test."""
+        from luminescent_cluster.extensions.registry import ExtensionRegistry
+
+        ExtensionRegistry.reset()
+        yield
+        ExtensionRegistry.reset()
+
+    @pytest.fixture
+    def request_dm(self):
+        """A direct-message request the bot responds to."""
+        return GatewayRequest(
+            message=ChatMessage(
+                id="msg-1",
+                content="Say hi",
+                author=MessageAuthor(id="user-1", username="user"),
+                channel_id="ch-1",
+                timestamp=datetime.now(),
+                is_direct_message=True,
+            ),
+            platform="slack",
+            thread_id="thread-1",
+        )
+
+    @pytest.mark.asyncio
+    async def test_streaming_adapter_receives_snapshots(self, request_dm):
+        """Adapters with send_message_stream get progressive snapshots."""
+        from luminescent_cluster.chatbot.llm_provider import LLMStreamChunk
+
+        async def chat_stream(**kwargs):
+            for piece in ["Hello ", "there ", "friend"]:
+                yield LLMStreamChunk(content=piece)
+
+        gateway = ChatbotGateway()
+        gateway.llm_provider = MagicMock()
+        gateway.llm_provider.chat_stream = MagicMock(side_effect=chat_stream)
+
+        sent = {}
+
+        class StreamingAdapter:
+            async def send_message_stream(self, channel_id, updates, reply_to=None):
+                sent["channel"], sent["reply_to"] = channel_id, reply_to
+                sent["snapshots"] = [text async for text in updates]
+
+        response = await gateway.reply(request_dm, StreamingAdapter())
+
+        assert response.content == "Hello there friend"
+        assert sent["channel"] == "ch-1"
+        assert sent["reply_to"] == "msg-1"
+        assert sent["snapshots"] == ["Hello", "Hello there", "Hello there friend"]
+
+    @pytest.mark.asyncio
+    async def test_plain_adapter_receives_one_message(self, request_dm):
+        """Adapters without streaming get one send_message() call."""
+        from luminescent_cluster.chatbot.llm_provider import LLMResponse
+
+        gateway = ChatbotGateway()
+        gateway.llm_provider = MagicMock(spec=["chat"])
+        gateway.llm_provider.chat = AsyncMock(
+            return_value=LLMResponse(content="Hi", model="m", tokens_used=3, finish_reason="stop")
+        )
+        adapter = MagicMock(spec=["send_message"])
+        adapter.send_message = AsyncMock()
+
+        response = await gateway.reply(request_dm, adapter)
+
+        adapter.send_message.assert_awaited_once_with("ch-1", response.content, reply_to="msg-1")
+
+
+class TestConcurrentPreparation:
+    """Tests for the concurrent pre-LLM stages and latency budget."""
+
+    @pytest.fixture
+    def mock_llm_provider(self):
+        """Create mock LLM provider."""
+        provider = AsyncMock()
+        provider.chat = AsyncMock(
+            return_value=MagicMock(content="Answer", tokens_used=10, model="gpt-4o-mini")
+        )
+        return provider
+
+    @pytest.fixture
+    def request_mcp(self):
+        """A DM request that asks for MCP retrieval."""
+        return GatewayRequest(
+            message=ChatMessage(
+                id="msg-1",
+                content="What do the docs say?",
+                author=MessageAuthor(id="user-1", username="user"),
+                channel_id="ch-1",
+                timestamp=datetime.now(),
+                is_direct_message=True,
+            ),
+            platform="discord",
+            use_mcp=True,
+        )
+
+    def _gateway(self, provider, mcp_client, **config):
+        gateway = ChatbotGateway(GatewayConfig(enable_mcp=True, **config))
+        gateway.llm_provider = provider
+        gateway.mcp_client = mcp_client
+        return gateway
+
+    @pytest.mark.asyncio
+    async def test_slow_mcp_is_skipped_after_timeout(self, mock_llm_provider, request_mcp):
+        """LLM call proceeds without MCP context once the MCP stage times out."""
+        import asyncio
+
+        async def slow_query(content):
+            await asyncio.sleep(5)
+            return {"results": [{"content": "too late"}]}
+
+        mcp_client = MagicMock()
+        mcp_client.query = slow_query
+        gateway = self._gateway(mock_llm_provider, mcp_client, mcp_timeout_ms=20)
+
+        response = await gateway.process(request_mcp)
+
+        assert response.error is None
+        messages = mock_llm_provider.chat.call_args.kwargs["messages"]
+        assert all("too late" not in m["content"] for m in messages)
+        assert gateway.get_stage_metrics()["mcp"]["timeouts"] == 1
+
+    @pytest.mark.asyncio
+    async def test_budget_caps_stage_timeouts(self, mock_llm_provider, request_mcp):
+        """The overall budget bounds stages even with generous stage timeouts."""
+        import asyncio
+
+        async def slow_query(content):
+            await asyncio.sleep(5)
+
+        mcp_client = MagicMock()
+        mcp_client.query = slow_query
+        gateway = self._gateway(
+            mock_llm_provider, mcp_client, mcp_timeout_ms=10_000, prepare_budget_ms=20
+        )
+
+        start = asyncio.get_running_loop().time()
+        await gateway.process(request_mcp)
+
+        assert asyncio.get_running_loop().time() - start < 1.0
+        assert gateway.get_stage_metrics()["mcp"]["timeouts"] == 1
+
+    @pytest.mark.asyncio
+    async def test_stages_run_concurrently(self, mock_llm_provider, request_mcp):
+        """Context loading and MCP retrieval overlap rather than add up."""
+        import asyncio
+
+        class SlowStore:
+            async def load(self, thread_id):
+                await asyncio.sleep(0.2)
+                return None
+
+        async def slow_query(content):
+            await asyncio.sleep(0.2)
+            return {"results": [{"content": "MCP fact"}]}
+
+        mcp_client = MagicMock()
+        mcp_client.query = slow_query
+        gateway = self._gateway(mock_llm_provider, mcp_client)
+        gateway.context_manager = ThreadContextManager(context_store=SlowStore())
+
+        start = asyncio.get_running_loop().time()
+        response = await gateway.process(request_mcp)
+        elapsed = asyncio.get_running_loop().time() - start
+
+        assert elapsed < 0.35
+        messages = mock_llm_provider.chat.call_args.kwargs["messages"]
+        assert "MCP fact" in messages[0]["content"]
+        stages = response.metadata["stage_latency_ms"]
+        assert {"checks", "context", "mcp", "llm"} <= set(stages)
+
+    @pytest.mark.asyncio
+    async def test_slow_context_falls_back_to_memory(self, mock_llm_provider, request_mcp):
+        """History already in memory is kept when the context stage times out."""
+        import asyncio
+
+        async def slow_get_or_create(thread_id, channel_id):
+            await asyncio.sleep(5)
+
+        gateway = ChatbotGateway(GatewayConfig(context_timeout_ms=20))
+        gateway.llm_provider = mock_llm_provider
+        gateway.context_manager = ThreadContextManager(context_store=MagicMock())
+        gateway.context_manager.add_message("msg-1", "user", "Earlier question")
+        gateway.context_manager.add_message("msg-1", "assistant", "Earlier answer")
+        gateway.context_manager.get_or_create_async = slow_get_or_create
+
+        response = await gateway.process(request_mcp)
+
+        assert response.error is None
+        assert gateway.get_stage_metrics()["context"]["timeouts"] == 1
+        contents = [m["content"] for m in mock_llm_provider.chat.call_args.kwargs["messages"]]
+        assert "Earlier question" in contents
+        assert "Earlier answer" in contents
+        assert contents[-1] == "What do the docs say?"
+
+    @pytest.mark.asyncio
+    async def test_capabilities_clamp_max_tokens(self, mock_llm_provider, request_mcp):
+        """Detected model output limits cap the requested max_tokens."""
+        from luminescent_cluster.chatbot.llm_provider import LLMCapabilities
+
+        mock_llm_provider.get_capabilities = AsyncMock(
+            return_value=LLMCapabilities(max_output_tokens=512)
+        )
+        gateway = ChatbotGateway(GatewayConfig(max_response_tokens=2048))
+        gateway.llm_provider = mock_llm_provider
+
+        await gateway.process(request_mcp)
+
+        assert mock_llm_provider.chat.call_args.kwargs["max_tokens"] == 512
@@ -0,0 +1,190 @@
+# Copyright 2024-2025 Amiable Development
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Tests for pooled HTTP clients used by the chatbot layer.
+"""
+
+import httpx
+import pytest
+
+from luminescent_cluster.chatbot.http_pool import (
+    HTTPClientPool,
+    HTTPPoolConfig,
+    SharedClientSession,
+)
+from luminescent_cluster.chatbot.llm_provider import LLMConfig, LLMProvider
+
+
+class TestHTTPClientPool:
+    """Tests for HTTPClientPool."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_client_per_base_url(self):
+        """Same base URL returns the same client; different URLs do not."""
+        pool = HTTPClientPool()
+        try:
+            a1 = await pool.get_client("https://api.example.com/v1")
+            a2 = await pool.get_client("https://api.example.com/v1/")
+            b = await pool.get_client("http://localhost:11434")
+
+            assert a1 is a2
+            assert a1 is not b
+            assert len(pool) == 2
+        finally:
+            await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_clients(self):
+        """aclose() closes every client and rejects further use."""
+        pool = HTTPClientPool()
+        client = await pool.get_client("https://api.example.com")
+
+        await pool.aclose()
+
+        assert client.is_closed
+        assert pool.closed
+        with pytest.raises(RuntimeError):
+            await pool.get_client("https://api.example.com")
+
+    @pytest.mark.asyncio
+    async def test_closed_client_is_replaced(self):
+        """A client closed out-of-band is recreated on next use."""
+        pool = HTTPClientPool()
+        try:
+            client = await pool.get_client("https://api.example.com")
+            await client.aclose()
+
+            assert await pool.get_client("https://api.example.com") is not client
+        finally:
+            await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_http2_requires_h2(self, monkeypatch):
+        """HTTP/2 is only requested when h2 is importable."""
+        monkeypatch.setattr(
+            "luminescent_cluster.chatbot.http_pool.http2_available", lambda: False
+        )
+        seen = {}
+        original = httpx.AsyncClient.__init__
+
+        def spy(self, *args, **kwargs):
+            seen.update(kwargs)
+            original(self, *args, **kwargs)
+
+        monkeypatch.setattr(httpx.AsyncClient, "__init__", spy)
+        pool = HTTPClientPool(HTTPPoolConfig(http2=True, max_connections=7))
+        try:
+            await pool.get_client("https://api.example.com")
+        finally:
+            await pool.aclose()
+
+        assert seen["http2"] is False
+        assert seen["limits"].max_connections == 7
+
+
+class TestLLMProviderPooling:
+    """Tests for LLMProvider connection reuse."""
+
+    @pytest.mark.asyncio
+    async def test_requests_share_one_client(self):
+        """Consecutive chat requests go through the same pooled client."""
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(str(request.url))
+            return httpx.Response(
+                200,
+                json={
+                    "choices": [{"message": {"content": "hi"}, "finish_reason": "stop"}],
+                    "usage": {"total_tokens": 3},
+                },
+            )
+
+        pool = HTTPClientPool()
+        client = httpx.AsyncClient(
+            base_url="https://api.example.com/v1", transport=httpx.MockTransport(handler)
+        )
+        pool._clients["https://api.example.com/v1"] = client
+
+        provider = LLMProvider(
+            LLMConfig(provider="openai", base_url="https://api.example.com/v1"),
+            http_pool=pool,
+        )
+        await provider.chat(messages=[{"role": "user", "content": "a"}])
+        await provider.chat(messages=[{"role": "user", "content": "b"}])
+
+        assert calls == ["https://api.example.com/v1/chat/completions"] * 2
+        assert len(pool) == 1
+
+        # A caller-supplied pool is not closed by the provider
+        await provider.close()
+        assert not pool.closed
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_close_releases_owned_pool(self):
+        """A provider closes the pool it created itself."""
+        provider = LLMProvider(LLMConfig(provider="openai", http_max_connections=5))
+
+        assert provider.http_pool.config.max_connections == 5
+
+        await provider.close()
+        assert provider.http_pool.closed
+
+    @pytest.mark.asyncio
+    async def test_async_with_closes_pool(self):
+        """Leaving an async with block closes the provider's pool."""
+        async with LLMProvider(LLMConfig(provider="openai")) as provider:
+            client = await provider.http_pool.get_client(provider.config.base_url)
+
+        assert client.is_closed
+        assert provider.http_pool.closed
+
+    @pytest.mark.asyncio
+    async def test_gateway_close_releases_provider_pool(self):
+        """Closing the gateway closes its provider's pool and flushes context."""
+        from unittest.mock import AsyncMock
+
+        from luminescent_cluster.chatbot.gateway import ChatbotGateway
+
+        provider = LLMProvider(LLMConfig(provider="openai"))
+        client = await provider.http_pool.get_client(provider.config.base_url)
+
+        async with ChatbotGateway() as gateway:
+            gateway.llm_provider = provider
+            gateway.context_manager.close = AsyncMock()
+
+        assert client.is_closed
+        gateway.context_manager.close.assert_awaited_once()
+
+
+class TestSharedClientSession:
+    """Tests for SharedClientSession."""
+
+    @pytest.mark.asyncio
+    async def test_session_reused_until_closed(self):
+        """The same session is returned until close() is called."""
+        holder = SharedClientSession()
+
+        s1 = await holder.get()
+        s2 = await holder.get()
+        assert s1 is s2
+
+        await holder.close()
+        assert s1.closed
+
+        s3 = await holder.get()
+        assert s3 is not s1
+        await holder.close()
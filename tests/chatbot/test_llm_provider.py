@@ -639,3 +639,108 @@ class TestLLMProviderStreaming:
             assert response.finish_reason == "length"
             call_args = mock_request.call_args
             assert call_args[1]["max_tokens"] == 50
+
+
+class TestLLMProviderSSEStreaming:
+    """Tests for true SSE streaming via chat_stream."""
+
+    @pytest.fixture
+    def provider(self):
+        """Create provider for streaming tests."""
+        return LLMProvider(LLMConfig(provider="openai", api_key="key", model="gpt-4o-mini"))
+
+    def test_parse_sse_line(self):
+        """Data lines decode to JSON; everything else is skipped."""
+        from luminescent_cluster.chatbot.llm_provider import parse_sse_line
+
+        assert parse_sse_line('data: {"a": 1}') == {"a": 1}
+        assert parse_sse_line("data: [DONE]") is None
+        assert parse_sse_line(": keep-alive") is None
+        assert parse_sse_line("") is None
+
+    @pytest.mark.asyncio
+    async def test_chat_stream_yields_deltas(self, provider):
+        """Deltas are yielded in order; usage arrives on the final chunk."""
+
+        async def events(**kwargs):
+            yield {"model": "gpt-4o-mini", "choices": [{"delta": {"role": "assistant"}}]}
+            yield {"choices": [{"delta": {"content": "Hel"}}]}
+            yield {"choices": [{"delta": {"content": "lo"}, "finish_reason": "stop"}]}
+            yield {"choices": [], "usage": {"total_tokens": 7}}
+
+        with patch.object(provider, "_make_stream_request", side_effect=events) as mock_stream:
+            chunks = [c async for c in provider.chat_stream(messages=[{"role": "user", "content": "Hi"}])]
+
+        assert "".join(c.content for c in chunks) == "Hello"
+        assert chunks[0].model == "gpt-4o-mini"
+        assert chunks[2].finish_reason == "stop"
+        assert chunks[-1].usage == {"total_tokens": 7}
+        assert mock_stream.call_args.kwargs["stream"] is True
+
+    @pytest.mark.asyncio
+    async def test_chat_stream_over_http(self):
+        """SSE body from the API is parsed line by line."""
+        import httpx
+        from luminescent_cluster.chatbot.http_pool import HTTPClientPool
+
+        body = (
+            'data: {"choices": [{"delta": {"content": "A"}}]}\n\n'
+            'data: {"choices": [{"delta": {"content": "B"}, "finish_reason": "stop"}]}\n\n'
+            "data: [DONE]\n\n"
+        )
+
+        def handler(request):
+            return httpx.Response(200, text=body, headers={"content-type": "text/event-stream"})
+
+        pool = HTTPClientPool()
+        pool._clients["https://api.example.com/v1"] = httpx.AsyncClient(
+            base_url="https://api.example.com/v1", transport=httpx.MockTransport(handler)
+        )
+        provider = LLMProvider(
+            LLMConfig(provider="openai", base_url="https://api.example.com/v1"), http_pool=pool
+        )
+
+        chunks = [c async for c in provider.chat_stream(messages=[{"role": "user", "content": "x"}])]
+        await pool.aclose()
+
+        assert [c.content for c in chunks] == ["A", "B"]
+
+    @pytest.mark.asyncio
+    async def test_chat_stream_failure_trips_circuit_breaker(self, provider):
+        """A failing stream is recorded as a circuit breaker failure."""
+
+        async def failing(**kwargs):
+            yield {"choices": [{"delta": {"content": "partial"}}]}
+            raise ConnectionError("dropped")
+
+        with patch.object(provider, "_make_stream_request", side_effect=failing):
+            with pytest.raises(ConnectionError):
+                async for _ in provider.chat_stream(messages=[{"role": "user", "content": "Hi"}]):
+                    pass
+
+        assert provider.circuit_breaker.failure_count == 1
+
+    @pytest.mark.asyncio
+    async def test_chat_stream_closed_early_records_success(self, provider):
+        """Stopping iteration early still resolves a half-open circuit."""
+        from luminescent_cluster.chatbot.llm_provider import CircuitState
+
+        closed = []
+
+        async def events(**kwargs):
+            try:
+                for piece in ["a", "b", "c"]:
+                    yield {"choices": [{"delta": {"content": piece}}]}
+            finally:
+                closed.append(True)
+
+        provider.circuit_breaker.state = CircuitState.HALF_OPEN
+        with patch.object(provider, "_make_stream_request", side_effect=events):
+            stream = provider.chat_stream(messages=[{"role": "user", "content": "Hi"}])
+            first = await stream.__anext__()
+            await stream.aclose()
+
+        assert first.content == "a"
+        assert closed == [True]
+        assert provider.circuit_breaker.state == CircuitState.CLOSED
+        assert provider.circuit_breaker.failure_count == 0
@@ -30,7 +30,12 @@ from datetime import datetime
 from typing import Optional
 from unittest.mock import AsyncMock, MagicMock
 
-from luminescent_cluster.chatbot.metrics import ChatMetrics, QueryMetric
+from luminescent_cluster.chatbot.metrics import (
+    ChatMetrics,
+    LatencyHistogram,
+    QueryMetric,
+    SlidingWindowCounter,
+)
 
 
 class TestChatMetricsClass:
@@ -299,3 +304,98 @@ class TestDegradedStatus:
         await metrics.record_error("discord", "error2", "anthropic")
 
         assert metrics.is_degraded() is True
+
+
+class TestStreamingAggregates:
+    """Tests for fixed-memory streaming aggregates."""
+
+    def test_histogram_percentiles_within_bucket_error(self):
+        """Histogram percentiles stay within the bucket precision."""
+        hist = LatencyHistogram()
+        for v in range(1, 10001):
+            hist.record(v)
+
+        assert hist.count == 10000
+        assert hist.mean() == 5000
+        assert hist.percentile(50) == pytest.approx(5000, rel=0.04)
+        assert hist.percentile(95) == pytest.approx(9500, rel=0.04)
+        assert hist.percentile(100) == 10000
+
+    def test_small_values_are_exact(self):
+        """Values below the sub-bucket count are recorded exactly."""
+        hist = LatencyHistogram()
+        for v in (3, 7, 7, 42):
+            hist.record(v)
+
+        assert hist.percentile(50) == 7
+        assert hist.percentile(100) == 42
+        assert hist.min == 3
+
+    def test_histograms_merge(self):
+        """Merging yields the same distribution as recording into one."""
+        a, b, combined = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+        for v in range(0, 5000, 3):
+            (a if v % 2 else b).record(v)
+            combined.record(v)
+
+        a.merge(b)
+
+        assert a.count == combined.count
+        assert a.total == combined.total
+        assert a.percentile(95) == combined.percentile(95)
+        with pytest.raises(ValueError):
+            a.merge(LatencyHistogram(precision_bits=4))
+
+    def test_sliding_window_drops_old_counts(self):
+        """Counts older than the window are no longer reported."""
+        now = [1000.0]
+        counter = SlidingWindowCounter(window_seconds=60, slots=6, clock=lambda: now[0])
+
+        counter.add(3)
+        now[0] += 30
+        counter.add()
+        assert counter.total() == 4
+
+        now[0] += 40
+        assert counter.total() == 1
+
+    @pytest.mark.asyncio
+    async def test_raw_records_are_bounded(self):
+        """Only the most recent records are retained; aggregates cover all."""
+        metrics = ChatMetrics(max_recent_records=10)
+
+        for i in range(100):
+            await metrics.record_query("discord", "u1", "chat", i, 2, 1)
+            await metrics.record_error("discord", "timeout", "openai")
+
+        assert len(metrics.get_metrics()) == 10
+        assert metrics.get_metrics()[-1].latency_ms == 99
+        assert len(metrics.get_errors()) == 10
+
+        exported = metrics.export()
+        assert exported["total_queries"] == 100
+        assert exported["total_errors"] == 100
+        assert exported["total_tokens"] == 200
+        assert exported["platforms"]["discord"]["latency"]["count"] == 100
+        assert metrics.get_error_rate("openai") == 0.5
+
+    @pytest.mark.asyncio
+    async def test_degraded_uses_recent_error_window(self, monkeypatch):
+        """Old errors stop counting towards degraded status."""
+        now = [1000.0]
+        monkeypatch.setattr(
+            "luminescent_cluster.chatbot.metrics.time.monotonic", lambda: now[0]
+        )
+        metrics = ChatMetrics(degraded_error_rate_threshold=0.1, error_window_seconds=60)
+
+        for _ in range(5):
+            await metrics.record_error("discord", "timeout", "openai")
+        assert metrics.is_degraded() is True
+
+        now[0] += 120
+        for _ in range(10):
+            await metrics.record_query("discord", "u1", "chat", 100, 50, 1)
+
+        assert metrics.get_recent_error_rate() == 0.0
+        assert metrics.is_degraded() is False
+        assert metrics.get_error_rate() == pytest.approx(5 / 15)
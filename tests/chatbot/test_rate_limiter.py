@@ -35,6 +35,7 @@ from datetime import datetime, timedelta
 from luminescent_cluster.chatbot.rate_limiter import (
     TokenBucketRateLimiter,
     RateLimitConfig,
+    RateLimitRequest,
     RateLimitResult,
 )
 
@@ -400,3 +401,67 @@ class TestRateLimiterRecording:
 
         result = limiter.check("user-123", tokens=0)
         assert result.remaining_tokens == 700
+
+
+class TestRateLimiterScaling:
+    """Tests for batch checks and idle bucket eviction."""
+
+    def test_check_many_matches_sequential_checks(self):
+        """A batch is evaluated in order, like repeated check() calls."""
+        config = RateLimitConfig(user_requests_per_minute=2, channel_requests_per_minute=3)
+        batch = [
+            RateLimitRequest("user-1", channel_id="ch-1"),
+            RateLimitRequest("user-1", channel_id="ch-1"),
+            RateLimitRequest("user-1", channel_id="ch-1"),
+            RateLimitRequest("user-2", channel_id="ch-1"),
+            RateLimitRequest("user-3", channel_id="ch-1"),
+        ]
+
+        batched = TokenBucketRateLimiter(config).check_many(batch)
+        sequential_limiter = TokenBucketRateLimiter(config)
+        sequential = [
+            sequential_limiter.check(r.user_id, channel_id=r.channel_id) for r in batch
+        ]
+
+        assert [r.allowed for r in batched] == [True, True, False, True, False]
+        assert [r.allowed for r in batched] == [r.allowed for r in sequential]
+        assert "Channel" in batched[-1].reason
+        assert TokenBucketRateLimiter(config).check_many([]) == []
+
+    def test_full_buckets_are_evicted(self):
+        """Buckets that have refilled completely are dropped."""
+        config = RateLimitConfig(requests_per_minute=60, idle_eviction_interval_seconds=0)
+        limiter = TokenBucketRateLimiter(config)
+
+        for i in range(100):
+            limiter.check(f"user-{i}")
+        assert limiter.bucket_count() == 200  # request + token bucket per user
+
+        limiter._advance_time(0.5)
+        assert limiter.evict_idle() == 100  # token buckets were never drawn down
+
+        limiter._advance_time(2.0)
+        assert limiter.evict_idle() == 100
+        assert limiter.bucket_count() == 0
+
+    def test_periodic_sweep_bounds_memory(self):
+        """Automatic sweeps drop idle buckets while active ones survive."""
+        config = RateLimitConfig(
+            user_requests_per_minute=1, lock_stripes=1, idle_eviction_interval_seconds=30
+        )
+        limiter = TokenBucketRateLimiter(config)
+
+        for i in range(50):
+            limiter.check(f"user-{i}")
+        limiter._advance_time(120)
+        limiter.check("user-0")
+        result = limiter.check("user-0")
+
+        assert result.allowed is False  # state of the active user is kept
+        assert limiter.bucket_count() == 2
+
+    def test_lock_stripes_rounded_to_power_of_two(self):
+        """Stripe count is a power of two."""
+        limiter = TokenBucketRateLimiter(RateLimitConfig(lock_stripes=10))
+
+        assert len(limiter._stripes) == 16
@@ -0,0 +1,299 @@
+# Copyright 2024-2025 Amiable Development
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Tests for the LLM response cache and in-flight coalescing.
+"""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from luminescent_cluster.chatbot.adapters.base import ChatMessage, MessageAuthor
+from luminescent_cluster.chatbot.gateway import ChatbotGateway, GatewayConfig, GatewayRequest
+from luminescent_cluster.chatbot.metrics import ChatMetrics
+from luminescent_cluster.chatbot.response_cache import (
+    CACHE_COALESCED,
+    CACHE_HIT,
+    CACHE_MISS,
+    LLMResponseCache,
+    ResponseCacheConfig,
+    cache_scope,
+)
+
+MESSAGES = [
+    {"role": "system", "content": "You are helpful."},
+    {"role": "user", "content": "What is  Python?"},
+]
+
+
+class TestCacheKeys:
+    """Tests for scoping and prompt normalization."""
+
+    def test_public_scope_shared_within_workspace(self):
+        """Public channels in one workspace share a scope."""
+        a = cache_scope(True, "W1", "C1", "U1")
+        b = cache_scope(True, "W1", "C2", "U2")
+        other = cache_scope(True, "W2", "C1", "U1")
+
+        assert a == b
+        assert a != other
+
+    def test_private_scope_is_per_channel_and_user(self):
+        """Direct messages never share a scope with anyone else."""
+        dm = cache_scope(False, "W1", "D1", "U1")
+
+        assert dm != cache_scope(False, "W1", "D1", "U2")
+        assert dm != cache_scope(False, "W1", "D2", "U1")
+        assert dm != cache_scope(True, "W1", "D1", "U1")
+
+    def test_normalized_prompts_share_a_key(self):
+        """Case and whitespace differences map to the same key."""
+        scope = cache_scope(True, "W1", "C1", "U1")
+        variant = [
+            {"role": "system", "content": "You are helpful."},
+            {"role": "user", "content": "what is python?  "},
+        ]
+
+        assert LLMResponseCache.make_key(scope, MESSAGES) == LLMResponseCache.make_key(
+            scope, variant
+        )
+        assert LLMResponseCache.make_key(scope, MESSAGES) != LLMResponseCache.make_key(
+            scope, MESSAGES, max_tokens=10
+        )
+
+
+class TestLLMResponseCache:
+    """Tests for cache storage and coalescing."""
+
+    def test_entries_expire_after_ttl(self, monkeypatch):
+        """Expired entries are not returned."""
+        now = [1000.0]
+        monkeypatch.setattr(
+            "luminescent_cluster.chatbot.response_cache.time.monotonic", lambda: now[0]
+        )
+        cache = LLMResponseCache(ResponseCacheConfig(ttl_seconds=10))
+        cache.put("k", "v")
+
+        now[0] += 9
+        assert cache.get("k") == "v"
+        now[0] += 2
+        assert cache.get("k") is None
+
+    def test_lru_eviction(self):
+        """The least recently used entry is evicted first."""
+        cache = LLMResponseCache(ResponseCacheConfig(max_entries=2))
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert len(cache) == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_duplicates_share_one_call(self):
+        """Identical in-flight requests are coalesced."""
+        cache = LLMResponseCache()
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "answer"
+
+        results = await asyncio.gather(*(cache.get_or_compute("k", compute) for _ in range(5)))
+
+        assert calls == 1
+        outcomes = sorted(outcome for _, outcome in results)
+        assert outcomes == [CACHE_COALESCED] * 4 + [CACHE_MISS]
+        assert await cache.get_or_compute("k", compute) == ("answer", CACHE_HIT)
+
+    @pytest.mark.asyncio
+    async def test_failure_propagates_and_is_not_cached(self):
+        """Waiters see the leader's error and the next call retries."""
+        cache = LLMResponseCache()
+
+        async def failing():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("upstream down")
+
+        results = await asyncio.gather(
+            cache.get_or_compute("k", failing),
+            cache.get_or_compute("k", failing),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert cache.get("k") is None
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_hands_over_to_waiter(self):
+        """Cancelling the leader does not cancel the requests that joined it."""
+        cache = LLMResponseCache()
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "answer"
+
+        leader = asyncio.create_task(cache.get_or_compute("k", compute))
+        await asyncio.sleep(0)
+        waiters = [asyncio.create_task(cache.get_or_compute("k", compute)) for _ in range(3)]
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        results = await asyncio.gather(*waiters)
+
+        assert leader.cancelled()
+        assert calls == 2
+        assert [value for value, _ in results] == ["answer"] * 3
+        assert sorted(outcome for _, outcome in results) == [CACHE_COALESCED] * 2 + [CACHE_MISS]
+        assert cache.get("k") == "answer"
+        assert not cache._in_flight
+
+
+class TestGatewayResponseCache:
+    """Tests for response caching in ChatbotGateway.process."""
+
+    @pytest.fixture
+    def gateway(self):
+        """Gateway with caching enabled and a slow mock LLM."""
+
+        async def chat(**kwargs):
+            await asyncio.sleep(0.01)
+            return MagicMock(content="Python is a language.", tokens_used=30, model="gpt-4o-mini")
+
+        gateway = ChatbotGateway(GatewayConfig(enable_context=False, enable_response_cache=True))
+        gateway.llm_provider = AsyncMock()
+        gateway.llm_provider.chat = AsyncMock(side_effect=chat)
+        gateway.metrics = ChatMetrics()
+        return gateway
+
+    @staticmethod
+    def _request(user_id, channel_id="C1", workspace_id="W1", is_dm=False):
+        return GatewayRequest(
+            message=ChatMessage(
+                id=f"msg-{user_id}",
+                content="<@BOT> what is python?",
+                author=MessageAuthor(id=user_id, username=user_id),
+                channel_id=channel_id,
+                timestamp=datetime.now(),
+                is_direct_message=is_dm,
+                metadata={"mentions_bot": True},
+            ),
+            platform="slack",
+            workspace_id=workspace_id,
+        )
+
+    @pytest.fixture(autouse=True)
+    def respond_to_everything(self, gateway):
+        """Skip invocation policy so public-channel requests are answered."""
+        gateway.invocation_policy.should_respond = lambda message: True
+
+    @pytest.mark.asyncio
+    async def test_repeat_in_public_channel_is_served_from_cache(self, gateway):
+        """A second user asking the same question gets a cached answer."""
+        first = await gateway.process(self._request("U1"))
+        second = await gateway.process(self._request("U2", channel_id="C2"))
+
+        assert gateway.llm_provider.chat.call_count == 1
+        assert second.content == first.content
+        assert first.metadata["cache"] == CACHE_MISS
+        assert second.metadata["cache"] == CACHE_HIT
+        assert second.tokens_used == 0
+
+    @pytest.mark.asyncio
+    async def test_private_and_cross_workspace_requests_not_shared(self, gateway):
+        """DMs and other workspaces never reuse a cached answer."""
+        await gateway.process(self._request("U1"))
+        await gateway.process(self._request("U1", channel_id="D1", is_dm=True))
+        await gateway.process(self._request("U2", channel_id="D2", is_dm=True))
+        await gateway.process(self._request("U3", workspace_id="W2"))
+
+        assert gateway.llm_provider.chat.call_count == 4
+
+    @pytest.mark.asyncio
+    async def test_concurrent_duplicates_coalesced_with_metrics(self, gateway):
+        """Concurrent identical questions share one LLM call and are counted."""
+        responses = await asyncio.gather(
+            *(gateway.process(self._request(f"U{i}")) for i in range(3))
+        )
+
+        assert gateway.llm_provider.chat.call_count == 1
+        assert {r.content for r in responses} == {"Python is a language."}
+
+        stats = gateway.metrics.get_cache_stats()
+        assert stats["misses"] == 1
+        assert stats["coalesced"] == 2
+        assert stats["hit_rate"] == pytest.approx(2 / 3)
+        assert gateway.metrics.export()["response_cache"] == stats
+
+    @pytest.fixture
+    def streaming_gateway(self, gateway):
+        """The cached gateway with a provider that can also stream."""
+        from luminescent_cluster.chatbot.llm_provider import LLMStreamChunk
+
+        gateway.stream_calls = 0
+
+        async def chat_stream(**kwargs):
+            gateway.stream_calls += 1
+            for piece in ["Python ", "is ", "a ", "language."]:
+                yield LLMStreamChunk(content=piece, model="gpt-4o-mini")
+            yield LLMStreamChunk(content="", finish_reason="stop", usage={"total_tokens": 30})
+
+        gateway.llm_provider.chat_stream = chat_stream
+        return gateway
+
+    @pytest.mark.asyncio
+    async def test_streamed_answer_is_cached(self, streaming_gateway):
+        """A streamed answer is stored and served to later requests as a hit."""
+        gateway = streaming_gateway
+        first = [c async for c in gateway.process_stream(self._request("U1"))]
+        second = [c async for c in gateway.process_stream(self._request("U2"))]
+        third = await gateway.process(self._request("U3"))
+
+        assert gateway.stream_calls == 1
+        assert gateway.llm_provider.chat.call_count == 0
+        assert len(first) > 1
+        assert first[-1].response.metadata["cache"] == CACHE_MISS
+        assert first[-1].response.tokens_used == 30
+
+        assert len(second) == 1 and second[0].done
+        assert second[0].content == "Python is a language."
+        assert second[0].response.metadata["cache"] == CACHE_HIT
+        assert second[0].response.tokens_used == 0
+        assert third.content == "Python is a language."
+        assert third.metadata["cache"] == CACHE_HIT
+
+        stats = gateway.metrics.get_cache_stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 2
+
+    @pytest.mark.asyncio
+    async def test_stream_served_from_answer_cached_by_process(self, streaming_gateway):
+        """A streaming request reuses an answer cached by process()."""
+        gateway = streaming_gateway
+        await gateway.process(self._request("U1"))
+
+        chunks = [c async for c in gateway.process_stream(self._request("U2"))]
+
+        assert gateway.stream_calls == 0
+        assert [c.content for c in chunks] == ["Python is a language."]
@@ -0,0 +1,60 @@
+# Copyright 2024-2025 Amiable Development
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Scale Benchmark - 1k-memory regression gate.
+
+Runs the scale benchmark at 1k memories and compares it with the
+committed baseline. Baselines are machine-specific, so the comparison
+only runs when SCALE_BENCHMARK_GATE=1 (e.g. on the machine that
+recorded them); SCALE_BENCHMARK_TOLERANCE overrides the tolerance.
+Larger sizes are run from the command line:
+
+    python -m luminescent_cluster.memory.evaluation.scale_benchmark --sizes 10k 100k
+
+ADR Reference: ADR-003 Memory Architecture, Phase 0 (Evaluation)
+"""
+
+import os
+
+import pytest
+
+from luminescent_cluster.memory.evaluation.scale_benchmark import (
+    DEFAULT_TOLERANCE,
+    OPERATIONS,
+    compare_to_baseline,
+    load_baseline,
+    run_scale_benchmark,
+)
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestScaleBenchmark:
+    """1k-memory scale benchmark."""
+
+    @pytest.fixture(scope="class")
+    def result(self):
+        """Run the benchmark once for the class."""
+        import asyncio
+
+        return asyncio.run(run_scale_benchmark(1_000))
+
+    def test_all_operations_measured(self, result):
+        """Every operation reports throughput and percentiles."""
+        assert set(result.operations) == set(OPERATIONS)
+        assert result.operations["bulk_store"].items == 1_000
+
+    @pytest.mark.skipif(
+        os.environ.get("SCALE_BENCHMARK_GATE") != "1",
+        reason="baselines are machine-specific; set SCALE_BENCHMARK_GATE=1",
+    )
+    def test_no_regression_against_baseline(self, result):
+        """No metric regresses beyond the tolerance."""
+        baseline = load_baseline(1_000)
+        assert baseline is not None
+        tolerance = float(os.environ.get("SCALE_BENCHMARK_TOLERANCE", DEFAULT_TOLERANCE))
+
+        regressions = compare_to_baseline(result, baseline, tolerance)
+
+        assert not regressions, "\n".join(str(r) for r in regressions)
@@ -0,0 +1,119 @@
+# Copyright 2024-2025 Amiable Development
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the quantized storage recall report.
+
+ADR Reference: ADR-003 Memory Architecture, Phase 0 (HNSW Recall Health Monitoring)
+"""
+
+import numpy as np
+import pytest
+
+from luminescent_cluster.memory.evaluation.brute_force import BruteForceSearcher, Document
+from luminescent_cluster.memory.evaluation.quantization import (
+    QuantizationReport,
+    QuantizationResult,
+    measure_quantization_recall,
+)
+
+
+class ClusteredEmbeddingModel:
+    """Mock model mapping texts to clustered embeddings."""
+
+    def __init__(self, texts: list[str], dimension: int = 384, seed: int = 0):
+        rng = np.random.default_rng(seed)
+        centers = rng.standard_normal((20, dimension))
+        self._embeddings = {
+            text: centers[i % 20] + 0.5 * rng.standard_normal(dimension)
+            for i, text in enumerate(texts)
+        }
+
+    def encode(self, texts: list[str] | str) -> np.ndarray:
+        """Look up embeddings for texts."""
+        if isinstance(texts, str):
+            texts = [texts]
+        return np.array([self._embeddings[text] for text in texts], dtype=np.float32)
+
+
+@pytest.fixture
+def brute_force() -> BruteForceSearcher:
+    """Create a brute-force searcher over a clustered corpus."""
+    documents = [Document(id=f"doc-{i}", content=f"document {i}") for i in range(500)]
+    queries = [f"query {i}" for i in range(20)]
+    model = ClusteredEmbeddingModel([d.content for d in documents] + queries)
+    searcher = BruteForceSearcher(model)
+    searcher.index_corpus(documents)
+    return searcher
+
+
+class TestMeasureQuantizationRecall:
+    """Tests for measure_quantization_recall."""
+
+    def test_report_covers_every_mode(self, brute_force: BruteForceSearcher) -> None:
+        """Test recall and footprint for each storage mode."""
+        queries = [f"query {i}" for i in range(20)]
+
+        report = measure_quantization_recall(brute_force, queries, k=10)
+
+        assert [r.storage for r in report.results] == ["float32", "float16", "int8"]
+        assert report.query_count == 20
+        assert report.corpus_size == 500
+        assert report.get("float32").recall_at_k == pytest.approx(1.0)
+        assert report.get("float16").compression_ratio == pytest.approx(2.0)
+        assert report.get("int8").compression_ratio > 3.9
+        for result in report.results:
+            assert result.recall_at_k >= 0.95
+            assert len(result.individual_recalls) == 20
+
+    def test_subset_of_modes(self, brute_force: BruteForceSearcher) -> None:
+        """Test measuring only selected modes."""
+        report = measure_quantization_recall(brute_force, ["query 0"], storage_modes=("int8",))
+
+        assert [r.storage for r in report.results] == ["int8"]
+        assert set(report.to_dict()) == {
+            "k",
+            "query_count",
+            "corpus_size",
+            "rescore_factor",
+            "results",
+        }
+
+    def test_unindexed_corpus_raises(self) -> None:
+        """Test that an unindexed searcher is rejected."""
+        searcher = BruteForceSearcher(ClusteredEmbeddingModel([]))
+
+        with pytest.raises(RuntimeError):
+            measure_quantization_recall(searcher, ["query"])
+
+    def test_invalid_arguments_raise(self, brute_force: BruteForceSearcher) -> None:
+        """Test validation of queries and k."""
+        with pytest.raises(ValueError):
+            measure_quantization_recall(brute_force, [])
+        with pytest.raises(ValueError):
+            measure_quantization_recall(brute_force, ["query 0"], k=0)
+
+
+class TestQuantizationReport:
+    """Tests for QuantizationReport.recommend."""
+
+    @staticmethod
+    def _report(recalls: dict[str, float]) -> QuantizationReport:
+        sizes = {"float32": 1536.0, "float16": 768.0, "int8": 388.0}
+        return QuantizationReport(
+            k=10,
+            query_count=1,
+            corpus_size=1,
+            rescore_factor=4,
+            results=[
+                QuantizationResult(mode, recall, sizes[mode], 1536.0 / sizes[mode])
+                for mode, recall in recalls.items()
+            ],
+        )
+
+    def test_recommends_smallest_within_budget(self) -> None:
+        """Test picking the smallest mode within the recall budget."""
+        report = self._report({"float32": 1.0, "float16": 0.998, "int8": 0.993})
+
+        assert report.recommend(0.01) == "int8"
+        assert report.recommend(0.005) == "float16"
+        assert report.recommend(0.0) == "float32"
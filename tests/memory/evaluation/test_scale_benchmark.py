@@ -0,0 +1,184 @@
+# Copyright 2024-2025 Amiable Development
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the scale benchmark harness.
+
+ADR Reference: ADR-003 Memory Architecture, Phase 0 (Evaluation)
+"""
+
+import dataclasses
+
+import numpy as np
+import pytest
+
+from luminescent_cluster.memory.evaluation.scale_benchmark import (
+    OPERATIONS,
+    HashingEncoder,
+    OperationResult,
+    ScaleBenchmarkResult,
+    compare_to_baseline,
+    generate_corpus,
+    generate_queries,
+    load_baseline,
+    main,
+    parse_size,
+    run_scale_benchmark,
+    save_baseline,
+)
+
+
+def _result(size: int = 1000, **overrides: float) -> ScaleBenchmarkResult:
+    """Build a result with one retrieve operation."""
+    values = {"p50_ms": 1.0, "p95_ms": 2.0, "p99_ms": 4.0, "throughput": 500.0}
+    values.update(overrides)
+    operation = OperationResult(
+        operation="retrieve", count=100, items=100, total_seconds=0.2, **values
+    )
+    return ScaleBenchmarkResult(size=size, seed=0, users=10, operations={"retrieve": operation})
+
+
+class TestSyntheticCorpus:
+    """Test corpus and query generation."""
+
+    def test_corpus_is_deterministic(self):
+        """The same seed yields the same corpus."""
+        first = generate_corpus(300, seed=3)
+        second = generate_corpus(300, seed=3)
+
+        assert [m.model_dump() for m in first] == [m.model_dump() for m in second]
+        assert [m.content for m in generate_corpus(300, seed=4)] != [m.content for m in first]
+
+    def test_corpus_shape(self):
+        """Memories span users, types and entities, with duplicates and expiry."""
+        corpus = generate_corpus(2000, seed=0, users=5)
+
+        assert len(corpus) == 2000
+        assert {m.user_id for m in corpus} == {f"user-{i}" for i in range(5)}
+        assert len({m.memory_type for m in corpus}) == 3
+        assert all(m.metadata["entities"] for m in corpus)
+        assert len({m.content for m in corpus}) < len(corpus)
+        assert 0 < sum(m.expires_at is not None for m in corpus) < len(corpus) // 10
+
+    def test_queries_are_deterministic(self):
+        """Queries depend only on the seed."""
+        assert generate_queries(20, seed=1) == generate_queries(20, seed=1)
+        assert all(user.startswith("user-") for user, _ in generate_queries(20, users=3))
+
+    def test_parse_size(self):
+        """Named and numeric sizes are accepted."""
+        assert parse_size("10k") == 10_000
+        assert parse_size("100k") == 100_000
+        assert parse_size("250") == 250
+        with pytest.raises(ValueError):
+            parse_size("0")
+
+
+class TestHashingEncoder:
+    """Test the deterministic embedder."""
+
+    def test_similar_texts_are_closer(self):
+        """Texts sharing words have higher cosine similarity."""
+        encoder = HashingEncoder(dimension=64)
+
+        a, b, c = encoder.encode(
+            ["auth-service uses Redis for caching", "auth-service uses Redis", "Prefers React"]
+        )
+
+        assert a.shape == (64,)
+        assert np.linalg.norm(a) == pytest.approx(1.0)
+        assert a @ b > a @ c
+
+
+class TestCompareToBaseline:
+    """Test regression detection."""
+
+    def test_within_tolerance(self):
+        """Small slowdowns are not regressions."""
+        current = _result(p95_ms=2.4, throughput=420.0)
+
+        assert compare_to_baseline(current, _result(), tolerance=0.25) == []
+
+    def test_latency_regression(self):
+        """Percentiles beyond the tolerance are reported."""
+        regressions = compare_to_baseline(_result(p99_ms=6.0), _result(), tolerance=0.25)
+
+        assert [(r.operation, r.metric) for r in regressions] == [("retrieve", "p99_ms")]
+        assert "p99_ms" in str(regressions[0])
+
+    def test_throughput_regression(self):
+        """Throughput below baseline / (1 + tolerance) is reported."""
+        regressions = compare_to_baseline(_result(throughput=300.0), _result(), tolerance=0.25)
+
+        assert [r.metric for r in regressions] == ["throughput"]
+
+    def test_noise_floor(self):
+        """Tiny absolute increases on fast operations are ignored."""
+        baseline = _result(p50_ms=0.01)
+
+        assert compare_to_baseline(_result(p50_ms=0.05), baseline, noise_floor_ms=0.1) == []
+
+    def test_missing_operation_skipped(self):
+        """Operations absent from the baseline are not compared."""
+        baseline = dataclasses.replace(_result(), operations={})
+
+        assert compare_to_baseline(_result(p99_ms=100.0), baseline) == []
+
+
+class TestBaselineFiles:
+    """Test baseline persistence."""
+
+    def test_round_trip(self, tmp_path):
+        """Saved baselines load back unchanged."""
+        result = _result(size=10_000)
+
+        path = save_baseline(result, tmp_path)
+
+        assert path.name == "scale_10k.json"
+        assert load_baseline(10_000, tmp_path) == result
+        assert load_baseline(1_000, tmp_path) is None
+
+    def test_committed_baselines_load(self):
+        """Every committed baseline parses and covers all operations."""
+        for size in (1_000, 10_000, 100_000):
+            baseline = load_baseline(size)
+            assert baseline is not None
+            assert set(baseline.operations) == set(OPERATIONS)
+
+
+class TestRunScaleBenchmark:
+    """Test a small end-to-end run."""
+
+    @pytest.mark.asyncio
+    async def test_small_run(self):
+        """Every operation is measured."""
+        result = await run_scale_benchmark(
+            200, users=4, query_count=5, store_samples=5, batch_size=50
+        )
+
+        assert set(result.operations) == set(OPERATIONS)
+        bulk = result.operations["bulk_store"]
+        assert bulk.count == 4
+        assert bulk.items == 200
+        assert result.operations["retrieve"].count == 5
+        for operation in result.operations.values():
+            assert operation.throughput > 0
+            assert 0 < operation.p50_ms <= operation.p95_ms <= operation.p99_ms
+
+    def test_main_gates_on_baseline(self, tmp_path, capsys):
+        """The command line run fails when a baseline is beaten by the tolerance."""
+        args = ["--sizes", "150", "--queries", "3", "--store-samples", "3"]
+        args += ["--baseline-dir", str(tmp_path)]
+
+        assert main([*args, "--update-baseline"]) == 0
+        baseline = load_baseline(150, tmp_path)
+        assert baseline is not None
+
+        # An impossibly fast baseline makes every metric a regression
+        for name, operation in baseline.operations.items():
+            baseline.operations[name] = dataclasses.replace(
+                operation, p50_ms=1e-6, p95_ms=1e-6, p99_ms=1e-6, throughput=1e12
+            )
+        save_baseline(baseline, tmp_path)
+
+        assert main(args) == 1
+        assert "REGRESSION" in capsys.readouterr().err
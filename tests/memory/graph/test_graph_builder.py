@@ -354,6 +354,116 @@ class TestGraphBuilderBuild:
         assert graph2.node_count == 1
 
 
+def _memory(content: str, *entities: tuple[str, str]) -> Memory:
+    """Create a memory whose metadata lists the given (name, type) entities."""
+    return Memory(
+        user_id="user-123",
+        content=content,
+        memory_type=MemoryType.FACT,
+        source="test",
+        metadata={"entities": [{"name": n, "type": t} for n, t in entities]},
+    )
+
+
+class TestGraphBuilderIncrementalUpdates:
+    """Tests for re-linking a single memory without a rebuild."""
+
+    def test_update_memory_relinks_only_that_memory(self):
+        """An edited memory moves its edges; shared nodes keep other links."""
+        from luminescent_cluster.memory.graph.graph_builder import GraphBuilder
+
+        builder = GraphBuilder(user_id="user-123")
+        builder.add_memory(
+            _memory(
+                "auth-service uses PostgreSQL",
+                ("auth-service", "service"),
+                ("PostgreSQL", "dependency"),
+            ),
+            "mem-1",
+        )
+        builder.add_memory(
+            _memory(
+                "payment-api uses PostgreSQL",
+                ("payment-api", "service"),
+                ("PostgreSQL", "dependency"),
+            ),
+            "mem-2",
+        )
+        builder.build()
+
+        graph = builder.update_memory(
+            _memory(
+                "auth-service uses Redis", ("auth-service", "service"), ("Redis", "dependency")
+            ),
+            "mem-1",
+        )
+
+        assert not graph.has_edge("auth-service", "postgresql")
+        assert graph.has_edge("auth-service", "redis")
+        assert graph.has_edge("payment-api", "postgresql")
+        assert graph.get_node("postgresql").memory_ids == ["mem-2"]
+        assert graph.get_node("redis").memory_ids == ["mem-1"]
+
+    def test_remove_memory_drops_orphaned_nodes(self):
+        """Nodes only referenced by the removed memory disappear."""
+        from luminescent_cluster.memory.graph.graph_builder import GraphBuilder
+
+        builder = GraphBuilder(user_id="user-123")
+        builder.add_memory(
+            _memory(
+                "auth-service uses Redis", ("auth-service", "service"), ("Redis", "dependency")
+            ),
+            "mem-1",
+        )
+        builder.add_memory(
+            _memory("auth-service is critical", ("auth-service", "service")), "mem-2"
+        )
+        builder.build()
+
+        graph = builder.remove_memory("mem-1")
+
+        assert not graph.has_node("redis")
+        assert graph.has_node("auth-service")
+        assert graph.edge_count == 0
+
+    def test_incremental_graph_matches_rebuild(self):
+        """Patching the graph gives the same result as building from scratch."""
+        from luminescent_cluster.memory.graph.graph_builder import GraphBuilder
+
+        first = _memory(
+            "auth-service uses PostgreSQL",
+            ("auth-service", "service"),
+            ("PostgreSQL", "dependency"),
+        )
+        second = _memory(
+            "auth-service uses FastAPI", ("auth-service", "service"), ("FastAPI", "framework")
+        )
+        edited = _memory(
+            "auth-service calls /users", ("auth-service", "service"), ("/users", "api")
+        )
+
+        builder = GraphBuilder(user_id="user-123")
+        builder.add_memory(first, "mem-1")
+        builder.add_memory(second, "mem-2")
+        builder.build()
+        patched = builder.update_memory(edited, "mem-1")
+
+        fresh = GraphBuilder(user_id="user-123")
+        fresh.add_memory(second, "mem-2")
+        fresh.add_memory(edited, "mem-1")
+        rebuilt = fresh.build()
+
+        def edge_key(edge):
+            return edge["source_id"], edge["target_id"]
+
+        assert sorted(patched.to_dict()["edges"], key=edge_key) == sorted(
+            rebuilt.to_dict()["edges"], key=edge_key
+        )
+        assert {n.id: sorted(n.memory_ids) for n in patched.get_all_nodes()} == {
+            n.id: sorted(n.memory_ids) for n in rebuilt.get_all_nodes()
+        }
+
+
 class TestModuleExports:
     """TDD: Tests for module exports."""
 
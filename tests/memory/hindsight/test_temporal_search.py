@@ -267,6 +267,29 @@ class TestTemporalSearchExecution:
         assert "decision-q4-1" in ids
         assert "decision-q4-2" in ids
 
+    def test_keyword_fallback_uses_timeline_index(self):
+        """When filters match nothing, keywords are looked up in the timeline."""
+        from luminescent_cluster.memory.hindsight.temporal_search import TemporalSearch
+        from luminescent_cluster.memory.hindsight.timeline import Timeline
+        from luminescent_cluster.memory.hindsight.types import TemporalEvent, NetworkType
+
+        timeline = Timeline(user_id="user-123")
+        for i, content in enumerate(["Migrated to PostgreSQL 16", "Redis cache warmed"]):
+            timeline.add_event(
+                TemporalEvent(
+                    id=f"evt-{i}",
+                    content=content,
+                    timestamp=datetime(2025, 6, 1 + i, tzinfo=timezone.utc),
+                    network=NetworkType.OBSERVATION,
+                    entity_id="svc",
+                )
+            )
+
+        search = TemporalSearch(timeline=timeline)
+        results = search.search("decisions about postgresql")
+
+        assert [r.id for r in results] == ["evt-0"]
+
 
 class TestTemporalSearchResults:
     """Test search result formatting and ranking."""
@@ -397,6 +397,147 @@ class TestTimelineStateReconstruction:
         assert state is None
 
 
+class TestTimelineSortedIndexes:
+    """Test the sorted time indexes and the state-at cache."""
+
+    @staticmethod
+    def _event(event_id, day, entity_id="svc", network=None, **kwargs):
+        from luminescent_cluster.memory.hindsight.types import TemporalEvent, NetworkType
+
+        return TemporalEvent(
+            id=event_id,
+            content=f"{entity_id} event {event_id}",
+            timestamp=datetime(2025, 1, 1, tzinfo=timezone.utc) + timedelta(days=day),
+            network=network or NetworkType.OBSERVATION,
+            entity_id=entity_id,
+            **kwargs,
+        )
+
+    def test_out_of_order_inserts_match_brute_force(self):
+        """Range and combined queries match a full scan on shuffled input."""
+        import random
+
+        from luminescent_cluster.memory.hindsight.timeline import Timeline
+        from luminescent_cluster.memory.hindsight.types import NetworkType, TimeRange
+
+        rng = random.Random(7)
+        networks = list(NetworkType)
+        events = [
+            self._event(f"e{i}", rng.randrange(365), f"svc-{i % 5}", networks[i % len(networks)])
+            for i in range(500)
+        ]
+        timeline = Timeline(user_id="user-123")
+        for event in events:
+            timeline.add_event(event)
+        for event in events[::10]:
+            timeline.remove_event(event.id)
+        remaining = [e for e in events if e not in events[::10]]
+
+        start = datetime(2025, 3, 1, tzinfo=timezone.utc)
+        time_range = TimeRange(start=start, end=start + timedelta(days=60))
+        expected = sorted(
+            (e for e in remaining if time_range.contains(e.timestamp)), key=lambda e: e.timestamp
+        )
+
+        assert [e.timestamp for e in timeline.query_by_time(time_range)] == [
+            e.timestamp for e in expected
+        ]
+        combined = timeline.query(
+            time_range=time_range, entity_id="svc-2", network=NetworkType.BANK
+        )
+        assert {e.id for e in combined} == {
+            e.id for e in expected if e.entity_id == "svc-2" and e.network == NetworkType.BANK
+        }
+        assert timeline.count() == len(remaining)
+
+    def test_readding_event_id_replaces_it(self):
+        """Adding an event with an existing ID does not duplicate it."""
+        from luminescent_cluster.memory.hindsight.timeline import Timeline
+
+        timeline = Timeline(user_id="user-123")
+        timeline.add_event(self._event("e1", 1))
+        timeline.add_event(self._event("e1", 5))
+
+        assert timeline.count() == 1
+        assert [e.timestamp.day for e in timeline.query_by_entity("svc")] == [6]
+
+    def test_state_cache_invalidated_by_new_events(self):
+        """A cached state-at answer is refreshed when the entity changes."""
+        from luminescent_cluster.memory.hindsight.timeline import Timeline
+
+        timeline = Timeline(user_id="user-123")
+        timeline.add_event(self._event("e1", 1))
+        at_time = datetime(2025, 2, 1, tzinfo=timezone.utc)
+
+        assert timeline.get_entity_state_at("svc", at_time).id == "e1"
+        timeline.add_event(self._event("e2", 10, supersedes="e1"))
+        assert timeline.get_entity_state_at("svc", at_time).id == "e2"
+        timeline.remove_event("e2")
+        assert timeline.get_entity_state_at("svc", at_time).id == "e1"
+
+    def test_cross_entity_supersede_invalidates_cache(self):
+        """Superseding an event of another entity refreshes that entity's state."""
+        from luminescent_cluster.memory.hindsight.timeline import Timeline
+
+        timeline = Timeline(user_id="user-123")
+        timeline.add_event(self._event("a1", 1, entity_id="a"))
+        at_time = datetime(2025, 2, 1, tzinfo=timezone.utc)
+
+        assert timeline.get_entity_state_at("a", at_time).id == "a1"
+        timeline.add_event(self._event("b1", 5, entity_id="b", supersedes="a1"))
+        assert timeline.get_entity_state_at("a", at_time) is None
+
+
+class TestTimelineKeywordQueries:
+    """Test keyword queries served from the term postings."""
+
+    @staticmethod
+    def _timeline():
+        from luminescent_cluster.memory.hindsight.timeline import Timeline
+        from luminescent_cluster.memory.hindsight.types import TemporalEvent, NetworkType
+
+        timeline = Timeline(user_id="user-123")
+        contents = [
+            "auth-service deployed v2.0",
+            "Rolled back PostgreSQL upgrade",
+            "payment-api deployment failed",
+            "Redis cache warmed",
+        ]
+        for i, content in enumerate(contents):
+            timeline.add_event(
+                TemporalEvent(
+                    id=f"evt-{i}",
+                    content=content,
+                    timestamp=datetime(2025, 6, 1 + i, tzinfo=timezone.utc),
+                    network=NetworkType.OBSERVATION,
+                    entity_id="svc",
+                )
+            )
+        return timeline
+
+    def test_matches_like_substring_scan(self):
+        """Keywords match case-insensitively inside words and across punctuation."""
+        timeline = self._timeline()
+
+        assert [e.id for e in timeline.query_by_keywords(["deploy"])] == ["evt-0", "evt-2"]
+        assert [e.id for e in timeline.query_by_keywords(["postgres"])] == ["evt-1"]
+        assert [e.id for e in timeline.query_by_keywords(["auth-service"])] == ["evt-0"]
+        assert [e.id for e in timeline.query_by_keywords(["v2.0"])] == ["evt-0"]
+        assert timeline.query_by_keywords(["kafka"]) == []
+
+    def test_time_range_and_removal(self):
+        """Results respect the time range and drop removed events."""
+        from luminescent_cluster.memory.hindsight.types import TimeRange
+
+        timeline = self._timeline()
+        june_2_on = TimeRange(start=datetime(2025, 6, 2, tzinfo=timezone.utc))
+
+        assert [e.id for e in timeline.query_by_keywords(["deploy"], june_2_on)] == ["evt-2"]
+        timeline.remove_event("evt-2")
+        assert timeline.query_by_keywords(["deploy"], june_2_on) == []
+        assert timeline._events_by_term.get("deployment") is None
+
+
 class TestTimelineCombinedQueries:
     """Test combined queries (time + entity + network)."""
 
@@ -350,6 +350,70 @@ class TestDedupChecker:
         assert not result.is_duplicate
         assert result.checked_count == 0
 
+    @pytest.mark.asyncio
+    async def test_check_duplicates_batch(self):
+        """Test batch checking against the corpus and within the batch."""
+        provider = MockProvider(
+            [{"id": "mem-1", "user_id": "user-1", "content": "Uses PostgreSQL database"}]
+        )
+        checker = DedupChecker(provider)
+
+        results = await checker.check_duplicates(
+            [
+                ("Uses PostgreSQL database", "user-1", None),
+                ("Prefers tabs for Python files", "user-1", None),
+                ("Prefers tabs for Python files", "user-1", None),
+                ("Prefers tabs for Python files", "user-2", None),
+            ]
+        )
+
+        assert [r.is_duplicate for r in results] == [True, False, True, False]
+        assert results[0].existing_memory_id == "mem-1"
+        assert results[2].existing_memory_id is None
+        assert results[2].batch_index == 1
+
+    @pytest.mark.asyncio
+    async def test_check_duplicates_skips_unstorable_and_duplicate_items(self):
+        """Test that later items only match earlier items that will be stored."""
+        provider = MockProvider(
+            [{"id": "mem-1", "user_id": "user-1", "content": "Uses PostgreSQL database"}]
+        )
+        checker = DedupChecker(provider)
+
+        results = await checker.check_duplicates(
+            [
+                ("Prefers tabs for Python files", "user-1", None),
+                ("Prefers tabs for Python files", "user-1", None),
+                ("Uses PostgreSQL database", "user-1", None),
+                ("Uses PostgreSQL database", "user-1", None),
+            ],
+            storable=[False, True, True, True],
+        )
+
+        assert [r.is_duplicate for r in results] == [False, False, True, True]
+        assert results[3].existing_memory_id == "mem-1"
+        assert results[3].batch_index is None
+
+    @pytest.mark.asyncio
+    async def test_check_duplicates_searches_once_per_scope(self):
+        """Test that the provider is searched once per user and type."""
+        provider = MockProvider([])
+        calls = []
+        original_search = provider.search
+
+        async def counting_search(user_id, filters, limit=10):
+            calls.append((user_id, filters.get("memory_type")))
+            return await original_search(user_id, filters, limit)
+
+        provider.search = counting_search
+        checker = DedupChecker(provider)
+
+        await checker.check_duplicates(
+            [(f"Memory number {i}", "user-1", "fact") for i in range(10)]
+        )
+
+        assert calls == [("user-1", "fact")]
+
     def test_calculate_similarity(self):
         """Test similarity calculation."""
         provider = MockProvider([])
@@ -488,6 +552,72 @@ class TestIngestionValidator:
         assert result.evidence.source_id == "ADR-003"
         assert result.evidence.confidence == "high"  # Tier 1
 
+    @pytest.mark.asyncio
+    async def test_validate_many_matches_validate(self, validator_with_dedup):
+        """Test that batch validation agrees with per-item validation."""
+        items = [
+            {
+                "content": "Per ADR-003, we use PostgreSQL",
+                "memory_type": "decision",
+                "source": "conversation",
+                "user_id": "user-1",
+            },
+            {
+                "content": "Maybe we should use Redis",
+                "memory_type": "fact",
+                "source": "conversation",
+                "user_id": "user-1",
+            },
+            {
+                "content": "The API uses OAuth2 for authentication",
+                "memory_type": "fact",
+                "source": "ai_synthesis",
+                "user_id": "user-1",
+            },
+        ]
+
+        batch = await validator_with_dedup.validate_many(items)
+        single = [await validator_with_dedup.validate(**item) for item in items]
+
+        assert [r.tier for r in batch] == [r.tier for r in single]
+
+    @pytest.mark.asyncio
+    async def test_validate_many_blocks_in_batch_duplicate(self, validator_with_dedup):
+        """Test that the second copy of a memory within one batch is blocked."""
+        item = {
+            "content": "Uses PostgreSQL database",
+            "memory_type": "fact",
+            "source": "user",
+            "user_id": "user-1",
+        }
+
+        results = await validator_with_dedup.validate_many([item, dict(item)])
+
+        assert results[0].tier == IngestionTier.AUTO_APPROVE
+        assert results[1].tier == IngestionTier.BLOCK
+        assert results[1].conflicting_memory_id is None
+        assert "duplicate_detected: batch item 0" in results[1].checks_failed
+
+    @pytest.mark.asyncio
+    async def test_validate_many_ignores_blocked_earlier_item(self, validator_with_dedup):
+        """Test that a blocked item does not make a later copy a duplicate."""
+        sentence = "The ingestion service writes every memory to the primary database first"
+        items = [
+            {
+                "content": f"Maybe {sentence}",
+                "memory_type": "fact",
+                "source": "user",
+                "user_id": "user-1",
+            },
+            {"content": sentence, "memory_type": "fact", "source": "user", "user_id": "user-1"},
+        ]
+
+        results = await validator_with_dedup.validate_many(items)
+        single = await validator_with_dedup.validate(**items[1])
+
+        assert results[0].tier == IngestionTier.BLOCK
+        assert results[1].tier == single.tier == IngestionTier.AUTO_APPROVE
+
     def test_quick_check(self, validator):
         """Test quick tier check."""
         # Citation -> AUTO_APPROVE
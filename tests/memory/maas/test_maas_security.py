@@ -196,6 +196,20 @@ class TestRateLimiting:
         allowed, _ = limiter.check(agent_id)
         assert allowed is True
 
+    def test_rate_limiter_shared_backend(self, tmp_path):
+        """Verify limiters sharing a backend enforce one combined limit."""
+        from luminescent_cluster.memory.maas.security import AgentRateLimiter
+        from luminescent_cluster.rate_limit_backend import SQLiteRateLimitBackend
+
+        path = tmp_path / "ratelimit.db"
+        a = AgentRateLimiter(requests_per_minute=5, backend=SQLiteRateLimitBackend(path))
+        b = AgentRateLimiter(requests_per_minute=5, backend=SQLiteRateLimitBackend(path))
+
+        results = [(a if i % 2 else b).check("agent-001") for i in range(8)]
+
+        assert sum(allowed for allowed, _ in results) == 5
+        assert "rate limit" in results[-1][1].lower()
+
 
 class TestAuditLogging:
     """Test audit logging for agent operations."""
@@ -0,0 +1,179 @@
+"""Tests for latency histograms and Prometheus exposition.
+
+Tests verify:
+- Percentile estimates from fixed-bucket histograms
+- Merging histograms and per-thread shards
+- Prometheus text rendering and the local /metrics endpoint
+"""
+
+import threading
+import urllib.error
+import urllib.request
+
+import numpy as np
+import pytest
+
+from luminescent_cluster.memory.observability.metrics import (
+    BUCKET_BOUNDS_MS,
+    LatencyStats,
+    MemoryMetrics,
+)
+from luminescent_cluster.memory.observability.prometheus import PrometheusMetricsServer
+
+
+class TestLatencyHistogram:
+    """Test LatencyStats percentiles and merging."""
+
+    def test_empty_percentiles(self):
+        """Should report zero with no measurements."""
+        stats = LatencyStats()
+
+        assert stats.p50_ms == 0.0
+        assert stats.p99_ms == 0.0
+
+    def test_percentiles_within_bucket_error(self):
+        """Should estimate percentiles within one bucket width."""
+        rng = np.random.default_rng(7)
+        samples = rng.lognormal(mean=1.0, sigma=1.0, size=20_000)
+        stats = LatencyStats()
+        for sample in samples:
+            stats.record(float(sample))
+
+        for percent in (50, 95, 99):
+            exact = float(np.percentile(samples, percent))
+            assert stats.percentile(percent) == pytest.approx(exact, rel=0.2)
+        assert stats.count == len(samples)
+        assert sum(stats.buckets) == len(samples)
+
+    def test_single_value_is_exact(self):
+        """Should clamp estimates to the observed range."""
+        stats = LatencyStats()
+        for _ in range(10):
+            stats.record(12.5)
+
+        assert stats.p50_ms == 12.5
+        assert stats.p99_ms == 12.5
+
+    def test_overflow_bucket(self):
+        """Should count latencies beyond the last bound."""
+        stats = LatencyStats()
+        stats.record(BUCKET_BOUNDS_MS[-1] * 10)
+
+        assert stats.buckets[-1] == 1
+        assert stats.p99_ms == BUCKET_BOUNDS_MS[-1] * 10
+
+    def test_merge_matches_combined_recording(self):
+        """Should merge to the same histogram as recording everything once."""
+        first, second, combined = LatencyStats(), LatencyStats(), LatencyStats()
+        for i in range(1, 200):
+            (first if i % 2 else second).record(i * 0.7)
+            combined.record(i * 0.7)
+
+        first.merge(second)
+
+        assert first.buckets == combined.buckets
+        assert first.count == combined.count
+        assert first.min_ms == combined.min_ms
+        assert first.max_ms == combined.max_ms
+        assert first.p95_ms == combined.p95_ms
+
+
+class TestMemoryMetricsLatency:
+    """Test latency recording in MemoryMetrics."""
+
+    def test_threads_record_into_shards(self):
+        """Should merge measurements recorded on several threads."""
+        metrics = MemoryMetrics()
+
+        def work() -> None:
+            for _ in range(1000):
+                metrics.record_latency("search", 2.0)
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert metrics.get_latency("search").count == 4000
+        assert metrics.get_stats()["latencies"]["search"]["p99_ms"] == 2.0
+
+    def test_exited_thread_shards_are_retired(self):
+        """Should fold shards of finished threads instead of keeping them."""
+        metrics = MemoryMetrics()
+
+        for _ in range(50):
+            thread = threading.Thread(target=metrics.record_latency, args=("store", 3.0))
+            thread.start()
+            thread.join()
+        metrics.record_latency("store", 3.0)
+
+        assert len(metrics._shards) == 1
+        stats = metrics.get_latency("store")
+        assert stats.count == 51
+        assert stats.min_ms == stats.max_ms == 3.0
+
+    def test_timer_records_failures(self):
+        """Should record the latency of blocks that raise."""
+        metrics = MemoryMetrics()
+
+        with pytest.raises(RuntimeError):
+            with metrics.timer("store"):
+                raise RuntimeError("boom")
+
+        assert metrics.get_latency("store").count == 1
+
+    def test_reset_clears_shards(self):
+        """Should clear latencies recorded on every thread."""
+        metrics = MemoryMetrics()
+        metrics.record_latency("store", 1.0)
+        thread = threading.Thread(target=metrics.record_latency, args=("store", 1.0))
+        thread.start()
+        thread.join()
+
+        metrics.reset()
+
+        assert metrics.get_latencies() == {}
+
+
+class TestPrometheusExposition:
+    """Test Prometheus text rendering and serving."""
+
+    def test_histogram_text(self):
+        """Should render cumulative buckets, sum and count per operation."""
+        metrics = MemoryMetrics()
+        metrics.record_latency("retrieve", 1.0)
+        metrics.record_latency("retrieve", 100.0)
+        metrics.record_store(memory_type="fact")
+
+        lines = metrics.to_prometheus().splitlines()
+
+        assert "# TYPE memory_operation_duration_seconds histogram" in lines
+        buckets = [
+            line for line in lines if line.startswith("memory_operation_duration_seconds_bucket")
+        ]
+        counts = [int(line.rsplit(" ", 1)[1]) for line in buckets]
+        assert len(buckets) == len(BUCKET_BOUNDS_MS) + 1
+        assert counts == sorted(counts)
+        assert buckets[-1] == (
+            'memory_operation_duration_seconds_bucket{operation="retrieve",le="+Inf"} 2'
+        )
+        assert 'memory_operation_duration_seconds_count{operation="retrieve"} 2' in lines
+        assert 'memory_operation_duration_seconds_sum{operation="retrieve"} 0.101' in lines
+        assert "memory_store_total 1" in lines
+        assert 'memory_store_by_type_total{value="fact"} 1' in lines
+
+    def test_server_serves_metrics(self):
+        """Should serve /metrics and 404 other paths."""
+        metrics = MemoryMetrics()
+        metrics.record_latency("store", 3.0)
+
+        with PrometheusMetricsServer(metrics, port=0) as server:
+            with urllib.request.urlopen(server.url, timeout=5) as response:
+                body = response.read().decode("utf-8")
+                content_type = response.headers["Content-Type"]
+            with pytest.raises(urllib.error.HTTPError):
+                urllib.request.urlopen(server.url.replace("/metrics", "/other"), timeout=5)
+
+        assert content_type.startswith("text/plain; version=0.0.4")
+        assert 'memory_operation_duration_seconds_count{operation="store"} 1' in body
@@ -0,0 +1,204 @@
+"""Tests for span buffering, sampling and OTLP/JSON export.
+
+Tests verify:
+- Ring buffer bounds and draining
+- Head sampling decided at the root span
+- Parent/child linkage across asyncio.to_thread
+- OTLP JSON encoding and the background exporter
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from luminescent_cluster.memory.observability.otlp import OTLPJsonExporter, spans_to_otlp
+from luminescent_cluster.memory.observability.tracing import MemoryTracer
+
+
+class TestSpanBuffer:
+    """Test the finished-span ring buffer."""
+
+    def test_buffer_keeps_newest_spans(self):
+        """Should drop the oldest spans when the buffer is full."""
+        tracer = MemoryTracer(max_spans=3)
+
+        for i in range(5):
+            with tracer.trace_operation(f"op-{i}"):
+                pass
+
+        assert [s.name for s in tracer.get_spans()] == ["op-2", "op-3", "op-4"]
+        assert tracer.dropped_spans == 2
+
+    def test_drain_removes_spans(self):
+        """Should return and remove up to max_spans, oldest first."""
+        tracer = MemoryTracer()
+        for i in range(4):
+            with tracer.trace_operation(f"op-{i}"):
+                pass
+
+        assert [s.name for s in tracer.drain(3)] == ["op-0", "op-1", "op-2"]
+        assert [s.name for s in tracer.drain()] == ["op-3"]
+        assert tracer.drain() == []
+
+    def test_invalid_configuration(self):
+        """Should reject out-of-range sample rates and buffer sizes."""
+        with pytest.raises(ValueError):
+            MemoryTracer(sample_rate=1.5)
+        with pytest.raises(ValueError):
+            MemoryTracer(max_spans=0)
+
+
+class TestSampling:
+    """Test head sampling."""
+
+    def test_zero_sample_rate_records_nothing(self):
+        """Should not record spans when disabled."""
+        tracer = MemoryTracer(sample_rate=0.0)
+
+        with tracer.trace_operation("memory.store") as span:
+            span.set_attribute("key", "value")
+
+        assert not tracer.enabled
+        assert tracer.get_spans() == []
+        assert span.attributes == {}
+
+    def test_children_inherit_root_decision(self):
+        """Should keep or drop whole traces, never partial ones."""
+        tracer = MemoryTracer(sample_rate=0.5)
+
+        for _ in range(50):
+            with tracer.trace_operation("root"):
+                with tracer.trace_operation("child"):
+                    pass
+
+        spans = tracer.get_spans()
+        roots = [s for s in spans if s.name == "root"]
+        children = [s for s in spans if s.name == "child"]
+        assert 0 < len(roots) < 50
+        assert {c.parent_span_id for c in children} == {r.span_id for r in roots}
+
+
+class TestSpanParenting:
+    """Test parent/child linkage."""
+
+    def test_nested_spans_share_trace(self):
+        """Should link nested spans and restore the parent afterwards."""
+        tracer = MemoryTracer()
+
+        with tracer.trace_operation("parent") as parent:
+            with tracer.trace_operation("child") as child:
+                pass
+            with tracer.trace_operation("sibling") as sibling:
+                pass
+
+        assert parent.parent_span_id is None
+        assert child.parent_span_id == parent.span_id
+        assert sibling.parent_span_id == parent.span_id
+        assert child.trace_id == parent.trace_id
+        assert len(parent.trace_id) == 32
+        assert len(parent.span_id) == 16
+
+    @pytest.mark.asyncio
+    async def test_spans_in_worker_threads(self):
+        """Should parent spans started in asyncio.to_thread workers."""
+        tracer = MemoryTracer()
+
+        def work(name: str) -> None:
+            with tracer.trace_operation(name):
+                pass
+
+        with tracer.trace_operation("parent") as parent:
+            await asyncio.gather(
+                asyncio.to_thread(work, "a"),
+                asyncio.to_thread(work, "b"),
+            )
+
+        children = [s for s in tracer.get_spans() if s.name in ("a", "b")]
+        assert len(children) == 2
+        assert all(c.parent_span_id == parent.span_id for c in children)
+
+
+class TestOTLPEncoding:
+    """Test OTLP JSON encoding."""
+
+    def test_request_shape(self):
+        """Should produce an ExportTraceServiceRequest body."""
+        tracer = MemoryTracer()
+        with tracer.trace_operation("parent", {"count": 3, "hit": True}):
+            with pytest.raises(RuntimeError):
+                with tracer.trace_operation("child") as child:
+                    child.add_event("retry", {"attempt": 1})
+                    raise RuntimeError("boom")
+
+        request = spans_to_otlp(tracer.get_spans(), service_name="svc")
+        json.dumps(request)
+
+        resource_spans = request["resourceSpans"][0]
+        assert resource_spans["resource"]["attributes"] == [
+            {"key": "service.name", "value": {"stringValue": "svc"}}
+        ]
+        child_span, parent_span = resource_spans["scopeSpans"][0]["spans"]
+        assert child_span["parentSpanId"] == parent_span["spanId"]
+        assert "parentSpanId" not in parent_span
+        assert child_span["status"] == {"code": 2, "message": "boom"}
+        assert parent_span["status"] == {"code": 1}
+        assert child_span["events"][0]["name"] == "retry"
+        assert {"key": "count", "value": {"intValue": "3"}} in parent_span["attributes"]
+        assert {"key": "hit", "value": {"boolValue": True}} in parent_span["attributes"]
+        assert int(parent_span["endTimeUnixNano"]) >= int(parent_span["startTimeUnixNano"])
+
+
+class TestOTLPJsonExporter:
+    """Test the background exporter."""
+
+    def test_requires_one_destination(self, tmp_path):
+        """Should require exactly one of path or endpoint."""
+        tracer = MemoryTracer()
+        with pytest.raises(ValueError):
+            OTLPJsonExporter(tracer)
+        with pytest.raises(ValueError):
+            OTLPJsonExporter(tracer, path=tmp_path / "t.jsonl", endpoint="http://x")
+
+    def test_export_writes_json_lines(self, tmp_path):
+        """Should write one request per batch and empty the buffer."""
+        tracer = MemoryTracer()
+        path = tmp_path / "traces.jsonl"
+        exporter = OTLPJsonExporter(tracer, path=path, batch_size=2)
+        for i in range(5):
+            with tracer.trace_operation(f"op-{i}"):
+                pass
+
+        assert exporter.export_once() == 5
+
+        lines = path.read_text().splitlines()
+        assert len(lines) == 3
+        names = [
+            span["name"]
+            for line in lines
+            for span in json.loads(line)["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        ]
+        assert names == [f"op-{i}" for i in range(5)]
+        assert tracer.get_spans() == []
+
+    def test_stop_flushes(self, tmp_path):
+        """Should export buffered spans when stopped."""
+        tracer = MemoryTracer()
+        path = tmp_path / "traces.jsonl"
+
+        with OTLPJsonExporter(tracer, path=path, interval_seconds=60):
+            with tracer.trace_operation("op"):
+                pass
+
+        assert len(path.read_text().splitlines()) == 1
+
+    def test_failed_export_is_counted(self):
+        """Should log and count failures instead of raising."""
+        tracer = MemoryTracer()
+        exporter = OTLPJsonExporter(tracer, endpoint="http://127.0.0.1:9/v1/traces")
+        exporter.timeout_seconds = 0.5
+        with tracer.trace_operation("op"):
+            pass
+
+        assert exporter.export_once() == 0
+        assert exporter.failed_spans == 1
@@ -11,6 +11,7 @@ from datetime import datetime, timezone
 import pytest
 
 from luminescent_cluster.memory.retrieval.bm25 import BM25Index, BM25Search
+from luminescent_cluster.memory.retrieval.filters import MemoryFilter
 from luminescent_cluster.memory.schemas import Memory, MemoryType
 
 
@@ -196,6 +197,36 @@ class TestBM25SearchIndexing:
         removed = bm25_search.remove_memory("nonexistent", "mem-1")
         assert removed is False
 
+    def test_update_memory_matches_fresh_index(
+        self, bm25_search: BM25Search, sample_memories: list[Memory]
+    ) -> None:
+        """Patching one document gives the same index as rebuilding."""
+        bm25_search.index_memories("user-1", sample_memories)
+        edited = sample_memories[0].model_copy(
+            update={"content": "The database now uses MySQL for durable storage"}
+        )
+
+        bm25_search.update_memory("user-1", edited, "mem-1")
+
+        rebuilt = BM25Search()
+        rebuilt.index_memories("user-1", [edited, *sample_memories[1:]])
+        patched_index = bm25_search._indexes["user-1"]
+        rebuilt_index = rebuilt._indexes["user-1"]
+        assert patched_index.doc_freq == rebuilt_index.doc_freq
+        assert patched_index.doc_term_freqs == rebuilt_index.doc_term_freqs
+        assert patched_index.avg_doc_length == pytest.approx(rebuilt_index.avg_doc_length)
+        assert bm25_search.search("user-1", "PostgreSQL") == []
+        assert bm25_search.search("user-1", "MySQL")[0][0] == "mem-1"
+        assert bm25_search.get_memory("user-1", "mem-1") is edited
+
+    def test_update_memory_not_indexed_adds_it(
+        self, bm25_search: BM25Search, sample_memories: list[Memory]
+    ) -> None:
+        """Updating an unknown memory indexes it."""
+        bm25_search.update_memory("user-1", sample_memories[0], "mem-1")
+
+        assert bm25_search.index_stats("user-1")["total_docs"] == 1
+
     def test_clear_index(self, bm25_search: BM25Search, sample_memories: list[Memory]) -> None:
         """Test clearing an index."""
         bm25_search.index_memories("user-1", sample_memories)
@@ -298,6 +329,51 @@ class TestBM25SearchScoring:
         assert len(results) == 0
 
 
+class TestBM25FilteredSearch:
+    """Tests for metadata filters applied before top-k."""
+
+    def test_selective_filter_returns_full_top_k(self, bm25_search: BM25Search) -> None:
+        """Test that a selective filter still fills top_k."""
+        now = datetime.now(timezone.utc)
+        memories = [
+            Memory(
+                user_id="user-1",
+                content=f"database note {i}" + (" database" if i % 10 else ""),
+                memory_type=MemoryType.FACT,
+                source="test",
+                created_at=now,
+                last_accessed_at=now,
+                metadata={"scope": "project" if i % 10 == 0 else "user"},
+            )
+            for i in range(100)
+        ]
+        bm25_search.index_memories("user-1", memories, [f"m{i}" for i in range(100)])
+        project = MemoryFilter(scope="project")
+
+        unfiltered = bm25_search.search("user-1", "database", top_k=5)
+        filtered = bm25_search.search("user-1", "database", top_k=5, memory_filter=project)
+
+        assert not {mem_id for mem_id, _ in unfiltered} & {f"m{i}" for i in range(0, 100, 10)}
+        assert len(filtered) == 5
+        assert all(int(mem_id[1:]) % 10 == 0 for mem_id, _ in filtered)
+
+    def test_filter_follows_updates_and_removals(
+        self, bm25_search: BM25Search, sample_memories: list[Memory]
+    ) -> None:
+        """Test that filter columns track update_memory and remove_memory."""
+        bm25_search.index_memories("user-1", sample_memories)
+        preferences = MemoryFilter(memory_types=frozenset({MemoryType.PREFERENCE}))
+
+        assert [m for m, _ in bm25_search.search("user-1", "database", 10, preferences)] == []
+
+        retyped = sample_memories[0].model_copy(update={"memory_type": MemoryType.PREFERENCE})
+        bm25_search.update_memory("user-1", retyped, "mem-1")
+        bm25_search.remove_memory("user-1", "mem-2")
+
+        results = bm25_search.search("user-1", "database", 10, preferences)
+        assert [mem_id for mem_id, _ in results] == ["mem-1"]
+
+
 class TestBM25SearchWithMemories:
     """Tests for search_with_memories."""
 
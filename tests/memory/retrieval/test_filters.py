@@ -0,0 +1,131 @@
+# Copyright 2024-2025 Amiable Development
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for metadata filters and per-attribute indexes.
+
+ADR Reference: ADR-003 Memory Architecture, Phase 1c (Retrieval & Ranking)
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+
+import numpy as np
+import pytest
+
+from luminescent_cluster.memory.retrieval.filters import MemoryFilter, MetadataIndex
+from luminescent_cluster.memory.schemas import Memory, MemoryType
+
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def make_memory(
+    memory_type: MemoryType = MemoryType.FACT,
+    expires_at: Optional[datetime] = None,
+    **metadata: Any,
+) -> Memory:
+    """Create a memory with the given attributes."""
+    return Memory(
+        user_id="user-1",
+        content="content",
+        memory_type=memory_type,
+        source="test",
+        created_at=NOW,
+        last_accessed_at=NOW,
+        expires_at=expires_at,
+        metadata=metadata,
+    )
+
+
+@pytest.fixture
+def memories() -> list[Memory]:
+    """Memories covering each filtered attribute."""
+    return [
+        make_memory(),
+        make_memory(MemoryType.PREFERENCE, scope="user"),
+        make_memory(scope="project", project_id="proj-1"),
+        make_memory(MemoryType.DECISION, scope="project", project_id="proj-2"),
+        make_memory(scope="global"),
+        make_memory(expires_at=NOW - timedelta(days=1)),
+        make_memory(is_valid=False),
+    ]
+
+
+class TestMemoryFilter:
+    """Tests for MemoryFilter.matches."""
+
+    def test_default_excludes_expired_and_invalid(self, memories: list[Memory]) -> None:
+        """Test that the default filter only drops expired and invalid memories."""
+        memory_filter = MemoryFilter(now=NOW)
+
+        assert [memory_filter.matches(m) for m in memories] == [True] * 5 + [False, False]
+
+    def test_scope_semantics(self, memories: list[Memory]) -> None:
+        """Test user, project and global scope matching."""
+        user = MemoryFilter(scope="user", now=NOW)
+        project = MemoryFilter(scope="project", now=NOW)
+        proj_1 = MemoryFilter(scope="project", project_id="proj-1", now=NOW)
+
+        assert [user.matches(m) for m in memories[:5]] == [True, True, False, False, False]
+        assert [project.matches(m) for m in memories[:5]] == [False, False, True, True, False]
+        assert [proj_1.matches(m) for m in memories[:5]] == [False, False, True, False, False]
+
+    def test_memory_types(self, memories: list[Memory]) -> None:
+        """Test filtering by a set of memory types."""
+        memory_filter = MemoryFilter(
+            memory_types=frozenset({MemoryType.PREFERENCE, MemoryType.DECISION}), now=NOW
+        )
+
+        assert [memory_filter.matches(m) for m in memories[:5]] == [
+            False,
+            True,
+            False,
+            True,
+            False,
+        ]
+
+    def test_include_flags(self, memories: list[Memory]) -> None:
+        """Test opting back into expired and invalid memories."""
+        memory_filter = MemoryFilter(include_expired=True, include_invalid=True, now=NOW)
+
+        assert all(memory_filter.matches(m) for m in memories)
+
+
+class TestMetadataIndex:
+    """Tests for MetadataIndex masks."""
+
+    @pytest.mark.parametrize(
+        "memory_filter",
+        [
+            MemoryFilter(now=NOW),
+            MemoryFilter(scope="user", now=NOW),
+            MemoryFilter(scope="project", project_id="proj-2", now=NOW),
+            MemoryFilter(scope="global", include_invalid=True, now=NOW),
+            MemoryFilter(memory_types=frozenset({MemoryType.FACT}), include_expired=True, now=NOW),
+            MemoryFilter(scope="nowhere", now=NOW),
+        ],
+    )
+    def test_mask_agrees_with_matches(
+        self, memories: list[Memory], memory_filter: MemoryFilter
+    ) -> None:
+        """Test that masks select exactly the rows matches() accepts."""
+        index = MetadataIndex()
+        for memory in memories:
+            index.append(memory)
+
+        expected = [memory_filter.matches(m) for m in memories]
+        assert index.mask(memory_filter).tolist() == expected
+
+    def test_mutations_keep_rows_aligned(self, memories: list[Memory]) -> None:
+        """Test that delete and replace invalidate cached bitmaps."""
+        index = MetadataIndex()
+        for memory in memories:
+            index.append(memory)
+        global_scope = MemoryFilter(scope="global", now=NOW)
+        assert np.flatnonzero(index.mask(global_scope)).tolist() == [4]
+
+        index.delete(0)
+        assert np.flatnonzero(index.mask(global_scope)).tolist() == [3]
+
+        index.replace(0, make_memory(scope="global"))
+        assert np.flatnonzero(index.mask(global_scope)).tolist() == [0, 3]
+        assert len(index) == len(memories) - 1
@@ -6,9 +6,12 @@
 ADR Reference: ADR-003 Memory Architecture, Phase 3 (Two-Stage Retrieval)
 """
 
+import random
+
+import numpy as np
 import pytest
 
-from luminescent_cluster.memory.retrieval.fusion import FusedResult, RRFFusion
+from luminescent_cluster.memory.retrieval.fusion import FusedResult, RRFFusion, top_k_indices
 
 
 @pytest.fixture
@@ -505,3 +508,71 @@ class TestRRFWeightedFusion:
         # a gets 0 from bm25, b gets 1/61 from vector
         assert fused_dict["a"] == 0.0
         assert fused_dict["b"] == pytest.approx(1.0 / 61)
+
+
+class TestRRFArrayFusion:
+    """Tests for array-based accumulation and top-k selection."""
+
+    @staticmethod
+    def _reference_fuse(
+        k: int, weights: dict[str, float], **ranked_lists: list[tuple[str, float]]
+    ) -> dict[str, float]:
+        """Dict-based RRF used as the reference implementation."""
+        scores: dict[str, float] = {}
+        for name, results in ranked_lists.items():
+            for rank, (item_id, _) in enumerate(results, start=1):
+                scores[item_id] = scores.get(item_id, 0.0) + weights.get(name, 1.0) / (k + rank)
+        return scores
+
+    def test_matches_reference_implementation(self) -> None:
+        """Test that array accumulation matches the dict-based computation."""
+        rng = random.Random(7)
+        ids = [f"m{i}" for i in range(300)]
+        lists = {name: [(i, 0.0) for i in rng.sample(ids, 120)] for name in ("a", "b", "c")}
+        weights = {"a": 1.0, "b": 0.5, "c": 2.0}
+
+        fused = RRFFusion(k=60).weighted_fuse(weights, **lists)
+        expected = self._reference_fuse(60, weights, **lists)
+
+        assert dict(fused) == pytest.approx(expected)
+        assert [score for _, score in fused] == sorted(expected.values(), reverse=True)
+
+    def test_fuse_top_k_returns_prefix_and_total(
+        self,
+        fusion: RRFFusion,
+        bm25_results: list[tuple[str, float]],
+        vector_results: list[tuple[str, float]],
+    ) -> None:
+        """Test that fuse_top_k returns the head of the full ranking."""
+        full = fusion.fuse(bm25=bm25_results, vector=vector_results)
+        top, total = fusion.fuse_top_k(3, bm25=bm25_results, vector=vector_results)
+
+        assert top == full[:3]
+        assert total == 6
+
+    def test_ties_keep_first_seen_order(self, fusion: RRFFusion) -> None:
+        """Test that tied items keep the order they were first seen in."""
+        top, _ = fusion.fuse_top_k(
+            2, bm25=[("x", 1.0), ("y", 0.9)], vector=[("y", 1.0), ("x", 0.9), ("z", 0.8)]
+        )
+
+        # x and y tie at 1/61 + 1/62; x was seen first
+        assert [item_id for item_id, _ in top] == ["x", "y"]
+
+    def test_duplicate_ids_within_list_accumulate(self, fusion: RRFFusion) -> None:
+        """Test that an ID repeated in one list gets both contributions."""
+        fused = dict(fusion.fuse(bm25=[("a", 1.0), ("a", 0.5)]))
+
+        assert fused["a"] == pytest.approx(1.0 / 61 + 1.0 / 62)
+
+    def test_empty_lists(self, fusion: RRFFusion) -> None:
+        """Test fusing only empty lists."""
+        assert fusion.fuse_top_k(5, bm25=[], vector=[]) == ([], 0)
+
+    def test_top_k_indices_partial_selection(self) -> None:
+        """Test that top_k_indices matches a stable full sort."""
+        scores = np.array([0.5, 0.9, 0.5, 0.1, 0.9, 0.5])
+
+        assert top_k_indices(scores, 4).tolist() == [1, 4, 0, 2]
+        assert top_k_indices(scores).tolist() == [1, 4, 0, 2, 5, 3]
+        assert top_k_indices(scores, 0).tolist() == []
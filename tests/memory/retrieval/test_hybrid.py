@@ -17,6 +17,8 @@ import pytest
 
 from luminescent_cluster.memory.retrieval.bm25 import BM25Search
 from luminescent_cluster.memory.retrieval.fusion import RRFFusion
+from luminescent_cluster.memory.observability.metrics import MemoryMetrics
+from luminescent_cluster.memory.observability.tracing import MemoryTracer, SpanNames
 from luminescent_cluster.memory.retrieval.hybrid import (
     HybridResult,
     HybridRetriever,
@@ -334,6 +336,121 @@ class TestHybridRetrieverMetrics:
         assert metrics.vector_candidates >= 0
         assert metrics.fused_candidates >= 0
 
+    @pytest.mark.asyncio
+    async def test_fused_candidates_counts_union_when_truncated(
+        self,
+        hybrid_retriever: HybridRetriever,
+        sample_memories: list[Memory],
+    ) -> None:
+        """Test fused_candidates reports the whole union, not just top_k."""
+        hybrid_retriever.index_memories("user-1", sample_memories)
+
+        results, metrics = await hybrid_retriever.retrieve("database", "user-1", top_k=2)
+
+        assert len(results) == 2
+        assert metrics.fused_candidates == 5
+
+    @pytest.mark.asyncio
+    async def test_stale_fused_ids_are_backfilled(
+        self,
+        hybrid_retriever: HybridRetriever,
+        sample_memories: list[Memory],
+    ) -> None:
+        """Test that unindexed fused IDs do not shrink the result list."""
+        hybrid_retriever.index_memories("user-1", sample_memories)
+        stale = [(f"gone-{i}", 1.0) for i in range(3)]
+        hybrid_retriever.bm25.search = lambda *args: stale  # type: ignore[method-assign]
+
+        results, metrics = await hybrid_retriever.retrieve("database", "user-1", top_k=3)
+
+        assert len(results) == 3
+        assert metrics.fused_candidates == 8
+
+
+class TestHybridRetrieverTracing:
+    """Tests for per-stage spans."""
+
+    @pytest.mark.asyncio
+    async def test_stage_spans(
+        self,
+        mock_vector_search: VectorSearch,
+        sample_memories: list[Memory],
+    ) -> None:
+        """Each stage gets a span under the retrieve span."""
+        tracer = MemoryTracer()
+        retriever = HybridRetriever(
+            bm25=BM25Search(),
+            vector=mock_vector_search,
+            reranker=FallbackReranker(),
+            tracer=tracer,
+        )
+        retriever.index_memories("user-1", sample_memories)
+
+        results, metrics = await retriever.retrieve("database", "user-1", top_k=3)
+
+        spans = {span.name: span for span in tracer.get_spans()}
+        root = spans[SpanNames.HYBRID_RETRIEVE]
+        assert set(spans) == {
+            SpanNames.HYBRID_RETRIEVE,
+            SpanNames.BM25,
+            SpanNames.VECTOR,
+            SpanNames.FUSION,
+            SpanNames.RERANK,
+        }
+        for name in (SpanNames.BM25, SpanNames.VECTOR, SpanNames.FUSION, SpanNames.RERANK):
+            assert spans[name].parent_span_id == root.span_id
+            assert spans[name].trace_id == root.trace_id
+        assert spans[SpanNames.BM25].attributes["candidates"] == metrics.bm25_candidates
+        assert root.attributes["result_count"] == len(results)
+
+    @pytest.mark.asyncio
+    async def test_tracing_disabled_by_default(
+        self,
+        hybrid_retriever: HybridRetriever,
+        sample_memories: list[Memory],
+    ) -> None:
+        """No spans are recorded without an explicit tracer."""
+        hybrid_retriever.index_memories("user-1", sample_memories)
+
+        await hybrid_retriever.retrieve("database", "user-1", top_k=3)
+
+        assert not hybrid_retriever.tracer.enabled
+        assert hybrid_retriever.tracer.get_spans() == []
+
+
+class TestHybridRetrieverLatencyMetrics:
+    """Tests for per-stage latency histograms."""
+
+    @pytest.mark.asyncio
+    async def test_stage_latencies(
+        self,
+        mock_vector_search: VectorSearch,
+        sample_memories: list[Memory],
+    ) -> None:
+        """Each stage records one latency per retrieve call."""
+        memory_metrics = MemoryMetrics()
+        retriever = HybridRetriever(
+            bm25=BM25Search(),
+            vector=mock_vector_search,
+            reranker=FallbackReranker(),
+            memory_metrics=memory_metrics,
+        )
+        retriever.index_memories("user-1", sample_memories)
+
+        await retriever.retrieve("database", "user-1", top_k=3)
+        await retriever.retrieve("cache", "user-1", top_k=3)
+
+        latencies = memory_metrics.get_latencies()
+        assert set(latencies) == {
+            "hybrid.retrieve",
+            "hybrid.bm25",
+            "hybrid.vector",
+            "hybrid.fusion",
+            "hybrid.rerank",
+        }
+        assert all(stats.count == 2 for stats in latencies.values())
+        assert latencies["hybrid.retrieve"].max_ms >= latencies["hybrid.fusion"].max_ms
+
 
 class TestHybridRetrieverSourceTracking:
     """Tests for source score tracking."""
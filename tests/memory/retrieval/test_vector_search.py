@@ -17,6 +17,7 @@ import numpy as np
 import pytest
 from numpy.typing import NDArray
 
+from luminescent_cluster.memory.retrieval.filters import MemoryFilter
 from luminescent_cluster.memory.retrieval.vector_search import VectorIndex, VectorSearch
 from luminescent_cluster.memory.schemas import Memory, MemoryType
 
@@ -242,6 +243,30 @@ class TestVectorSearchIndexing:
         removed = vector_search.remove_memory("user-1", "nonexistent")
         assert removed is False
 
+    def test_update_memory_reembeds_only_changed_content(
+        self, vector_search: VectorSearch, sample_memories: list[Memory]
+    ) -> None:
+        """Only the edited row is replaced, and only when the content changed."""
+        vector_search.index_memories("user-1", sample_memories)
+        before = vector_search._indexes["user-1"].embeddings.copy()
+        encode = MagicMock(wraps=vector_search._model.encode)
+        vector_search._model.encode = encode
+
+        retagged = sample_memories[1].model_copy(update={"metadata": {"tag": "x"}})
+        vector_search.update_memory("user-1", retagged, "mem-2")
+        assert encode.call_count == 0
+        assert vector_search.get_memory("user-1", "mem-2") is retagged
+
+        edited = sample_memories[1].model_copy(update={"content": "Kafka streams events"})
+        vector_search.update_memory("user-1", edited, "mem-2")
+        after = vector_search._indexes["user-1"].embeddings
+
+        assert encode.call_count == 1
+        assert after.shape == before.shape
+        assert not np.allclose(after[1], before[1])
+        np.testing.assert_array_equal(np.delete(after, 1, axis=0), np.delete(before, 1, axis=0))
+        np.testing.assert_allclose(after[1], vector_search.embed_single("Kafka streams events"))
+
     def test_clear_index(self, vector_search: VectorSearch, sample_memories: list[Memory]) -> None:
         """Test clearing an index."""
         vector_search.index_memories("user-1", sample_memories)
@@ -440,6 +465,177 @@ class TestVectorSearchStats:
         assert stats["embedding_dim"] == 384
 
 
+class TestVectorSearchQuantizedStorage:
+    """Tests for float16 and int8 embedding storage."""
+
+    @pytest.fixture(params=["float16", "int8"])
+    def quantized_search(
+        self, request: pytest.FixtureRequest, mock_transformer: MockSentenceTransformer
+    ) -> VectorSearch:
+        """Create a quantized VectorSearch with the mock model."""
+        search = VectorSearch(lazy_load=True, storage=request.param)
+        search._model = mock_transformer
+        return search
+
+    def test_invalid_storage_raises(self) -> None:
+        """Test that unknown storage modes are rejected."""
+        with pytest.raises(ValueError, match="storage"):
+            VectorSearch(storage="int4")
+        with pytest.raises(ValueError, match="rescore_factor"):
+            VectorSearch(storage="int8", rescore_factor=0)
+
+    def test_storage_dtype_and_footprint(
+        self,
+        quantized_search: VectorSearch,
+        vector_search: VectorSearch,
+        sample_memories: list[Memory],
+    ) -> None:
+        """Test that quantized indexes store smaller embeddings."""
+        quantized_search.index_memories("user-1", sample_memories)
+        vector_search.index_memories("user-1", sample_memories)
+
+        index = quantized_search._indexes["user-1"]
+        full_bytes = vector_search.index_stats("user-1")["embedding_bytes"]
+        quantized_bytes = quantized_search.index_stats("user-1")["embedding_bytes"]
+
+        assert index.embeddings.dtype == np.dtype(quantized_search.storage)
+        assert (index.scales is not None) == (quantized_search.storage == "int8")
+        assert quantized_bytes <= full_bytes / 2
+
+    def test_search_matches_float32_ranking(
+        self,
+        quantized_search: VectorSearch,
+        vector_search: VectorSearch,
+        sample_memories: list[Memory],
+    ) -> None:
+        """Test that rescored results match float32 search."""
+        quantized_search.index_memories("user-1", sample_memories)
+        vector_search.index_memories("user-1", sample_memories)
+
+        expected = vector_search.search("user-1", sample_memories[2].content, top_k=3)
+        results = quantized_search.search("user-1", sample_memories[2].content, top_k=3)
+
+        assert [mem_id for mem_id, _ in results] == [mem_id for mem_id, _ in expected]
+        assert [score for _, score in results] == pytest.approx(
+            [score for _, score in expected], abs=0.02
+        )
+
+    def test_get_embedding_dequantizes(
+        self, quantized_search: VectorSearch, sample_memories: list[Memory]
+    ) -> None:
+        """Test that get_embedding returns approximate float32 vectors."""
+        quantized_search.index_memories("user-1", sample_memories)
+
+        embedding = quantized_search.get_embedding("user-1", "mem-1")
+
+        assert embedding is not None
+        assert embedding.dtype == np.float32
+        np.testing.assert_allclose(
+            embedding, quantized_search.embed_single(sample_memories[0].content), atol=0.01
+        )
+
+    def test_add_update_remove_keep_scales_aligned(
+        self, quantized_search: VectorSearch, sample_memories: list[Memory]
+    ) -> None:
+        """Test that incremental changes keep rows and scales in step."""
+        quantized_search.index_memories("user-1", sample_memories[:3])
+        quantized_search.add_memories("user-1", sample_memories[3:], ["mem-4", "mem-5"])
+        quantized_search.remove_memory("user-1", "mem-2")
+        edited = sample_memories[0].model_copy(update={"content": "Kafka streams events"})
+        quantized_search.update_memory("user-1", edited, "mem-1")
+
+        index = quantized_search._indexes["user-1"]
+        assert index.embeddings.shape[0] == len(index.doc_ids) == 4
+        if index.scales is not None:
+            assert index.scales.shape == (4,)
+        assert quantized_search.search("user-1", "Kafka streams events", top_k=1)[0][0] == "mem-1"
+
+    def test_index_embeddings(self, quantized_search: VectorSearch) -> None:
+        """Test building an index from precomputed embeddings."""
+        rng = np.random.default_rng(0)
+        embeddings = rng.standard_normal((50, 384)).astype(np.float32)
+        embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+
+        quantized_search.index_embeddings("user-1", [f"d{i}" for i in range(50)], embeddings)
+
+        results = quantized_search.search_by_embedding("user-1", embeddings[7], top_k=5)
+        assert results[0][0] == "d7"
+        assert quantized_search.get_memory("user-1", "d7") is None
+
+
+class TestVectorSearchFiltered:
+    """Tests for metadata filters applied before top-k."""
+
+    @pytest.mark.parametrize("storage", ["float32", "int8"])
+    @pytest.mark.parametrize("project_every", [2, 10])
+    def test_filter_returns_top_matching_rows(
+        self, mock_transformer: MockSentenceTransformer, storage: str, project_every: int
+    ) -> None:
+        """Test filtered search against brute force over the matching rows."""
+        search = VectorSearch(lazy_load=True, storage=storage)
+        search._model = mock_transformer
+        now = datetime.now(timezone.utc)
+        memories = [
+            Memory(
+                user_id="user-1",
+                content=f"note {i}",
+                memory_type=MemoryType.FACT,
+                source="test",
+                created_at=now,
+                last_accessed_at=now,
+                metadata={"scope": "project" if i % project_every == 0 else "user"},
+            )
+            for i in range(200)
+        ]
+        ids = [f"m{i}" for i in range(200)]
+        search.index_memories("user-1", memories, ids)
+        query = mock_transformer.encode("query")[0]
+
+        results = search.search_by_embedding(
+            "user-1", query, top_k=5, memory_filter=MemoryFilter(scope="project")
+        )
+
+        allowed = [i for i in range(200) if i % project_every == 0]
+        exact = {i: float(search.get_embedding("user-1", ids[i]) @ query) for i in allowed}
+        expected = sorted(allowed, key=lambda i: exact[i], reverse=True)[:5]
+        assert [mem_id for mem_id, _ in results] == [ids[i] for i in expected]
+
+    def test_no_matching_rows(
+        self, vector_search: VectorSearch, sample_memories: list[Memory]
+    ) -> None:
+        """Test that a filter matching nothing returns no results."""
+        vector_search.index_memories("user-1", sample_memories)
+
+        results = vector_search.search(
+            "user-1", "database", memory_filter=MemoryFilter(scope="global")
+        )
+
+        assert results == []
+
+    def test_filter_requires_memory_metadata(self, vector_search: VectorSearch) -> None:
+        """Test that indexes built from raw embeddings reject filters."""
+        embeddings = np.eye(3, 384, dtype=np.float32)
+        vector_search.index_embeddings("user-1", ["a", "b", "c"], embeddings)
+
+        with pytest.raises(ValueError, match="metadata"):
+            vector_search.search_by_embedding("user-1", embeddings[0], memory_filter=MemoryFilter())
+
+
+    def test_raw_index_grows_without_metadata(
+        self, vector_search: VectorSearch, sample_memories: list[Memory]
+    ) -> None:
+        """Test that adds and removes on a raw-embedding index leave metadata alone."""
+        embeddings = np.eye(3, 384, dtype=np.float32)
+        vector_search.index_embeddings("user-1", ["a", "b", "c"], embeddings)
+        vector_search.add_memories("user-1", sample_memories[:2], ["d", "e"])
+
+        assert vector_search.remove_memory("user-1", "d")
+
+        index = vector_search._indexes["user-1"]
+        assert index.doc_ids == ["a", "b", "c", "e"]
+        assert len(index.metadata) == 0
+
+
 class TestVectorIndex:
     """Tests for VectorIndex dataclass."""
 
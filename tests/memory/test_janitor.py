@@ -58,6 +58,21 @@ class TestJanitorFramework:
         assert "total_removed" in result
         assert "duration_ms" in result
 
+    @pytest.mark.asyncio
+    async def test_run_all_records_task_latencies(self):
+        """Each task's latency should be recorded in the shared metrics."""
+        from luminescent_cluster.memory.janitor.runner import JanitorRunner
+        from luminescent_cluster.memory.providers.local import LocalMemoryProvider
+
+        provider = LocalMemoryProvider()
+        janitor = JanitorRunner(provider, memory_metrics=provider.memory_metrics)
+
+        await janitor.run_all(user_id="user-1")
+
+        latencies = provider.memory_metrics.get_latencies()
+        for task in ("deduplication", "contradiction", "expiration", "run_all"):
+            assert latencies[f"janitor.{task}"].count == 1
+
 
 class TestDeduplication:
     """Tests for memory deduplication."""
@@ -14,7 +14,7 @@ ADR Reference: ADR-003 Memory Architecture, Phase 1a (Storage)
 """
 
 import pytest
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 try:
@@ -100,6 +100,46 @@ class TestLocalMemoryProviderStore:
         assert id1 != id2
 
 
+class TestLocalMemoryProviderStoreMany:
+    """Tests for LocalMemoryProvider.store_many batch ingestion."""
+
+    @pytest.fixture
+    def provider(self):
+        """Create a fresh LocalMemoryProvider for each test."""
+        from luminescent_cluster.memory.providers.local import LocalMemoryProvider
+
+        return LocalMemoryProvider()
+
+    @pytest.mark.asyncio
+    async def test_store_many_returns_ids_in_order(self, provider):
+        """store_many should return one unique ID per memory, in input order."""
+        from luminescent_cluster.memory.schemas import Memory, MemoryType
+
+        memories = [
+            Memory(
+                user_id=user_id,
+                content=f"Batch memory {i}",
+                memory_type=MemoryType.FACT,
+                source="backfill",
+            )
+            for i, user_id in enumerate(["user-a", "user-b", "user-a"])
+        ]
+
+        memory_ids = await provider.store_many(memories, {})
+
+        assert len(set(memory_ids)) == 3
+        for memory_id, memory in zip(memory_ids, memories):
+            stored = await provider.get_by_id(memory_id)
+            assert stored.content == memory.content
+            assert stored.user_id == memory.user_id
+
+    @pytest.mark.asyncio
+    async def test_store_many_empty_batch(self, provider):
+        """store_many with no memories stores nothing."""
+        assert await provider.store_many([], {}) == []
+        assert provider.count() == 0
+
+
 class TestLocalMemoryProviderRetrieve:
     """TDD: Tests for LocalMemoryProvider.retrieve method."""
 
@@ -812,3 +852,233 @@ class TestLocalMemoryProviderGraphSupport:
 
         # Should be empty
         assert graph_provider.count() == 0
+
+
+class _HashEncoder:
+    """Deterministic stand-in for a sentence-transformers model."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def encode(self, texts, batch_size=32, show_progress_bar=False, normalize_embeddings=True):
+        import numpy as np
+
+        self.calls += 1
+        rows = []
+        for text in texts:
+            rng = np.random.default_rng(sum(map(ord, text)))
+            row = rng.standard_normal(16).astype(np.float32)
+            rows.append(row / np.linalg.norm(row))
+        return np.array(rows, dtype=np.float32)
+
+
+class TestLocalMemoryProviderUpdateReindexing:
+    """Tests that update() keeps the retrieval indexes and graph in sync."""
+
+    @pytest.fixture
+    def provider(self):
+        """Graph-enabled provider with a stub embedding model."""
+        from luminescent_cluster.memory.providers.local import LocalMemoryProvider
+
+        provider = LocalMemoryProvider(
+            use_hybrid_retrieval=True,
+            use_cross_encoder=False,
+            use_query_rewriter=False,
+            use_graph=True,
+            use_cache=True,
+        )
+        provider._hybrid_retriever.vector._model = _HashEncoder()
+        return provider
+
+    @staticmethod
+    def _memory(content, *entities):
+        from luminescent_cluster.memory.schemas import Memory, MemoryType
+
+        return Memory(
+            user_id="user-123",
+            content=content,
+            memory_type=MemoryType.FACT,
+            source="test",
+            metadata={"entities": [{"name": n, "type": t} for n, t in entities]},
+        )
+
+    @pytest.mark.asyncio
+    async def test_content_update_reindexes_one_memory(self, provider):
+        """Edited content is searchable by its new terms and not its old ones."""
+        memory_id = await provider.store(
+            self._memory(
+                "auth-service uses PostgreSQL",
+                ("auth-service", "service"),
+                ("PostgreSQL", "dependency"),
+            ),
+            {},
+        )
+        await provider.store(self._memory("Prefers dark mode"), {})
+        retriever = provider._hybrid_retriever
+        encoder = retriever.vector._model
+        calls_before = encoder.calls
+
+        await provider.update(
+            memory_id,
+            {
+                "content": "auth-service uses Redis",
+                "metadata": {
+                    "entities": [
+                        {"name": "auth-service", "type": "service"},
+                        {"name": "Redis", "type": "dependency"},
+                    ]
+                },
+            },
+        )
+
+        assert encoder.calls == calls_before + 1
+        assert retriever.bm25.search("user-123", "PostgreSQL") == []
+        assert retriever.bm25.search("user-123", "Redis")[0][0] == memory_id
+        assert retriever.vector.get_memory("user-123", memory_id).content == (
+            "auth-service uses Redis"
+        )
+        graph = provider._graph_search._graphs["user-123"]
+        assert not graph.has_node("postgresql")
+        assert graph.has_edge("auth-service", "redis")
+
+    @pytest.mark.asyncio
+    async def test_metadata_update_does_not_reembed(self, provider):
+        """Updates that leave content unchanged skip the embedding model."""
+        memory_id = await provider.store(self._memory("Prefers dark mode"), {})
+        await provider.retrieve("dark mode", "user-123")
+        encoder = provider._hybrid_retriever.vector._model
+        calls_before = encoder.calls
+
+        await provider.update(memory_id, {"source": "settings"})
+
+        assert encoder.calls == calls_before
+        assert provider._cache.get(user_id="user-123", query="dark mode", limit=5) is None
+
+
+class TestLocalMemoryProviderFilteredRetrieval:
+    """Tests for retrieve() with a metadata filter."""
+
+    @pytest.fixture(params=[False, True], ids=["simple", "hybrid"])
+    def provider(self, request):
+        """Provider in simple or hybrid mode."""
+        from luminescent_cluster.memory.providers.local import LocalMemoryProvider
+
+        provider = LocalMemoryProvider(
+            use_hybrid_retrieval=request.param,
+            use_cross_encoder=False,
+            use_query_rewriter=False,
+            use_cache=True,
+        )
+        if request.param:
+            provider._hybrid_retriever.vector._model = _HashEncoder()
+        return provider
+
+    @pytest.mark.asyncio
+    async def test_filter_applied_before_limit(self, provider):
+        """Rare matching memories are returned even behind many others."""
+        from luminescent_cluster.memory.retrieval.filters import MemoryFilter
+        from luminescent_cluster.memory.schemas import Memory, MemoryType
+
+        now = datetime.now(timezone.utc)
+        for i in range(30):
+            memory_type = MemoryType.DECISION if i % 10 == 0 else MemoryType.FACT
+            await provider.store(
+                Memory(
+                    user_id="user-123",
+                    content=f"deploy note {i}",
+                    memory_type=memory_type,
+                    source="test",
+                    expires_at=now - timedelta(days=1) if i == 20 else None,
+                ),
+                {},
+            )
+        decisions = MemoryFilter(memory_types=frozenset({MemoryType.DECISION}))
+
+        results = await provider.retrieve("deploy", "user-123", limit=5, memory_filter=decisions)
+        unfiltered = await provider.retrieve("deploy", "user-123", limit=5)
+
+        # Note 20 is a decision but has expired
+        assert sorted(m.content for m in results) == ["deploy note 0", "deploy note 10"]
+        assert len(unfiltered) == 5
+
+
+class TestLocalMemoryProviderTracing:
+    """Tests for provider spans."""
+
+    @pytest.mark.asyncio
+    async def test_write_and_cache_spans(self):
+        """Writes and cache lookups are traced."""
+        from luminescent_cluster.memory.observability.tracing import MemoryTracer, SpanNames
+        from luminescent_cluster.memory.providers.local import LocalMemoryProvider
+        from luminescent_cluster.memory.schemas import Memory, MemoryType
+
+        tracer = MemoryTracer()
+        provider = LocalMemoryProvider(use_cache=True, tracer=tracer)
+        memory = Memory(
+            user_id="user-123",
+            content="Prefers tabs over spaces",
+            memory_type=MemoryType.PREFERENCE,
+            source="conversation",
+        )
+
+        memory_id = await provider.store(memory, {})
+        await provider.store_many([memory], {})
+        await provider.update(memory_id, {"content": "Prefers spaces"})
+        await provider.retrieve("spaces", "user-123")
+        await provider.retrieve("spaces", "user-123")
+        await provider.delete(memory_id)
+
+        names = [span.name for span in tracer.get_spans()]
+        assert names == [
+            SpanNames.STORE,
+            SpanNames.STORE_MANY,
+            SpanNames.UPDATE,
+            SpanNames.CACHE_LOOKUP,
+            SpanNames.RETRIEVE,
+            SpanNames.CACHE_LOOKUP,
+            SpanNames.RETRIEVE,
+            SpanNames.DELETE,
+        ]
+        lookups = [s for s in tracer.get_spans() if s.name == SpanNames.CACHE_LOOKUP]
+        retrieves = [s for s in tracer.get_spans() if s.name == SpanNames.RETRIEVE]
+        assert [s.attributes["cache.hit"] for s in lookups] == [False, True]
+        assert [s.parent_span_id for s in lookups] == [s.span_id for s in retrieves]
+
+
+class TestLocalMemoryProviderMetrics:
+    """Tests for provider latency histograms and counters."""
+
+    @pytest.mark.asyncio
+    async def test_operations_recorded(self):
+        """Every provider operation records a latency."""
+        from luminescent_cluster.memory.providers.local import LocalMemoryProvider
+        from luminescent_cluster.memory.schemas import Memory, MemoryType
+
+        provider = LocalMemoryProvider(use_cache=True)
+        memory = Memory(
+            user_id="user-123",
+            content="Prefers tabs over spaces",
+            memory_type=MemoryType.PREFERENCE,
+            source="conversation",
+        )
+
+        memory_id = await provider.store(memory, {})
+        await provider.store_many([memory, memory], {})
+        await provider.retrieve("tabs", "user-123")
+        await provider.search("user-123", {})
+        await provider.update(memory_id, {"content": "Prefers spaces"})
+        await provider.delete(memory_id)
+
+        stats = provider.memory_metrics.get_stats()
+        assert set(stats["latencies"]) == {
+            "store",
+            "store_many",
+            "retrieve",
+            "cache_lookup",
+            "search",
+            "update",
+            "delete",
+        }
+        assert stats["counters"]["store_total"] == 3
+        assert stats["counters"]["retrieve_results"] == 3
+        assert stats["labels"]["store_by_type"] == {"preference": 3}
@@ -97,6 +97,121 @@ class TestCreateMemoryTool:
         assert "memory_id" in result
 
 
+class TestCreateMemoriesTool:
+    """Tests for the create_memories batch MCP tool."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_provider(self):
+        """Start each test with an empty provider."""
+        from luminescent_cluster.memory.mcp.tools import reset_provider
+
+        reset_provider()
+        yield
+        reset_provider()
+
+    @pytest.mark.asyncio
+    async def test_create_memories_per_item_results(self):
+        """create_memories should return one result per input, in order."""
+        from luminescent_cluster.memory.mcp import create_memories
+
+        result = await create_memories(
+            [
+                {
+                    "user_id": "batch-user",
+                    "content": "Prefers tabs over spaces",
+                    "memory_type": "preference",
+                    "source": "conversation",
+                },
+                {
+                    "user_id": "batch-user",
+                    "content": "Maybe we should switch to Redis",
+                    "memory_type": "fact",
+                    "source": "conversation",
+                },
+                {
+                    "user_id": "batch-user",
+                    "content": "Anything",
+                    "memory_type": "not-a-type",
+                    "source": "conversation",
+                },
+            ]
+        )
+
+        assert result["created"] == 1
+        assert result["blocked"] == 1
+        assert result["invalid"] == 1
+        assert "memory_id" in result["results"][0]
+        assert result["results"][1]["error"] == "blocked"
+        assert "Invalid memory_type" in result["results"][2]["error"]
+
+    @pytest.mark.asyncio
+    async def test_create_memories_reports_missing_fields_per_item(self):
+        """Entries missing required keys fail alone; the batch still stores."""
+        from luminescent_cluster.memory.mcp import create_memories
+
+        result = await create_memories(
+            [
+                {"user_id": "batch-user", "memory_type": "fact", "source": "user"},
+                {
+                    "user_id": "batch-user",
+                    "content": "Deploys run on Fridays",
+                    "memory_type": "fact",
+                    "source": "user",
+                },
+                {"content": "No owner", "memory_type": "fact"},
+                "not a dict",
+            ],
+            bypass_validation=True,
+        )
+
+        assert result["created"] == 1
+        assert result["invalid"] == 3
+        assert result["results"][0]["error"] == "Missing required field(s): content"
+        assert "memory_id" in result["results"][1]
+        assert result["results"][2]["error"] == "Missing required field(s): user_id, source"
+        assert "expected an object" in result["results"][3]["error"]
+
+    @pytest.mark.asyncio
+    async def test_create_memories_blocks_duplicates_within_batch(self):
+        """Two copies of the same memory in one batch store only one."""
+        from luminescent_cluster.memory.mcp import create_memories, search_memories
+
+        item = {
+            "user_id": "batch-dup-user",
+            "content": "Uses PostgreSQL for the billing service",
+            "memory_type": "fact",
+            "source": "user",
+        }
+
+        result = await create_memories([item, dict(item)])
+
+        assert result["created"] == 1
+        assert result["blocked"] == 1
+        stored = await search_memories(user_id="batch-dup-user")
+        assert stored["count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_create_memories_bypass_validation(self):
+        """bypass_validation should store every well-formed entry."""
+        from luminescent_cluster.memory.mcp import create_memories
+
+        result = await create_memories(
+            [
+                {
+                    "user_id": "batch-user",
+                    "content": f"Trusted fact {i}",
+                    "memory_type": "fact",
+                    "source": "test",
+                }
+                for i in range(5)
+            ],
+            bypass_validation=True,
+        )
+
+        assert result["created"] == 5
+        assert len({r["memory_id"] for r in result["results"]}) == 5
+
+
 class TestGetMemoriesTool:
     """TDD: Tests for get_memories MCP tool."""
 
@@ -190,6 +190,93 @@ class TestMemoryRanker:
         assert len(ranked) <= 2
 
 
+class TestMemoryRankerBatchScoring:
+    """Tests for the vectorized batch scoring path."""
+
+    @pytest.fixture
+    def candidates(self) -> List[Memory]:
+        """Create a varied batch of candidates."""
+        import random
+
+        rng = random.Random(3)
+        words = ["tabs", "spaces", "python", "rest", "api", "uses", "prefers", "over"]
+        now = datetime.now(timezone.utc)
+        return [
+            Memory(
+                user_id="user-1",
+                content=" ".join(rng.choice(words) for _ in range(rng.randint(1, 6))),
+                memory_type=MemoryType.FACT,
+                confidence=rng.random(),
+                source="test",
+                last_accessed_at=now - timedelta(hours=rng.randint(0, 2000)),
+            )
+            for _ in range(200)
+        ]
+
+    @pytest.mark.parametrize("decay_enabled", [True, False])
+    def test_batch_scores_match_scalar(self, candidates, decay_enabled):
+        """calculate_scores agrees with calculate_score for every candidate."""
+        from luminescent_cluster.memory.retrieval.ranker import MemoryRanker
+
+        ranker = MemoryRanker(decay_enabled=decay_enabled)
+        for query in ["prefers tabs", "python", "uses rest api", "unknown words", ""]:
+            expected = [ranker.calculate_score(query, m) for m in candidates]
+            assert ranker.calculate_scores(query, candidates) == pytest.approx(expected)
+
+    def test_rank_matches_scalar_ordering(self, candidates):
+        """rank() returns the same top-k as sorting scalar scores."""
+        from luminescent_cluster.memory.retrieval.ranker import MemoryRanker, RankingFeatures
+
+        ranker = MemoryRanker()
+        features = RankingFeatures.from_memories(candidates)
+        scalar = sorted(
+            ((m, ranker.calculate_score("tabs over spaces", m)) for m in candidates),
+            key=lambda x: x[1],
+            reverse=True,
+        )[:10]
+
+        for ranked in (
+            ranker.rank("tabs over spaces", candidates, limit=10),
+            ranker.rank("tabs over spaces", candidates, limit=10, features=features),
+        ):
+            assert [m for m, _ in ranked] == [m for m, _ in scalar]
+
+    def test_feature_and_list_scores_agree(self, candidates):
+        """Precomputed features and plain lists give the same scores."""
+        from luminescent_cluster.memory.retrieval.ranker import MemoryRanker, RankingFeatures
+
+        ranker = MemoryRanker()
+        features = RankingFeatures.from_memories(candidates)
+        for query in ["prefers tabs", "Python", "uses rest api", "s ov", ""]:
+            assert ranker.calculate_scores(query, candidates) == pytest.approx(
+                ranker.calculate_scores(query, features)
+            )
+
+    def test_word_cache_is_bounded(self, candidates):
+        """Per-content word sets are reused across calls and capped in size."""
+        from luminescent_cluster.memory.retrieval.ranker import MemoryRanker
+
+        ranker = MemoryRanker(word_cache_size=5)
+        first = ranker.calculate_scores("tabs", candidates)
+        second = ranker.calculate_scores("tabs", candidates)
+
+        assert len(ranker._word_cache) == 5
+        assert first == pytest.approx(second)
+        assert MemoryRanker(word_cache_size=0).rank("tabs", candidates, limit=3)
+
+    def test_top_k_ties_keep_input_order(self):
+        """Equal scores are returned in input order, like a stable sort."""
+        import numpy as np
+
+        from luminescent_cluster.memory.retrieval.ranker import MemoryRanker
+
+        scores = np.array([0.5, 0.9, 0.5, 0.5, 0.1])
+
+        assert MemoryRanker.top_k(scores, 3).tolist() == [1, 0, 2]
+        assert MemoryRanker.top_k(scores).tolist() == [1, 0, 2, 3, 4]
+        assert MemoryRanker.top_k(scores, 0).tolist() == []
+
+
 class TestQueryRewriter:
     """Tests for query rewriting and expansion."""
 
@@ -402,6 +489,83 @@ class TestScopedRetriever:
         )
         assert isinstance(results, list)
 
+    @staticmethod
+    async def _store_many(provider, project_count: int) -> None:
+        """Store 20 user-scoped and project_count project-scoped matches."""
+        now = datetime.now(timezone.utc)
+        for i in range(20 + project_count):
+            metadata = {"scope": "project", "project_id": "proj-1"} if i >= 20 else {}
+            await provider.store(
+                Memory(
+                    user_id="user-1",
+                    content=f"database note {i}",
+                    memory_type=MemoryType.FACT,
+                    source="conversation",
+                    created_at=now,
+                    last_accessed_at=now,
+                    metadata=metadata,
+                ),
+                {},
+            )
+
+    @pytest.mark.asyncio
+    async def test_selective_scope_fills_limit(self, retriever):
+        """A rare scope should still return `limit` matches."""
+        await self._store_many(retriever.provider, project_count=3)
+
+        results = await retriever.retrieve(
+            query="database",
+            user_id="user-1",
+            scope="project",
+            project_id="proj-1",
+            limit=3,
+        )
+
+        assert len(results) == 3
+        assert all(m.metadata["scope"] == "project" for m in results)
+
+    @pytest.mark.asyncio
+    async def test_provider_without_filter_support(self, retriever):
+        """Providers without memory_filter fall back to over-fetching."""
+        from luminescent_cluster.memory.retrieval.scoped import ScopedRetriever
+
+        inner = retriever.provider
+        await self._store_many(inner, project_count=3)
+
+        class PlainProvider:
+            async def retrieve(self, query: str, user_id: str, limit: int = 5):
+                return await inner.retrieve(query, user_id, limit)
+
+        plain = ScopedRetriever(PlainProvider())
+        results = await plain.retrieve(
+            query="database", user_id="user-1", scope="project", project_id="proj-1", limit=3
+        )
+
+        assert not plain._provider_filters
+        assert all(m.metadata["scope"] == "project" for m in results)
+
+
+    def test_scope_matching_edge_cases(self, retriever):
+        """Unknown scopes, empty project IDs and empty scopes keep their meaning."""
+        now = datetime.now(timezone.utc)
+
+        def memory(metadata):
+            return Memory(
+                user_id="user-1",
+                content="note",
+                memory_type=MemoryType.FACT,
+                source="conversation",
+                created_at=now,
+                last_accessed_at=now,
+                metadata=metadata,
+            )
+
+        project = memory({"scope": "project", "project_id": "proj-1"})
+        assert retriever._matches_scope(project, "team", None)
+        assert retriever._matches_scope(project, "project", "")
+        assert not retriever._matches_scope(memory({"scope": ""}), "user", None)
+        assert retriever._matches_scope(memory({"scope": None}), "user", None)
+
 
 class TestMemoryDecayIntegration:
     """Tests for memory decay integration with retrieval."""
@@ -0,0 +1,482 @@
+# Copyright 2024-2025 Amiable Development
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Tests for the Pixeltable MCP server's executor, aggregates and result cache.
+
+The server module imports Pixeltable at import time, so these tests are
+skipped where it is not installed. Table access is replaced with fakes;
+no database is touched.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+import types
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("pixeltable")
+
+from luminescent_cluster.servers import pixeltable as server_module  # noqa: E402
+from luminescent_cluster.servers.pixeltable import (  # noqa: E402
+    PixeltableMemoryServer,
+    QueryExecutor,
+    ServiceAggregates,
+)
+
+
+class FakeKnowledgeTable:
+    """Stand-in for org_knowledge that answers the aggregate projection scan."""
+
+    type = "type"
+    metadata = "metadata"
+    title = "title"
+    created_at = "created_at"
+
+    def __init__(self, rows=None):
+        self.rows = list(rows or [])
+        self.scans = 0
+        self.scan_started = threading.Event()
+        self.release_scan = threading.Event()
+        self.release_scan.set()
+
+    def add(self, item_type, service, title="t", created_at=None):
+        self.rows.append(
+            {
+                "type": item_type,
+                "metadata": {"service": service},
+                "title": title,
+                "created_at": created_at or datetime(2025, 1, 1),
+            }
+        )
+
+    def select(self, *columns):
+        return self
+
+    def collect(self):
+        self.scans += 1
+        snapshot = [dict(row) for row in self.rows]
+        self.scan_started.set()
+        self.release_scan.wait(timeout=5)
+        return snapshot
+
+
+async def _wait_until(predicate, timeout: float = 5.0) -> None:
+    """Poll until predicate() is true."""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline, "condition not reached"
+        await asyncio.sleep(0.005)
+
+
+@pytest.fixture
+def executor():
+    """A single-worker executor so calls queue behind each other."""
+    executor = QueryExecutor(max_workers=1, timeout=5.0)
+    yield executor
+    executor.shutdown()
+
+
+class TestQueryExecutor:
+    """Queue accounting, timeouts and counters."""
+
+    @pytest.mark.asyncio
+    async def test_counts_completed_and_failed_calls(self, executor):
+        """Results and exceptions pass through and are counted."""
+
+        def fail():
+            raise ValueError("bad query")
+
+        assert await executor.run(sum, [1, 2, 3]) == 6
+        with pytest.raises(ValueError):
+            await executor.run(fail)
+
+        metrics = executor.metrics()
+        assert metrics["completed"] == 1
+        assert metrics["failed"] == 1
+        assert metrics["timed_out"] == 0
+        assert metrics["queued"] == 0
+        assert metrics["running"] == 0
+        assert metrics["avg_queue_wait_ms"] >= 0.0
+
+    @pytest.mark.asyncio
+    async def test_queue_depth_while_worker_is_busy(self, executor):
+        """Calls waiting for the worker are reported as queued."""
+        release = threading.Event()
+        blocker = asyncio.ensure_future(executor.run(release.wait, timeout=None))
+        await _wait_until(lambda: executor.metrics()["running"] == 1)
+
+        waiting = [asyncio.ensure_future(executor.run(len, "abc")) for _ in range(3)]
+        await _wait_until(lambda: executor.metrics()["queued"] == 3)
+        release.set()
+
+        assert await asyncio.gather(*waiting) == [3, 3, 3]
+        assert await blocker is True
+        metrics = executor.metrics()
+        assert metrics["queued"] == 0
+        assert metrics["max_queue_depth"] == 3
+        assert metrics["completed"] == 4
+
+    @pytest.mark.asyncio
+    async def test_timeout_while_queued_releases_queue_slot(self, executor):
+        """Calls that time out before starting leave the queue and never run."""
+        release = threading.Event()
+        ran = []
+        blocker = asyncio.ensure_future(executor.run(release.wait, timeout=None))
+        await _wait_until(lambda: executor.metrics()["running"] == 1)
+
+        for _ in range(5):
+            with pytest.raises(TimeoutError):
+                await executor.run(ran.append, 1, timeout=0.01)
+        release.set()
+        await blocker
+        await executor.run(len, "")  # drains anything left in the pool
+
+        metrics = executor.metrics()
+        assert metrics["queued"] == 0
+        assert metrics["timed_out"] == 5
+        assert ran == []
+
+    @pytest.mark.asyncio
+    async def test_timeout_while_running(self, executor):
+        """A started call that overruns is counted as timed out."""
+        release = threading.Event()
+
+        with pytest.raises(TimeoutError):
+            await executor.run(release.wait, timeout=0.01)
+        release.set()
+        await _wait_until(lambda: executor.metrics()["running"] == 0)
+
+        metrics = executor.metrics()
+        assert metrics["timed_out"] == 1
+        assert metrics["queued"] == 0
+
+    @pytest.mark.asyncio
+    async def test_cancel_while_queued_releases_queue_slot(self, executor):
+        """Cancelled callers do not leave phantom queued calls behind."""
+        release = threading.Event()
+        blocker = asyncio.ensure_future(executor.run(release.wait, timeout=None))
+        await _wait_until(lambda: executor.metrics()["running"] == 1)
+
+        waiting = asyncio.ensure_future(executor.run(len, "abc"))
+        await _wait_until(lambda: executor.metrics()["queued"] == 1)
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+        release.set()
+        await blocker
+
+        assert executor.metrics()["queued"] == 0
+
+
+class TestServiceAggregates:
+    """Per-service counts, staleness and reloads."""
+
+    def test_counts_and_recent_incidents(self):
+        """One scan yields counts by type and the newest incidents."""
+        kb = FakeKnowledgeTable()
+        kb.add("code", "auth")
+        kb.add("decision", "auth")
+        for day in range(1, 6):
+            kb.add("incident", "auth", f"outage-{day}", datetime(2025, 1, day))
+        kb.add("code", "billing")
+        aggregates = ServiceAggregates(ttl_seconds=0)
+
+        aggregates.ensure_loaded(kb)
+        aggregates.ensure_loaded(kb)
+
+        context = aggregates.service_context("auth")
+        assert kb.scans == 1
+        assert (context["code_files"], context["decisions"], context["incidents"]) == (1, 1, 5)
+        assert [i["title"] for i in context["recent_incidents"]] == [
+            "outage-5",
+            "outage-4",
+            "outage-3",
+        ]
+        assert aggregates.stats()["total_items"] == 8
+        assert aggregates.services() == ["auth", "billing"]
+
+    def test_local_writes_update_without_rescan(self):
+        """Recorded inserts apply in place."""
+        kb = FakeKnowledgeTable()
+        kb.add("code", "auth")
+        aggregates = ServiceAggregates(ttl_seconds=0)
+        aggregates.ensure_loaded(kb)
+
+        aggregates.record("auth", "incident", "outage", datetime(2025, 2, 1))
+        aggregates.ensure_loaded(kb)
+
+        assert kb.scans == 1
+        assert aggregates.service_context("auth")["incidents"] == 1
+
+    def test_mixed_naive_and_aware_dates(self):
+        """Aware incident dates are compared with naive table rows as UTC."""
+        kb = FakeKnowledgeTable()
+        kb.add("incident", "auth", "old", datetime(2025, 1, 1, 12))
+        aggregates = ServiceAggregates(ttl_seconds=0)
+        aggregates.ensure_loaded(kb)
+
+        aggregates.record(
+            "auth", "incident", "new", datetime.fromisoformat("2025-01-01T13:00:00+02:00")
+        )
+        aggregates.record("auth", "incident", "newest", datetime(2025, 1, 2))
+
+        recent = aggregates.service_context("auth")["recent_incidents"]
+        assert [i["title"] for i in recent] == ["newest", "old", "new"]
+        assert recent[2]["created_at"] == datetime(2025, 1, 1, 11)
+
+    def test_ttl_picks_up_writes_from_other_processes(self):
+        """Rows this process never saw appear once the aggregates expire."""
+        kb = FakeKnowledgeTable()
+        kb.add("code", "auth")
+        aggregates = ServiceAggregates(ttl_seconds=0.05)
+        aggregates.ensure_loaded(kb)
+
+        kb.add("code", "billing")  # written by an ingestion script
+        aggregates.ensure_loaded(kb)
+        assert aggregates.services() == ["auth"]
+
+        time.sleep(0.06)
+        aggregates.ensure_loaded(kb)
+        assert aggregates.services() == ["auth", "billing"]
+
+    def test_scan_does_not_block_readers(self):
+        """Reads during a rescan return the previous aggregates immediately."""
+        kb = FakeKnowledgeTable()
+        kb.add("code", "auth")
+        aggregates = ServiceAggregates(ttl_seconds=0)
+        aggregates.ensure_loaded(kb)
+        aggregates.invalidate()
+        kb.scan_started.clear()
+        kb.release_scan.clear()
+
+        loader = threading.Thread(target=aggregates.ensure_loaded, args=(kb,))
+        loader.start()
+        assert kb.scan_started.wait(timeout=5)
+        started = time.perf_counter()
+        context = aggregates.service_context("auth")
+        elapsed = time.perf_counter() - started
+        kb.release_scan.set()
+        loader.join(timeout=5)
+
+        assert context["code_files"] == 1
+        assert elapsed < 0.5
+
+    def test_write_during_scan_forces_rescan(self):
+        """A write racing the scan is not lost; the next read rescans."""
+        kb = FakeKnowledgeTable()
+        aggregates = ServiceAggregates(ttl_seconds=0)
+        kb.release_scan.clear()
+
+        loader = threading.Thread(target=aggregates.ensure_loaded, args=(kb,))
+        loader.start()
+        assert kb.scan_started.wait(timeout=5)
+        kb.add("incident", "auth", "outage")  # inserted after the scan read
+        aggregates.record("auth", "incident", "outage", datetime(2025, 1, 1))
+        kb.release_scan.set()
+        loader.join(timeout=5)
+
+        aggregates.ensure_loaded(kb)
+
+        assert kb.scans == 2
+        assert aggregates.service_context("auth")["incidents"] == 1
+
+
+@pytest.fixture
+def fake_setup(monkeypatch):
+    """Replace the pixeltable_setup write helpers."""
+    module = types.ModuleType("pixeltable_setup")
+    module.incidents = []
+
+    def ingest_incident(kb, data):
+        if data.get("fail"):
+            raise RuntimeError("insert failed")
+        module.incidents.append(data)
+        kb.add("incident", data.get("service"), data["title"], data["date"])
+
+    def ingest_codebase(kb, repo_path, service, extensions):
+        kb.add("code", service)
+        return 1
+
+    def ingest_adr(kb, path, title, service):
+        kb.add("decision", service, title)
+
+    def delete_service_data(kb, service):
+        before = len(kb.rows)
+        kb.rows = [r for r in kb.rows if r["metadata"]["service"] != service]
+        return {"deleted_count": before - len(kb.rows)}
+
+    def prune_old_data(kb, days_old):
+        return {"deleted_count": 0}
+
+    module.ingest_incident = ingest_incident
+    module.ingest_codebase = ingest_codebase
+    module.ingest_adr = ingest_adr
+    module.delete_service_data = delete_service_data
+    module.prune_old_data = prune_old_data
+    monkeypatch.setitem(sys.modules, "pixeltable_setup", module)
+    return module
+
+
+@pytest.fixture
+def server(monkeypatch):
+    """A server whose org_knowledge table is a FakeKnowledgeTable."""
+    kb = FakeKnowledgeTable()
+    kb.add("code", "auth")
+
+    def get_table(name):
+        if name == "org_knowledge":
+            return kb
+        raise RuntimeError(f"no table {name}")
+
+    monkeypatch.setattr(server_module.pxt, "get_table", get_table)
+    server = PixeltableMemoryServer()
+    yield server
+    server.close()
+
+
+class TestIncidentIngestAggregates:
+    """Incident writes keep the aggregates in step with the table."""
+
+    @pytest.mark.asyncio
+    async def test_successful_insert_is_recorded(self, server, fake_setup):
+        """The new incident is counted without a rescan."""
+        await server.get_service_context("auth")
+
+        result = await server.ingest_incident_data(
+            {"title": "outage", "service": "auth", "date": "2025-03-01T00:00:00"}
+        )
+
+        assert result == {"success": True, "incident": "outage"}
+        context = await server.get_service_context("auth")
+        assert context["incidents"] == 1
+        assert server.kb.scans == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_insert_is_not_recorded(self, server, fake_setup):
+        """A failed insert reports failure and leaves the counts alone."""
+        await server.get_service_context("auth")
+
+        result = await server.ingest_incident_data(
+            {"title": "outage", "service": "auth", "fail": True}
+        )
+
+        assert result["success"] is False
+        assert (await server.get_service_context("auth"))["incidents"] == 0
+
+
+class TestDeleteServiceAggregates:
+    """Service deletion leaves the aggregates matching the table."""
+
+    @pytest.mark.asyncio
+    async def test_rows_sharing_a_path_are_recounted(self, server, fake_setup):
+        """Rows of other services deleted by a shared path drop out of the counts."""
+        server.kb.add("incident", "billing", "outage")
+        server.kb.add("incident", "auth", "outage")
+        assert (await server.get_service_context("billing"))["incidents"] == 1
+
+        def delete_by_path(kb, service):
+            # Both incidents were stored with path="" and go together
+            kb.rows = [
+                r
+                for r in kb.rows
+                if r["metadata"]["service"] != service and r["type"] != "incident"
+            ]
+            return {"deleted": 2}
+
+        fake_setup.delete_service_data = delete_by_path
+        result = await server.delete_service("auth", confirm=True)
+
+        assert result["success"] is True
+        assert (await server.get_service_context("billing"))["incidents"] == 0
+        assert await server.list_all_services() == []
+
+
+class TestResultCache:
+    """Search results are cached per kb_version and dropped by writes."""
+
+    @pytest.fixture
+    def queries(self, server, monkeypatch):
+        """Count similarity queries; each returns a distinct result."""
+        calls = []
+
+        async def query_knowledge(query, tenant_filter, type_filter, service_filter, limit):
+            calls.append(query)
+            return [{"title": f"{query}-{len(calls)}"}]
+
+        monkeypatch.setattr(server, "_query_knowledge", query_knowledge)
+        return calls
+
+    @pytest.mark.asyncio
+    async def test_repeated_search_hits_cache(self, server, queries):
+        """The second identical search is served from the cache."""
+        first = await server.search_knowledge("redis")
+        second = await server.search_knowledge("redis")
+        await server.search_knowledge("redis", type_filter="code")
+
+        assert first == second
+        assert queries == ["redis", "redis"]
+        assert server.result_cache.get_metrics()["hits"] == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "write",
+        [
+            lambda s: s.ingest_incident_data({"title": "outage", "service": "auth"}),
+            lambda s: s.ingest_codebase_data("/repo", "auth"),
+            lambda s: s.ingest_adr_data("/adr/001.md", "Use Redis", "auth"),
+            lambda s: s.delete_service("auth", confirm=True),
+            lambda s: s.prune_old(30, confirm=True),
+        ],
+        ids=["incident", "codebase", "adr", "delete", "prune"],
+    )
+    async def test_write_invalidates_cached_search(self, server, queries, fake_setup, write):
+        """Every write bumps kb_version, so the next search queries again."""
+        before = await server.search_knowledge("redis")
+        version = server.kb_version
+
+        result = await write(server)
+        after = await server.search_knowledge("redis")
+
+        assert result["success"] is True
+        assert server.kb_version == version + 1
+        assert after != before
+        assert len(queries) == 2
+
+    @pytest.mark.asyncio
+    async def test_results_expire_with_the_aggregates(self, server, queries, monkeypatch):
+        """Writes by other processes are picked up once cached results expire."""
+        assert server.result_cache.ttl_seconds == server.aggregates.ttl_seconds
+
+        now = [time.time()]
+        monkeypatch.setattr("luminescent_cluster.memory.retrieval.cache.time.time", lambda: now[0])
+        await server.search_knowledge("redis")
+        now[0] += server.result_cache.ttl_seconds + 1
+        await server.search_knowledge("redis")
+
+        assert len(queries) == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_write_keeps_cache(self, server, queries, fake_setup):
+        """A rejected insert changes nothing, so cached results stay valid."""
+        await server.search_knowledge("redis")
+
+        await server.ingest_incident_data({"title": "outage", "fail": True})
+        await server.search_knowledge("redis")
+
+        assert server.kb_version == 0
+        assert len(queries) == 1
@@ -0,0 +1,246 @@
+"""
+Tests for shared-state rate limit backends.
+
+Replicas sharing a backend must enforce one combined limit rather than
+one limit each.
+"""
+
+import multiprocessing
+import time
+
+import pytest
+
+from luminescent_cluster.chatbot.rate_limiter import RateLimitConfig, TokenBucketRateLimiter
+from luminescent_cluster.rate_limit_backend import (
+    InMemoryRateLimitBackend,
+    LeasedRateLimitBackend,
+    RateLimitBackend,
+    SQLiteRateLimitBackend,
+)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend(request, tmp_path):
+    """Each backend implementation."""
+    if request.param == "memory":
+        yield InMemoryRateLimitBackend()
+    else:
+        backend = SQLiteRateLimitBackend(tmp_path / "ratelimit.db")
+        yield backend
+        backend.close()
+
+
+def _take_many(path, count, results):
+    """Consume from a shared SQLite bucket in a separate process."""
+    backend = SQLiteRateLimitBackend(path)
+    granted = 0
+    for _ in range(count):
+        ok, _ = backend.take("user:shared", 1.0, 50.0, 0.0, time.time())
+        granted += ok
+    backend.close()
+    results.put(granted)
+
+
+class TestBackendSemantics:
+    """Refill-and-consume behaviour common to every backend."""
+
+    def test_implements_protocol(self, backend):
+        """Backends satisfy the RateLimitBackend protocol."""
+        assert isinstance(backend, RateLimitBackend)
+
+    def test_new_bucket_starts_full_and_depletes(self, backend):
+        """Buckets start at capacity and deny once empty."""
+        results = [backend.take("k", 1.0, 3.0, 1.0, 100.0) for _ in range(4)]
+
+        assert [granted for granted, _ in results] == [True, True, True, False]
+        assert results[2][1] == 0.0
+
+    def test_refill_refund_and_force(self, backend):
+        """Elapsed time refills, negative amounts refund, force clamps at zero."""
+        backend.take("k", 3.0, 3.0, 1.0, 100.0)
+
+        assert backend.take("k", 1.0, 3.0, 1.0, 101.5) == (True, 0.5)
+        assert backend.take("k", -1.0, 3.0, 1.0, 101.5) == (True, 1.5)
+        assert backend.take("k", 10.0, 3.0, 1.0, 101.5, force=True) == (True, 0.0)
+        assert backend.take("k", 0.0, 3.0, 1.0, 101.5) == (True, 0.0)
+
+    def test_evict_idle_drops_refilled_buckets(self, backend):
+        """Only buckets that are full again are evicted."""
+        backend.take("idle", 1.0, 2.0, 1.0, 100.0)
+        backend.take("busy", 2.0, 2.0, 0.1, 100.0)
+
+        assert backend.evict_idle(101.0) == 1
+        assert backend.take("busy", 1.0, 2.0, 0.1, 101.0)[0] is False
+
+
+class TestSharedLimits:
+    """Limits hold across replicas that share a backend."""
+
+    def test_two_limiters_share_one_budget(self, tmp_path):
+        """Two gateway replicas share a per-user limit instead of doubling it."""
+        path = tmp_path / "ratelimit.db"
+        config = RateLimitConfig(user_requests_per_minute=10)
+        replicas = [
+            TokenBucketRateLimiter(config, backend=SQLiteRateLimitBackend(path)) for _ in range(2)
+        ]
+
+        allowed = sum(replicas[i % 2].check("user-1").allowed for i in range(20))
+
+        assert allowed == 10
+        for limiter in replicas:
+            limiter.backend.close()
+
+    def test_processes_share_sqlite_bucket(self, tmp_path):
+        """Concurrent processes never over-grant from one bucket."""
+        path = tmp_path / "ratelimit.db"
+        SQLiteRateLimitBackend(path).close()
+        ctx = multiprocessing.get_context("spawn")
+        results = ctx.Queue()
+        procs = [ctx.Process(target=_take_many, args=(path, 40, results)) for _ in range(3)]
+        for p in procs:
+            p.start()
+        for p in procs:
+            p.join(timeout=60)
+
+        assert sum(results.get(timeout=5) for _ in procs) == 50
+
+    def test_record_and_token_limits_use_backend(self):
+        """record() drains the shared token bucket seen by other replicas."""
+        shared = InMemoryRateLimitBackend()
+        config = RateLimitConfig(tokens_per_minute=1000)
+        a = TokenBucketRateLimiter(config, backend=shared)
+        b = TokenBucketRateLimiter(config, backend=shared)
+
+        a.record("user-1", tokens_used=700)
+        result = b.check("user-1", tokens=400)
+
+        assert result.allowed is False
+        assert "Token limit" in result.reason
+
+
+class TestLeasedBackend:
+    """Token leasing avoids a shared round-trip per request."""
+
+    def test_leases_reduce_round_trips(self):
+        """Requests are served from leased tokens between round-trips."""
+        shared = InMemoryRateLimitBackend()
+        leased = LeasedRateLimitBackend(shared, lease_size=9)
+
+        granted = [leased.take("k", 1.0, 100.0, 0.0, 100.0)[0] for _ in range(30)]
+
+        assert all(granted)
+        assert leased.round_trips == 3
+        assert shared.take("k", 0.0, 100.0, 0.0, 100.0)[1] == 70.0
+
+    def test_leased_tokens_are_returned(self):
+        """Unused leased tokens go back to the shared bucket."""
+        shared = InMemoryRateLimitBackend()
+        leased = LeasedRateLimitBackend(shared, lease_size=9, lease_ttl_seconds=1.0)
+
+        leased.take("k", 1.0, 100.0, 0.0, 100.0)
+        assert shared.take("k", 0.0, 100.0, 0.0, 100.0)[1] == 90.0
+
+        leased.evict_idle(200.0)
+        assert shared.take("k", 0.0, 100.0, 0.0, 200.0)[1] == 99.0
+
+    def test_falls_back_to_exact_amount_near_limit(self):
+        """Near the limit, the lease shrinks to the request itself."""
+        shared = InMemoryRateLimitBackend()
+        leased = LeasedRateLimitBackend(shared, lease_size=5)
+
+        granted = [leased.take("k", 1.0, 3.0, 0.0, 100.0)[0] for _ in range(4)]
+
+        assert granted == [True, True, True, False]
+
+    def test_limiter_checks_mostly_skip_the_shared_backend(self):
+        """Peeks and refunds in check() are served from the lease."""
+        shared = InMemoryRateLimitBackend()
+        leased = LeasedRateLimitBackend(shared, lease_size=9, lease_ttl_seconds=60.0)
+        limiter = TokenBucketRateLimiter(
+            RateLimitConfig(user_requests_per_minute=1000, tokens_per_minute=1000),
+            backend=leased,
+        )
+
+        results = [limiter.check("user-1") for _ in range(100)]
+
+        assert all(r.allowed for r in results)
+        assert leased.round_trips <= 15
+
+    def test_refunds_and_forced_usage_settle_on_expiry(self):
+        """Local refunds and forced usage reach the shared bucket when the lease expires."""
+        shared = InMemoryRateLimitBackend()
+        leased = LeasedRateLimitBackend(shared, lease_size=4, lease_ttl_seconds=1.0)
+
+        leased.take("k", 1.0, 100.0, 0.0, 100.0)
+        assert leased.take("k", 0.0, 100.0, 0.0, 100.0) == (True, 99.0)
+        assert leased.take("k", -1.0, 100.0, 0.0, 100.0) == (True, 100.0)
+        assert leased.take("k", 20.0, 100.0, 0.0, 100.0, force=True) == (True, 80.0)
+        assert leased.round_trips == 1
+
+        leased.evict_idle(200.0)
+
+        assert shared.take("k", 0.0, 100.0, 0.0, 200.0)[1] == 80.0
+
+    def test_peek_without_lease_takes_nothing(self):
+        """A zero-amount take with no lease reads the shared level only."""
+        shared = InMemoryRateLimitBackend()
+        leased = LeasedRateLimitBackend(shared, lease_size=9)
+        shared.take("k", 30.0, 100.0, 0.0, 100.0)
+
+        assert leased.take("k", 0.0, 100.0, 0.0, 100.0) == (True, 70.0)
+        assert leased.take("k", 0.0, 100.0, 0.0, 100.0) == (True, 70.0)
+        assert leased.round_trips == 1
+        assert shared.take("k", 0.0, 100.0, 0.0, 100.0)[1] == 70.0
+
+    def test_limiter_reports_shared_bucket_level(self):
+        """Remaining counts reflect the shared bucket, not the lease."""
+        leased = LeasedRateLimitBackend(InMemoryRateLimitBackend(), lease_size=5)
+        limiter = TokenBucketRateLimiter(
+            RateLimitConfig(user_requests_per_minute=10, tokens_per_minute=100_000),
+            backend=leased,
+        )
+
+        remaining = [limiter.check("user-1").remaining_requests for _ in range(3)]
+        limiter.record("user-1", tokens_used=500)
+        result = limiter.check("user-1")
+
+        assert remaining == [9, 8, 7]
+        assert result.remaining_requests == 6
+        assert result.remaining_tokens == 99_500
+
+    def test_refill_settles_forced_usage(self):
+        """Forced usage beyond the lease is charged on the next refill."""
+        shared = InMemoryRateLimitBackend()
+        leased = LeasedRateLimitBackend(shared, lease_size=0, lease_ttl_seconds=60.0)
+
+        leased.take("k", 10.0, 10.0, 0.0, 100.0, force=True)
+
+        assert leased.take("k", 1.0, 10.0, 0.0, 100.0)[0] is False
+        assert shared.take("k", 0.0, 10.0, 0.0, 100.0)[1] == 0.0
+
+    def test_take_settles_expired_leases(self):
+        """Leases for idle keys are dropped without an explicit evict_idle()."""
+        shared = InMemoryRateLimitBackend()
+        leased = LeasedRateLimitBackend(shared, lease_size=9, lease_ttl_seconds=1.0)
+        for i in range(50):
+            leased.take(f"user-{i}", 1.0, 100.0, 0.0, 100.0)
+        assert len(leased) == 50
+
+        leased.take("other", 1.0, 100.0, 0.0, 102.0)
+
+        assert len(leased) == 1
+        assert shared.take("user-0", 0.0, 100.0, 0.0, 102.0)[1] == 99.0
+
+    def test_limiter_evicts_backend_periodically(self):
+        """check() calls the backend's evict_idle once per eviction interval."""
+        shared = InMemoryRateLimitBackend()
+        config = RateLimitConfig(requests_per_minute=60, idle_eviction_interval_seconds=30)
+        limiter = TokenBucketRateLimiter(config, backend=shared)
+        for i in range(20):
+            limiter.check(f"user-{i}")
+        assert len(shared) > 20
+
+        limiter._advance_time(61.0)
+        limiter.check("user-0")
+
+        assert len(shared) == 1  # only the request bucket just drawn down
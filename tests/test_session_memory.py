@@ -0,0 +1,103 @@
+# Copyright 2024-2025 Amiable Development
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tests for SessionMemoryServer git helpers.
+
+Covers the streaming ``git log --name-only`` parser behind get_changed_files.
+"""
+
+import git
+import pytest
+
+from luminescent_cluster.servers import session_memory
+from luminescent_cluster.servers.session_memory import SessionMemoryServer
+
+
+def _commit(repo: git.Repo, files: dict, message: str, author: str) -> None:
+    """Write files and commit them as the given author."""
+    for name, content in files.items():
+        path = repo.working_tree_dir + "/" + name
+        with open(path, "w") as f:
+            f.write(content)
+        repo.index.add([name])
+    actor = git.Actor(author, f"{author.lower()}@example.com")
+    repo.index.commit(message, author=actor, committer=actor)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """A small git repository with overlapping file changes."""
+    repo = git.Repo.init(tmp_path)
+    _commit(repo, {"a.py": "1", "b.py": "1"}, "first", "Alice")
+    _commit(repo, {"b.py": "2", "c.py": "1"}, "second", "Bob")
+    _commit(repo, {"a.py": "3"}, "third", "Carol")
+    return repo
+
+
+class TestGetChangedFiles:
+    """Tests for SessionMemoryServer.get_changed_files."""
+
+    @pytest.mark.asyncio
+    async def test_each_path_reported_once(self, repo):
+        """Paths touched by several commits appear exactly once."""
+        server = SessionMemoryServer(repo.working_tree_dir)
+
+        changed = await server.get_changed_files(since_hours=24)
+
+        paths = [c["path"] for c in changed]
+        assert sorted(paths) == ["a.py", "b.py", "c.py"]
+
+    @pytest.mark.asyncio
+    async def test_most_recent_modification_wins(self, repo):
+        """Each path carries the newest commit that modified it."""
+        server = SessionMemoryServer(repo.working_tree_dir)
+
+        changed = {c["path"]: c for c in await server.get_changed_files(since_hours=24)}
+
+        assert changed["a.py"]["last_author"] == "Carol"
+        assert changed["b.py"]["last_author"] == "Bob"
+        assert changed["c.py"]["last_author"] == "Bob"
+
+        head = repo.head.commit
+        assert changed["a.py"]["last_modified"] == head.committed_datetime.isoformat()
+
+    @pytest.mark.asyncio
+    async def test_no_repository_returns_empty(self, tmp_path):
+        """A non-git directory yields no changed files."""
+        server = SessionMemoryServer(str(tmp_path))
+
+        assert await server.get_changed_files() == []
+
+    @pytest.mark.asyncio
+    async def test_git_process_reaped_when_reading_fails(self, repo, monkeypatch):
+        """An error mid-stream kills git instead of waiting on a full pipe."""
+        started = []
+        real_popen = session_memory.subprocess.Popen
+
+        class FailingStdout:
+            """Yield git's first line, then fail as a parser bug would."""
+
+            def __init__(self, stdout):
+                self.stdout = stdout
+
+            def __iter__(self):
+                yield next(iter(self.stdout))
+                raise RuntimeError("parse failed")
+
+            def close(self):
+                self.stdout.close()
+
+        def popen(*args, **kwargs):
+            proc = real_popen(*args, **kwargs)
+            proc.stdout = FailingStdout(proc.stdout)
+            started.append(proc)
+            return proc
+
+        monkeypatch.setattr(session_memory.subprocess, "Popen", popen)
+        server = SessionMemoryServer(repo.working_tree_dir)
+
+        with pytest.raises(RuntimeError, match="parse failed"):
+            await server.get_changed_files(since_hours=24)
+
+        assert started[0].returncode is not None